@@ -46,6 +46,100 @@
 #                         function (checkBattStatus()). When either one of the i2c devices are failed, it will
 #                         switch to default print statement for LCD operation and default value for current 
 #                         battery status value.
+#              0015     - Single external command execution layer (runCommand()). All external commands are
+#                         executed as argument list without shell, with per command execution deadline, exit
+#                         code checking, bounded output capture, optional output streaming and per command
+#                         latency histogram.
+#              0016     - Persistent QMI session for 4G LTE modem. All qmicli requests are issued through qmi-proxy
+#                         and reuse the previously allocated QMI client ID (DMS and WDS), instead of open the
+#                         device and allocate/release new client ID on each request. 4G LTE modem bring-up time
+#                         are recorded for each attempt.
+#              0017     - QMI indication listener for 4G LTE modem. The data session are started with qmicli
+#                         --wds-follow-network and the qmicli process are kept running, WDS packet service status
+#                         indication are pushed to network monitoring as 'connected'/'disconnected' event. NAS
+#                         serving system registration/roaming status changes are pushed as 'registration' event.
+#                         Data session drop are handled immediately and PING google.com are only used when the
+#                         listener are not running.
+#              0018     - 4G LTE modem bring-up planner. Current modem operating mode, OS Raw IP Mode setting,
+#                         wwan0 interface state, data session and wwan0 IP address are probed first, and only the
+#                         remaining bring-up steps are executed. Fixed delay between commands are replaced with
+#                         readiness wait.
+#              0019     - Multiple 4G LTE modem support. Each QMI control device (/dev/cdc-wdm*) are mapped to its
+#                         network interface through sysfs, with per 4G LTE modem state. All 4G LTE modem are
+#                         brought up in parallel, a dropped 4G LTE modem are reset without affecting the others,
+#                         and failed or newly plugged 4G LTE modem are retried while other 4G LTE modem are UP.
+#              0020     - Multiple WAN uplink management by macro script parameter (MULTIWAN). Candidate WAN uplink
+#                         (4G LTE modem, Wi-Fi, Ethernet) are continuously probed with ICMP echo through each
+#                         network interface and scored by RTT and packet loss. Default route are switched to the
+#                         best WAN uplink, with failover after consecutive lost probe on the active WAN uplink, and
+#                         OpenVPN connection are restarted over the new WAN uplink.
+#              0021     - Multipath VPN tunnel by macro script parameter (MULTIPATH). Secondary VPN tunnel are
+#                         started over each additional WAN uplink with source policy routing, and the VPN route
+#                         are balanced per flow across all VPN tunnel by ECMP multipath route weighted by each
+#                         WAN uplink measured capacity.
+#              0022     - 4G LTE modem pre-warm by macro script parameter (PREWARM - at boot, PREWARMCLIENT - after
+#                         client computer detected). 4G LTE modem are brought up before USB thumb drive are plug in,
+#                         with forwarding lockdown so the client computer traffic only leave through VPN tunnel.
+#                         USB thumb drive insertion only trigger the VPN tunnel initiation.
+#              0023     - Bring-up pipeline by stage graph executor. 4G LTE modem initiation and nc2vpn key
+#                         decryption are executed concurrently, followed by VPN remote server resolution and VPN
+#                         tunnel initiation. Per stage timing and critical path are recorded for each bring-up.
+#              0024     - Warm-standby OpenVPN. OpenVPN are started before the USB key are inserted with the
+#                         previously decrypted nc2vpn key profile without the private key and credential (RAM), and
+#                         held at the management interface (--management-hold). Once the nc2vpn key are decrypted
+#                         OpenVPN are released, the private key signature (--management-external-key) and
+#                         auth-user-pass (--management-query-passwords) are handed over through the management
+#                         interface. OpenVPN remote query are answered with the resolved VPN remote server IP address.
+#              0025     - Decrypted nc2vpn key are stored inside RAM (tmpfs) temporary folder instead of SD card,
+#                         and loaded with its key files inline into sealed memory file (memfd). OpenVPN read the
+#                         configuration through /proc/<pid>/fd path, the decrypted files are removed immediately
+#                         after loaded and the sealed memory file are closed after VPN tunnel initiated.
+#              0026     - Decrypted nc2vpn key are cached inside kernel user keyring (keyctl) with expiry, VPN
+#                         tunnel reconnect load the key from the cache without decrypt again. The cache are
+#                         revoked immediately when USB key removed.
+#              0027     - Pre-generated crypto public and private key pool by macro script parameter (KEYPOOL).
+#                         Key pair are generated in background at idle priority inside RAM (tmpfs) and taken
+#                         during USB encrypt process, provisioning latency are recorded with and without key pool.
+#              0028     - nc2vpn key bundle are encrypted/decrypted per file by a pool of parallel job (one per
+#                         online CPU), each file are streamed through the cipher with bounded memory, sub directory
+#                         are kept. Per file status and throughput are reported. Bundle file encrypted by the
+#                         previous encrypt.py are still decrypted by decrypt.py per file.
+#              0029     - SHA-256 content hash and nc2vpn key bundle cipher (AES-256-CBC) through Linux kernel crypto
+#                         API (AF_ALG) with splice zero-copy, fallback to userspace (hashlib, openssl enc). The faster
+#                         backend are selected by benchmark at startup, both cipher backend output are compatible.
+#              0030     - USB volume are detected from mount table changes (/proc/self/mountinfo POLLPRI) instead of
+#                         directory creation (inotify) and fixed delay, volume device, UUID and filesystem type are
+#                         reported after the volume actually mounted.
+#              0031     - USB volume manifest (file size, modification time and content hash) are cached by
+#                         filesystem UUID after successful decrypt process. Re-inserted USB key with unchanged
+#                         manifest skip the decrypt process when the decrypted nc2vpn key still available.
+#              0032     - USB key removal grace window by macro script parameter (USBGRACE=<seconds>). VPN tunnel
+#                         are stopped immediately under forwarding lockdown, 4G LTE modem data session and DHCP
+#                         lease are kept, re-inserted same USB key only restart the VPN tunnel.
+#              0033     - USB key removal lockdown stop kernel IP forwarding in-process first, then STOP VPN tunnel,
+#                         DHCP client and 4G LTE modem concurrently without delay. Time-to-blackhole are measured
+#                         against the deadline. Forwarding only restored with the forwarding lockdown in place.
+#              0034     - Each mounted USB volume are processed by its own job with bounded concurrency, USB volume
+#                         scanning, encrypt and decrypt run in parallel inside its own staging directory, only the
+#                         gateway crypto key pair and nc2vpn key (archive) replacement are serialised. USB path and
+#                         crypto process status are kept per job, only the latest replacing job are published.
+#              0035     - Crypto key and nc2vpn key files are copied in-kernel (copy_file_range/sendfile) and secure
+#                         wiped (zero overwrite) in-process, flushed to the storage (fsync) before USB key removal
+#                         are prompted. NO fixed delay between the USB encrypt/decrypt process steps.
+#              0036     - Indexed nc2vpn key archive, each OpenVPN profile (referenced key files inline) are
+#                         encrypted individually and the whole index are encrypted once (single wrapped key). Only the
+#                         index and the selected OpenVPN profile (PROFILE=<name>) are decrypted.
+#              0037     - OpenVPN configuration pre-flight check, remote server, protocol, inline certificates, route
+#                         directive and options are parsed and validated (including certificate expiry) before the
+#                         VPN tunnel are started. Parse result are cached by the configuration content hash.
+#              0038     - DNS cache, VPN remote server and health check probe host are pre-resolved once the WAN
+#                         uplink are up (VPN remote server also once the nc2vpn key are decrypted or loaded from
+#                         the cache), and refreshed in background before the TTL expired. OpenVPN are started
+#                         with the cached IP address, PING health check use the cached IP address.
+#              0039     - Happy eyeballs VPN remote server selection, reachability probe (UDP OpenVPN handshake, TCP
+#                         connect) are raced to all VPN remote server, OpenVPN are started with the VPN remote server
+#                         ranked by handshake RTT. Ranking are remembered for the next reconnect. UDP probe are
+#                         signed (tls-auth) or encrypted (tls-crypt) with the OpenVPN static key.
 #
 #              ----------------------------------------------------------------------------------------------
 # Author : Ahmad Bahari Nizam B. Abu Bakar.
@@ -54,16 +148,69 @@
 # Version: 1.0.2 - Add feature item [0010]. Please refer above description
 # Version: 1.0.3 - Add feature item [0011,0012]. Please refer above description
 # Version: 1.0.4 - Add feature item [0013,0014]. Please refer above description
+# Version: 1.0.5 - Add feature item [0015]. Please refer above description
+# Version: 1.0.6 - Add feature item [0016]. Please refer above description
+# Version: 1.0.7 - Add feature item [0017]. Please refer above description
+# Version: 1.0.8 - Add feature item [0018]. Please refer above description
+# Version: 1.0.9 - Add feature item [0019]. Please refer above description
+# Version: 1.1.0 - Add feature item [0020]. Please refer above description
+# Version: 1.1.1 - Add feature item [0021]. Please refer above description
+# Version: 1.1.2 - Add feature item [0022]. Please refer above description
+# Version: 1.1.3 - Add feature item [0023]. Please refer above description
+# Version: 1.1.4 - Add feature item [0024]. Please refer above description
+# Version: 1.1.5 - Add feature item [0025]. Please refer above description
+# Version: 1.1.6 - Add feature item [0026]. Please refer above description
+# Version: 1.1.7 - Add feature item [0027]. Please refer above description
+# Version: 1.1.8 - Add feature item [0028]. Please refer above description
+# Version: 1.1.9 - Add feature item [0029]. Please refer above description
+# Version: 1.2.0 - Add feature item [0030]. Please refer above description
+# Version: 1.2.1 - Add feature item [0031]. Please refer above description
+# Version: 1.2.2 - Add feature item [0032]. Please refer above description
+# Version: 1.2.3 - Add feature item [0033]. Please refer above description
+# Version: 1.2.4 - Add feature item [0034]. Please refer above description
+# Version: 1.2.5 - Add feature item [0035]. Please refer above description
+# Version: 1.2.6 - Add feature item [0036]. Please refer above description
+# Version: 1.2.7 - Add feature item [0037]. Please refer above description
+# Version: 1.2.8 - Add feature item [0038]. Please refer above description
+# Version: 1.2.9 - Add feature item [0039]. Please refer above description
 #
 # Date   : 18/02/2021 (INITIAL RELEASE DATE)
 #          UPDATED - 23/02/2021 - 1.0.2
 #          UPDATED - 02/03/2021 - 1.0.3
 #          UPDATED - 02/03/2021 - 1.0.4
+#          UPDATED - 19/10/2026 - 1.0.5
+#          UPDATED - 19/10/2026 - 1.0.6
+#          UPDATED - 19/10/2026 - 1.0.7
+#          UPDATED - 19/10/2026 - 1.0.8
+#          UPDATED - 19/10/2026 - 1.0.9
+#          UPDATED - 19/10/2026 - 1.1.0
+#          UPDATED - 19/10/2026 - 1.1.1
+#          UPDATED - 19/10/2026 - 1.1.2
+#          UPDATED - 19/10/2026 - 1.1.3
+#          UPDATED - 19/10/2026 - 1.1.4
+#          UPDATED - 19/10/2026 - 1.1.5
+#          UPDATED - 19/10/2026 - 1.1.6
+#          UPDATED - 19/10/2026 - 1.1.7
+#          UPDATED - 19/10/2026 - 1.1.8
+#          UPDATED - 19/10/2026 - 1.1.9
+#          UPDATED - 19/10/2026 - 1.2.0
+#          UPDATED - 19/10/2026 - 1.2.1
+#          UPDATED - 19/10/2026 - 1.2.2
+#          UPDATED - 19/10/2026 - 1.2.3
+#          UPDATED - 19/10/2026 - 1.2.4
+#          UPDATED - 19/10/2026 - 1.2.5
+#          UPDATED - 19/10/2026 - 1.2.6
+#          UPDATED - 19/10/2026 - 1.2.7
+#          UPDATED - 19/10/2026 - 1.2.8
+#          UPDATED - 19/10/2026 - 1.2.9
 #
 #############################################################################################################
 
 from __future__ import unicode_literals
-import os, re, sys, time, socket
+import os, re, sys, time, socket, select, shlex, fcntl, glob, ctypes, shutil, mmap, hashlib, errno, base64, calendar, hmac, signal
+import threading
+import json
+import Queue
 import thread
 import logging
 import logging.handlers
@@ -98,7 +245,38 @@ pubKeyPath         = ''       # Public key to decrypt the USB thumb drive
 usbMountPath       = ''       # USB mount path directory
 nc2VpnKeyPath      = ''       # NC2VPN encrypted key file directory location 
 nc2VpnKeyTPath     = ''       # NC2VPN decrypted key temporary file directory location
+nc2VpnArchPath     = ''       # NC2VPN encrypted key archive file location
 currUSBPath        = ''       # Current detected USB stick path after insertion
+usbMountList       = {}       # Current mounted USB volume, key: mount point, value: {'dev', 'uuid', 'fsType'}
+mountPollTimeOut   = 5000     # Mount table (/proc/self/mountinfo) change wait deadline before rescan (miliseconds)
+volManifestCache   = {}       # USB volume manifest after successful decrypt process, key: filesystem UUID
+manifestHashMax    = 1048576  # Maximum file size with content hash inside USB volume manifest (bytes)
+usbGraceTime       = 0        # USB key removal grace window (seconds), VPN tunnel cut and 4G LTE modem kept, 0 - Disable
+usbGraceExp        = 0        # USB key removal grace window deadline, 0 - NO grace window
+usbLockDeadline    = 0.1      # USB key removal time-to-blackhole (forwarding stopped) deadline (seconds)
+fwdSysPath         = ['/proc/sys/net/ipv4/ip_forward', '/proc/sys/net/ipv6/conf/all/forwarding'] # Kernel IP forwarding switch
+fwdHoldState       = {}       # Forwarding switch kept STOP after USB key removal lockdown chain failed, restored when VPN tunnel UP
+volJobMax          = 4        # Maximum concurrent USB volume job (volume scanning, encrypt and decrypt)
+volJobSem          = threading.BoundedSemaphore(volJobMax) # Concurrent USB volume job limit
+cryptoStoreLock    = thread.allocate_lock() # Lock for gateway crypto key pair, encrypted and decrypted nc2vpn key update
+volJobSeq          = 0        # USB volume job sequence, new sequence on each job start and crypto store replacement
+volPubSeq          = 0        # USB volume job sequence of the published USB path, LCD operation mode and crypto process status
+fileBuffSize       = 1048576  # Secure wipe overwrite and file copy transfer size (bytes)
+ovpnProfile        = ''       # Selected OpenVPN profile name inside nc2vpn key archive, empty - First profile
+ovpnParseCache     = {}       # Parsed OpenVPN configuration, key: configuration content hash
+ovpnParseMax       = 8        # Maximum cached parsed OpenVPN configuration
+dnsCache           = {}       # Resolved host name, key: host name, value: (IP address list, expiry time, TTL)
+dnsCacheLock       = thread.allocate_lock() # Lock for resolved host name cache
+dnsProbeHost       = ['google.com'] # Health check probe host name, pre-resolved once WAN uplink are up
+dnsRemoteHost      = []       # VPN remote server host name of the loaded nc2vpn key, pre-resolved once loaded or WAN uplink are up
+dnsResolvPath      = '/etc/resolv.conf' # Name server configuration file
+dnsTimeOut         = 3        # DNS query time out for each name server (seconds)
+dnsMinTtl          = 30       # Minimum resolved host name cache TTL (seconds)
+dnsMaxTtl          = 3600     # Maximum resolved host name cache TTL (seconds)
+remoteRank         = {}       # VPN remote server last probe handshake RTT (ms), None - NOT reachable, key: (IP address, port, proto)
+remoteProbeTimeOut = 2        # VPN remote server reachability probe time out (seconds)
+remoteProbeDelay   = 0.05     # Delay between each VPN remote server probe start (seconds), last best remote probed first
+remoteProbeGrace   = 0.3      # Wait for the other VPN remote server probe reply after the first reply (seconds)
 lcdBattVolt        = ''       # Stored current battery voltage value for LCD information display
 lcdBattCap         = ''       # Stored current battery capacity value for LCD information display
 clientIPAddr       = ''       # Stored client machine IP address that connected to the gateway
@@ -110,6 +288,67 @@ lcdDlyStatCnt      = 0        # LCD display info switch between date-time, gatew
 netMonChkCnt       = 0        # Network monitoring process checking counter
 net4gAtmptCnt      = 0        # 4G LTE modem connection attempt counter
 vpnAtmptCnt        = 0        # VPN tunnel connection attempt counter
+cmdTimeOut         = 30       # Default external command execution deadline (seconds)
+cmdMaxCapture      = 65536    # Maximum external command output capture size (bytes)
+cmdHistLogIntv     = 600      # External command latency histogram logging interval (network monitoring cycle)
+cmdLatencyBkt      = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60] # Latency histogram bucket upper bound (seconds)
+cmdLatencyHist     = {}       # External command latency histogram, key: command name, value: bucket counter list
+cmdHistLock        = thread.allocate_lock() # Lock for external command latency histogram access
+qmiCliBin          = 'qmicli' # QMI command line client, can be replaced with fake QMI endpoint by macro argument
+qmiDevice          = '/dev/cdc-wdm0' # 4G LTE modem QMI control device
+qmiClientCid       = {}       # Allocated QMI client ID kept inside qmi-proxy, key: <QMI device>:<QMI service>
+qmiPktHandle       = {}       # WDS packet data handle of the current data session, key: QMI device
+qmiLock            = thread.allocate_lock() # Lock for QMI session request lock list
+qmiDevLock         = {}       # Lock for QMI session request, key: QMI device
+qmiFollowTimeOut   = 31536000 # QMI indication listener (qmicli --wds-follow-network) execution deadline (seconds)
+qmiFollowProc      = {}       # QMI indication listener process list of the current data session, key: QMI device
+modemIndValid      = {}       # Flag to indicate QMI indication listener are running, key: QMI device
+modemEvtQueue      = Queue.Queue() # 4G LTE modem event from QMI indication listener: (QMI device, event, info)
+nasPollIntv        = 2        # NAS serving system registration and roaming status polling interval (seconds)
+modemList          = {}       # Discovered 4G LTE modem state, key: QMI device, value: {'netIf': network interface, 'valid': UP flag}
+modemLock          = thread.allocate_lock() # Lock for 4G LTE modem bring-up
+modemRetryIntv     = 30       # Failed 4G LTE modem bring-up retry interval while other 4G LTE modem are UP (network monitoring cycle)
+multiWan           = False    # Macro for multiple WAN uplink management
+uplinkCandList     = ['eth0', 'wlan0'] # Candidate WAN uplink network interface, 4G LTE modem network interface are added automatically
+uplinkProbeAddr    = '8.8.8.8'  # WAN uplink health probe destination (ICMP echo), IP address to avoid DNS lookup
+uplinkProbeIntv    = 0.25     # WAN uplink health probe interval (seconds)
+uplinkFailCnt      = 3        # Consecutive lost probe on active WAN uplink before failover
+uplinkHoldCnt      = 20       # Consecutive probe round with better score before switch to the better WAN uplink
+uplinkActive       = ''       # Current active WAN uplink network interface
+uplinkStat         = {}       # WAN uplink health status, key: network interface, value: {'rtt', 'loss', 'lossCnt', 'score', 'gw'}
+multiPath          = False    # Macro for multipath VPN tunnel across multiple WAN uplink
+mpathTunnel        = {}       # Multipath VPN tunnel, key: tun device, value: {'netIf', 'addr', 'table', 'bytes', 'cap', 'proc'}
+mpathRouteList     = []       # VPN route balanced across multipath VPN tunnel
+mpathWeight        = {}       # Current multipath VPN tunnel route weight, key: tun device
+mpathTableBase     = 100      # Policy routing table base number for secondary VPN tunnel WAN uplink
+preWarmMode        = 0        # Macro for 4G LTE modem pre-warm: 0 - Disable, 1 - At boot, 2 - After client computer detected
+preWarmLock        = False    # Flag to indicate forwarding lockdown are applied and 4G LTE modem pre-warm are allowed
+ovpnMgmtPath       = '/run/scssgw-ovpn.sock' # Warm-standby OpenVPN management interface unix socket
+ovpnPidPath        = '/run/scssgw-ovpn.pid' # Primary VPN tunnel OpenVPN PID file (--writepid)
+ovpnMgmtSock       = None     # OpenVPN management interface connection
+ovpnMgmtState      = {}       # OpenVPN management interface state, 'hold': held flag, 'state': OpenVPN state
+ovpnMgmtLock       = thread.allocate_lock() # Lock for OpenVPN management interface command
+ovpnMgmtCred       = {}       # Credential handed over through the management interface, 'key': private key, 'user', 'pass': auth-user-pass
+ovpnStandbyPath    = '/dev/shm/scssgw-standby.ovpn' # Warm-standby OpenVPN profile, nc2vpn key without the private key and credential (RAM)
+ovpnStandbyLock    = thread.allocate_lock() # Lock for warm-standby OpenVPN start
+ovpnStandbyRetry   = 30       # Failed warm-standby OpenVPN retry interval (seconds)
+ovpnRemoteMap      = {}       # Resolved VPN remote server IP address for OpenVPN remote query, key: remote host
+ovpnRemoteBest     = {}       # Best ranked VPN remote server for OpenVPN remote query, 'remote': (host, port, proto), 'addr': IP address, 'used': True after answered
+ovpnMemfd          = {}       # Decrypted nc2vpn key sealed memory file, 'fd': file descriptor, 'path': OpenVPN configuration path
+keyCacheName       = 'scssgw:nc2vpn'  # Decrypted nc2vpn key cache description inside kernel user keyring
+keyCacheTimeOut    = 28800    # Decrypted nc2vpn key cache expiry (seconds), cache are revoked earlier when USB key removed
+keyPool            = False    # Macro for pre-generated crypto public and private key pool
+keyPoolPath        = '/dev/shm/scssgw-key-pool' # Pre-generated crypto key pool directory, inside RAM (tmpfs), only accessible by root
+keyPoolSize        = 2        # Maximum pre-generated crypto public and private key pair
+keyPoolLock        = thread.allocate_lock() # Lock for crypto key pool
+cryptoStagePath    = '/dev/shm/scssgw-crypto-stage' # Crypto secret and per file decrypt.py staging directory, inside RAM (tmpfs)
+cryptoMaxJob       = 0        # Maximum parallel nc2vpn key bundle encrypt/decrypt job, 0 - Number of online CPU
+hashBackend        = ''       # Active SHA-256 content hash backend: 'af_alg' - Kernel crypto API, 'hashlib' - Userspace
+hashChunkSize      = 65536    # Content hash zero-copy transfer size (bytes)
+hashBenchSize      = 1048576  # Content hash backend benchmark data size (bytes)
+cipherBackend      = ''       # Active nc2vpn key bundle cipher backend: 'af_alg' - Kernel crypto API, 'openssl' - Userspace
+cipherChunkSize    = 65536    # Bundle cipher zero-copy transfer size (bytes), multiple of AES block size
+cipherBenchSize    = 1048576  # Bundle cipher backend benchmark data size (bytes)
 
 # Check for macro arguments
 if (len(sys.argv) > 1):
@@ -150,6 +389,33 @@ if (len(sys.argv) > 1):
                     # Option for ubuntu touch devices
                     elif x == 'UBUNTU':
                         ubuntuTouch = True
+                    # Optional macro for multiple WAN uplink management
+                    elif x == 'MULTIWAN':
+                        multiWan = True
+                    # Optional macro for multipath VPN tunnel
+                    elif x == 'MULTIPATH':
+                        multiPath = True
+                    # Optional macro for 4G LTE modem pre-warm at boot
+                    elif x == 'PREWARM':
+                        preWarmMode = 1
+                    # Optional macro for 4G LTE modem pre-warm after client computer detected
+                    elif x == 'PREWARMCLIENT':
+                        preWarmMode = 2
+                    # Optional macro for pre-generated crypto key pool
+                    elif x == 'KEYPOOL':
+                        keyPool = True
+                    # Optional candidate WAN uplink network interface list, e.g. UPLINK=eth0,wlan0
+                    elif x.startswith('UPLINK='):
+                        uplinkCandList = [y for y in x[len('UPLINK='):].split(',') if y != '']
+                    # Optional USB key removal grace window (seconds), e.g. USBGRACE=30
+                    elif x.startswith('USBGRACE='):
+                        usbGraceTime = int(x[len('USBGRACE='):])
+                    # Optional OpenVPN profile name inside nc2vpn key archive, e.g. PROFILE=office.ovpn
+                    elif x.startswith('PROFILE='):
+                        ovpnProfile = x[len('PROFILE='):]
+                    # Optional QMI command line client path, e.g. fake QMI endpoint for testing
+                    elif x.startswith('QMICLI='):
+                        qmiCliBin = x[len('QMICLI='):]
 
 # Setup log file 
 if backLogger == True:
@@ -206,8 +472,13 @@ else:
     
 # nc2vpn key path - Encrypted file
 nc2VpnKeyPath = '/sources/common/vpn-client-key/nc2vpn-key'
-# nc2vpn key temporary path - Decrypted file
-nc2VpnKeyTPath = '/sources/common/vpn-client-key/temp-nc2vpn-key'
+# nc2vpn key archive path - Indexed encrypted file, each OpenVPN profile can be decrypted individually
+nc2VpnArchPath = '/sources/common/vpn-client-key/nc2vpn-key.arc'
+# nc2vpn key temporary path - Decrypted file, inside RAM (tmpfs) instead of SD card, only accessible by root
+nc2VpnKeyTPath = '/dev/shm/scssgw-nc2vpn-key'
+if path.exists(nc2VpnKeyTPath) == False:
+    os.makedirs(nc2VpnKeyTPath, 0o700)
+os.chmod(nc2VpnKeyTPath, 0o700)
 # Client computer hard coded IP address
 clientIPAddr = '192.168.4.201'
 
@@ -232,6 +503,26 @@ if ubuntuTouch == False:
     except:
         i2cLcd = False
 
+# Mounted USB volume information, passed to EventHandler
+class MountEvent(object):
+
+    def __init__(self, pathname, dev, uuid, fsType):
+        self.pathname = pathname
+        self.dev = dev
+        self.uuid = uuid
+        self.fsType = fsType
+
+# USB volume job result, USB path, LCD operation mode and crypto process status are kept per job until published
+# by publishVolumeJob(), None - NOT changed by the job
+class VolumeJob(object):
+
+    def __init__(self, seq):
+        self.seq = seq
+        self.usbPath = ''
+        self.lcdOperSel = None
+        self.dCryptProc = None
+        self.eCryptProc = None
+
 # Class for USB thumb drive insertion automatic notification
 # Also include encrypt and decrypt nc2vpn key process
 # Process that will be done:
@@ -245,47 +536,81 @@ class EventHandler(pyinotify.ProcessEvent):
         self.public_key = public_key
         self.nc2vpnkeypath = nc2vpnkeypath
         self.nc2vpnkeytpath = nc2vpnkeytpath
-        self.cryptoType = False
-        
+
+    # USB volume job - USB volume are scanned, encrypted and decrypted concurrently inside its own staging directory,
+    # only the gateway crypto key pair and nc2vpn key update are serialised (cryptoStoreLock)
     def process_IN_CREATE(self, event):
+        global radioMode
+        global volJobSem
+
+        if os.path.isdir(event.pathname) == False or radioMode == True:
+            return
+
+        volJobSem.acquire()
+        try:
+            volJob = startVolumeJob()
+            volManifest = scanVolManifest(event.pathname)
+            self.processVolume(event, volManifest, volJob)
+            publishVolumeJob(volJob)
+        finally:
+            volJobSem.release()
+
+    def processVolume(self, event, volManifest, volJob):
         global backLogger
-        global lcdOperSel
-        global dCryptProc
-        global eCryptProc
-        global currUSBPath
+        global keyPool
+        global nc2VpnArchPath
         global radioMode
+        global volManifestCache
+        global usbGraceExp
         
         if os.path.isdir(event.pathname) and radioMode == False:
-            # Copy the detected USB path to local variable, for later usage
-            currUSBPath = event.pathname
-
             # Write to logger
             if backLogger == True:
                 # print("New mounted volume detected: " + event.pathname)
-                logger.info("DEBUG_CRYPTO: New mounted volume detected: %s" % (event.pathname))
+                logger.info("DEBUG_CRYPTO: New mounted volume detected: %s [%s, UUID: %s, %s]" % (event.pathname, event.dev, event.uuid, event.fsType))
             # Print statement
             else:
-                print "DEBUG_CRYPTO: New mounted volume detected: %s" % (event.pathname)
+                print "DEBUG_CRYPTO: New mounted volume detected: %s [%s, UUID: %s, %s]" % (event.pathname, event.dev, event.uuid, event.fsType)
 
-            # Wait for the volume to be mounted and avoid permission errors
-            time.sleep(1)
-            
             # Check private key existence
-            tempCmd = 'cd ' + event.pathname + ';ls -la'
-            out = subprocess.Popen([tempCmd], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            stdout,stderr = out.communicate()
+            # Continue with decrypt process
+            if 'key.private' in volManifest:
+                cryptoType = True
 
-            # NO error after command execution
-            if stderr == None:
-                # Continue with decrypt process
-                if 'key.private' in stdout:
-                    self.cryptoType = True
-                # Continue with encrypt process
+                # Keep the detected USB path inside the USB volume job, for later usage
+                volJob.usbPath = event.pathname
+            # Continue with encrypt process
+            else:
+                cryptoType = False
+
+            # Same USB key re-inserted with unchanged manifest and the decrypted nc2vpn key still available
+            fastPath = False
+            if cryptoType == True and event.uuid != '' and volManifestCache.get(event.uuid) == volManifest:
+                fastPath = getDecryptedOvpn() != ''
+
+            # Re-inserted within USB key removal grace window, only the same USB key keep the cached nc2vpn key
+            if usbGraceExp != 0:
+                usbGraceExp = 0
+                if fastPath == False:
+                    revokeOvpnKeyCache()
+
+            # Skip decrypt process
+            if fastPath == True:
+                # Write to logger
+                if backLogger == True:
+                    logger.info("DEBUG_CRYPTO: USB key manifest unchanged [UUID: %s], SKIP DECRYPT process" % (event.uuid))
+                # Print statement
                 else:
-                    self.cryptoType = False
-            
+                    print "DEBUG_CRYPTO: USB key manifest unchanged [UUID: %s], SKIP DECRYPT process" % (event.uuid)
+
+                # Change LCD operation mode
+                volJob.lcdOperSel = 7
+
+                # Set status of decrypt process
+                volJob.dCryptProc = True
+
             # Start decrypt process
-            if self.cryptoType == True:
+            elif cryptoType == True:
                 # Write to logger
                 if backLogger == True:
                     logger.info("DEBUG_CRYPTO: Start DECRYPT process")
@@ -294,64 +619,59 @@ class EventHandler(pyinotify.ProcessEvent):
                     print "DEBUG_CRYPTO: Start DECRYPT process"
 
                 # Change LCD operation mode
-                lcdOperSel = 5
-
-                # Delete the contents of nc2vpn key inside temporary folder
-                tempArgs = 'cd ' + self.nc2vpnkeytpath + ';rm -rf *'
-                out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
-
-                # NO error after command execution
-                if stderr == None:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_CRYPTO: Delete temporary nc2vpn key files successful")
-                    # Print statement
-                    else:
-                        print "DEBUG_CRYPTO: Delete temporary nc2vpn key files successful"
+                volJob.lcdOperSel = 5
+                publishVolumeJob(volJob)
 
-                    # Wait before execute another command
-                    time.sleep(1)
-                
-                    # Start decrypt the nc2vpn key and stored it inside temporary folder
-                    # Command:
-                    # python3 decrypt.py --source=/path/to/your/drive/ --destination=/path/to/your/drive/ --private-key=/path/to/your/key.private
+                # Decrypt the nc2vpn key into this USB volume staging directory
+                stageDir = createCryptoStage('decrypt')
+                try:
                     tempPrivKeyPath = event.pathname + '/key.private'
-                    out = subprocess.Popen(['python3', 'decrypt.py', '--source', self.nc2vpnkeypath, '--destination', self.nc2vpnkeytpath, '--private-key', tempPrivKeyPath], \
-                                           stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+                    retCode, stdout = decryptNc2Vpn(self.nc2vpnkeypath, stageDir, tempPrivKeyPath)
 
                     # NO error after command execution
-                    if stderr == None:
-                        if 'Decrypting:' in stdout:
+                    if retCode == 0 and 'Decrypting:' in stdout:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_CRYPTO: Decrypt nc2vpn key successful")
+                        # Print statement
+                        else:
+                            print "DEBUG_CRYPTO: Decrypt nc2vpn key successful"
+
+                        # Close previous nc2vpn key sealed memory file and replace the contents of temporary folder
+                        if storeDecryptedOvpn(stageDir, self.nc2vpnkeytpath, volJob) == True:
                             # Write to logger
                             if backLogger == True:
-                                logger.info("DEBUG_CRYPTO: Decrypt nc2vpn key successful")
+                                logger.info("DEBUG_CRYPTO: Replace temporary nc2vpn key files successful")
                             # Print statement
                             else:
-                                print "DEBUG_CRYPTO: Decrypt nc2vpn key successful"
+                                print "DEBUG_CRYPTO: Replace temporary nc2vpn key files successful"
 
                             # Change LCD operation mode
-                            lcdOperSel = 7
-                
+                            volJob.lcdOperSel = 7
+
                             # Set status of decrypt process
-                            dCryptProc = True
+                            volJob.dCryptProc = True
+
+                            # Keep the USB key manifest for re-insertion
+                            if event.uuid != '':
+                                volManifestCache[event.uuid] = volManifest
+
                         # Operation failed
                         else:
                             # Write to logger
                             if backLogger == True:
-                                logger.info("DEBUG_CRYPTO: Decrypt nc2vpn key FAILED!")
+                                logger.info("DEBUG_CRYPTO: Replace temporary nc2vpn key files FAILED!")
                                 logger.info("DEBUG_CRYPTO: DECRYPT process FAILED!")
                             # Print statement
                             else:
-                                print "DEBUG_CRYPTO: Decrypt nc2vpn key FAILED!"
+                                print "DEBUG_CRYPTO: Replace temporary nc2vpn key files FAILED!"
                                 print "DEBUG_CRYPTO: DECRYPT process FAILED!"
 
                             # Change LCD operation mode
-                            lcdOperSel = 12
+                            volJob.lcdOperSel = 12
                             # Set status of decrypt process
-                            dCryptProc = False
-                            
+                            volJob.dCryptProc = False
+
                     # Operation failed
                     else:
                         # Write to logger
@@ -364,26 +684,12 @@ class EventHandler(pyinotify.ProcessEvent):
                             print "DEBUG_CRYPTO: DECRYPT process FAILED!"
 
                         # Change LCD operation mode
-                        lcdOperSel = 12
+                        volJob.lcdOperSel = 12
                         # Set status of decrypt process
-                        dCryptProc = False
-                            
-                # Operation failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_CRYPTO: Delete temporary nc2vpn key files FAILED!")
-                        logger.info("DEBUG_CRYPTO: DECRYPT process FAILED!")
-                    # Print statement
-                    else:
-                        print "DEBUG_CRYPTO: Delete temporary nc2vpn key files FAILED!"
-                        print "DEBUG_CRYPTO: DECRYPT process FAILED!"
+                        volJob.dCryptProc = False
+                finally:
+                    shutil.rmtree(stageDir, True)
 
-                    # Change LCD operation mode
-                    lcdOperSel = 12
-                    # Set status of decrypt process
-                    dCryptProc = False
-                            
             # Start encrypt process
             else:
                 # Write to logger
@@ -394,293 +700,167 @@ class EventHandler(pyinotify.ProcessEvent):
                     print "DEBUG_CRYPTO: Start ENCRYPT process"
 
                 # Change LCD operation mode
-                lcdOperSel = 1
-                
-                # Delete first public and private key
-                out = subprocess.Popen(["rm -rf key.public key.private"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
-
-                # NO error after command execution
-                if stderr == None:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_CRYPTO: Delete public and private key successful")
-                    # Print statement
-                    else:
-                        print "DEBUG_CRYPTO: Delete public and private key successful"
-
-                    # Wait before execute another command
-                    time.sleep(1)
-
-                    # Delete nc2vpn encrypted files from folder: /sources/common/vpn-client-key/nc2vpn-key
-                    tempArgs = tempArgs = 'cd ' + self.nc2vpnkeypath + ';rm -rf *'
-                    out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+                volJob.lcdOperSel = 1
+                publishVolumeJob(volJob)
+                provStartTime = time.time()
+                keyPoolUsed = False
+                failStep = ''
+
+                # Crypto key pair (RAM), encrypted nc2vpn key and archive are prepared inside this USB volume staging,
+                # then replace the gateway crypto store at once
+                stageDir = createCryptoStage('encrypt')
+                stagePubKey = os.path.join(stageDir, 'key.public')
+                bundleDir = self.nc2vpnkeypath + '.' + os.path.basename(stageDir)
+                archPath = nc2VpnArchPath + '.' + os.path.basename(stageDir)
+                oldDir = ''
+                try:
+                    # Take public and private key from the key pool
+                    retCode = None
+                    if keyPool == True:
+                        retCode, stdout = getPoolKeyPair(stageDir)
+                        keyPoolUsed = retCode == 0
+
+                    # Create public and private key first
+                    if retCode == None:
+                        retCode, stdout = runCommand(['python3', os.path.abspath('generate_keys.py')], 120, cmdDir=stageDir)
 
                     # NO error after command execution
-                    if stderr == None:
+                    if retCode == 0 and 'Generated public key at:' in stdout and 'Generated private key at:' in stdout:
                         # Write to logger
                         if backLogger == True:
-                            logger.info("DEBUG_CRYPTO: Delete encrypted nc2vpn key files successful")
+                            logger.info("DEBUG_CRYPTO: Generate crypto public and private key successful")
                         # Print statement
                         else:
-                            print "DEBUG_CRYPTO: Delete encrypted nc2vpn key files successful"
+                            print "DEBUG_CRYPTO: Generate crypto public and private key successful"
+                    else:
+                        failStep = 'Generate crypto public and private key'
 
-                        # Wait before execute another command
-                        time.sleep(1)
-                    
-                        # Create public and private key first
-                        out = subprocess.Popen(['python3', 'generate_keys.py'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                        stdout,stderr = out.communicate()
+                    # Start encrypt nc2vpn key files
+                    if failStep == '':
+                        os.makedirs(bundleDir, 0o700)
+                        retCode, stdout = runCryptoBundle('encrypt', event.pathname, bundleDir, stagePubKey)
 
                         # NO error after command execution
-                        if stderr == None:
-                            if 'Generated public key at:' in stdout:
-                                if 'Generated private key at:' in stdout:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_CRYPTO: Generate crypto public and private key successful")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_CRYPTO: Generate crypto public and private key successful"
-
-                                    # Wait before execute another command
-                                    time.sleep(1)
-
-                                    # Start encrypt nc2vpn key files
-                                    out = subprocess.Popen(['python3', 'encrypt.py', '--source', event.pathname, '--destination', self.nc2vpnkeypath, '--public-key', self.public_key], \
-                                                           stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                    stdout,stderr = out.communicate()
-
-                                    # NO error after command execution
-                                    if stderr == None:
-                                        if 'Encrypting:' in stdout:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_CRYPTO: Encrypt nc2vpn key successful")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_CRYPTO: Encrypt nc2vpn key successful"
-
-                                            # Wait before execute another command
-                                            time.sleep(1)
-
-                                            # Delete nc2vpn key inside USB thumb drive
-                                            tempArgs = 'cd ' + event.pathname + ';rm -rf *'
-                                            out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-
-                                            stdout,stderr = out.communicate()
-
-                                            # NO error after command execution
-                                            if stderr == None:
-                                                # Write to logger
-                                                if backLogger == True:
-                                                    logger.info("DEBUG_CRYPTO: Delete nc2vpn key inside USB thumb drive successful")
-                                                # Print statement
-                                                else:
-                                                    print "DEBUG_CRYPTO: Delete nc2vpn key inside USB thumb drive successful"
-
-                                                # Wait before execute another command
-                                                time.sleep(1)
-
-                                                # Copy private key to USB thumbdrive
-                                                tempArgs = 'cp key.private ' + event.pathname 
-                                                out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-
-                                                stdout,stderr = out.communicate()
-                                                
-                                                # NO error after command execution
-                                                if stderr == None:
-                                                    # Write to logger
-                                                    if backLogger == True:
-                                                        logger.info("DEBUG_CRYPTO: Copy private key to USB thumb drive successful")
-                                                    # Print statement
-                                                    else:
-                                                        print "DEBUG_CRYPTO: Copy private key to USB thumb drive successful"
-
-                                                    # Wait before execute another command
-                                                    time.sleep(1)
-
-                                                    # Delete private key from local folder
-                                                    out = subprocess.Popen(['rm -rf key.private'], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                                    stdout,stderr = out.communicate()
-
-                                                    # NO error after command execution
-                                                    if stderr == None:
-                                                        # Write to logger
-                                                        if backLogger == True:
-                                                            logger.info("DEBUG_CRYPTO: Delete private key from local folder successful")
-                                                            logger.info("DEBUG_CRYPTO: ENCRYPT process successful")
-                                                        # Print statement
-                                                        else:
-                                                            print "DEBUG_CRYPTO: Delete private key from local folder successful"
-                                                            print "DEBUG_CRYPTO: ENCRYPT process successful"
-
-                                                        # Change LCD operation mode
-                                                        lcdOperSel = 3
-                                                        # Set status of encrypt process
-                                                        eCryptProc = True
-                
-                                                    # Operation failed
-                                                    else:
-                                                        # Write to logger
-                                                        if backLogger == True:
-                                                            logger.info("DEBUG_CRYPTO: Delete private key from local folder FAILED!")
-                                                            logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
-                                                        # Print statement
-                                                        else:
-                                                            print "DEBUG_CRYPTO: Delete private key from local folder FAILED!"
-                                                            print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
-
-                                                        # Change LCD operation mode
-                                                        lcdOperSel = 13
-                                                        # Set status of decrypt process
-                                                        eCryptProc = False
-
-                                                # Operation failed
-                                                else:
-                                                    # Write to logger
-                                                    if backLogger == True:
-                                                        logger.info("DEBUG_CRYPTO: Copy private key to USB thumb drive FAILED!")
-                                                        logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
-                                                    # Print statement
-                                                    else:
-                                                        print "DEBUG_CRYPTO: Copy private key to USB thumb drive FAILED!"
-                                                        print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
-
-                                                    # Change LCD operation mode
-                                                    lcdOperSel = 13
-                                                    # Set status of decrypt process
-                                                    eCryptProc = False
+                        if retCode == 0 and 'Encrypting:' in stdout:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_CRYPTO: Encrypt nc2vpn key successful")
+                            # Print statement
+                            else:
+                                print "DEBUG_CRYPTO: Encrypt nc2vpn key successful"
 
-                                            # Operation failed
-                                            else:
-                                                # Write to logger
-                                                if backLogger == True:
-                                                    logger.info("DEBUG_CRYPTO: Delete nc2vpn key inside USB thumb drive FAILED!")
-                                                    logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
-                                                # Print statement
-                                                else:
-                                                    print "DEBUG_CRYPTO: Delete nc2vpn key inside USB thumb drive FAILED!"
-                                                    print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
+                            # Build nc2vpn key archive, before nc2vpn key inside USB thumb drive deleted
+                            if buildOvpnArchive(event.pathname, stagePubKey, archPath) == 0:
+                                archPath = ''
+                        else:
+                            failStep = 'Encrypt nc2vpn key'
 
-                                                # Change LCD operation mode
-                                                lcdOperSel = 13
-                                                # Set status of decrypt process
-                                                eCryptProc = False
+                    # Replace gateway crypto public key, encrypted nc2vpn key files and archive
+                    if failStep == '':
+                        retCode, oldDir = storeCryptoKey(stagePubKey, self.public_key, bundleDir, self.nc2vpnkeypath, archPath, volJob)
 
-                                        # Operation failed
-                                        else:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_CRYPTO: Encrypt nc2vpn key FAILED!")
-                                                logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_CRYPTO: Encrypt nc2vpn key FAILED"
-                                                print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
+                        # NO error after command execution
+                        if retCode == 0:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_CRYPTO: Replace public key and encrypted nc2vpn key files successful")
+                            # Print statement
+                            else:
+                                print "DEBUG_CRYPTO: Replace public key and encrypted nc2vpn key files successful"
 
-                                            # Change LCD operation mode
-                                            lcdOperSel = 13
-                                            # Set status of decrypt process
-                                            eCryptProc = False
-                                            
-                                    # Operation failed
-                                    else:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_CRYPTO: Encrypt nc2vpn key FAILED!")
-                                            logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_CRYPTO: Encrypt nc2vpn key FAILED"
-                                            print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
+                            # Previous encrypted nc2vpn key files
+                            if oldDir != '':
+                                wipePath([oldDir])
+                                os.rmdir(oldDir)
+                        else:
+                            failStep = 'Replace public key and encrypted nc2vpn key files'
 
-                                        # Change LCD operation mode
-                                        lcdOperSel = 13
-                                        # Set status of decrypt process
-                                        eCryptProc = False
-                                    
-                                # Operation failed
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_CRYPTO: Generate crypto public and private key FAILED!")
-                                        logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_CRYPTO: Generate crypto public and private key FAILED!"
-                                        print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
+                    # Delete nc2vpn key inside USB thumb drive
+                    if failStep == '':
+                        retCode, stdout = wipePath([event.pathname])
 
-                                    # Change LCD operation mode
-                                    lcdOperSel = 13
-                                    # Set status of decrypt process
-                                    eCryptProc = False
-                                        
-                            # Operation failed
+                        # NO error after command execution
+                        if retCode == 0:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_CRYPTO: Delete nc2vpn key inside USB thumb drive successful")
+                            # Print statement
                             else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_CRYPTO: Generate crypto public and private key FAILED!")
-                                    logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
-                                # Print statement
-                                else:
-                                    print "DEBUG_CRYPTO: Generate crypto public and private key FAILED!"
-                                    print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
-
-                                # Change LCD operation mode
-                                lcdOperSel = 13
-                                # Set status of decrypt process
-                                eCryptProc = False
-                                
-                        # Operation failed
+                                print "DEBUG_CRYPTO: Delete nc2vpn key inside USB thumb drive successful"
                         else:
+                            failStep = 'Delete nc2vpn key inside USB thumb drive'
+
+                    # Copy private key to USB thumbdrive
+                    if failStep == '':
+                        retCode, stdout = copyFileSync(os.path.join(stageDir, 'key.private'), event.pathname)
+
+                        # NO error after command execution
+                        if retCode == 0:
                             # Write to logger
                             if backLogger == True:
-                                logger.info("DEBUG_CRYPTO: Generate crypto public and private key FAILED!")
-                                logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
+                                logger.info("DEBUG_CRYPTO: Copy private key to USB thumb drive successful")
                             # Print statement
                             else:
-                                print "DEBUG_CRYPTO: Generate crypto public and private key FAILED!"
-                                print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
+                                print "DEBUG_CRYPTO: Copy private key to USB thumb drive successful"
+                        else:
+                            failStep = 'Copy private key to USB thumb drive'
+                except (IOError, OSError):
+                    failStep = 'Prepare USB volume crypto staging'
+
+                # Delete private key and the staging, encrypted nc2vpn key files and archive are only kept when replaced
+                retCode, stdout = wipePath([stageDir] + [x for x in [bundleDir, archPath] if x != '' and path.exists(x) == True])
+                try:
+                    for stagePath in [bundleDir, stageDir]:
+                        if path.exists(stagePath) == True:
+                            os.rmdir(stagePath)
+                except OSError:
+                    retCode = None
+                if failStep == '' and retCode != 0:
+                    failStep = 'Delete private key from local folder'
+
+                # Operation successful
+                if failStep == '':
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_CRYPTO: Delete private key from local folder successful")
+                        logger.info("DEBUG_CRYPTO: ENCRYPT process successful")
+                    # Print statement
+                    else:
+                        print "DEBUG_CRYPTO: Delete private key from local folder successful"
+                        print "DEBUG_CRYPTO: ENCRYPT process successful"
 
-                            # Change LCD operation mode
-                            lcdOperSel = 13
-                            # Set status of decrypt process
-                            eCryptProc = False
-                                        
-                    # Operation failed
+                    # Provisioning latency, with and without key pool
+                    provTime = time.time() - provStartTime
+                    recordCmdLatency('provision-keypool' if keyPoolUsed == True else 'provision-keygen', provTime)
+
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_CRYPTO: Provisioning latency: %.2fs, key pool: %s" % (provTime, keyPoolUsed))
+                    # Print statement
                     else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_CRYPTO: Delete encrypted nc2vpn key files FAILED!")
-                            logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
-                        # Print statement
-                        else:
-                            print "DEBUG_CRYPTO: Delete encrypted nc2vpn key files FAILED!"
-                            print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
+                        print "DEBUG_CRYPTO: Provisioning latency: %.2fs, key pool: %s" % (provTime, keyPoolUsed)
+
+                    # Change LCD operation mode
+                    volJob.lcdOperSel = 3
+                    # Set status of encrypt process
+                    volJob.eCryptProc = True
 
-                        # Change LCD operation mode
-                        lcdOperSel = 13
-                        # Set status of decrypt process
-                        eCryptProc = False
-                        
                 # Operation failed
                 else:
                     # Write to logger
                     if backLogger == True:
-                        logger.info("DEBUG_CRYPTO: Delete public and private key FAILED!")
+                        logger.info("DEBUG_CRYPTO: %s FAILED!" % (failStep))
                         logger.info("DEBUG_CRYPTO: ENCRYPT process FAILED!")
                     # Print statement
                     else:
-                        print "DEBUG_CRYPTO: Delete public and private key FAILED!"
+                        print "DEBUG_CRYPTO: %s FAILED!" % (failStep)
                         print "DEBUG_CRYPTO: ENCRYPT process FAILED!"
 
                     # Change LCD operation mode
-                    lcdOperSel = 13
-                    # Set status of decrypt process
-                    eCryptProc = False
-    
+                    volJob.lcdOperSel = 13
+                    # Set status of encrypt process
+                    volJob.eCryptProc = False
+
 # Doing string manipulations
 def mid(s, offset, amount):
     return s[offset-1:offset+amount-1]
@@ -703,2709 +883,7042 @@ def readBattCapacity(bus):
 
     return capacity
 
-# Check the routing table IP address
-def chkRouteAddIpAddress (ipAddress, ipAddressCnt):
-    existCnt = 0
-    retResult = False
-    # Execute the command
-    process = subprocess.Popen(['route'], shell=True, stdout=subprocess.PIPE)
-    # Loop the result
+# Record external command execution latency inside the latency histogram
+def recordCmdLatency (cmdName, latency):
+    global cmdLatencyBkt
+    global cmdLatencyHist
+
+    cmdHistLock.acquire()
+    try:
+        # First record for this command
+        if cmdName not in cmdLatencyHist:
+            cmdLatencyHist[cmdName] = [0] * (len(cmdLatencyBkt) + 1)
+
+        # Find the histogram bucket, last bucket for latency above the highest bucket bound
+        bktIdx = len(cmdLatencyBkt)
+        for a in range(len(cmdLatencyBkt)):
+            if latency <= cmdLatencyBkt[a]:
+                bktIdx = a
+                break
+        cmdLatencyHist[cmdName][bktIdx] += 1
+    finally:
+        cmdHistLock.release()
+
+# Write current external command latency histogram to logger
+def logCmdLatencyHist ():
+    global backLogger
+    global cmdLatencyBkt
+    global cmdLatencyHist
+
+    cmdHistLock.acquire()
+    try:
+        histLines = []
+        for cmdName in sorted(cmdLatencyHist.keys()):
+            bktInfo = ''
+            for a in range(len(cmdLatencyHist[cmdName])):
+                # Bucket upper bound
+                if a < len(cmdLatencyBkt):
+                    bktInfo += '<=%ss:%s ' % (cmdLatencyBkt[a], cmdLatencyHist[cmdName][a])
+                # Overflow bucket
+                else:
+                    bktInfo += '>%ss:%s' % (cmdLatencyBkt[-1], cmdLatencyHist[cmdName][a])
+            histLines.append('%s [%s]' % (cmdName, bktInfo))
+    finally:
+        cmdHistLock.release()
+
+    for histLine in histLines:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CMD: Latency histogram: %s" % (histLine))
+        # Print statement
+        else:
+            print "DEBUG_CMD: Latency histogram: %s" % (histLine)
+
+# Execute external command as argument list (NO shell) with execution deadline and bounded output capture
+# Parameters:
+# cmdArgs    - Command argument list, e.g. ['ifconfig', 'wwan0', 'down']
+# timeOut    - Command execution deadline (seconds), command will be killed after the deadline
+# maxCapture - Maximum captured output size (bytes), stdout and stderr are merged unless errList given
+# streamFunc - Optional function called for each output line, return True to stop the command
+# cmdDir     - Optional command working directory
+# procList   - Optional list, the command process object are appended for termination by other thread
+# cmdInput   - Optional command input data through stdin
+# errList    - Optional list, stderr are captured separately (NOT merged into the output) and appended
+# Return:
+# retCode    - Command exit code, None when the command failed to execute or time out
+# stdout     - Captured command output
+def runCommand (cmdArgs, timeOut=None, maxCapture=None, streamFunc=None, cmdDir=None, procList=None, cmdInput=None, \
+                errList=None):
+    global backLogger
+    global cmdTimeOut
+    global cmdMaxCapture
+
+    retCode = None
+    outBuff = b''
+    errBuff = b''
+    lineBuff = b''
+    cmdStop = False
+    cmdTimeExp = False
+    cmdName = os.path.basename(cmdArgs[0])
+
+    if timeOut == None:
+        timeOut = cmdTimeOut
+    if maxCapture == None:
+        maxCapture = cmdMaxCapture
+
+    startTime = time.time()
+    deadLine = startTime + timeOut
+
+    # Start the command
+    try:
+        out = subprocess.Popen(cmdArgs, stdin=subprocess.PIPE if cmdInput != None else None, stdout=subprocess.PIPE, \
+                               stderr=subprocess.PIPE if errList != None else subprocess.STDOUT, cwd=cmdDir, close_fds=True)
+    except OSError as e:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CMD: Command [%s] execution FAILED! [%s]" % (cmdName, e))
+        # Print statement
+        else:
+            print "DEBUG_CMD: Command [%s] execution FAILED! [%s]" % (cmdName, e)
+
+        recordCmdLatency(cmdName, time.time() - startTime)
+        if errList != None:
+            errList.append(errBuff)
+        return retCode, outBuff
+
+    if procList != None:
+        procList.append(out)
+
+    # Command input through stdin, fed within the output read loop (large input NOT blocked by full output pipe)
+    inFd = None
+    if cmdInput != None:
+        inFd = out.stdin.fileno()
+        fcntl.fcntl(inFd, fcntl.F_SETFL, fcntl.fcntl(inFd, fcntl.F_GETFL) | os.O_NONBLOCK)
+
+    # Separate stderr, read within the output read loop (command NOT blocked by full stderr pipe)
+    errFd = None
+    if errList != None:
+        errFd = out.stderr.fileno()
+        fcntl.fcntl(errFd, fcntl.F_SETFL, fcntl.fcntl(errFd, fcntl.F_GETFL) | os.O_NONBLOCK)
+
+    # Read the command output until end of file or deadline
+    outFd = out.stdout.fileno()
     while True:
-        output = process.stdout.readline()
-        if output == '' and process.poll() is not None:
+        remTime = deadLine - time.time()
+        if remTime <= 0:
+            cmdTimeExp = True
             break
-        if output:
-            tempOut = output.strip()
-            #print tempOut
-            # Check through IP address buffer
-            for a in range(ipAddressCnt):
-                # IP address exist inside routing table
-                if ipAddress[a] in tempOut:
-                    #print 'masuk'
-                    #print ipAddress[a]
-                    existCnt += 1    
 
-    if existCnt > 0:
-        retResult = True
-            
-    return retResult
-                
-# KILL all openvpn instances
-def terminateOpenVpn (command):
-    openVpnPid = []
-    openVpnCnt = 0
+        # All input written, close stdin for end of file
+        if inFd != None and len(cmdInput) == 0:
+            out.stdin.close()
+            inFd = None
 
-    # Execute the command
-    process = subprocess.Popen([command], shell=True, stdout=subprocess.PIPE)
-    # Loop the result
-    while True:
-        output = process.stdout.readline()
-        if output == '' and process.poll() is not None:
+        rdList, wrList, exList = select.select([x for x in [outFd, errFd] if x != None], [inFd] if inFd != None else [], \
+                                               [], min(remTime, 0.1))
+        if len(wrList) > 0:
+            try:
+                cmdInput = cmdInput[os.write(inFd, cmdInput[:65536]):]
+            except OSError:
+                # Command exit without reading all input
+                cmdInput = b''
+
+        if len(rdList) == 0:
+            # Command already exit, output pipe may still held open by its background child
+            if len(wrList) == 0 and out.poll() != None:
+                break
+            continue
+
+        # Bounded stderr capture
+        if errFd in rdList:
+            chunk = os.read(errFd, 4096)
+            if chunk == b'':
+                errFd = None
+            elif len(errBuff) < maxCapture:
+                errBuff += chunk[:maxCapture - len(errBuff)]
+
+            if outFd not in rdList:
+                continue
+
+        chunk = os.read(outFd, 4096)
+        # End of file
+        if chunk == b'':
             break
-        if output:
-            tempOut = output.strip()
 
-            foundDig = False
-            pidNo = ''
-            respLen = len(tempOut)
-            
-            # Go through the read line
-            for a in range(0, (respLen + 1)):
-                oneChar = mid(tempOut, a, 1)
-                # Check PID digit
-                if oneChar.isdigit():
-                    foundDig = True
-                    pidNo += oneChar
-                elif foundDig == True and oneChar == ' ':
+        # Bounded output capture, the rest of the output are discarded
+        if len(outBuff) < maxCapture:
+            outBuff += chunk[:maxCapture - len(outBuff)]
+
+        # Stream the output line by line
+        if streamFunc != None:
+            lineBuff += chunk
+            while b'\n' in lineBuff:
+                oneLine, lineBuff = lineBuff.split(b'\n', 1)
+                if streamFunc(oneLine) == True:
+                    cmdStop = True
                     break
 
-            # First array index
-            if openVpnCnt == 0:
-                openVpnPid = [pidNo]
-                openVpnCnt += 1           
+            if cmdStop == True:
+                break
 
-            # Subsequent array index
-            else:
-                openVpnPid.append(pidNo)
-                openVpnCnt += 1
+            # Line without new line character, keep the buffer bounded
+            if len(lineBuff) > maxCapture:
+                lineBuff = lineBuff[-maxCapture:]
 
-    return openVpnPid, openVpnCnt
-                
-# Get the openvpn routing info
-def getOpenVpnRouteInfo (command):
-    routeInfo = []
-    routeInfoCnt = 0
-    timeOut = 0
-    openVpnStat = False
-    
-    # Execute the command
-    process = subprocess.Popen([command], shell=True, stdout=subprocess.PIPE)
-    # Loop until get ip routing info
-    while True:
-        output = process.stdout.readline()
-        if output == '' and process.poll() is not None:
+    # Wait for the command to exit within the deadline
+    if cmdTimeExp == False and cmdStop == False:
+        while out.poll() == None:
+            if time.time() >= deadLine:
+                cmdTimeExp = True
+                break
+            time.sleep(0.01)
+
+    # Deadline reached or stop requested, kill the command
+    if cmdTimeExp == True or cmdStop == True:
+        try:
+            out.kill()
+        except OSError:
+            pass
+        out.wait()
+
+    # Remaining stderr after the output end of file, pipe may still held open by its background child
+    while errFd != None and len(errBuff) < maxCapture:
+        try:
+            chunk = os.read(errFd, 4096)
+        except OSError:
             break
-        if output:
-            tempOut = output.strip()
-            # Getting the ip routing info
-            if 'ip route add' in tempOut:
-                # Get the 'ip route add' segment
-                ipRouteCmd = ''
-                #spaceCnt = 0
-                bSlashFound = False
-                getIpRoute = False
-                lenOut = len(tempOut)
+        if chunk == b'':
+            break
+        errBuff += chunk[:maxCapture - len(errBuff)]
+
+    if inFd != None:
+        out.stdin.close()
+    out.stdout.close()
+    if errList != None:
+        out.stderr.close()
+        errList.append(errBuff)
+    recordCmdLatency(cmdName, time.time() - startTime)
+
+    # Command time out
+    if cmdTimeExp == True:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CMD: Command [%s] TIME OUT after %ss" % (cmdName, timeOut))
+        # Print statement
+        else:
+            print "DEBUG_CMD: Command [%s] TIME OUT after %ss" % (cmdName, timeOut)
+    else:
+        retCode = out.returncode
 
-                # Go through the read line
-                for a in range(0, (lenOut + 1)):
-                    oneChar = mid(tempOut, a, 1)
-                    # Check for back slash character
-                    if oneChar == '/' and getIpRoute == False:
-                        ipRouteCmd += oneChar
-                        getIpRoute = True
-                    # Start get the ip route add rules 
-                    elif getIpRoute == True:
-                        ipRouteCmd += oneChar
-                        
-##                    # Count space char 
-##                    if oneChar == ' ' and getIpRoute == False:
-##                        spaceCnt += 1
-##                        if spaceCnt == 5:
-##                            getIpRoute = True
-##
-##                    # Start get the ip route add rules 
-##                    elif getIpRoute == True:
-##                        ipRouteCmd += oneChar 
+    return retCode, outBuff
 
-                # First array index
-                if routeInfoCnt == 0:
-                    routeInfo = [ipRouteCmd]
-                    routeInfoCnt += 1    
+# Start external command as argument list (NO shell) in background, command output are discarded
+# Parameters:
+# inFd  - Optional command stdin file descriptor, read from its current position
+# outFd - Optional command stdout file descriptor instead of discarded, written from its current position
+# Return: Command process object, None when the command failed to execute
+def spawnCommand (cmdArgs, cmdDir=None, inFd=None, outFd=None):
+    global backLogger
 
-                # Subsequent array index
-                else:
-                    routeInfo.append(ipRouteCmd)
-                    routeInfoCnt += 1
+    devNull = open(os.devnull, 'w')
+    try:
+        out = subprocess.Popen(cmdArgs, stdin=inFd, stdout=outFd if outFd != None else devNull, stderr=devNull, cwd=cmdDir, \
+                               close_fds=True)
+    except OSError as e:
+        out = None
+
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CMD: Command [%s] execution FAILED! [%s]" % (os.path.basename(cmdArgs[0]), e))
+        # Print statement
+        else:
+            print "DEBUG_CMD: Command [%s] execution FAILED! [%s]" % (os.path.basename(cmdArgs[0]), e)
+    devNull.close()
 
-            # Exit loop
-            elif 'Initialization Sequence Completed' in tempOut:
-                openVpnStat = True
-                break    
-            
-            #time.sleep(1)
+    return out
 
-            timeOut += 1
-            # 1 minute time out in case failed to initiate openvpn
-            if timeOut == 500:
-                openVpnStat = False
-                break
+# Write value to sysfs/procfs file
+# Return: True when write successful
+def writeSysFile (filePath, value):
+    try:
+        sysFile = open(filePath, 'w')
+        try:
+            sysFile.write(value)
+        finally:
+            sysFile.close()
+    except (IOError, OSError):
+        return False
 
-    # Previously initiate openvpn successfull
-    if openVpnStat == True:
-        # Kill back the openvpn instances
-        openVpnPID = []    # Current openvpn PID instances
-        openVpnPIDCnt = 0  # Current openvpn PID counter
+    return True
 
-        # Get openvpn PID
-        openVpnPID, openVpnPIDCnt = terminateOpenVpn('ps aux | grep -v grep | grep openvpn')
-        # Openvpn instances exist
-        if openVpnPIDCnt > 0:
-            # Execute kill instance command
-            for a in range (openVpnPIDCnt):
-                tempArgs = 'kill -9 ' + openVpnPID[a]
-                
-                out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
-                
-                # NO error after command execution
-                if stderr == None:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a]))
-                    # Print statement
-                    else:
-                        print "DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a])
+# Read sysfs/procfs file
+# Return: File content without trailing new line, empty string when read failed
+def readSysFile (filePath):
+    try:
+        sysFile = open(filePath, 'r')
+        try:
+            return sysFile.read().strip()
+        finally:
+            sysFile.close()
+    except (IOError, OSError):
+        return ''
+
+# Check network interface UP (IFF_UP) flag
+def chkIfUp (ifName):
+    ifFlags = readSysFile('/sys/class/net/' + ifName + '/flags')
+    if ifFlags == '':
+        return False
+
+    return (int(ifFlags, 16) & 0x1) == 0x1
+
+# Get network interface IPv4 address (SIOCGIFADDR)
+# Return: IPv4 address, empty string when the interface has no IPv4 address
+def getIfIpAddress (ifName):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        ifReq = fcntl.ioctl(sock.fileno(), 0x8915, struct.pack(b'256s', ifName.encode('ascii')[:15]))
+        return socket.inet_ntoa(ifReq[20:24])
+    except IOError:
+        return ''
+    finally:
+        sock.close()
+
+# Poll the condition function until it return True or time out, replacing fixed delay between commands
+# Return: True when the condition are met before time out
+def waitForCondition (chkFunc, timeOut, pollIntv=0.05):
+    deadLine = time.time() + timeOut
+    while True:
+        if chkFunc() == True:
+            return True
+        if time.time() >= deadLine:
+            return False
+        time.sleep(pollIntv)
+
+# Create sealed memory file (memfd), the content can not be modified after sealed
+# F_ADD_SEALS (1033): F_SEAL_SEAL (1) | F_SEAL_SHRINK (2) | F_SEAL_GROW (4) | F_SEAL_WRITE (8)
+# Return: File descriptor, -1 when memfd not supported
+def createSealedMemfd (memName, data):
+    try:
+        memfdCreate = ctypes.CDLL(None, use_errno=True).memfd_create
+    except AttributeError:
+        return -1
 
-        # There is NO openvpn instances
+    # MFD_CLOEXEC (1) | MFD_ALLOW_SEALING (2)
+    memFd = memfdCreate(memName.encode('ascii'), 3)
+    if memFd < 0:
+        return -1
+
+    try:
+        while len(data) > 0:
+            data = data[os.write(memFd, data):]
+        fcntl.fcntl(memFd, 1033, 15)
+    except (IOError, OSError):
+        os.close(memFd)
+        return -1
+
+    return memFd
+
+# Build single OpenVPN configuration with the referenced key files inline (<ca>, <cert>, <key>, ...)
+# Configuration and key files are handled as byte string, non-ASCII content (e.g. UTF-8 comment) are kept as is
+# Return: OpenVPN configuration (byte string), None when the configuration reference file that can not be inline
+def inlineOvpnConfig (filePath):
+    inlineTag = [b'ca', b'cert', b'key', b'dh', b'extra-certs', b'tls-auth', b'tls-crypt', b'secret']
+    fileTag = [b'pkcs12', b'auth-user-pass', b'crl-verify', b'askpass', b'tls-crypt-v2', b'http-proxy-user-pass']
+    fileDir = os.path.dirname(filePath)
+    if isinstance(fileDir, unicode) == True:
+        fileDir = fileDir.encode('utf-8')
+    ovpnConf = []
+
+    try:
+        ovpnFile = open(filePath, 'rb')
+        try:
+            ovpnData = ovpnFile.read()
+        finally:
+            ovpnFile.close()
+
+        for oneLine in ovpnData.split(b'\n'):
+            ovpnField = oneLine.strip().split()
+            if len(ovpnField) > 1 and ovpnField[0] in inlineTag and ovpnField[1] != b'[inline]':
+                keyFile = open(os.path.join(fileDir, ovpnField[1]), 'rb')
+                try:
+                    keyData = keyFile.read().strip()
+                finally:
+                    keyFile.close()
+
+                ovpnConf.append(b'<%s>\n%s\n</%s>' % (ovpnField[0], keyData, ovpnField[0]))
+                # tls-auth/secret key direction
+                if len(ovpnField) > 2:
+                    ovpnConf.append(b'key-direction ' + ovpnField[2])
+
+            # Referenced file can not be inline
+            elif len(ovpnField) > 1 and ovpnField[0] in fileTag and ovpnField[1] != b'[inline]':
+                return None
+            else:
+                ovpnConf.append(oneLine)
+    except (IOError, OSError):
+        return None
+
+    return b'\n'.join(ovpnConf) + b'\n'
+
+# Load decrypted nc2vpn key into sealed memory file, and remove the decrypted nc2vpn key files
+# OpenVPN read the configuration through /proc/<pid>/fd/<fd> path
+# Return: OpenVPN configuration path, the decrypted .ovpn file path when sealed memory file not supported
+def loadOvpnMemfd (fileName):
+    global backLogger
+    global nc2VpnKeyTPath
+    global ovpnMemfd
+
+    filePath = os.path.join(nc2VpnKeyTPath, fileName)
+    ovpnConf = inlineOvpnConfig(filePath)
+    saveOvpnStandby(ovpnConf if ovpnConf != None else b'')
+    memFd = -1
+    if ovpnConf != None:
+        memFd = createSealedMemfd('scssgw-nc2vpn', ovpnConf)
+
+    # Sealed memory file not supported, use the decrypted nc2vpn key files
+    if memFd < 0:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CRYPTO: Load nc2vpn key into sealed memory file FAILED!, use decrypted file")
+        # Print statement
         else:
+            print "DEBUG_CRYPTO: Load nc2vpn key into sealed memory file FAILED!, use decrypted file"
+
+        seedDnsRemote(filePath)
+        return filePath
+
+    releaseOvpnMemfd()
+    ovpnMemfd['fd'] = memFd
+    ovpnMemfd['path'] = '/proc/%d/fd/%d' % (os.getpid(), memFd)
+    seedDnsRemote(ovpnMemfd['path'])
+
+    # Reconnect without decrypt nc2vpn key again
+    cacheOvpnKey(ovpnConf)
+
+    return ovpnMemfd['path']
+
+# Crypto key pool monitoring, pre-generate public and private key pair at idle priority
+# Each key pair are generated inside temporary directory and renamed to 'key-<time>' when completed
+def keyPoolMon (threadname, delay):
+    global backLogger
+    global keyPoolPath
+    global keyPoolSize
+    global keyPoolLock
+
+    genScript = os.path.abspath('generate_keys.py')
+
+    if path.exists(keyPoolPath) == False:
+        os.makedirs(keyPoolPath, 0o700)
+    os.chmod(keyPoolPath, 0o700)
+
+    # Remove incomplete key pair from previous run
+    for files in os.listdir(keyPoolPath):
+        if files.startswith('gen-') == True:
+            shutil.rmtree(os.path.join(keyPoolPath, files), True)
+
+    # Forever loop
+    while True:
+        time.sleep(delay)
+
+        keyPoolLock.acquire()
+        keyCnt = len([y for y in os.listdir(keyPoolPath) if y.startswith('key-') == True])
+        keyPoolLock.release()
+
+        # Key pool full
+        if keyCnt >= keyPoolSize:
+            continue
+
+        genPath = os.path.join(keyPoolPath, 'gen-%d' % (int(time.time() * 1000)))
+        os.mkdir(genPath, 0o700)
+
+        # Generate key pair at lowest CPU priority
+        startTime = time.time()
+        retCode, stdout = runCommand(['nice', '-n', '19', 'python3', genScript], 600, cmdDir=genPath)
+
+        if retCode == 0 and path.exists(os.path.join(genPath, 'key.public')) == True \
+                and path.exists(os.path.join(genPath, 'key.private')) == True:
+            keyPoolLock.acquire()
+            os.rename(genPath, os.path.join(keyPoolPath, 'key-' + os.path.basename(genPath)[4:]))
+            keyPoolLock.release()
+
             # Write to logger
             if backLogger == True:
-                logger.info("DEBUG_UTOUCH: NO OpenVPN instance EXIST!")
+                logger.info("DEBUG_CRYPTO: Key pool generate key pair successful, %.2fs, pool: %s/%s" % (time.time() - startTime, keyCnt + 1, keyPoolSize))
             # Print statement
             else:
-                print "DEBUG_UTOUCH: NO OpenVPN instance EXIST!" 
-    
-    return routeInfo, routeInfoCnt
+                print "DEBUG_CRYPTO: Key pool generate key pair successful, %.2fs, pool: %s/%s" % (time.time() - startTime, keyCnt + 1, keyPoolSize)
 
-# Check and monitor USB thumb drive plug in status
-def checkUSBUtouchStatus (threadname, delay):
-    global eCryptProc
-    global dCryptProc
-    global initPihole
-    global wifiShutDown
-    
-    # Forever loop
-    while True:
-        # Loop every 0.5s
-        time.sleep(delay)
+        else:
+            shutil.rmtree(genPath, True)
 
-        context = pyudev.Context()
-        monitor = pyudev.Monitor.from_netlink(context)
-        monitor.filter_by(subsystem='usb')
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_CRYPTO: Key pool generate key pair FAILED!")
+            # Print statement
+            else:
+                print "DEBUG_CRYPTO: Key pool generate key pair FAILED!"
 
-        monitor.start()
-        for device in iter(monitor.poll, None):
-            if device.action != 'add':
-                if eCryptProc == True or dCryptProc == True:
-                    # STOP VPN tunnel
-                    openVpnPID = []    # Current openvpn PID instances
-                    openVpnPIDCnt = 0  # Current openvpn PID counter
+            # Wait longer before retry
+            time.sleep(delay * 10)
 
-                    # Get openvpn PID
-                    openVpnPID, openVpnPIDCnt = terminateOpenVpn('ps aux | grep -v grep | grep openvpn')
-                    # Openvpn instances exist
-                    if openVpnPIDCnt > 0:
-                        # Execute kill instance command
-                        for a in range (openVpnPIDCnt):
-                            tempArgs = 'kill -9 ' + openVpnPID[a]
-                            
-                            out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                            stdout,stderr = out.communicate()
-                            
-                            # NO error after command execution
-                            if stderr == None:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_USBUTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a]))
-                                # Print statement
-                                else:
-                                    print "DEBUG_USBUTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a])
+# Take pre-generated public and private key pair from the key pool into the key directory
+# keyDir - Destination directory of key.public and key.private
+# Return: Return code and output in generate_keys.py format, return code None when key pool empty
+def getPoolKeyPair (keyDir):
+    global keyPoolPath
+    global keyPoolLock
 
-                    # There is NO openvpn instances
-                    else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_USBUTOUCH: NO OpenVPN instance EXIST!")
-                        # Print statement
-                        else:
-                            print "DEBUG_USBUTOUCH: NO OpenVPN instance EXIST!"
+    retCode = None
+    stdout = b''
 
-                    dCryptProc = False
-                    eCryptProc = False
-                    initPihole = False
-                    wifiShutDown = False
-                    
-# Communication and process monitoring for Ubuntu Touch smartphone
-def uTouchCommProc (threadname, delay):
+    keyPoolLock.acquire()
+    try:
+        keyList = []
+        if path.exists(keyPoolPath) == True:
+            keyList = sorted([y for y in os.listdir(keyPoolPath) if y.startswith('key-') == True])
+
+        if len(keyList) > 0:
+            keyPath = os.path.join(keyPoolPath, keyList[0])
+            for keyFile in ['key.public', 'key.private']:
+                shutil.move(os.path.join(keyPath, keyFile), os.path.join(keyDir, keyFile))
+                stdout += b'Generated %s key at: %s\n' % (keyFile[4:], os.path.join(keyDir, keyFile))
+
+            os.rmdir(keyPath)
+            retCode = 0
+    except (IOError, OSError):
+        retCode = None
+    finally:
+        keyPoolLock.release()
+
+    return retCode, stdout
+
+# Create crypto staging directory inside RAM (tmpfs), only accessible by root
+# Return: Staging directory path
+def createCryptoStage (stageName):
+    global cryptoStagePath
+
+    if path.exists(cryptoStagePath) == False:
+        os.makedirs(cryptoStagePath, 0o700)
+
+    stageDir = os.path.join(cryptoStagePath, '%s-%d-%s' % (stageName, os.getpid(), os.urandom(8).encode('hex')))
+    os.mkdir(stageDir, 0o700)
+
+    return stageDir
+
+# Replace the gateway crypto public key, encrypted nc2vpn key directory and nc2vpn key archive with the USB encrypt
+# process result, serialised by cryptoStoreLock. Crypto and file copy to the USB volume are done outside the lock
+# Parameters:
+# pubKey     - New crypto public key
+# pubKeyPath - Gateway crypto public key path
+# bundleDir  - New encrypted nc2vpn key directory, same filesystem as keyDir
+# keyDir     - Encrypted nc2vpn key directory
+# archPath   - New nc2vpn key archive, empty string when NO OpenVPN profile archived
+# volJob     - USB volume job, new sequence taken when replaced
+# Return: retCode (0 when successful, None when failed) and previous encrypted nc2vpn key directory to be wiped
+def storeCryptoKey (pubKey, pubKeyPath, bundleDir, keyDir, archPath, volJob=None):
+    global cryptoStoreLock
+    global nc2VpnArchPath
+    global volJobSeq
+
+    oldDir = ''
+    cryptoStoreLock.acquire()
+    try:
+        # Public key replaced, previous private key never kept
+        retCode, stdout = wipePath([pubKeyPath, os.path.join(os.path.dirname(pubKeyPath), 'key.private')])
+        if retCode == 0:
+            retCode, stdout = copyFileSync(pubKey, pubKeyPath)
+
+        if retCode == 0:
+            if path.exists(keyDir) == True:
+                oldDir = bundleDir + '.old'
+                os.rename(keyDir, oldDir)
+            os.rename(bundleDir, keyDir)
+
+            if archPath != '':
+                os.rename(archPath, nc2VpnArchPath)
+            elif path.exists(nc2VpnArchPath) == True:
+                os.remove(nc2VpnArchPath)
+            fsyncPath(os.path.dirname(os.path.abspath(keyDir)))
+
+            if volJob != None:
+                volJobSeq += 1
+                volJob.seq = volJobSeq
+    except OSError:
+        retCode = None
+    finally:
+        cryptoStoreLock.release()
+
+    return retCode, oldDir
+
+# Replace the decrypted nc2vpn key with the USB decrypt process result, serialised by cryptoStoreLock
+# Parameters:
+# stageDir - Decrypted nc2vpn key staging directory, same filesystem as keyTPath
+# keyTPath - Decrypted nc2vpn key temporary directory
+# volJob   - USB volume job, new sequence taken when replaced
+# Return: True when successful
+def storeDecryptedOvpn (stageDir, keyTPath, volJob=None):
+    global cryptoStoreLock
+    global volJobSeq
+
+    cryptoStoreLock.acquire()
+    try:
+        if releaseOvpnMemfd() == False:
+            return False
+
+        for files in os.listdir(stageDir):
+            os.rename(os.path.join(stageDir, files), os.path.join(keyTPath, files))
+
+        if volJob != None:
+            volJobSeq += 1
+            volJob.seq = volJobSeq
+    except OSError:
+        return False
+    finally:
+        cryptoStoreLock.release()
+
+    return True
+
+# Start USB volume job with new sequence
+# Return: USB volume job
+def startVolumeJob ():
+    global cryptoStoreLock
+    global volJobSeq
+
+    cryptoStoreLock.acquire()
+    try:
+        volJobSeq += 1
+        return VolumeJob(volJobSeq)
+    finally:
+        cryptoStoreLock.release()
+
+# Publish USB volume job result to USB path, LCD operation mode and crypto process status, serialised by
+# cryptoStoreLock. Concurrent USB volume job only published when NO newer job (latest crypto store replacement or
+# started later) already published, so the published USB path always match the current crypto store
+# Return: True when published
+def publishVolumeJob (volJob):
+    global cryptoStoreLock
+    global volPubSeq
+    global currUSBPath
+    global lcdOperSel
     global dCryptProc
-    global nc2VpnKeyTPath
-    global nc2VpnKeyPath
-    global initPihole
-    global wifiShutDown
     global eCryptProc
+
+    cryptoStoreLock.acquire()
+    try:
+        if volJob.seq < volPubSeq:
+            return False
+        volPubSeq = volJob.seq
+
+        if volJob.usbPath != '':
+            currUSBPath = volJob.usbPath
+        if volJob.lcdOperSel != None:
+            lcdOperSel = volJob.lcdOperSel
+        if volJob.dCryptProc != None:
+            dCryptProc = volJob.dCryptProc
+        if volJob.eCryptProc != None:
+            eCryptProc = volJob.eCryptProc
+    finally:
+        cryptoStoreLock.release()
+
+    return True
+
+# Wrap secret with the crypto public key (RSA-OAEP)
+# Return: Wrapped secret, None when failed
+def wrapSecret (pubKey, secret):
+    outPath = createTempFile(b'')
+    try:
+        retCode, stdout = runCommand(['openssl', 'pkeyutl', '-encrypt', '-pubin', '-inkey', pubKey, '-pkeyopt', 'rsa_padding_mode:oaep', '-out', outPath], 30, cmdInput=secret)
+        if retCode != 0:
+            return None
+        outFile = open(outPath, 'rb')
+        try:
+            wrapData = outFile.read()
+        finally:
+            outFile.close()
+    finally:
+        wipeFile(outPath)
+
+    return wrapData
+
+# Unwrap secret wrapped by wrapSecret() with the crypto private key
+# Return: Secret, None when failed
+def unwrapSecret (privKey, wrapData):
     global backLogger
-    global currUSBPath
-    
-    networkManFailed = False
-    initOthers = False
-    nc2VpnTunn = False
-        
-    fileDel = False
-    fileExist = False
-    fileName = ''
-        
-    checkProcCnt = 0
-    pingAtmptCnt = 0
-    vpnTunAtmptCnt = 0
-    piHoleCnt = 0
-    
-    ipRouteArr = []  # Ip route add command that not successfully initiate by openvpn
-    ipRouteCnt = 0   # Ip route add index counter
-    execSuccCnt = 0  # Ip route add process success counter
-        
-    # Forever loop
-    while True:
-        # Loop every 0.5s
-        time.sleep(delay)
 
-        # Previously there was encryption process take place
-        # Start decryption process for secure gateway initialization
-        if eCryptProc == True:
-            # Clear encryption process
-            eCryptProc = False
-            # Set status of decrypt process
-            dCryptProc = True
-                        
-##            # Write to logger
-##            if backLogger == True:
-##                logger.info("DEBUG_UTOUCH: Start DECRYPT process")
-##            # Print statement
-##            else:
-##                print "DEBUG_UTOUCH: Start DECRYPT process"
-##
-##            # Delete the contents of nc2vpn key inside temporary folder
-##            tempArgs = 'cd ' + nc2VpnKeyTPath + ';rm -rf *'
-##            out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-##            stdout,stderr = out.communicate()
-##
-##            # NO error after command execution
-##            if stderr == None:
-##                # Write to logger
-##                if backLogger == True:
-##                    logger.info("DEBUG_UTOUCH: Delete temporary nc2vpn key files successful")
-##                # Print statement
-##                else:
-##                    print "DEBUG_UTOUCH: Delete temporary nc2vpn key files successful"
-##
-##                # Wait before execute another command
-##                time.sleep(1)
-##            
-##                # Start decrypt the nc2vpn key and stored it inside temporary folder
-##                # Command:
-##                # python3 decrypt.py --source=/path/to/your/drive/ --destination=/path/to/your/drive/ --private-key=/path/to/your/key.private
-##                tempPrivKeyPath = currUSBPath + '/key.private'
-##                out = subprocess.Popen(['python3', 'decrypt.py', '--source', nc2VpnKeyPath, '--destination', nc2VpnKeyTPath, '--private-key', tempPrivKeyPath], \
-##                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-##                stdout,stderr = out.communicate()
-##
-##                # NO error after command execution
-##                if stderr == None:
-##                    if 'Decrypting:' in stdout:
-##                        # Write to logger
-##                        if backLogger == True:
-##                            logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key successful")
-##                        # Print statement
-##                        else:
-##                            print "DEBUG_UTOUCH: Decrypt nc2vpn key successful"
-##
-##                        # Clear encryption process
-##                        eCryptProc = False
-##                        # Set status of decrypt process
-##                        dCryptProc = True
-##                    # Operation failed
-##                    else:
-##                        # Write to logger
-##                        if backLogger == True:
-##                            logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!")
-##                            logger.info("DEBUG_UTOUCH: DECRYPT process FAILED!")
-##                        # Print statement
-##                        else:
-##                            print "DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!"
-##                            print "DEBUG_UTOUCH: DECRYPT process FAILED!"
-##
-##                        # Set status of decrypt process
-##                        dCryptProc = False
-##                        
-##                # Operation failed
-##                else:
-##                    # Write to logger
-##                    if backLogger == True:
-##                        logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!")
-##                        logger.info("DEBUG_UTOUCH: DECRYPT process FAILED!")
-##                    # Print statement
-##                    else:
-##                        print "DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!"
-##                        print "DEBUG_UTOUCH: DECRYPT process FAILED!"
-##
-##                    # Set status of decrypt process
-##                    dCryptProc = False
-##                        
-##            # Operation failed
-##            else:
-##                # Write to logger
-##                if backLogger == True:
-##                    logger.info("DEBUG_UTOUCH: Delete temporary nc2vpn key files FAILED!")
-##                    logger.info("DEBUG_UTOUCH: DECRYPT process FAILED!")
-##                # Print statement
-##                else:
-##                    print "DEBUG_UTOUCH: Delete temporary nc2vpn key files FAILED!"
-##                    print "DEBUG_UTOUCH: DECRYPT process FAILED!"
-##
-##                # Set status of decrypt process
-##                dCryptProc = False
-                
-        # Only check other networks process when USB thumb drive are plug in
-        elif dCryptProc == True:
-            # Start back WIFI
-            if wifiShutDown == True:
-                # Enable WIFI radio hardware    
-                out = subprocess.Popen(["nmcli radio wifi on"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
+    errList = []
+    retCode, stdout = runCommand(['openssl', 'pkeyutl', '-decrypt', '-inkey', privKey, '-pkeyopt', 'rsa_padding_mode:oaep'], 30, cmdInput=wrapData, \
+                                 errList=errList)
+    if retCode != 0 or len(stdout) != 64:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CRYPTO: Unwrap secret FAILED! [%s]" % (b''.join(errList).strip()))
+        # Print statement
+        else:
+            print "DEBUG_CRYPTO: Unwrap secret FAILED! [%s]" % (b''.join(errList).strip())
 
-                # NO error after command execution
-                if stderr == None:
-                    wifiShutDown = False
-                    
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_UTOUCH: Bring UP WIFI SUCCESSFULL")
-                    # Print statement
-                    else:
-                        print "DEBUG_UTOUCH: Bring UP WIFI SUCCESSFULL"
+        return None
 
-                    # Wait before execute another command
-                    time.sleep(1)
-                            
-                    # Restart network-manager service
-                    out = subprocess.Popen(["service network-manager restart"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+    return stdout
 
-                    # NO error after command execution
-                    if stderr == None:
-                        # Restart network-manager successful
-                        if 'start/running' in stdout:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_UTOUCH: RESTART network-manager SUCCESSFULL")
-                            # Print statement
-                            else:
-                                print "DEBUG_UTOUCH: RESTART network-manager SUCCESSFULL"
-                
-                            networkManFailed = False  # Clear network-manager check flag, all is running well, no need to check it
-                            initOthers = True         # Set flag for process initialization and status check
-                                
-                        # Restart network-manager failed!
-                        else:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle")
-                            # Print statement
-                            else:
-                                print "DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle"
+# Stream file content through openssl enc (AES-256-CBC, PBKDF2 key derivation), file content are NOT read into memory
+# Parameters:
+# cipherMode - 'encrypt' or 'decrypt'
+# secret     - Cipher secret
+# srcFd      - Source file descriptor, read from the current position until end of file
+# dstFd      - Destination file descriptor, written from the current position
+# Return: True when successful
+def streamUserCipher (cipherMode, secret, srcFd, dstFd):
+    passPath = createTempFile(secret)
+    try:
+        cipherArgs = ['-d'] if cipherMode == 'decrypt' else []
+        cipherProc = spawnCommand(['openssl', 'enc'] + cipherArgs + ['-aes-256-cbc', '-pbkdf2', '-pass', 'file:' + passPath], \
+                                  inFd=srcFd, outFd=dstFd)
+        if cipherProc == None:
+            return False
+
+        if waitForCondition(lambda: cipherProc.poll() != None, 120, 0.005) == False:
+            cipherProc.kill()
+            cipherProc.wait()
+            return False
+    finally:
+        wipeFile(passPath)
+
+    return cipherProc.returncode == 0
+
+# AF_ALG control message (struct cmsghdr, SOL_ALG level), data aligned to the native long size
+# Return: Control message data
+def afAlgControl (cmsgType, cmsgData):
+    longSize = ctypes.sizeof(ctypes.c_long)
+    hdrSize = (struct.calcsize('@Lii') + longSize - 1) & ~(longSize - 1)
+    dataSize = (len(cmsgData) + longSize - 1) & ~(longSize - 1)
+
+    # SOL_ALG (279)
+    return struct.pack('@Lii', hdrSize + len(cmsgData), 279, cmsgType).ljust(hdrSize, b'\x00') + cmsgData.ljust(dataSize, b'\x00')
+
+# Stream file content through Linux kernel crypto API (AF_ALG skcipher cbc(aes)), kernel may use optimised AES
+# implementation (NEON, ARMv8 CE). Output are the same as openssl enc -aes-256-cbc -pbkdf2 ('Salted__' header, key and IV
+# by PBKDF2-HMAC-SHA256 10000 iterations), both backend decrypt each other output
+# File content are transferred with splice (file -> pipe -> AF_ALG socket) without copy into userspace, the whole file
+# are one cipher operation (IV chained by the kernel), only the last partial block (PKCS#7 padding) are sent from
+# userspace
+# Parameters:
+# cipherMode - 'encrypt' or 'decrypt'
+# secret     - Cipher secret
+# srcFd      - Source file descriptor, read from the current position until end of file
+# dstFd      - Destination file descriptor, written from the current position
+# Return: True when successful, False when AF_ALG not supported or failed
+def afAlgStreamCipher (cipherMode, secret, srcFd, dstFd):
+    global cipherChunkSize
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.splice.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint]
+    libc.splice.restype = ctypes.c_ssize_t
+
+    # Read exact length, empty string when end of file reached before
+    def readAll (inFd, readLen):
+        readData = b''
+        while len(readData) < readLen:
+            oneRead = os.read(inFd, readLen - len(readData))
+            if oneRead == b'':
+                return b''
+            readData += oneRead
+        return readData
+
+    def writeAll (outFd, writeData):
+        while len(writeData) > 0:
+            writeData = writeData[os.write(outFd, writeData):]
+
+    fdList = []
+    try:
+        # AF_ALG (38), SOCK_SEQPACKET (5), struct sockaddr_alg
+        tfmFd = libc.socket(38, 5, 0)
+        if tfmFd < 0:
+            return False
+        fdList.append(tfmFd)
+
+        algAddr = struct.pack('=H14sII64s', 38, b'skcipher', 0, 0, b'cbc(aes)')
+        if libc.bind(tfmFd, algAddr, len(algAddr)) < 0:
+            return False
+
+        # Salt from openssl enc header when decrypt
+        srcLen = os.fstat(srcFd).st_size - os.lseek(srcFd, 0, os.SEEK_CUR)
+        if cipherMode == 'encrypt':
+            cipherSalt = os.urandom(8)
+            bodyLen = srcLen - srcLen % 16
+        else:
+            hdrData = readAll(srcFd, 16)
+            if hdrData[:8] != b'Salted__' or srcLen < 32 or srcLen % 16 != 0:
+                return False
+            cipherSalt = hdrData[8:]
+            bodyLen = srcLen - 16
+
+        # SOL_ALG (279), ALG_SET_KEY (1)
+        keyData = hashlib.pbkdf2_hmac(b'sha256', secret, cipherSalt, 10000, 48)
+        if libc.setsockopt(tfmFd, 279, 1, keyData[:32], 32) < 0:
+            return False
+
+        opFd = libc.accept(tfmFd, None, None)
+        if opFd < 0:
+            return False
+        fdList.append(opFd)
+
+        # ALG_SET_OP (3) - ALG_OP_ENCRYPT (1) or ALG_OP_DECRYPT (0), ALG_SET_IV (2) - struct af_alg_iv
+        ctrlData = afAlgControl(3, struct.pack('=I', 1 if cipherMode == 'encrypt' else 0)) + \
+                   afAlgControl(2, struct.pack('=I', 16) + keyData[32:])
+        ctrlBuff = ctypes.create_string_buffer(ctrlData, len(ctrlData))
+        # struct msghdr, NO data, MSG_MORE (0x8000) - cipher operation NOT finished yet
+        msgHdr = ctypes.create_string_buffer(struct.pack('@PIPLPLi', 0, 0, 0, 0, ctypes.addressof(ctrlBuff), len(ctrlData), 0), 64)
+        if libc.sendmsg(opFd, msgHdr, 0x8000) < 0:
+            return False
+
+        pipeRd, pipeWr = os.pipe()
+        fdList.extend([pipeRd, pipeWr])
+
+        if cipherMode == 'encrypt':
+            writeAll(dstFd, b'Salted__' + cipherSalt)
+
+        sentLen = 0
+        recvLen = 0
+        outData = b''
+        while sentLen < bodyLen:
+            # SPLICE_F_MOVE (1)
+            inLen = libc.splice(srcFd, None, pipeWr, None, min(cipherChunkSize, bodyLen - sentLen), 1)
+            if inLen <= 0:
+                return False
+            sentLen += inLen
+
+            while inLen > 0:
+                # SPLICE_F_MOVE (1) | SPLICE_F_MORE (4), cipher operation NOT finished yet
+                outLen = libc.splice(pipeRd, None, opFd, None, inLen, 5)
+                if outLen <= 0:
+                    return False
+                inLen -= outLen
+
+            # Full blocks are processed, last decrypted block are kept for the padding
+            readLen = sentLen - sentLen % 16 - recvLen
+            if readLen > 0:
+                oneRead = readAll(opFd, readLen)
+                if oneRead == b'':
+                    return False
+                recvLen += readLen
+                outData += oneRead
+
+            if cipherMode == 'encrypt':
+                writeAll(dstFd, outData)
+                outData = b''
+            elif len(outData) > 16:
+                writeAll(dstFd, outData[:-16])
+                outData = outData[-16:]
+
+        # Finish the cipher operation, last partial block with PKCS#7 padding when encrypt
+        if cipherMode == 'encrypt':
+            tailData = readAll(srcFd, srcLen - bodyLen)
+            tailData += chr(16 - len(tailData)) * (16 - len(tailData))
+            if libc.send(opFd, tailData, len(tailData), 0) != len(tailData):
+                return False
+            sentLen += len(tailData)
+        elif libc.send(opFd, None, 0, 0) < 0:
+            return False
+
+        if sentLen > recvLen:
+            oneRead = readAll(opFd, sentLen - recvLen)
+            if oneRead == b'':
+                return False
+            outData += oneRead
+
+        # Remove PKCS#7 padding, invalid padding when decrypted by the wrong secret
+        if cipherMode == 'decrypt':
+            padLen = ord(outData[-1:])
+            if padLen < 1 or padLen > 16 or outData[-padLen:] != chr(padLen) * padLen:
+                return False
+            outData = outData[:-padLen]
+        writeAll(dstFd, outData)
+
+        return True
+    except (IOError, OSError):
+        return False
+    finally:
+        for fd in fdList:
+            os.close(fd)
+
+# Stream file content through the selected cipher backend, fallback to userspace (openssl enc) when kernel crypto API
+# failed. Source and destination are restarted from its original position before the fallback
+# Return: True when successful
+def streamCipher (cipherMode, secret, srcFd, dstFd):
+    global cipherBackend
+
+    if cipherBackend == '':
+        selectCipherBackend()
+
+    if cipherBackend == 'af_alg':
+        srcPos = os.lseek(srcFd, 0, os.SEEK_CUR)
+        dstPos = os.lseek(dstFd, 0, os.SEEK_CUR)
+        if afAlgStreamCipher(cipherMode, secret, srcFd, dstFd) == True:
+            return True
+
+        os.lseek(srcFd, srcPos, os.SEEK_SET)
+        os.ftruncate(dstFd, dstPos)
+        os.lseek(dstFd, dstPos, os.SEEK_SET)
+
+    return streamUserCipher(cipherMode, secret, srcFd, dstFd)
+
+# Stream file through the cipher backend function
+# Return: True when successful
+def cipherFile (cipherFunc, cipherMode, secret, srcPath, dstPath):
+    srcFd = os.open(srcPath, os.O_RDONLY)
+    try:
+        dstFd = os.open(dstPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            return cipherFunc(cipherMode, secret, srcFd, dstFd)
+        finally:
+            os.close(dstFd)
+    finally:
+        os.close(srcFd)
+
+# Benchmark and select the faster nc2vpn key bundle cipher backend, encrypt and decrypt throughput of each backend are
+# reported. Kernel crypto API output are verified by openssl enc (compatible bundle file)
+# Return: Selected backend
+def selectCipherBackend ():
+    global backLogger
+    global cipherBackend
+    global cipherBenchSize
 
-                            networkManFailed = True  # Set network-manager check flag, network problem, retry to start back on the next process cycle
-                            initOthers = False       # Clear flag for process initialization and status check, network problem, drop the checking
-                    
-                    # Command operation failed
-                    else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle")
-                        # Print statement
-                        else:
-                            print "DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle"
+    benchData = os.urandom(cipherBenchSize)
+    benchSecret = os.urandom(32).encode('hex')
+    benchPath = createTempFile(benchData)
 
-                        networkManFailed = True  # Set network-manager check flag, network problem, retry to start back on the next cycle
-                        initOthers = False       # Clear flag for process initialization and status check, network problem, drop the checking
+    # Compare output with the benchmark data
+    def sameData (filePath):
+        benchFile = open(filePath, 'rb')
+        try:
+            return benchFile.read() == benchData
+        finally:
+            benchFile.close()
 
-                # Command operation failed
+    benchResult = {}
+    try:
+        for backend, cipherFunc in [('af_alg', afAlgStreamCipher), ('openssl', streamUserCipher)]:
+            startTime = time.time()
+            retResult = cipherFile(cipherFunc, 'encrypt', benchSecret, benchPath, benchPath + '.enc')
+            encTime = time.time() - startTime
+
+            startTime = time.time()
+            retResult = retResult and cipherFile(cipherFunc, 'decrypt', benchSecret, benchPath + '.enc', benchPath + '.dec')
+            decTime = time.time() - startTime
+
+            # Decrypted by openssl enc
+            if retResult == True and backend != 'openssl':
+                retResult = cipherFile(streamUserCipher, 'decrypt', benchSecret, benchPath + '.enc', benchPath + '.ref')
+                retResult = retResult and sameData(benchPath + '.ref')
+
+            # Backend failed or wrong output
+            if retResult != True or sameData(benchPath + '.dec') == False:
+                # Write to logger
+                if backLogger == True:
+                    logger.info("DEBUG_CRYPTO: Cipher backend [%s] NOT available" % (backend))
+                # Print statement
                 else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_UTOUCH: Bring UP WIFI FAILED!, will restart back in the next cycle")
-                    # Print statement
-                    else:
-                        print "DEBUG_UTOUCH: Bring UP WIFI FAILED!, will restart back in the next cycle"
+                    print "DEBUG_CRYPTO: Cipher backend [%s] NOT available" % (backend)
 
-            # Previously network-manager failed to start
-            elif networkManFailed == True:
-                # Restart pihole DNS server
-                out = subprocess.Popen(["pihole restartdns"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
+                continue
 
-                # NO error after command execution
-                if stderr == None:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL")
-                    # Print statement
-                    else:
-                        print "DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL"
+            benchResult[backend] = cipherBenchSize / 1048576.0 / max(encTime + decTime, 0.000001)
 
-                    # Wait before execute another command
-                    time.sleep(1)
-                    
-                    # Restart network-manager service
-                    out = subprocess.Popen(["service network-manager restart"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_CRYPTO: Cipher backend [%s] encrypt %.1f MB/s, decrypt %.1f MB/s" % (backend, \
+                            cipherBenchSize / 1048576.0 / max(encTime, 0.000001), cipherBenchSize / 1048576.0 / max(decTime, 0.000001)))
+            # Print statement
+            else:
+                print "DEBUG_CRYPTO: Cipher backend [%s] encrypt %.1f MB/s, decrypt %.1f MB/s" % (backend, \
+                      cipherBenchSize / 1048576.0 / max(encTime, 0.000001), cipherBenchSize / 1048576.0 / max(decTime, 0.000001))
+    finally:
+        for benchFile in [benchPath, benchPath + '.enc', benchPath + '.dec', benchPath + '.ref']:
+            if path.exists(benchFile) == True:
+                os.remove(benchFile)
+
+    cipherBackend = 'openssl'
+    if 'af_alg' in benchResult and benchResult['af_alg'] > benchResult.get('openssl', 0):
+        cipherBackend = 'af_alg'
+
+    return cipherBackend
+
+# Check nc2vpn key bundle file encrypted by bundleEncryptFile()
+# Return: True when the file start with the bundle file magic
+def isBundleFile (filePath):
+    try:
+        bundleFile = open(filePath, 'rb')
+        try:
+            return bundleFile.read(8) == b'SCSSENC1'
+        finally:
+            bundleFile.close()
+    except IOError:
+        return False
+
+# Encrypt one nc2vpn key bundle file - Random secret wrapped by the crypto public key (RSA-OAEP), file content streamed
+# through the cipher (AES-256-CBC) into the destination file
+# File format: 'SCSSENC1' <wrapped secret length (2 bytes)> <wrapped secret> <encrypted content>
+# Return: True when successful
+def bundleEncryptFile (srcPath, dstPath, pubKey):
+    bundleSecret = os.urandom(32).encode('hex')
+    wrapData = wrapSecret(pubKey, bundleSecret)
+    if wrapData == None:
+        return False
 
-                    # NO error after command execution
-                    if stderr == None:
-                        # Restart network-manager successful
-                        if 'start/running' in stdout:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_UTOUCH: RESTART network-manager SUCCESSFULL")
-                            # Print statement
-                            else:
-                                print "DEBUG_UTOUCH: RESTART network-manager SUCCESSFULL"
+    retResult = False
+    srcFd = os.open(srcPath, os.O_RDONLY)
+    try:
+        dstFd = os.open(dstPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            hdrData = b'SCSSENC1' + struct.pack('>H', len(wrapData)) + wrapData
+            while len(hdrData) > 0:
+                hdrData = hdrData[os.write(dstFd, hdrData):]
+
+            retResult = streamCipher('encrypt', bundleSecret, srcFd, dstFd)
+            if retResult == True:
+                os.fsync(dstFd)
+        finally:
+            os.close(dstFd)
+    finally:
+        os.close(srcFd)
 
-                            if ipRouteCnt > 0:
-                                # Execute ip route add command
-                                for a in range (ipRouteCnt):
-                                    out = subprocess.Popen([ipRouteArr[a]], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                    stdout,stderr = out.communicate()
-                                    
-                                    # NO error after command execution
-                                    if stderr == None:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_UTOUCH: IP route add [%s] SUCCESSFULL" % (ipRouteArr[a]))
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_UTOUCH: IP route add [%s] SUCCESSFULL" % (ipRouteArr[a])
+    return retResult
 
-                            networkManFailed = False  # Clear network-manager check flag, all is running well, no need to check it
-                            initOthers = True         # Set flag for process initialization and status check
-                            checkProcCnt = 0
-                                                    
-                        # Restart network-manager failed!
-                        else:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle")
-                            # Print statement
-                            else:
-                                print "DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle"
-                            
-                    # Command operation failed
-                    else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_UTOUCH: RESTART network-manager FAILED! [stderr], will restart back in the next cycle")
-                        # Print statement
-                        else:
-                            print "DEBUG_UTOUCH: RESTART network-manager FAILED! [stderr], will restart back in the next cycle"
+# Decrypt one nc2vpn key bundle file encrypted by bundleEncryptFile()
+# Return: True when successful
+def bundleDecryptFile (srcPath, dstPath, privKey):
+    retResult = False
+    srcFd = os.open(srcPath, os.O_RDONLY)
+    try:
+        hdrData = os.read(srcFd, 10)
+        if len(hdrData) != 10 or hdrData[:8] != b'SCSSENC1':
+            return False
+        wrapLen = struct.unpack('>H', hdrData[8:])[0]
+        bundleSecret = unwrapSecret(privKey, os.read(srcFd, wrapLen))
+        if bundleSecret == None:
+            return False
+
+        dstFd = os.open(dstPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            retResult = streamCipher('decrypt', bundleSecret, srcFd, dstFd)
+        finally:
+            os.close(dstFd)
+    finally:
+        os.close(srcFd)
 
-                # Command operation failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_UTOUCH: Initialize pihole DNS FAILED! [stderr], will reinitialize back in the next cycle")
-                    # Print statement
-                    else:
-                        print "DEBUG_UTOUCH: Initialize pihole DNS FAILED! [stderr], will reinitialize back in the next cycle"    
+    return retResult
 
-            # Initialization and checking for others parameter
-            if initOthers == True:
-                # Test the 4G network by executing ping process
-                if checkProcCnt == 0:
-                    # Ping every 60 seconds
-                    #if pingChkCnt == 60:
-                    #    pingChkCnt = 0
+# Decrypt one nc2vpn key bundle file encrypted by the previous encrypt.py, by decrypt.py through its own staging
+# directory
+# Return: True when successful
+def legacyDecryptFile (srcPath, dstDir, privKey):
+    stageDir = createCryptoStage('decrypt.py')
+    try:
+        os.symlink(os.path.abspath(srcPath), os.path.join(stageDir, os.path.basename(srcPath)))
+
+        # Command:
+        # python3 decrypt.py --source=/path/to/your/drive/ --destination=/path/to/your/drive/ --private-key=/path/to/your/key.private
+        retCode, stdout = runCommand(['python3', 'decrypt.py', '--source', stageDir, '--destination', dstDir, '--private-key', privKey], 120)
+    finally:
+        shutil.rmtree(stageDir, True)
+
+    return retCode == 0 and 'Decrypting:' in stdout
+
+# nc2vpn key bundle crypto worker, take one file at a time from the job queue until the job queue are empty
+# Parameters:
+# cryptoMode  - 'encrypt' or 'decrypt'
+# srcDir      - Source directory
+# dstDir      - Destination directory
+# keyPath     - Crypto public key (encrypt) or private key (decrypt) path
+# jobQueue    - Queue of (relative file path, file size)
+# resultQueue - Queue to report each file result: (relative file path, file size, elapsed time, status)
+def bundleWorker (threadname, cryptoMode, srcDir, dstDir, keyPath, jobQueue, resultQueue):
+    while True:
+        try:
+            relPath, fileSize = jobQueue.get_nowait()
+        except Queue.Empty:
+            break
 
-                    out = subprocess.Popen(["ping -c 1 google.com"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) 
-                    stdout,stderr = out.communicate()
+        startTime = time.time()
+        srcPath = os.path.join(srcDir, relPath)
+        dstPath = os.path.join(dstDir, relPath)
+        try:
+            if cryptoMode == 'encrypt':
+                retResult = bundleEncryptFile(srcPath, dstPath, keyPath)
+            elif isBundleFile(srcPath) == True:
+                retResult = bundleDecryptFile(srcPath, dstPath, keyPath)
+            else:
+                retResult = legacyDecryptFile(srcPath, os.path.dirname(dstPath), keyPath)
+        except (IOError, OSError, struct.error):
+            retResult = False
+
+        # Partially written file are NOT kept
+        if retResult == False and path.lexists(dstPath) == True:
+            wipeFile(dstPath)
+
+        resultQueue.put((relPath, fileSize, time.time() - startTime, retResult))
+
+# Encrypt/decrypt nc2vpn key bundle - Each file (including sub directory) are one job, processed by a pool of parallel
+# worker (one per online CPU) largest file first. Per file status and throughput are reported
+# Parameters:
+# cryptoMode - 'encrypt' or 'decrypt'
+# srcDir     - Source directory
+# dstDir     - Destination directory, sub directory are created as the source directory
+# keyPath    - Crypto public key (encrypt) or private key (decrypt) path
+# Return: retCode (0 when all file processed successfully) and output with 'Encrypting: <file>'/'Decrypting: <file>'
+#         for each successful file
+def runCryptoBundle (cryptoMode, srcDir, dstDir, keyPath):
+    global backLogger
+    global cryptoMaxJob
 
-                    # NO error after command execution
-                    if stderr == None:
-                        # 4G network OK
-                        if '1 received' in stdout:
-                            checkProcCnt = 1 # Pihole restart DNS and pihole status check, on next process cycle
-                            pingAtmptCnt = 0
-                            
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_UTOUCH: 4G network OK")
-                            # Print statement
-                            else:
-                                print "DEBUG_UTOUCH: 4G network OK"
+    maxJob = cryptoMaxJob
+    if maxJob == 0:
+        maxJob = os.sysconf(b'SC_NPROCESSORS_ONLN')
 
-                        # 4G network FAILED!
-                        elif '0 received' or 'failure' in stdout:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_UTOUCH: 4G network FAILED!")
-                            # Print statement
-                            else:
-                                print "DEBUG_UTOUCH: 4G network FAILED!"
+    fileList = []
+    try:
+        for dirPath, dirList, fileNames in os.walk(srcDir):
+            for fileName in fileNames:
+                filePath = os.path.join(dirPath, fileName)
+                if os.path.islink(filePath) == False and os.path.isfile(filePath) == True:
+                    fileList.append((os.path.relpath(filePath, srcDir), os.path.getsize(filePath)))
+
+            # Destination sub directory
+            for dirName in dirList:
+                dstSubDir = os.path.join(dstDir, os.path.relpath(os.path.join(dirPath, dirName), srcDir))
+                if path.isdir(dstSubDir) == False:
+                    os.makedirs(dstSubDir, 0o700)
+    except OSError:
+        return None, b''
+
+    jobQueue = Queue.Queue()
+    for oneFile in sorted(fileList, key=lambda x: x[1], reverse=True):
+        jobQueue.put(oneFile)
+
+    startTime = time.time()
+    resultQueue = Queue.Queue()
+    jobCnt = min(maxJob, len(fileList))
+    for a in range(jobCnt):
+        thread.start_new_thread(bundleWorker, ("[bundleWorker]", cryptoMode, srcDir, dstDir, keyPath, jobQueue, resultQueue))
+
+    retCode = 0
+    stdout = b''
+    totalSize = 0
+    for a in range(len(fileList)):
+        relPath, fileSize, fileTime, fileResult = resultQueue.get()
+        totalSize += fileSize
+        if fileResult == True:
+            stdout += b'%s: %s\n' % ('Encrypting' if cryptoMode == 'encrypt' else 'Decrypting', relPath)
+        else:
+            retCode = 1
 
-                            # Increment for ping check attempt
-                            pingAtmptCnt += 1
-                            # 10 attempt still network failed, prepare to restart network-manager
-                            if pingAtmptCnt == 10:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager")
-                                # Print statement
-                                else:
-                                    print "DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager"
-                                
-                                initOthers = False        # Disable aother process initialization and checking
-                                networkManFailed = True   # Restart network-manager
-                                checkProcCnt = 0          # Reset check process counter
-                                pingAtmptCnt = 0
-
-                    # Command operation failed
-                    else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager")
-                        # Print statement
-                        else:
-                            print "DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager"
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CRYPTO: %s [%s] %s bytes, %.3fs, %.1f KB/s, status: %s" % (cryptoMode, relPath, fileSize, fileTime, fileSize / 1024.0 / max(fileTime, 0.001), fileResult))
+        # Print statement
+        else:
+            print "DEBUG_CRYPTO: %s [%s] %s bytes, %.3fs, %.1f KB/s, status: %s" % (cryptoMode, relPath, fileSize, fileTime, fileSize / 1024.0 / max(fileTime, 0.001), fileResult)
 
-                        # Increment for ping check attempt
-                        pingAtmptCnt += 1
-                        # 60 attempt still network failed, prepare to restart network-manager
-                        if pingAtmptCnt == 60:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager")
-                            # Print statement
-                            else:
-                                print "DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager"
-                            
-                            initOthers = False        # Disable aother process initialization and checking
-                            networkManFailed = True   # Restart network-manager
-                            checkProcCnt = 0          # Reset check process counter
-                            pingAtmptCnt = 0
+    bundleTime = time.time() - startTime
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_CRYPTO: %s bundle %s files, %s bytes, %s jobs, %.3fs, %.1f KB/s, status: %s" % (cryptoMode, len(fileList), totalSize, jobCnt, bundleTime, totalSize / 1024.0 / max(bundleTime, 0.001), retCode))
+    # Print statement
+    else:
+        print "DEBUG_CRYPTO: %s bundle %s files, %s bytes, %s jobs, %.3fs, %.1f KB/s, status: %s" % (cryptoMode, len(fileList), totalSize, jobCnt, bundleTime, totalSize / 1024.0 / max(bundleTime, 0.001), retCode)
 
-                # Start nc2vpn tunnel if not start yet and continuously monitored the tunnel
-                elif checkProcCnt == 1:
-                    # First initialization of the nc2vpn tunnel
-                    if nc2VpnTunn == False:
-                        fileDel = False
+    return retCode, stdout
 
-                        # Check and retrieve nc2vpn .ovpn file name
-                        tempData = os.listdir(nc2VpnKeyTPath)
-                                                
-                        # Go through the resulted data
-                        for files in tempData:
-                            if '.ovpn' in files:
-                                fileName = files
-                                fileExist = True  # Set a flag to indicate vpn file already previously decrypted   
-                                break
+# SHA-256 content hash through Linux kernel crypto API (AF_ALG), kernel may use optimised implementation (NEON, ARMv8 CE)
+# File content are transferred with splice (file -> pipe -> AF_ALG socket) without copy into userspace
+# Return: Hex digest, None when AF_ALG not supported or failed
+def afAlgHashFile (filePath):
+    global hashChunkSize
 
-                        # NO file or previously has been deleted, decrypt back nc2vpn key
-                        if fileExist == False:
-                            # Start decrypt the nc2vpn key and stored it inside temporary folder
-                            # Command:
-                            # python3 decrypt.py --source=/path/to/your/drive/ --destination=/path/to/your/drive/ --private-key=/path/to/your/key.private
-                            tempPrivKeyPath = currUSBPath + '/key.private'
-                            out = subprocess.Popen(['python3', 'decrypt.py', '--source', nc2VpnKeyPath, '--destination', nc2VpnKeyTPath, '--private-key', tempPrivKeyPath], \
-                                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                            stdout,stderr = out.communicate()
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.splice.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint]
+    libc.splice.restype = ctypes.c_ssize_t
 
-                            # NO error after command execution
-                            if stderr == None:
-                                if 'Decrypting:' in stdout:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key successful")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_UTOUCH: Decrypt nc2vpn key successful"
+    fdList = []
+    try:
+        # AF_ALG (38), SOCK_SEQPACKET (5), struct sockaddr_alg
+        tfmFd = libc.socket(38, 5, 0)
+        if tfmFd < 0:
+            return None
+        fdList.append(tfmFd)
+
+        algAddr = struct.pack('=H14sII64s', 38, b'hash', 0, 0, b'sha256')
+        if libc.bind(tfmFd, algAddr, len(algAddr)) < 0:
+            return None
+
+        opFd = libc.accept(tfmFd, None, None)
+        if opFd < 0:
+            return None
+        fdList.append(opFd)
+
+        fileFd = os.open(filePath, os.O_RDONLY)
+        fdList.append(fileFd)
+        pipeRd, pipeWr = os.pipe()
+        fdList.extend([pipeRd, pipeWr])
+
+        while True:
+            # SPLICE_F_MOVE (1)
+            inLen = libc.splice(fileFd, None, pipeWr, None, hashChunkSize, 1)
+            if inLen < 0:
+                return None
+            # End of file
+            elif inLen == 0:
+                break
 
-                                # Operation failed, will retry to decrypt on the next process cycle
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!"
+            while inLen > 0:
+                # SPLICE_F_MOVE (1) | SPLICE_F_MORE (4), hash are not finalised yet
+                outLen = libc.splice(pipeRd, None, opFd, None, inLen, 5)
+                if outLen <= 0:
+                    return None
+                inLen -= outLen
+
+        # Send without MSG_MORE to finalise the hash
+        if libc.send(opFd, None, 0, 0) < 0:
+            return None
+
+        digest = os.read(opFd, 32)
+        if len(digest) != 32:
+            return None
+
+        return digest.encode('hex')
+    except (IOError, OSError):
+        return None
+    finally:
+        for fd in fdList:
+            os.close(fd)
+
+# SHA-256 content hash in userspace (hashlib), file content are mapped into memory instead of read copy
+# Return: Hex digest, None when failed
+def userHashFile (filePath):
+    try:
+        hashObj = hashlib.sha256()
+        hashFd = open(filePath, 'rb')
+        try:
+            if os.fstat(hashFd.fileno()).st_size > 0:
+                hashMap = mmap.mmap(hashFd.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    hashObj.update(hashMap)
+                finally:
+                    hashMap.close()
+        finally:
+            hashFd.close()
+
+        return hashObj.hexdigest()
+    except (IOError, OSError, ValueError):
+        return None
+
+# Benchmark and select the faster SHA-256 content hash backend, throughput of each backend are reported
+# Return: Selected backend
+def selectHashBackend ():
+    global backLogger
+    global hashBackend
+    global hashBenchSize
 
-                            # Operation failed, will retry to decrypt on the next process cycle
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!")
-                                # Print statement
-                                else:
-                                    print "DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!"
+    benchPath = '/dev/shm/scssgw-hash-bench'
+    benchData = os.urandom(hashBenchSize)
+    benchFile = open(benchPath, 'wb')
+    try:
+        benchFile.write(benchData)
+    finally:
+        benchFile.close()
+
+    benchResult = {}
+    refDigest = hashlib.sha256(benchData).hexdigest()
+    for backend, hashFunc in [('af_alg', afAlgHashFile), ('hashlib', userHashFile)]:
+        startTime = time.time()
+        digest = hashFunc(benchPath)
+        benchTime = time.time() - startTime
+
+        # Backend failed or wrong digest
+        if digest != refDigest:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_CRYPTO: Hash backend [%s] NOT available" % (backend))
+            # Print statement
+            else:
+                print "DEBUG_CRYPTO: Hash backend [%s] NOT available" % (backend)
 
-                        # Temporary nc2vpn key exist
-                        else:
-                            # Clear the IP route add buffer
-                            if ipRouteCnt > 0:
-                                for a in range (ipRouteCnt):
-                                    ipRouteArr[a] = ''
-                                ipRouteCnt = 0
-                                
-                            # Get the ip route add info    
-                            tempArgs = 'cd ' + nc2VpnKeyTPath + ';openvpn --config ' + fileName
-                            ipRouteArr, ipRouteCnt = getOpenVpnRouteInfo(tempArgs)
-                            # Previously successfully get the ip route add info
-                            if ipRouteCnt > 0:
-                                # Wait before execute another command
-                                time.sleep(1)
-                        
-                                # START VPN tunnel
-                                tempArgs = 'cd ' + nc2VpnKeyTPath + ';openvpn --config ' + fileName + ' --daemon'
-                                out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
+            continue
 
-                                # NO error after command execution
-                                if stderr == None:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_UTOUCH: Init. OpenVPN sequence completed")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_UTOUCH: Init. OpenVPN sequence completed"
-                                
-                                    nc2VpnTunn = True  # Set a flag to check periodically vpn tunnel 
-                                    checkProcCnt = 0   # Reset check process counter, start with ping process, on next process cycle
-                                    
-                                # Command operation failed
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_UTOUCH: Init. OpenVPN sequence FAILED! [stderr]")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_UTOUCH: Init. OpenVPN sequence FAILED! [stderr]"
+        benchResult[backend] = hashBenchSize / 1048576.0 / max(benchTime, 0.000001)
 
-                            # Get the info failed
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_UTOUCH: Init. OpenVPN sequence FAILED!")
-                                # Print statement
-                                else:
-                                    print "DEBUG_UTOUCH: Init. OpenVPN sequence FAILED!"
-                                
-                    # OpenVPN checking by checking tun0 interface 
-                    else:
-                        # Check tun0 interface
-                        out = subprocess.Popen(['ifconfig'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                        stdout,stderr = out.communicate()
-                        
-                        # NO error after command execution
-                        if stderr == None:
-                            # VPN tunnel exist
-                            if 'tun0' in stdout:
-                                # Delete previous decrypted vpn file, to ensure secured vpn transaction
-                                if fileDel == False:
-                                    # Delete the contents of nc2vpn key inside temporary folder
-                                    tempArgs = 'cd ' + nc2VpnKeyTPath + ';rm -rf *'
-                                    out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                    stdout,stderr = out.communicate()
-                                    
-                                    # NO error after command execution
-                                    if stderr == None:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_UTOUCH: Delete temporary nc2vpn key files successful")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_UTOUCH: Delete temporary nc2vpn key files successful"    
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CRYPTO: Hash backend [%s] %.1f MB/s" % (backend, benchResult[backend]))
+        # Print statement
+        else:
+            print "DEBUG_CRYPTO: Hash backend [%s] %.1f MB/s" % (backend, benchResult[backend])
 
-                                    fileDel = True
+    os.remove(benchPath)
 
-                                # Initiate ip route add process
-                                # Get the routing table IP address
-                                ipAddress = []
-                                ipAddressCnt = 0
-                                chkExist = False
-                                for a in range (ipRouteCnt):
-                                    foundChar = False
-                                    ipAddr = ''
-                                    respLen = len(ipRouteArr[a])
-                                    
-                                    # Go through the ip route array contents
-                                    for b in range(0, (respLen + 1)):
-                                        oneChar = mid(ipRouteArr[a], b, 1)
-                                        # Check the IP address
-                                        if oneChar.isdigit() or oneChar == '.':
-                                            foundChar = True
-                                            ipAddr += oneChar
-                                        elif foundChar == True and oneChar == '/':
-                                            break
+    hashBackend = 'hashlib'
+    if 'af_alg' in benchResult and benchResult['af_alg'] > benchResult.get('hashlib', 0):
+        hashBackend = 'af_alg'
 
-                                    # First array index
-                                    if ipAddressCnt == 0:
-                                        ipAddress = [ipAddr]
-                                        ipAddressCnt += 1
-                                        
-                                    # Subsequent array index
-                                    else:
-                                        ipAddress.append(ipAddr)
-                                        ipAddressCnt += 1
+    return hashBackend
 
-                                # Start check the routing table
-                                chkExist = chkRouteAddIpAddress(ipAddress, ipAddressCnt)
-                                # Routing for openvpn IP address still not exist
-                                if chkExist == False:
-                                    # Execute ip route add command
-                                    for a in range (ipRouteCnt):
-                                        out = subprocess.Popen([ipRouteArr[a]], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                        stdout,stderr = out.communicate()
-                                        
-                                        # NO error after command execution
-                                        if stderr == None:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_UTOUCH: IP route add [%s] SUCCESSFULL" % (ipRouteArr[a]))
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_UTOUCH: IP route add [%s] SUCCESSFULL" % (ipRouteArr[a])
+# SHA-256 content hash by the selected backend, fallback to userspace when kernel crypto API failed
+# Return: Hex digest, None when failed
+def hashFile (filePath):
+    global hashBackend
 
-                                            execSuccCnt += 1
-                                        
-                                    # Previous IP route add process successfull
-                                    if execSuccCnt == ipRouteCnt:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_UTOUCH: IP route add process SUCCESSFULL")
-                                            logger.info("DEBUG_UTOUCH: Init. OpenVPN sequence completed")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_UTOUCH: IP route add process SUCCESSFULL"
-                                            print "DEBUG_UTOUCH: Init. OpenVPN sequence completed"
+    if hashBackend == '':
+        selectHashBackend()
 
-                                        execSuccCnt = 0    
-                                        nc2VpnTunn = True  # Set a flag to check periodically vpn tunnel 
-                                        checkProcCnt = 0   # Reset check process counter, start with ping process, on next process cycle
+    if hashBackend == 'af_alg':
+        digest = afAlgHashFile(filePath)
+        if digest != None:
+            return digest
 
-                                    # Previous IP route add process failed!
-                                    else:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_UTOUCH: IP route add process FAILED!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_UTOUCH: IP route add process FAILED!"
-                                            
-                                        openVpnPID = []    # Current openvpn PID instances
-                                        openVpnPIDCnt = 0  # Current openvpn PID counter
-                                        
-                                        # Get openvpn PID
-                                        openVpnPID, openVpnPIDCnt = terminateOpenVpn('ps aux | grep -v grep | grep openvpn')
-                                        # Openvpn instances exist
-                                        if openVpnPIDCnt > 0:
-                                            # Execute kill instance command
-                                            for a in range (openVpnPIDCnt):
-                                                tempArgs = 'kill -9 ' + openVpnPID[a]
-                                                
-                                                out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                                stdout,stderr = out.communicate()
-                                                
-                                                # NO error after command execution
-                                                if stderr == None:
-                                                    # Write to logger
-                                                    if backLogger == True:
-                                                        logger.info("DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a]))
-                                                    # Print statement
-                                                    else:
-                                                        print "DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a])
-                                                    
-                                        # There is NO openvpn instances
-                                        else:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_UTOUCH: NO OpenVPN instance EXIST!")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_UTOUCH: NO OpenVPN instance EXIST!"
+    return userHashFile(filePath)
 
-                                # Routing for openvpn IP address already exist
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_UTOUCH: Routing table IP address EXIST")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_UTOUCH: Routing table IP address EXIST"
-                                                                                                    
-                                checkProcCnt = 0   # Reset check process counter, start with ping process, on next process cycle
+# Flush file and its directory entry to the storage
+def fsyncPath (filePath):
+    for syncPath in [filePath, os.path.dirname(os.path.abspath(filePath))]:
+        syncFd = os.open(syncPath, os.O_RDONLY)
+        try:
+            os.fsync(syncFd)
+        finally:
+            os.close(syncFd)
+
+# Copy file in-kernel (copy_file_range, fallback to sendfile, then read/write), the destination are flushed to the
+# storage before return
+# Parameters:
+# srcPath - Source file path
+# dstPath - Destination file or directory path
+# Return: retCode (0 when successful, None when failed) and copy information
+def copyFileSync (srcPath, dstPath):
+    global backLogger
+    global fileBuffSize
 
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_UTOUCH: VPN tunnel OK")
-                                # Print statement
-                                else:
-                                    print "DEBUG_UTOUCH: VPN tunnel OK"
+    if os.path.isdir(dstPath) == True:
+        dstPath = os.path.join(dstPath, os.path.basename(srcPath))
 
-                            # VPN tunnel not exist
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_UTOUCH: VPN tunnel tun0 NOT exist!")
-                                # Print statement
-                                else:
-                                    print "DEBUG_UTOUCH: VPN tunnel tun0 NOT exist!"
+    libc = ctypes.CDLL(None, use_errno=True)
+    libc.sendfile.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t]
+    libc.sendfile.restype = ctypes.c_ssize_t
+    copyRange = None
+    try:
+        copyRange = libc.copy_file_range
+        copyRange.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint]
+        copyRange.restype = ctypes.c_ssize_t
+    except AttributeError:
+        pass
+
+    startTime = time.time()
+    copyMethod = 'copy_file_range'
+    copySize = 0
+    try:
+        srcFd = os.open(srcPath, os.O_RDONLY)
+        try:
+            dstFd = os.open(dstPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                fileSize = os.fstat(srcFd).st_size
+                while copySize < fileSize:
+                    outLen = -1
+                    if copyMethod == 'copy_file_range':
+                        if copyRange != None:
+                            outLen = copyRange(srcFd, None, dstFd, None, fileSize - copySize, 0)
+                        # Not supported, e.g. across filesystem
+                        if outLen < 0:
+                            copyMethod = 'sendfile'
+                            continue
+                    elif copyMethod == 'sendfile':
+                        outLen = libc.sendfile(dstFd, srcFd, None, fileSize - copySize)
+                        if outLen < 0:
+                            copyMethod = 'read/write'
+                            continue
+                    else:
+                        fileData = os.read(srcFd, fileBuffSize)
+                        outLen = len(fileData)
+                        while len(fileData) > 0:
+                            fileData = fileData[os.write(dstFd, fileData):]
+
+                    # Source file truncated
+                    if outLen == 0:
+                        break
+                    copySize += outLen
+
+                os.fsync(dstFd)
+            finally:
+                os.close(dstFd)
+        finally:
+            os.close(srcFd)
+
+        fsyncPath(dstPath)
+    except (IOError, OSError) as e:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CRYPTO: Copy [%s] to [%s] FAILED! [%s]" % (srcPath, dstPath, e))
+        # Print statement
+        else:
+            print "DEBUG_CRYPTO: Copy [%s] to [%s] FAILED! [%s]" % (srcPath, dstPath, e)
 
-                                # Increment VPN tunnel check attempt counter
-                                vpnTunAtmptCnt += 1
-                                # 60 attempt still tun0 interface not exist, prepare to kill openvpn
-                                if vpnTunAtmptCnt == 60:
-                                    # STOP VPN tunnel
-                                    openVpnPID = []    # Current openvpn PID instances
-                                    openVpnPIDCnt = 0  # Current openvpn PID counter
+        return None, b''
 
-                                    # Get openvpn PID
-                                    openVpnPID, openVpnPIDCnt = terminateOpenVpn('ps aux | grep -v grep | grep openvpn')
-                                    # Openvpn instances exist
-                                    if openVpnPIDCnt > 0:
-                                        # Execute kill instance command
-                                        for a in range (openVpnPIDCnt):
-                                            tempArgs = 'kill -9 ' + openVpnPID[a]
-                                            
-                                            out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                            stdout,stderr = out.communicate()
-                                            
-                                            # NO error after command execution
-                                            if stderr == None:
-                                                # Write to logger
-                                                if backLogger == True:
-                                                    logger.info("DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a]))
-                                                # Print statement
-                                                else:
-                                                    print "DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a])
+    copyInfo = "Copy [%s] to [%s] %s bytes by %s, %.3fs" % (srcPath, dstPath, copySize, copyMethod, time.time() - startTime)
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_CRYPTO: " + copyInfo)
+    # Print statement
+    else:
+        print "DEBUG_CRYPTO: " + copyInfo
 
-                                    # There is NO openvpn instances
-                                    else:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_UTOUCH: NO OpenVPN instance EXIST!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_UTOUCH: NO OpenVPN instance EXIST!"    
+    return 0, copyInfo
 
-                                    vpnTunAtmptCnt = 0
-                                    nc2VpnTunn = False   # Reset a flag to initiate back OpenVpn, checking network connectivity first 
-                                    checkProcCnt = 0     # Reset check process counter, start with ping process, on next process cycle
-                                    
-        # USB key detached
+# Secure wipe file - Overwrite the file content with zero, flush to the storage and remove the file
+# Flash storage (SD card, USB thumb drive) may keep old content by wear levelling, the overwrite are best effort
+# Return: Wiped size, missing file are treated as wiped
+def wipeFile (filePath):
+    global fileBuffSize
+
+    try:
+        fileStat = os.lstat(filePath)
+    except OSError:
+        return 0
+
+    # Regular file content only, link and special file are removed
+    wipeSize = 0
+    if (fileStat.st_mode & 0o170000) == 0o100000:
+        wipeFd = os.open(filePath, os.O_WRONLY)
+        try:
+            zeroBuff = b'\0' * fileBuffSize
+            while wipeSize < fileStat.st_size:
+                wipeSize += os.write(wipeFd, zeroBuff[:min(fileBuffSize, fileStat.st_size - wipeSize)])
+            os.fsync(wipeFd)
+        finally:
+            os.close(wipeFd)
+
+    os.remove(filePath)
+
+    return wipeSize
+
+# Secure wipe files and remove the directory contents, equivalent of 'rm -f' for file and 'find -mindepth 1 -delete'
+# for directory (the directory itself are kept)
+# Parameters:
+# wipeList - File or directory path list
+# Return: retCode (0 when successful, None when failed) and wipe information
+def wipePath (wipeList):
+    global backLogger
+
+    startTime = time.time()
+    wipeCnt = 0
+    wipeSize = 0
+    try:
+        for wipeItem in wipeList:
+            if os.path.isdir(wipeItem) == True and os.path.islink(wipeItem) == False:
+                for dirPath, dirList, fileList in os.walk(wipeItem, topdown=False):
+                    for fileName in fileList + [x for x in dirList if os.path.islink(os.path.join(dirPath, x)) == True]:
+                        wipeSize += wipeFile(os.path.join(dirPath, fileName))
+                        wipeCnt += 1
+                    for dirName in dirList:
+                        if os.path.islink(os.path.join(dirPath, dirName)) == False:
+                            os.rmdir(os.path.join(dirPath, dirName))
+                fsyncPath(os.path.join(wipeItem, '.'))
+            elif path.lexists(wipeItem) == True:
+                wipeSize += wipeFile(wipeItem)
+                wipeCnt += 1
+                fsyncPath(os.path.dirname(os.path.abspath(wipeItem)))
+    except (IOError, OSError) as e:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CRYPTO: Secure wipe %s FAILED! [%s]" % (wipeList, e))
+        # Print statement
         else:
-##            # First initialization of the pihole
-##            if initPihole == False:
-##                # First check wifi status
-##                out = subprocess.Popen(["nmcli radio wifi"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-##                stdout,stderr = out.communicate()
-##                # NO error after command execution
-##                if stderr == None:
-##                    # Wifi still in enabled mode, shut it down
-##                    if 'enabled' in stdout:
-##                        DEFNULL = open(os.devnull, 'w')
-##                        retcode = subprocess.call(['/usr/local/bin/pihole', 'restartdns'], stdout=DEFNULL, stderr=subprocess.STDOUT)
-##
-##                        # Write to logger
-##                        if backLogger == True:
-##                            logger.info("DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL")
-##                        # Print statement
-##                        else:
-##                            print "DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL"
-##                                
-####                        # Restart pihole DNS server
-####                        out = subprocess.Popen(["/usr/local/bin/pihole restartdns"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-####                        stdout,stderr = out.communicate()
-####
-####                        # NO error after command execution
-####                        if stderr == None:
-####                            # Write to logger
-####                            if backLogger == True:
-####                                logger.info("DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL")
-####                            # Print statement
-####                            else:
-####                                print "DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL"
-##
-##                        initPihole = True
-##            
-##            # Previously pihole already been initialized
-##            else:
-            # Shutdown WIFI if USB key NOT attached
-            if wifiShutDown == False:
-                checkProcCnt = 0
-                vpnTunAtmptCnt = 0
-                pingAtmptCnt = 0
+            print "DEBUG_CRYPTO: Secure wipe %s FAILED! [%s]" % (wipeList, e)
 
-                initOthers = False
-                networkManFailed = False
-                nc2VpnTunn = False
+        return None, b''
 
-                # First check wifi status
-                out = subprocess.Popen(["nmcli radio wifi"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
-                # NO error after command execution
-                if stderr == None:
-                    # Wifi still in enabled mode, shut it down
-                    if 'enabled' in stdout: 
-                        # Wait before execute another command
-                        time.sleep(1)
-                                   
-                        # Disable WIFI radio hardware    
-                        out = subprocess.Popen(["nmcli radio wifi off"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                        stdout,stderr = out.communicate()
+    wipeInfo = "Secure wipe %s, %s files, %s bytes, %.3fs" % (wipeList, wipeCnt, wipeSize, time.time() - startTime)
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_CRYPTO: " + wipeInfo)
+    # Print statement
+    else:
+        print "DEBUG_CRYPTO: " + wipeInfo
 
-                        # NO error after command execution
-                        if stderr == None:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_UTOUCH: Shutdown WIFI")
-                            # Print statement
-                            else:
-                                print "DEBUG_UTOUCH: Shutdown WIFI"
+    return 0, wipeInfo
 
-                    # Wifi already been shutdown
-                    elif 'disabled' in stdout:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_UTOUCH: Previously WIFI already been SHUTDOWN")
-                        # Print statement
-                        else:
-                            print "DEBUG_UTOUCH: Previously WIFI already been SHUTDOWN"
+# Create temporary file inside RAM (tmpfs), only accessible by root
+# Return: Temporary file path
+def createTempFile (data):
+    global cryptoStagePath
 
-                        wifiShutDown = True
+    if path.exists(cryptoStagePath) == False:
+        os.makedirs(cryptoStagePath, 0o700)
 
-            # Previously WIFI already been shutdown
-            else:
-                # Write to logger
-                if backLogger == True:
-                    logger.info("DEBUG_UTOUCH: NC2VPN Secure GW OFFLINE")
-                # Print statement
-                else:
-                    print "DEBUG_UTOUCH: NC2VPN Secure GW OFFLINE"
-    
-# Connection and tunnel monitoring - network monitoring and validation
-def networkMon (threadname, delay):
-    global dCryptProc
-    global clientIPAddr
-    global netMonChkCnt
-    global tunnelValid
-    global net4gValid
-    global net4gAtmptCnt
-    global nc2VpnKeyTPath
-    global nc2VpnKeyPath
-    global vpnAtmptCnt
-    global currUSBPath
-    global lcdOperSel
-    global radioMode
-    global radioValid
-    global radioOpt
-    global publicIPaddr
-    
-    fileName = ''
-    fileExist = False
-    fileDel = False
-    tempData = []
-                
-    # Forever loop
-    while True:
-        # Loop every 0.5s
-        time.sleep(delay)
+    tempPath = os.path.join(cryptoStagePath, 'tmp-%d-%s' % (os.getpid(), os.urandom(8).encode('hex')))
+    tempFd = os.open(tempPath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        while len(data) > 0:
+            data = data[os.write(tempFd, data):]
+    finally:
+        os.close(tempFd)
+
+    return tempPath
+
+# Encrypt nc2vpn key archive item - Random secret wrapped by the crypto public key (RSA-OAEP), item content encrypted
+# by the secret (AES-256-CBC)
+# Item format: <wrapped secret length (2 bytes)> <wrapped secret> <encrypted content>
+# Return: Encrypted item, None when failed
+def archEncrypt (pubKey, data):
+    archSecret = os.urandom(32).encode('hex')
+    wrapData = wrapSecret(pubKey, archSecret)
+    if wrapData == None:
+        return None
+
+    passPath = createTempFile(archSecret)
+    outPath = passPath + '.out'
+    try:
+        retCode, stdout = runCommand(['openssl', 'enc', '-aes-256-cbc', '-pbkdf2', '-pass', 'file:' + passPath, '-out', outPath], 30, cmdInput=data)
+        if retCode != 0:
+            return None
+        outFile = open(outPath, 'rb')
+        try:
+            encData = outFile.read()
+        finally:
+            outFile.close()
+    finally:
+        wipeFile(passPath)
+        wipeFile(outPath)
+
+    return struct.pack('>H', len(wrapData)) + wrapData + encData
+
+# Decrypt nc2vpn key archive item, openssl stderr are captured separately from the decrypted content
+# Return: Item content, None when failed
+def archDecrypt (privKey, item):
+    global backLogger
 
-        # Radio mode
-        if radioMode == True:
-            # Initiate and check 4G LTE modem
-            if netMonChkCnt == 0:
-                # 4G network not start yet, or previously has already terminated
-                if net4gValid == False:
-                    # Start initiate 4G network
-                    retResult = initiate4GModem()
-                    # Successful
-                    if retResult == True:
-                        net4gValid = True
-                        netMonChkCnt = 1
+    wrapLen = struct.unpack('>H', item[:2])[0]
+    archSecret = unwrapSecret(privKey, item[2:2 + wrapLen])
+    if archSecret == None:
+        return None
 
-                        # Change LCD operation mode
-                        lcdOperSel = 9
-                    
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_NETMON: Initiate 4G LTE modem successful")
-                        # Print statement
-                        else:
-                            print "DEBUG_NETMON: Initiate 4G LTE modem successful"
+    errList = []
+    passPath = createTempFile(archSecret)
+    encPath = createTempFile(item[2 + wrapLen:])
+    try:
+        retCode, stdout = runCommand(['openssl', 'enc', '-d', '-aes-256-cbc', '-pbkdf2', '-pass', 'file:' + passPath, '-in', encPath], 30, maxCapture=len(item), \
+                                     errList=errList)
+    finally:
+        wipeFile(passPath)
+        wipeFile(encPath)
+
+    if retCode != 0:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CRYPTO: Decrypt nc2vpn key archive item FAILED! [%s]" % (b''.join(errList).strip()))
+        # Print statement
+        else:
+            print "DEBUG_CRYPTO: Decrypt nc2vpn key archive item FAILED! [%s]" % (b''.join(errList).strip())
+
+        return None
+
+    return stdout
+
+# Read nc2vpn key archive layout
+# Archive format:
+# 'SCSSARC2' <entry>... <index> <index offset (8 bytes)> <index length (4 bytes)> 'SCSSIDX2'
+# Each entry and the index are encrypted item, index content: list of {'name', 'offset', 'length'} of the entry
+# Return: Index offset and length
+def readArchLayout (archFile):
+    archFile.seek(0)
+    if archFile.read(8) != b'SCSSARC2':
+        raise IOError('Invalid nc2vpn key archive')
+
+    archFile.seek(-20, 2)
+    idxStart, idxLen, idxMagic = struct.unpack('>QI8s', archFile.read(20))
+    if idxMagic != b'SCSSIDX2':
+        raise IOError('Invalid nc2vpn key archive')
+
+    return idxStart, idxLen
+
+# Write new nc2vpn key archive, each entry and the index are encrypted individually. Archive are always written as
+# a whole, every provisioning generate a new crypto key pair so existing entries can NOT be kept
+# Parameters:
+# archPath  - New nc2vpn key archive path, must NOT exist
+# entryList - List of (entry name, entry content)
+# pubKey    - Crypto public key path
+# Return: True when successful
+def writeArchive (archPath, entryList, pubKey):
+    try:
+        archFile = os.fdopen(os.open(archPath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), 'wb')
+        try:
+            archFile.write(b'SCSSARC2')
+            idxStart = 8
+            archIndex = []
+            for entryName, entryData in entryList:
+                entryItem = archEncrypt(pubKey, entryData)
+                if entryItem == None:
+                    return False
+                archFile.write(entryItem)
+                archIndex.append({'name': entryName, 'offset': idxStart, 'length': len(entryItem)})
+                idxStart += len(entryItem)
+
+            idxItem = archEncrypt(pubKey, json.dumps(archIndex))
+            if idxItem == None:
+                return False
+            archFile.write(idxItem + struct.pack('>QI8s', idxStart, len(idxItem), b'SCSSIDX2'))
+
+            archFile.flush()
+            os.fsync(archFile.fileno())
+        finally:
+            archFile.close()
+    except (IOError, OSError, struct.error):
+        return False
+
+    return True
+
+# Read nc2vpn key archive index, decrypted once regardless of the number of entries
+# Return: Index list of {'name', 'offset', 'length'}, None when failed
+def readArchIndex (archPath, privKey):
+    try:
+        archFile = open(archPath, 'rb')
+        try:
+            idxStart, idxLen = readArchLayout(archFile)
+            archFile.seek(idxStart)
+            idxData = archDecrypt(privKey, archFile.read(idxLen))
+        finally:
+            archFile.close()
+
+        if idxData == None:
+            return None
+        archIndex = json.loads(idxData)
+    except (IOError, OSError, struct.error, ValueError):
+        return None
+
+    return archIndex
+
+# Build nc2vpn key archive from the USB thumb drive OpenVPN profile, referenced key files are inline so each profile
+# are self-contained entry. Profile with the referenced file that can not be inline are NOT included
+# Parameters:
+# srcDir  - OpenVPN profile directory
+# pubKey  - Crypto public key path
+# newPath - New archive path, replace the nc2vpn key archive by storeCryptoKey()
+# Return: Number of archived profile, NO new archive when 0
+def buildOvpnArchive (srcDir, pubKey, newPath):
+    global backLogger
 
-                    # Failed
-                    else:
-                        # STOP 4G LTE modem 
-                        out = subprocess.Popen(['qmicli', '-d', '/dev/cdc-wdm0', '--device-open-sync', '--dms-get-operating-mode'], \
-                           stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                        stdout,stderr = out.communicate()
+    startTime = time.time()
+    if path.exists(newPath) == True:
+        os.remove(newPath)
 
-                        # NO error after command execution
-                        if stderr == None:
-                            if 'HW restricted:' in stdout:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_NETMON: STOP 4G LTE modem successful - Init. 4G LTE modem")
-                                # Print statement
-                                else:
-                                    print "DEBUG_NETMON: STOP 4G LTE modem successful - Init. 4G LTE modem"
-                                        
-                                # Wait before execute another command
-                                time.sleep(1)
+    entryList = []
+    for files in sorted(os.listdir(srcDir)):
+        if files.endswith('.ovpn') == False:
+            continue
 
-                                # Bring wwan0 interface DOWN
-                                out = subprocess.Popen(['ifconfig', 'wwan0', 'down'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
+        ovpnConf = inlineOvpnConfig(os.path.join(srcDir, files))
+        if ovpnConf == None:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_CRYPTO: Archive OpenVPN profile [%s] FAILED!" % (files))
+            # Print statement
+            else:
+                print "DEBUG_CRYPTO: Archive OpenVPN profile [%s] FAILED!" % (files)
 
-                                # NO error after command execution
-                                if stderr == None:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_NETMON: Bringing DOWN wwan0 successful - Init. 4G LTE modem")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_NETMON: Bringing DOWN wwan0 successful - Init. 4G LTE modem"
+            continue
 
-                                # Operation failed
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - Init. 4G LTE modem")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - Init. 4G LTE modem"
+        entryList.append((files, ovpnConf))
 
-                            # Operation failed
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_NETMON: STOP 4G LTE modem FAILED! - Init. 4G LTE modem")
-                                # Print statement
-                                else:
-                                    print "DEBUG_NETMON: STOP 4G LTE modem FAILED! - Init. 4G LTE modem"
+    # All profile and the index are written at once
+    entryCnt = len(entryList)
+    if entryCnt > 0 and writeArchive(newPath, entryList, pubKey) == False:
+        entryCnt = 0
 
-                        # Operation failed
-                        else:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - init. 4G LTE modem")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - init. 4G LTE modem"
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_CRYPTO: Write nc2vpn key archive FAILED!")
+        # Print statement
+        else:
+            print "DEBUG_CRYPTO: Write nc2vpn key archive FAILED!"
 
-                        # Retry again the sequence
-                        netMonChkCnt = 0
+    if entryCnt == 0 and path.exists(newPath) == True:
+        os.remove(newPath)
 
-                # 4G network checking by pinging process to google.com 
-                else:
-                    # Start PING google.com
-                    out = subprocess.Popen(['ping', '-c', '1', 'google.com'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_CRYPTO: Build nc2vpn key archive, %s profiles, %.2fs" % (entryCnt, time.time() - startTime))
+    # Print statement
+    else:
+        print "DEBUG_CRYPTO: Build nc2vpn key archive, %s profiles, %.2fs" % (entryCnt, time.time() - startTime)
 
-                    # NO error after command execution
-                    if stderr == None:
-                        # 4G network OK
-                        if '1 received' in stdout:
-                            net4gValid = True
+    return entryCnt
 
-                            net4gAtmptCnt = 0
-                            netMonChkCnt = 1
+# Decrypt the selected OpenVPN profile only from nc2vpn key archive into the destination directory
+# Return: Decrypted profile name, empty string when failed
+def decryptOvpnArchive (dstDir, privKey):
+    global backLogger
+    global nc2VpnArchPath
+    global ovpnProfile
+
+    startTime = time.time()
+    archIndex = readArchIndex(nc2VpnArchPath, privKey)
+    if archIndex == None or len(archIndex) == 0:
+        return ''
+
+    # Selected profile, or the first profile
+    archEntry = archIndex[0]
+    for oneEntry in archIndex:
+        if oneEntry['name'] == ovpnProfile:
+            archEntry = oneEntry
+            break
 
-                            # Write to logger
+    try:
+        archFile = open(nc2VpnArchPath, 'rb')
+        try:
+            archFile.seek(archEntry['offset'])
+            entryData = archDecrypt(privKey, archFile.read(archEntry['length']))
+        finally:
+            archFile.close()
+    except (IOError, OSError):
+        return ''
+
+    if entryData == None:
+        return ''
+
+    dstFd = os.open(os.path.join(dstDir, os.path.basename(archEntry['name'])), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        while len(entryData) > 0:
+            entryData = entryData[os.write(dstFd, entryData):]
+    finally:
+        os.close(dstFd)
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_CRYPTO: Decrypt [%s] from nc2vpn key archive (%s profiles), %.2fs" % (archEntry['name'], len(archIndex), time.time() - startTime))
+    # Print statement
+    else:
+        print "DEBUG_CRYPTO: Decrypt [%s] from nc2vpn key archive (%s profiles), %.2fs" % (archEntry['name'], len(archIndex), time.time() - startTime)
+
+    return archEntry['name']
+
+# Decrypt nc2vpn key - The selected OpenVPN profile from nc2vpn key archive, fallback to whole encrypted nc2vpn key
+# directory by decrypt.py
+# Return: retCode (0 when successful) and decrypt output
+def decryptNc2Vpn (srcDir, dstDir, privKey):
+    global nc2VpnArchPath
+
+    if path.exists(nc2VpnArchPath) == True:
+        entryName = decryptOvpnArchive(dstDir, privKey)
+        if entryName != '':
+            return 0, b'Decrypting: ' + entryName
+
+    return runCryptoBundle('decrypt', srcDir, dstDir, privKey)
+
+# Store decrypted nc2vpn key OpenVPN configuration inside kernel user keyring with expiry
+# Return: True when stored
+def cacheOvpnKey (ovpnConf):
+    global backLogger
+    global keyCacheName
+    global keyCacheTimeOut
+
+    # Add or update the key, key ID returned
+    retCode, stdout = runCommand(['keyctl', 'padd', 'user', keyCacheName, '@u'], 10, cmdInput=ovpnConf)
+    if retCode == 0 and stdout.strip().isdigit() == True:
+        keyId = stdout.strip()
+        retCode, stdout = runCommand(['keyctl', 'timeout', keyId, str(keyCacheTimeOut)], 10)
+        if retCode == 0:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_CRYPTO: Cache nc2vpn key inside kernel keyring successful, key ID: %s" % (keyId))
+            # Print statement
+            else:
+                print "DEBUG_CRYPTO: Cache nc2vpn key inside kernel keyring successful, key ID: %s" % (keyId)
+
+            return True
+
+        # Cache without expiry are not allowed
+        runCommand(['keyctl', 'revoke', keyId], 10)
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_CRYPTO: Cache nc2vpn key inside kernel keyring FAILED!")
+    # Print statement
+    else:
+        print "DEBUG_CRYPTO: Cache nc2vpn key inside kernel keyring FAILED!"
+
+    return False
+
+# Load cached nc2vpn key OpenVPN configuration from kernel user keyring into sealed memory file
+# Return: OpenVPN configuration path, empty string when NO cached key or already expired/revoked
+def loadOvpnKeyCache ():
+    global backLogger
+    global keyCacheName
+    global ovpnMemfd
+
+    retCode, stdout = runCommand(['keyctl', 'search', '@u', 'user', keyCacheName], 10)
+    if retCode != 0 or stdout.strip().isdigit() == False:
+        return ''
+
+    retCode, stdout = runCommand(['keyctl', 'pipe', stdout.strip()], 10)
+    if retCode != 0 or stdout == b'':
+        return ''
+
+    memFd = createSealedMemfd('scssgw-nc2vpn', stdout)
+    if memFd < 0:
+        return ''
+    saveOvpnStandby(stdout)
+
+    releaseOvpnMemfd()
+    ovpnMemfd['fd'] = memFd
+    ovpnMemfd['path'] = '/proc/%d/fd/%d' % (os.getpid(), memFd)
+    seedDnsRemote(ovpnMemfd['path'])
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_CRYPTO: Load nc2vpn key from kernel keyring cache successful")
+    # Print statement
+    else:
+        print "DEBUG_CRYPTO: Load nc2vpn key from kernel keyring cache successful"
+
+    return ovpnMemfd['path']
+
+# Revoke cached nc2vpn key inside kernel user keyring, release sealed memory file and remove the warm-standby OpenVPN
+# profile
+# Return: True when NO cached key left
+def revokeOvpnKeyCache ():
+    global backLogger
+    global keyCacheName
+    global ovpnMgmtCred
+    global ovpnStandbyPath
+
+    retResult = True
+    releaseOvpnMemfd()
+    ovpnMgmtCred.clear()
+
+    # Warm-standby OpenVPN profile (RAM) NOT kept after the USB key removed
+    for standbyPath in [ovpnStandbyPath, ovpnStandbyPath + '.tmp']:
+        try:
+            os.remove(standbyPath)
+        except OSError:
+            pass
+
+    # Revoke all matched key
+    while True:
+        retCode, stdout = runCommand(['keyctl', 'search', '@u', 'user', keyCacheName], 10)
+        if retCode != 0 or stdout.strip().isdigit() == False:
+            break
+
+        keyId = stdout.strip()
+        retCode, stdout = runCommand(['keyctl', 'revoke', keyId], 10)
+        if retCode != 0:
+            retResult = False
+            break
+
+        # Revoked key are still linked until garbage collected, unlink it
+        runCommand(['keyctl', 'unlink', keyId, '@u'], 10)
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_CRYPTO: Revoke nc2vpn key kernel keyring cache, status: %s" % (retResult))
+    # Print statement
+    else:
+        print "DEBUG_CRYPTO: Revoke nc2vpn key kernel keyring cache, status: %s" % (retResult)
+
+    return retResult
+
+# Get decrypted nc2vpn key OpenVPN configuration path, load newly decrypted nc2vpn key into sealed memory file
+# or load from the kernel keyring cache
+# Return: OpenVPN configuration path, empty string when no decrypted nc2vpn key
+def getDecryptedOvpn ():
+    global nc2VpnKeyTPath
+    global ovpnMemfd
+
+    for files in os.listdir(nc2VpnKeyTPath):
+        if '.ovpn' in files:
+            return loadOvpnMemfd(files)
+
+    if 'path' in ovpnMemfd:
+        return ovpnMemfd['path']
+
+    # Previously decrypted nc2vpn key inside kernel keyring cache
+    return loadOvpnKeyCache()
+
+# Close decrypted nc2vpn key sealed memory file and remove the decrypted nc2vpn key files
+# Return: True when all decrypted nc2vpn key are removed
+def releaseOvpnMemfd ():
+    global nc2VpnKeyTPath
+    global ovpnMemfd
+
+    retResult = True
+    if 'fd' in ovpnMemfd:
+        os.close(ovpnMemfd['fd'])
+        ovpnMemfd.clear()
+
+    try:
+        for files in os.listdir(nc2VpnKeyTPath):
+            filePath = os.path.join(nc2VpnKeyTPath, files)
+            if os.path.isdir(filePath) == True and os.path.islink(filePath) == False:
+                shutil.rmtree(filePath)
+            else:
+                os.remove(filePath)
+    except OSError:
+        retResult = False
+
+    return retResult
+
+# Check the routing table IP address
+def chkRouteAddIpAddress (ipAddress, ipAddressCnt):
+    existCnt = 0
+    retResult = False
+    # Execute the command
+    retCode, stdout = runCommand(['route', '-n'], 10)
+    # Loop the result
+    for output in stdout.splitlines():
+        if output:
+            tempOut = output.strip()
+            #print tempOut
+            # Check through IP address buffer
+            for a in range(ipAddressCnt):
+                # IP address exist inside routing table
+                if ipAddress[a] in tempOut:
+                    #print 'masuk'
+                    #print ipAddress[a]
+                    existCnt += 1    
+
+    if existCnt > 0:
+        retResult = True
+            
+    return retResult
+                
+# KILL all openvpn instances
+# Get the process PID list from the command, e.g. ['pgrep', 'openvpn']
+def terminateOpenVpn (cmdArgs):
+    openVpnPid = []
+    openVpnCnt = 0
+
+    # Execute the command
+    retCode, stdout = runCommand(cmdArgs, 10)
+    # Loop the result
+    for output in stdout.splitlines():
+        if output:
+            tempOut = output.strip()
+
+            foundDig = False
+            pidNo = ''
+            respLen = len(tempOut)
+            
+            # Go through the read line
+            for a in range(0, (respLen + 1)):
+                oneChar = mid(tempOut, a, 1)
+                # Check PID digit
+                if oneChar.isdigit():
+                    foundDig = True
+                    pidNo += oneChar
+                elif foundDig == True and oneChar == ' ':
+                    break
+
+            # First array index
+            if openVpnCnt == 0:
+                openVpnPid = [pidNo]
+                openVpnCnt += 1           
+
+            # Subsequent array index
+            else:
+                openVpnPid.append(pidNo)
+                openVpnCnt += 1
+
+    return openVpnPid, openVpnCnt
+                
+# Get the openvpn routing info
+# Command: ['openvpn', '--config', <file name>], executed inside cmdDir directory
+def getOpenVpnRouteInfo (cmdArgs, cmdDir):
+    routeInfo = []
+    routeInfoCnt = 0
+    timeOut = 0
+    openVpnStat = False
+    openVpnOut = []
+
+    # Collect openvpn output line, stop openvpn after initialization completed or after 500 lines
+    def collectOpenVpnOut (output):
+        openVpnOut.append(output)
+        return 'Initialization Sequence Completed' in output or len(openVpnOut) >= 500
+
+    # Execute the command, 1 minute time out in case failed to initiate openvpn
+    retCode, stdout = runCommand(cmdArgs, 60, streamFunc=collectOpenVpnOut, cmdDir=cmdDir)
+    # Loop until get ip routing info
+    for output in openVpnOut:
+        if output:
+            tempOut = output.strip()
+            # Getting the ip routing info
+            if 'ip route add' in tempOut:
+                # Get the 'ip route add' segment
+                ipRouteCmd = ''
+                #spaceCnt = 0
+                bSlashFound = False
+                getIpRoute = False
+                lenOut = len(tempOut)
+
+                # Go through the read line
+                for a in range(0, (lenOut + 1)):
+                    oneChar = mid(tempOut, a, 1)
+                    # Check for back slash character
+                    if oneChar == '/' and getIpRoute == False:
+                        ipRouteCmd += oneChar
+                        getIpRoute = True
+                    # Start get the ip route add rules 
+                    elif getIpRoute == True:
+                        ipRouteCmd += oneChar
+                        
+##                    # Count space char 
+##                    if oneChar == ' ' and getIpRoute == False:
+##                        spaceCnt += 1
+##                        if spaceCnt == 5:
+##                            getIpRoute = True
+##
+##                    # Start get the ip route add rules 
+##                    elif getIpRoute == True:
+##                        ipRouteCmd += oneChar 
+
+                # First array index
+                if routeInfoCnt == 0:
+                    routeInfo = [ipRouteCmd]
+                    routeInfoCnt += 1    
+
+                # Subsequent array index
+                else:
+                    routeInfo.append(ipRouteCmd)
+                    routeInfoCnt += 1
+
+            # Exit loop
+            elif 'Initialization Sequence Completed' in tempOut:
+                openVpnStat = True
+                break    
+            
+            #time.sleep(1)
+
+            timeOut += 1
+            # 1 minute time out in case failed to initiate openvpn
+            if timeOut == 500:
+                openVpnStat = False
+                break
+
+    # Previously initiate openvpn successfull
+    if openVpnStat == True:
+        # Kill back the openvpn instances
+        openVpnPID = []    # Current openvpn PID instances
+        openVpnPIDCnt = 0  # Current openvpn PID counter
+
+        # Get openvpn PID
+        openVpnPID, openVpnPIDCnt = terminateOpenVpn(['pgrep', 'openvpn'])
+        # Openvpn instances exist
+        if openVpnPIDCnt > 0:
+            # Execute kill instance command
+            for a in range (openVpnPIDCnt):
+                tempArgs = ['kill', '-9', openVpnPID[a]]
+                
+                retCode, stdout = runCommand(tempArgs, 10)
+                
+                # NO error after command execution
+                if retCode == 0:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a]))
+                    # Print statement
+                    else:
+                        print "DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a])
+
+        # There is NO openvpn instances
+        else:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_UTOUCH: NO OpenVPN instance EXIST!")
+            # Print statement
+            else:
+                print "DEBUG_UTOUCH: NO OpenVPN instance EXIST!" 
+    
+    return routeInfo, routeInfoCnt
+
+# Check and monitor USB thumb drive plug in status
+def checkUSBUtouchStatus (threadname, delay):
+    global eCryptProc
+    global dCryptProc
+    global initPihole
+    global wifiShutDown
+    
+    # Forever loop
+    while True:
+        # Loop every 0.5s
+        time.sleep(delay)
+
+        context = pyudev.Context()
+        monitor = pyudev.Monitor.from_netlink(context)
+        monitor.filter_by(subsystem='usb')
+
+        monitor.start()
+        for device in iter(monitor.poll, None):
+            if device.action != 'add':
+                if eCryptProc == True or dCryptProc == True:
+                    # Revoke nc2vpn key cache immediately
+                    revokeOvpnKeyCache()
+
+                    # STOP VPN tunnel
+                    openVpnPID = []    # Current openvpn PID instances
+                    openVpnPIDCnt = 0  # Current openvpn PID counter
+
+                    # Get openvpn PID
+                    openVpnPID, openVpnPIDCnt = terminateOpenVpn(['pgrep', 'openvpn'])
+                    # Openvpn instances exist
+                    if openVpnPIDCnt > 0:
+                        # Execute kill instance command
+                        for a in range (openVpnPIDCnt):
+                            tempArgs = ['kill', '-9', openVpnPID[a]]
+                            
+                            retCode, stdout = runCommand(tempArgs, 10)
+                            
+                            # NO error after command execution
+                            if retCode == 0:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_USBUTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a]))
+                                # Print statement
+                                else:
+                                    print "DEBUG_USBUTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a])
+
+                    # There is NO openvpn instances
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_USBUTOUCH: NO OpenVPN instance EXIST!")
+                        # Print statement
+                        else:
+                            print "DEBUG_USBUTOUCH: NO OpenVPN instance EXIST!"
+
+                    dCryptProc = False
+                    eCryptProc = False
+                    initPihole = False
+                    wifiShutDown = False
+                    
+# Communication and process monitoring for Ubuntu Touch smartphone
+def uTouchCommProc (threadname, delay):
+    global dCryptProc
+    global nc2VpnKeyTPath
+    global nc2VpnKeyPath
+    global initPihole
+    global wifiShutDown
+    global eCryptProc
+    global backLogger
+    global currUSBPath
+    
+    networkManFailed = False
+    initOthers = False
+    nc2VpnTunn = False
+        
+    fileDel = False
+    fileExist = False
+    fileName = ''
+        
+    checkProcCnt = 0
+    pingAtmptCnt = 0
+    vpnTunAtmptCnt = 0
+    piHoleCnt = 0
+    
+    ipRouteArr = []  # Ip route add command that not successfully initiate by openvpn
+    ipRouteCnt = 0   # Ip route add index counter
+    execSuccCnt = 0  # Ip route add process success counter
+        
+    # Forever loop
+    while True:
+        # Loop every 0.5s
+        time.sleep(delay)
+
+        # Previously there was encryption process take place
+        # Start decryption process for secure gateway initialization
+        if eCryptProc == True:
+            # Clear encryption process
+            eCryptProc = False
+            # Set status of decrypt process
+            dCryptProc = True
+                        
+##            # Write to logger
+##            if backLogger == True:
+##                logger.info("DEBUG_UTOUCH: Start DECRYPT process")
+##            # Print statement
+##            else:
+##                print "DEBUG_UTOUCH: Start DECRYPT process"
+##
+##            # Delete the contents of nc2vpn key inside temporary folder
+##            tempArgs = 'cd ' + nc2VpnKeyTPath + ';rm -rf *'
+##            out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+##            stdout,stderr = out.communicate()
+##
+##            # NO error after command execution
+##            if stderr == None:
+##                # Write to logger
+##                if backLogger == True:
+##                    logger.info("DEBUG_UTOUCH: Delete temporary nc2vpn key files successful")
+##                # Print statement
+##                else:
+##                    print "DEBUG_UTOUCH: Delete temporary nc2vpn key files successful"
+##
+##                # Wait before execute another command
+##                time.sleep(1)
+##            
+##                # Start decrypt the nc2vpn key and stored it inside temporary folder
+##                # Command:
+##                # python3 decrypt.py --source=/path/to/your/drive/ --destination=/path/to/your/drive/ --private-key=/path/to/your/key.private
+##                tempPrivKeyPath = currUSBPath + '/key.private'
+##                out = subprocess.Popen(['python3', 'decrypt.py', '--source', nc2VpnKeyPath, '--destination', nc2VpnKeyTPath, '--private-key', tempPrivKeyPath], \
+##                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+##                stdout,stderr = out.communicate()
+##
+##                # NO error after command execution
+##                if stderr == None:
+##                    if 'Decrypting:' in stdout:
+##                        # Write to logger
+##                        if backLogger == True:
+##                            logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key successful")
+##                        # Print statement
+##                        else:
+##                            print "DEBUG_UTOUCH: Decrypt nc2vpn key successful"
+##
+##                        # Clear encryption process
+##                        eCryptProc = False
+##                        # Set status of decrypt process
+##                        dCryptProc = True
+##                    # Operation failed
+##                    else:
+##                        # Write to logger
+##                        if backLogger == True:
+##                            logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!")
+##                            logger.info("DEBUG_UTOUCH: DECRYPT process FAILED!")
+##                        # Print statement
+##                        else:
+##                            print "DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!"
+##                            print "DEBUG_UTOUCH: DECRYPT process FAILED!"
+##
+##                        # Set status of decrypt process
+##                        dCryptProc = False
+##                        
+##                # Operation failed
+##                else:
+##                    # Write to logger
+##                    if backLogger == True:
+##                        logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!")
+##                        logger.info("DEBUG_UTOUCH: DECRYPT process FAILED!")
+##                    # Print statement
+##                    else:
+##                        print "DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!"
+##                        print "DEBUG_UTOUCH: DECRYPT process FAILED!"
+##
+##                    # Set status of decrypt process
+##                    dCryptProc = False
+##                        
+##            # Operation failed
+##            else:
+##                # Write to logger
+##                if backLogger == True:
+##                    logger.info("DEBUG_UTOUCH: Delete temporary nc2vpn key files FAILED!")
+##                    logger.info("DEBUG_UTOUCH: DECRYPT process FAILED!")
+##                # Print statement
+##                else:
+##                    print "DEBUG_UTOUCH: Delete temporary nc2vpn key files FAILED!"
+##                    print "DEBUG_UTOUCH: DECRYPT process FAILED!"
+##
+##                # Set status of decrypt process
+##                dCryptProc = False
+                
+        # Only check other networks process when USB thumb drive are plug in
+        elif dCryptProc == True:
+            # Start back WIFI
+            if wifiShutDown == True:
+                # Enable WIFI radio hardware    
+                retCode, stdout = runCommand(['nmcli', 'radio', 'wifi', 'on'], 30)
+
+                # NO error after command execution
+                if retCode == 0:
+                    wifiShutDown = False
+                    
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_UTOUCH: Bring UP WIFI SUCCESSFULL")
+                    # Print statement
+                    else:
+                        print "DEBUG_UTOUCH: Bring UP WIFI SUCCESSFULL"
+
+                    # Wait before execute another command
+                    time.sleep(1)
+                            
+                    # Restart network-manager service
+                    retCode, stdout = runCommand(['service', 'network-manager', 'restart'], 60)
+
+                    # NO error after command execution
+                    if retCode == 0:
+                        # Restart network-manager successful
+                        if 'start/running' in stdout:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_UTOUCH: RESTART network-manager SUCCESSFULL")
+                            # Print statement
+                            else:
+                                print "DEBUG_UTOUCH: RESTART network-manager SUCCESSFULL"
+                
+                            networkManFailed = False  # Clear network-manager check flag, all is running well, no need to check it
+                            initOthers = True         # Set flag for process initialization and status check
+                                
+                        # Restart network-manager failed!
+                        else:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle")
+                            # Print statement
+                            else:
+                                print "DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle"
+
+                            networkManFailed = True  # Set network-manager check flag, network problem, retry to start back on the next process cycle
+                            initOthers = False       # Clear flag for process initialization and status check, network problem, drop the checking
+                    
+                    # Command operation failed
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle")
+                        # Print statement
+                        else:
+                            print "DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle"
+
+                        networkManFailed = True  # Set network-manager check flag, network problem, retry to start back on the next cycle
+                        initOthers = False       # Clear flag for process initialization and status check, network problem, drop the checking
+
+                # Command operation failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_UTOUCH: Bring UP WIFI FAILED!, will restart back in the next cycle")
+                    # Print statement
+                    else:
+                        print "DEBUG_UTOUCH: Bring UP WIFI FAILED!, will restart back in the next cycle"
+
+            # Previously network-manager failed to start
+            elif networkManFailed == True:
+                # Restart pihole DNS server
+                retCode, stdout = runCommand(['pihole', 'restartdns'], 60)
+
+                # NO error after command execution
+                if retCode == 0:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL")
+                    # Print statement
+                    else:
+                        print "DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL"
+
+                    # Wait before execute another command
+                    time.sleep(1)
+                    
+                    # Restart network-manager service
+                    retCode, stdout = runCommand(['service', 'network-manager', 'restart'], 60)
+
+                    # NO error after command execution
+                    if retCode == 0:
+                        # Restart network-manager successful
+                        if 'start/running' in stdout:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_UTOUCH: RESTART network-manager SUCCESSFULL")
+                            # Print statement
+                            else:
+                                print "DEBUG_UTOUCH: RESTART network-manager SUCCESSFULL"
+
+                            if ipRouteCnt > 0:
+                                # Execute ip route add command
+                                for a in range (ipRouteCnt):
+                                    retCode, stdout = runCommand(shlex.split(ipRouteArr[a]), 10)
+                                    
+                                    # NO error after command execution
+                                    if retCode == 0:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_UTOUCH: IP route add [%s] SUCCESSFULL" % (ipRouteArr[a]))
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_UTOUCH: IP route add [%s] SUCCESSFULL" % (ipRouteArr[a])
+
+                            networkManFailed = False  # Clear network-manager check flag, all is running well, no need to check it
+                            initOthers = True         # Set flag for process initialization and status check
+                            checkProcCnt = 0
+                                                    
+                        # Restart network-manager failed!
+                        else:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle")
+                            # Print statement
+                            else:
+                                print "DEBUG_UTOUCH: RESTART network-manager FAILED!, will restart back in the next cycle"
+                            
+                    # Command operation failed
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_UTOUCH: RESTART network-manager FAILED! [stderr], will restart back in the next cycle")
+                        # Print statement
+                        else:
+                            print "DEBUG_UTOUCH: RESTART network-manager FAILED! [stderr], will restart back in the next cycle"
+
+                # Command operation failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_UTOUCH: Initialize pihole DNS FAILED! [stderr], will reinitialize back in the next cycle")
+                    # Print statement
+                    else:
+                        print "DEBUG_UTOUCH: Initialize pihole DNS FAILED! [stderr], will reinitialize back in the next cycle"    
+
+            # Initialization and checking for others parameter
+            if initOthers == True:
+                # Test the 4G network by executing ping process
+                if checkProcCnt == 0:
+                    # Ping every 60 seconds
+                    #if pingChkCnt == 60:
+                    #    pingChkCnt = 0
+
+                    retCode, stdout = runCommand(['ping', '-c', '1', getProbeAddr(dnsProbeHost[0])], 15)
+
+                    # NO error after command execution
+                    if retCode != None:
+                        # 4G network OK
+                        if '1 received' in stdout:
+                            checkProcCnt = 1 # Pihole restart DNS and pihole status check, on next process cycle
+                            pingAtmptCnt = 0
+                            
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_UTOUCH: 4G network OK")
+                            # Print statement
+                            else:
+                                print "DEBUG_UTOUCH: 4G network OK"
+
+                        # 4G network FAILED!
+                        elif '0 received' or 'failure' in stdout:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_UTOUCH: 4G network FAILED!")
+                            # Print statement
+                            else:
+                                print "DEBUG_UTOUCH: 4G network FAILED!"
+
+                            # Increment for ping check attempt
+                            pingAtmptCnt += 1
+                            # 10 attempt still network failed, prepare to restart network-manager
+                            if pingAtmptCnt == 10:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager")
+                                # Print statement
+                                else:
+                                    print "DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager"
+                                
+                                initOthers = False        # Disable aother process initialization and checking
+                                networkManFailed = True   # Restart network-manager
+                                checkProcCnt = 0          # Reset check process counter
+                                pingAtmptCnt = 0
+
+                    # Command operation failed
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager")
+                        # Print statement
+                        else:
+                            print "DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager"
+
+                        # Increment for ping check attempt
+                        pingAtmptCnt += 1
+                        # 60 attempt still network failed, prepare to restart network-manager
+                        if pingAtmptCnt == 60:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager")
+                            # Print statement
+                            else:
+                                print "DEBUG_UTOUCH: 4G network FAILED!, prepare to restart network-manager"
+                            
+                            initOthers = False        # Disable aother process initialization and checking
+                            networkManFailed = True   # Restart network-manager
+                            checkProcCnt = 0          # Reset check process counter
+                            pingAtmptCnt = 0
+
+                # Start nc2vpn tunnel if not start yet and continuously monitored the tunnel
+                elif checkProcCnt == 1:
+                    # First initialization of the nc2vpn tunnel
+                    if nc2VpnTunn == False:
+                        fileDel = False
+
+                        # Check and retrieve nc2vpn OpenVPN configuration (sealed memory file)
+                        fileName = getDecryptedOvpn()
+                        fileExist = fileName != ''  # Set a flag to indicate vpn file already previously decrypted
+
+                        # NO file or previously has been deleted, decrypt back nc2vpn key
+                        if fileExist == False:
+                            # Start decrypt the nc2vpn key and stored it inside temporary folder
+                            # Command:
+                            # python3 decrypt.py --source=/path/to/your/drive/ --destination=/path/to/your/drive/ --private-key=/path/to/your/key.private
+                            tempPrivKeyPath = currUSBPath + '/key.private'
+                            retCode, stdout = decryptNc2Vpn(nc2VpnKeyPath, nc2VpnKeyTPath, tempPrivKeyPath)
+
+                            # NO error after command execution
+                            if retCode == 0:
+                                if 'Decrypting:' in stdout:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key successful")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_UTOUCH: Decrypt nc2vpn key successful"
+
+                                # Operation failed, will retry to decrypt on the next process cycle
+                                else:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!"
+
+                            # Operation failed, will retry to decrypt on the next process cycle
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!")
+                                # Print statement
+                                else:
+                                    print "DEBUG_UTOUCH: Decrypt nc2vpn key FAILED!"
+
+                        # Invalid OpenVPN configuration (pre-flight check), NOT started until the nc2vpn key replaced
+                        elif preflightOvpn(fileName) == False:
+                            pass
+
+                        # Temporary nc2vpn key exist
+                        else:
+                            # Clear the IP route add buffer
+                            if ipRouteCnt > 0:
+                                for a in range (ipRouteCnt):
+                                    ipRouteArr[a] = ''
+                                ipRouteCnt = 0
+                                
+                            # VPN remote server resolved through the DNS cache
+                            remoteArgs = []
+                            for remoteAddr, remotePort, remoteProto in resolveOvpnRemote(fileName):
+                                remoteArgs += ['--remote', remoteAddr, remotePort, remoteProto]
+
+                            # Get the ip route add info    
+                            tempArgs = ['openvpn'] + remoteArgs + ['--config', fileName]
+                            ipRouteArr, ipRouteCnt = getOpenVpnRouteInfo(tempArgs, nc2VpnKeyTPath)
+                            # Previously successfully get the ip route add info
+                            if ipRouteCnt > 0:
+                                # Wait before execute another command
+                                time.sleep(1)
+                        
+                                # START VPN tunnel
+                                tempArgs = ['openvpn'] + remoteArgs + ['--config', fileName, '--writepid', ovpnPidPath, '--daemon']
+                                retCode, stdout = runCommand(tempArgs, 30, cmdDir=nc2VpnKeyTPath)
+
+                                # NO error after command execution
+                                if retCode == 0:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_UTOUCH: Init. OpenVPN sequence completed")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_UTOUCH: Init. OpenVPN sequence completed"
+                                
+                                    nc2VpnTunn = True  # Set a flag to check periodically vpn tunnel 
+                                    checkProcCnt = 0   # Reset check process counter, start with ping process, on next process cycle
+                                    
+                                # Command operation failed
+                                else:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_UTOUCH: Init. OpenVPN sequence FAILED! [stderr]")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_UTOUCH: Init. OpenVPN sequence FAILED! [stderr]"
+
+                            # Get the info failed
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_UTOUCH: Init. OpenVPN sequence FAILED!")
+                                # Print statement
+                                else:
+                                    print "DEBUG_UTOUCH: Init. OpenVPN sequence FAILED!"
+                                
+                    # OpenVPN checking by checking tun0 interface 
+                    else:
+                        # Check tun0 interface
+                        retCode, stdout = runCommand(['ifconfig'], 10)
+                        
+                        # NO error after command execution
+                        if retCode == 0:
+                            # VPN tunnel exist
+                            if 'tun0' in stdout:
+                                # Delete previous decrypted vpn file, to ensure secured vpn transaction
+                                if fileDel == False:
+                                    # Close nc2vpn key sealed memory file and remove the contents of temporary folder
+                                    if releaseOvpnMemfd() == True:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_UTOUCH: Delete temporary nc2vpn key files successful")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_UTOUCH: Delete temporary nc2vpn key files successful"    
+
+                                    fileDel = True
+
+                                # Initiate ip route add process
+                                # Get the routing table IP address
+                                ipAddress = []
+                                ipAddressCnt = 0
+                                chkExist = False
+                                for a in range (ipRouteCnt):
+                                    foundChar = False
+                                    ipAddr = ''
+                                    respLen = len(ipRouteArr[a])
+                                    
+                                    # Go through the ip route array contents
+                                    for b in range(0, (respLen + 1)):
+                                        oneChar = mid(ipRouteArr[a], b, 1)
+                                        # Check the IP address
+                                        if oneChar.isdigit() or oneChar == '.':
+                                            foundChar = True
+                                            ipAddr += oneChar
+                                        elif foundChar == True and oneChar == '/':
+                                            break
+
+                                    # First array index
+                                    if ipAddressCnt == 0:
+                                        ipAddress = [ipAddr]
+                                        ipAddressCnt += 1
+                                        
+                                    # Subsequent array index
+                                    else:
+                                        ipAddress.append(ipAddr)
+                                        ipAddressCnt += 1
+
+                                # Start check the routing table
+                                chkExist = chkRouteAddIpAddress(ipAddress, ipAddressCnt)
+                                # Routing for openvpn IP address still not exist
+                                if chkExist == False:
+                                    # Execute ip route add command
+                                    for a in range (ipRouteCnt):
+                                        retCode, stdout = runCommand(shlex.split(ipRouteArr[a]), 10)
+                                        
+                                        # NO error after command execution
+                                        if retCode == 0:
+                                            # Write to logger
+                                            if backLogger == True:
+                                                logger.info("DEBUG_UTOUCH: IP route add [%s] SUCCESSFULL" % (ipRouteArr[a]))
+                                            # Print statement
+                                            else:
+                                                print "DEBUG_UTOUCH: IP route add [%s] SUCCESSFULL" % (ipRouteArr[a])
+
+                                            execSuccCnt += 1
+                                        
+                                    # Previous IP route add process successfull
+                                    if execSuccCnt == ipRouteCnt:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_UTOUCH: IP route add process SUCCESSFULL")
+                                            logger.info("DEBUG_UTOUCH: Init. OpenVPN sequence completed")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_UTOUCH: IP route add process SUCCESSFULL"
+                                            print "DEBUG_UTOUCH: Init. OpenVPN sequence completed"
+
+                                        execSuccCnt = 0    
+                                        nc2VpnTunn = True  # Set a flag to check periodically vpn tunnel 
+                                        checkProcCnt = 0   # Reset check process counter, start with ping process, on next process cycle
+
+                                    # Previous IP route add process failed!
+                                    else:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_UTOUCH: IP route add process FAILED!")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_UTOUCH: IP route add process FAILED!"
+                                            
+                                        openVpnPID = []    # Current openvpn PID instances
+                                        openVpnPIDCnt = 0  # Current openvpn PID counter
+                                        
+                                        # Get openvpn PID
+                                        openVpnPID, openVpnPIDCnt = terminateOpenVpn(['pgrep', 'openvpn'])
+                                        # Openvpn instances exist
+                                        if openVpnPIDCnt > 0:
+                                            # Execute kill instance command
+                                            for a in range (openVpnPIDCnt):
+                                                tempArgs = ['kill', '-9', openVpnPID[a]]
+                                                
+                                                retCode, stdout = runCommand(tempArgs, 10)
+                                                
+                                                # NO error after command execution
+                                                if retCode == 0:
+                                                    # Write to logger
+                                                    if backLogger == True:
+                                                        logger.info("DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a]))
+                                                    # Print statement
+                                                    else:
+                                                        print "DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a])
+                                                    
+                                        # There is NO openvpn instances
+                                        else:
+                                            # Write to logger
+                                            if backLogger == True:
+                                                logger.info("DEBUG_UTOUCH: NO OpenVPN instance EXIST!")
+                                            # Print statement
+                                            else:
+                                                print "DEBUG_UTOUCH: NO OpenVPN instance EXIST!"
+
+                                # Routing for openvpn IP address already exist
+                                else:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_UTOUCH: Routing table IP address EXIST")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_UTOUCH: Routing table IP address EXIST"
+                                                                                                    
+                                checkProcCnt = 0   # Reset check process counter, start with ping process, on next process cycle
+
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_UTOUCH: VPN tunnel OK")
+                                # Print statement
+                                else:
+                                    print "DEBUG_UTOUCH: VPN tunnel OK"
+
+                            # VPN tunnel not exist
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_UTOUCH: VPN tunnel tun0 NOT exist!")
+                                # Print statement
+                                else:
+                                    print "DEBUG_UTOUCH: VPN tunnel tun0 NOT exist!"
+
+                                # Increment VPN tunnel check attempt counter
+                                vpnTunAtmptCnt += 1
+                                # 60 attempt still tun0 interface not exist, prepare to kill openvpn
+                                if vpnTunAtmptCnt == 60:
+                                    # STOP VPN tunnel
+                                    openVpnPID = []    # Current openvpn PID instances
+                                    openVpnPIDCnt = 0  # Current openvpn PID counter
+
+                                    # Get openvpn PID
+                                    openVpnPID, openVpnPIDCnt = terminateOpenVpn(['pgrep', 'openvpn'])
+                                    # Openvpn instances exist
+                                    if openVpnPIDCnt > 0:
+                                        # Execute kill instance command
+                                        for a in range (openVpnPIDCnt):
+                                            tempArgs = ['kill', '-9', openVpnPID[a]]
+                                            
+                                            retCode, stdout = runCommand(tempArgs, 10)
+                                            
+                                            # NO error after command execution
+                                            if retCode == 0:
+                                                # Write to logger
+                                                if backLogger == True:
+                                                    logger.info("DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a]))
+                                                # Print statement
+                                                else:
+                                                    print "DEBUG_UTOUCH: KILL OpenVPN instance [%s] SUCCESSFULL" % (openVpnPID[a])
+
+                                    # There is NO openvpn instances
+                                    else:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_UTOUCH: NO OpenVPN instance EXIST!")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_UTOUCH: NO OpenVPN instance EXIST!"    
+
+                                    vpnTunAtmptCnt = 0
+                                    nc2VpnTunn = False   # Reset a flag to initiate back OpenVpn, checking network connectivity first 
+                                    checkProcCnt = 0     # Reset check process counter, start with ping process, on next process cycle
+                                    
+        # USB key detached
+        else:
+##            # First initialization of the pihole
+##            if initPihole == False:
+##                # First check wifi status
+##                out = subprocess.Popen(["nmcli radio wifi"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+##                stdout,stderr = out.communicate()
+##                # NO error after command execution
+##                if stderr == None:
+##                    # Wifi still in enabled mode, shut it down
+##                    if 'enabled' in stdout:
+##                        DEFNULL = open(os.devnull, 'w')
+##                        retcode = subprocess.call(['/usr/local/bin/pihole', 'restartdns'], stdout=DEFNULL, stderr=subprocess.STDOUT)
+##
+##                        # Write to logger
+##                        if backLogger == True:
+##                            logger.info("DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL")
+##                        # Print statement
+##                        else:
+##                            print "DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL"
+##                                
+####                        # Restart pihole DNS server
+####                        out = subprocess.Popen(["/usr/local/bin/pihole restartdns"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+####                        stdout,stderr = out.communicate()
+####
+####                        # NO error after command execution
+####                        if stderr == None:
+####                            # Write to logger
+####                            if backLogger == True:
+####                                logger.info("DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL")
+####                            # Print statement
+####                            else:
+####                                print "DEBUG_UTOUCH: Initialize pihole DNS SUCCESSFULL"
+##
+##                        initPihole = True
+##            
+##            # Previously pihole already been initialized
+##            else:
+            # Shutdown WIFI if USB key NOT attached
+            if wifiShutDown == False:
+                checkProcCnt = 0
+                vpnTunAtmptCnt = 0
+                pingAtmptCnt = 0
+
+                initOthers = False
+                networkManFailed = False
+                nc2VpnTunn = False
+
+                # First check wifi status
+                retCode, stdout = runCommand(['nmcli', 'radio', 'wifi'], 30)
+                # NO error after command execution
+                if retCode == 0:
+                    # Wifi still in enabled mode, shut it down
+                    if 'enabled' in stdout: 
+                        # Wait before execute another command
+                        time.sleep(1)
+                                   
+                        # Disable WIFI radio hardware    
+                        retCode, stdout = runCommand(['nmcli', 'radio', 'wifi', 'off'], 30)
+
+                        # NO error after command execution
+                        if retCode == 0:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_UTOUCH: Shutdown WIFI")
+                            # Print statement
+                            else:
+                                print "DEBUG_UTOUCH: Shutdown WIFI"
+
+                    # Wifi already been shutdown
+                    elif 'disabled' in stdout:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_UTOUCH: Previously WIFI already been SHUTDOWN")
+                        # Print statement
+                        else:
+                            print "DEBUG_UTOUCH: Previously WIFI already been SHUTDOWN"
+
+                        wifiShutDown = True
+
+            # Previously WIFI already been shutdown
+            else:
+                # Write to logger
+                if backLogger == True:
+                    logger.info("DEBUG_UTOUCH: NC2VPN Secure GW OFFLINE")
+                # Print statement
+                else:
+                    print "DEBUG_UTOUCH: NC2VPN Secure GW OFFLINE"
+    
+# Connection and tunnel monitoring - network monitoring and validation
+def networkMon (threadname, delay):
+    global dCryptProc
+    global clientIPAddr
+    global netMonChkCnt
+    global usbGraceExp
+    global tunnelValid
+    global net4gValid
+    global net4gAtmptCnt
+    global nc2VpnKeyTPath
+    global nc2VpnKeyPath
+    global vpnAtmptCnt
+    global currUSBPath
+    global lcdOperSel
+    global radioMode
+    global radioValid
+    global radioOpt
+    global publicIPaddr
+    global cmdHistLogIntv
+    global qmiDevice
+    global modemIndValid
+    global modemEvtQueue
+    global modemList
+    global modemRetryIntv
+    global multiPath
+    global preWarmLock
+    global fwdHoldState
+    global ovpnMgmtPath
+    global ovpnMgmtSock
+    global ovpnMgmtCred
+    
+    fileName = ''
+    fileExist = False
+    fileDel = False
+    tempData = []
+    cmdHistCnt = 0
+    modemRetryCnt = 0
+                
+    # Forever loop
+    while True:
+        # Loop every 0.5s
+        time.sleep(delay)
+
+        # Periodically write external command latency histogram
+        cmdHistCnt += 1
+        if cmdHistCnt == cmdHistLogIntv:
+            cmdHistCnt = 0
+            logCmdLatencyHist()
+
+        # Process 4G LTE modem event from QMI indication listener and NAS serving system monitoring
+        while modemEvtQueue.empty() == False:
+            evtDev, evtType, evtInfo = modemEvtQueue.get()
+
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_NETMON: [%s] 4G LTE modem event: %s %s" % (evtDev, evtType, evtInfo))
+            # Print statement
+            else:
+                print "DEBUG_NETMON: [%s] 4G LTE modem event: %s %s" % (evtDev, evtType, evtInfo)
+
+            # Data session dropped, reset the 4G LTE modem immediately
+            if evtType == 'disconnected' and evtDev in modemList and modemList[evtDev]['valid'] == True:
+                reset4GModem(evtDev)
+                modemList[evtDev]['valid'] = False
+
+                # No other 4G LTE modem UP, initiate 4G LTE modem on the next cycle
+                if net4gValid == True and chk4GModemValid() == False:
+                    net4gValid = False
+                    net4gAtmptCnt = 0
+                    netMonChkCnt = 0
+
+        # Forwarding kept STOP by USB key removal lockdown, restore once the VPN tunnel UP again
+        if len(fwdHoldState) > 0 and tunnelValid == True:
+            restoreForward(fwdHoldState)
+            fwdHoldState = {}
+
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_NETMON: VPN tunnel UP, forwarding restored")
+            # Print statement
+            else:
+                print "DEBUG_NETMON: VPN tunnel UP, forwarding restored"
+
+        # USB key removal grace window expired and the USB key NOT re-inserted
+        if usbGraceExp != 0 and time.time() >= usbGraceExp:
+            usbGraceExp = 0
+            expireUsbGrace()
+
+        # Periodically retry failed or newly plugged 4G LTE modem in background while other 4G LTE modem are UP
+        modemRetryCnt += 1
+        if modemRetryCnt >= modemRetryIntv:
+            modemRetryCnt = 0
+            if net4gValid == True:
+                discover4GModem()
+                if False in [modemList[x]['valid'] for x in modemList.keys()]:
+                    thread.start_new_thread(initiateAll4GModem, ())
+
+        # Radio mode
+        if radioMode == True:
+            # Initiate and check 4G LTE modem
+            if netMonChkCnt == 0:
+                # 4G network not start yet, or previously has already terminated
+                if net4gValid == False:
+                    # Start initiate 4G network
+                    startTime = time.time()
+                    retResult = initiateAll4GModem()
+
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_NETMON: 4G LTE modem bring-up time: %.2fs" % (time.time() - startTime))
+                    # Print statement
+                    else:
+                        print "DEBUG_NETMON: 4G LTE modem bring-up time: %.2fs" % (time.time() - startTime)
+
+                    # Successful
+                    if retResult == True:
+                        net4gValid = True
+                        netMonChkCnt = 1
+
+                        # Change LCD operation mode
+                        lcdOperSel = 9
+                    
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_NETMON: Initiate 4G LTE modem successful")
+                        # Print statement
+                        else:
+                            print "DEBUG_NETMON: Initiate 4G LTE modem successful"
+
+                    # Failed
+                    else:
+                        # STOP 4G LTE modem 
+                        retCode, stdout = stopAll4GModem()
+
+                        # NO error after command execution
+                        if retCode == 0:
+                            if 'HW restricted:' in stdout:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_NETMON: STOP 4G LTE modem successful - Init. 4G LTE modem")
+                                # Print statement
+                                else:
+                                    print "DEBUG_NETMON: STOP 4G LTE modem successful - Init. 4G LTE modem"
+                                        
+                                # Wait before execute another command
+                                time.sleep(1)
+
+                                # Bring wwan0 interface DOWN
+                                retCode, stdout = runCommand(['ifconfig', get4GModemNetIf(), 'down'], 10)
+
+                                # NO error after command execution
+                                if retCode == 0:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_NETMON: Bringing DOWN wwan0 successful - Init. 4G LTE modem")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_NETMON: Bringing DOWN wwan0 successful - Init. 4G LTE modem"
+
+                                # Operation failed
+                                else:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - Init. 4G LTE modem")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - Init. 4G LTE modem"
+
+                            # Operation failed
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_NETMON: STOP 4G LTE modem FAILED! - Init. 4G LTE modem")
+                                # Print statement
+                                else:
+                                    print "DEBUG_NETMON: STOP 4G LTE modem FAILED! - Init. 4G LTE modem"
+
+                        # Operation failed
+                        else:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - init. 4G LTE modem")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - init. 4G LTE modem"
+
+                        # Retry again the sequence
+                        netMonChkCnt = 0
+
+                # 4G network checking through QMI indication listener of the UP 4G LTE modem, data session drop are reported as event
+                elif True in [modemIndValid.get(x, False) for x in modemList.keys() if modemList[x]['valid'] == True]:
+                    net4gAtmptCnt = 0
+                    netMonChkCnt = 1
+
+                # 4G network checking by pinging process to google.com (QMI indication listener not running)
+                else:
+                    # Start PING google.com
+                    retCode, stdout = runCommand(['ping', '-c', '1', getProbeAddr(dnsProbeHost[0])], 15)
+
+                    # NO error after command execution
+                    if retCode != None:
+                        # 4G network OK
+                        if '1 received' in stdout:
+                            net4gValid = True
+
+                            net4gAtmptCnt = 0
+                            netMonChkCnt = 1
+
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: 4G network OK")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: 4G network OK"
+                                
+                        # 4G network FAILED!
+                        elif '0 received' or 'failure' in stdout:
+                            # Increment attempt to check 4G network by pinging process
+                            net4gAtmptCnt += 1
+
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: PING google.com FAILED! - PING google.com attempt FAILED! [%s]" % (net4gAtmptCnt))
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: PING google.com FAILED! - PING google.com attempt FAILED! [%s]" % (net4gAtmptCnt)
+                                
+                            # After  checking 5 times, still 4G network failed, do:
+                            # 1 - Stop 4G modem properly
+                            # 2 - Bring wwan0 interface DOWN
+                            if net4gAtmptCnt == 5:
+                                net4gAtmptCnt = 0
+
+                                # STOP 4G LTE modem
+                                retCode, stdout = stopAll4GModem()
+
+                                # NO error after command execution
+                                if retCode == 0:
+                                    if 'HW restricted:' in stdout:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_NETMON: STOP 4G LTE modem successful - PING google.com attempt FAILED!")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_NETMON: STOP 4G LTE modem successful - PING google.com attempt FAILED!"
+                                        
+                                        # Wait before execute another command
+                                        time.sleep(1)
+
+                                        # Bring wwan0 interface DOWN
+                                        retCode, stdout = runCommand(['ifconfig', get4GModemNetIf(), 'down'], 10)
+
+                                        # NO error after command execution
+                                        if retCode == 0:
+                                            # Write to logger
+                                            if backLogger == True:
+                                                logger.info("DEBUG_NETMON: Bringing DOWN wwan0 successful - PING google.com attempt FAILED!")
+                                            # Print statement
+                                            else:
+                                                print "DEBUG_NETMON: Bringing DOWN wwan0 successful - PING google.com attempt FAILED!"
+
+                                            # Wait before execute another command
+                                            time.sleep(1)
+
+                                            # KILL udhcpc instance of the primary 4G LTE modem network interface only
+                                            retCode, stdout = runCommand(['pkill', '-f', 'udhcpc -i ' + get4GModemNetIf()], 10)
+
+                                            # NO error after command execution
+                                            if retCode != None:
+                                                # Write to logger
+                                                if backLogger == True:
+                                                    logger.info("DEBUG_NETMON: KILL  udhcpc SUCCESSFUL")
+                                                    logger.info("DEBUG_NETMON: Initiate 4G LTE modem on the next cycle...")
+                                                # Print statement
+                                                else:
+                                                    print "DEBUG_NETMON: KILL  udhcpc SUCCESSFUL"
+                                                    print "DEBUG_NETMON: Initiate 4G LTE modem on the next cycle..."
+                                            
+                                                # Retry again the sequence, start with pinging client process  
+                                                net4gValid = False
+                                                netMonChkCnt = 0
+
+                                        # Operation failed
+                                        else:
+                                            # Write to logger
+                                            if backLogger == True:
+                                                logger.info("DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - PING google.com attempt FAILED!")
+                                            # Print statement
+                                            else:
+                                                print "DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - PING google.com attempt FAILED!"
+
+                                    # Operation failed
+                                    else:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_NETMON: STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_NETMON: STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!"
+
+                                # Operation failed
+                                else:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!"    
+
+                    # Operation failed
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_NETMON: Command execution to PING google.com FAILED!")
+                        # Print statement
+                        else:
+                            print "DEBUG_NETMON: Command execution to PING google.com FAILED!"
+                            
+            # Initiate and check SDR radio monitoring server
+            elif netMonChkCnt == 1:
+                # Radio monitoring server not start yet, or previously has already terminated
+                if radioValid == False:
+                    # Checking SDR availability
+                    retCode, stdout = runCommand(['lsusb'], 10)
+
+                    # NO error after command execution
+                    if retCode == 0:
+                        # SDR USB bus ID
+                        if '1df7:3000' in stdout:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: SDR module available")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: SDR module available"
+                                    
+                            # Wait before execute another command
+                            time.sleep(1)
+
+                            # Option for soapy sdr server
+                            if radioOpt == 0:
+                                tempArg = ['SoapySDRServer', '--bind=' + publicIPaddr + ':1234']
+                                out = spawnCommand(tempArg)
+                                
+                            # Option for RSPTCP server
+                            elif radioOpt == 1:
+                                tempArg = ['rsp_tcp', '-E', '-a', publicIPaddr]
+                                out = spawnCommand(tempArg)
+
+                            # Option for custom gnuradio radio data server
+                            elif radioOpt == 2:
+                                out = spawnCommand(['/usr/bin/python', 'radio_server.py'], '/sources/common/sourcecode/radio-server')
+
+                            # NO error after command execution
+                            if out != None:
+                                radioValid = True
+                                netMonChkCnt = 0
+
+                                # Change LCD operation mode
+                                lcdOperSel = 14
+                                
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_NETMON: Initiate radio monitoring server successful")
+                                # Print statement
+                                else:
+                                    print "DEBUG_NETMON: Initiate radio monitoring server successful"
+                                
+                            # Operation failed
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_NETMON: Command execution to initiate radio monitoring server FAILED!")
+                                # Print statement
+                                else:
+                                    print "DEBUG_NETMON: Command execution to initiate radio monitoring server FAILED!"
+                                    
+                        # SDR NOT available
+                        else:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: SDR module NOT available")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: SDR module NOT available"
+
+                            # Change LCD operation mode
+                            lcdOperSel = 15
+                    
+                # Radio monitoring server status check by checking the server process ID
+                else:
+                    # Option for soapy sdr server
+                    if radioOpt == 0:
+                        retCode, stdout = runCommand(['pgrep', '-f', 'SoapySDRServer'], 10)
+
+                    # Option for RSPTCP server
+                    elif radioOpt == 1:
+                        retCode, stdout = runCommand(['pgrep', '-f', 'rsp_tcp'], 10)
+
+                    # Option for custom gnuradio radio data server
+                    elif radioOpt == 2:
+                        retCode, stdout = runCommand(['pgrep', '-f', 'radio_server'], 10)
+
+                    # NO error after command execution
+                    if retCode != None:
+                        foundDig = False
+                        pidNo = ''
+                        respLen = len(stdout)
+                        for a in range(0, (respLen + 1)):
+                            oneChar = mid(stdout, a, 1)
+                            # Check PID digit
+                            if oneChar.isdigit():
+                                foundDig = True
+                                pidNo += oneChar
+                            elif foundDig == True and oneChar == ' ':
+                                break
+
+                        # PID found
+                        if foundDig == True and pidNo != '':
+                            radioValid = True
+                            netMonChkCnt = 0
+
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: Radio monitoring server OK: PID: [%s]" % (pidNo))
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: Radio monitoring server OK: PID: [%s]" % (pidNo)
+
+                        # PID not found
+                        else:
+                            radioValid = False
+                            netMonChkCnt = 0
+
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: Radio monitoring server TERMINATED, will be restarted on the next cycle")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: Radio monitoring server TERMINATED, will be restarted on the next cycle"
+
+                    # Operation failed
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_NETMON: Command execution to check radio monitoring server status FAILED!")
+                        # Print statement
+                        else:
+                            print "DEBUG_NETMON: Command execution to radio monitoring server status FAILED!"        
+                            
+        # Security gateway mode
+        else:
+            # Check the client computer network, by pinging process
+            if netMonChkCnt == 0:
+                # Start PING client computer
+                retCode, stdout = runCommand(['ping', '-c', '1', clientIPAddr], 15)
+
+                # NO error after command execution
+                if retCode != None:
+                    # Client computer already connected to wifi
+                    if '1 received' in stdout:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_NETMON: PING client computer successful")
+                        # Print statement
+                        else:
+                            print "DEBUG_NETMON: PING client computer successful"
+
+                    # Client computer disconnected from wifi
+                    # To check whether client computer still connected to wifi network
+                    elif '0 received' in stdout:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_NETMON: PING client computer FAILED!")
+                        # Print statement
+                        else:
+                            print "DEBUG_NETMON: PING client computer FAILED!"
+
+                    # Only check other networks process when USB thumbdrive are plug in
+                    if dCryptProc == True:
+                        netMonChkCnt = 1
+                    # Pre-warm mode, bring up 4G LTE modem before USB thumbdrive are plug in
+                    elif chkPreWarm('1 received' in stdout) == True:
+                        netMonChkCnt = 1
+                    else:
+                        netMonChkCnt = 0
+                        
+                # Operation failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_NETMON: Command execution to PING client computer FAILED!")
+                    # Print statement
+                    else:
+                        print "DEBUG_NETMON: Command execution to PING client computer FAILED!"
+                            
+            # Start 4G network if its not start yet and continuously monitored the network
+            elif netMonChkCnt == 1 and (dCryptProc == True or preWarmLock == True):
+                # 4G network not start yet, or previously has already terminated
+                if net4gValid == False:
+                    # Start initiate 4G network
+                    startTime = time.time()
+
+                    # USB thumbdrive plug in and VPN tunnel not start yet, initiate 4G network, nc2vpn key decryption,
+                    # VPN remote resolution and VPN tunnel in one bring-up pipeline
+                    if dCryptProc == True and tunnelValid == False:
+                        stageResult = initiateBringUpPipeline()
+                        retResult = stageResult['modem']
+                    else:
+                        retResult = initiateAll4GModem()
+
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_NETMON: 4G LTE modem bring-up time: %.2fs" % (time.time() - startTime))
+                    # Print statement
+                    else:
+                        print "DEBUG_NETMON: 4G LTE modem bring-up time: %.2fs" % (time.time() - startTime)
+
+                    # Successful
+                    if retResult == True:
+                        net4gValid = True
+                        # VPN tunnel only after USB thumbdrive are plug in, pre-warm mode keep monitoring 4G network
+                        if dCryptProc == True:
+                            netMonChkCnt = 2
+                        else:
+                            netMonChkCnt = 0
+
+                        # Change LCD operation mode
+                        lcdOperSel = 9
+
+                        # VPN tunnel already initiated by bring-up pipeline
+                        if tunnelValid == True:
+                            lcdOperSel = 11
+                    
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_NETMON: Initiate 4G LTE modem successful")
+                        # Print statement
+                        else:
+                            print "DEBUG_NETMON: Initiate 4G LTE modem successful"
+                        
+                    # Failed
+                    else:
+                        # STOP 4G LTE modem 
+                        retCode, stdout = stopAll4GModem()
+
+                        # NO error after command execution
+                        if retCode == 0:
+                            if 'HW restricted:' in stdout:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_NETMON: STOP 4G LTE modem successful - Init. 4G LTE modem")
+                                # Print statement
+                                else:
+                                    print "DEBUG_NETMON: STOP 4G LTE modem successful - Init. 4G LTE modem"
+                                        
+                                # Wait before execute another command
+                                time.sleep(1)
+
+                                # Bring wwan0 interface DOWN
+                                retCode, stdout = runCommand(['ifconfig', get4GModemNetIf(), 'down'], 10)
+
+                                # NO error after command execution
+                                if retCode == 0:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_NETMON: Bringing DOWN wwan0 successful - Init. 4G LTE modem")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_NETMON: Bringing DOWN wwan0 successful - Init. 4G LTE modem"
+
+                                # Operation failed
+                                else:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - Init. 4G LTE modem")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - Init. 4G LTE modem"
+
+                            # Operation failed
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_NETMON: STOP 4G LTE modem FAILED! - Init. 4G LTE modem")
+                                # Print statement
+                                else:
+                                    print "DEBUG_NETMON: STOP 4G LTE modem FAILED! - Init. 4G LTE modem"
+
+                        # Operation failed
+                        else:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - init. 4G LTE modem")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - init. 4G LTE modem"
+
+                        # Retry again the sequence, start with pinging client process 
+                        netMonChkCnt = 0
+
+                # 4G network checking through QMI indication listener of the UP 4G LTE modem, data session drop are reported as event
+                elif True in [modemIndValid.get(x, False) for x in modemList.keys() if modemList[x]['valid'] == True]:
+                    net4gAtmptCnt = 0
+                    # VPN tunnel only after USB thumbdrive are plug in, pre-warm mode keep monitoring 4G network
+                    if dCryptProc == True:
+                        netMonChkCnt = 2
+                    else:
+                        netMonChkCnt = 0
+
+                # 4G network checking by pinging process to google.com (QMI indication listener not running)
+                else:
+                    # Start PING google.com
+                    retCode, stdout = runCommand(['ping', '-c', '1', getProbeAddr(dnsProbeHost[0])], 15)
+
+                    # NO error after command execution
+                    if retCode != None:
+                        # 4G network OK
+                        if '1 received' in stdout:
+                            net4gValid = True
+
+                            net4gAtmptCnt = 0
+                            # VPN tunnel only after USB thumbdrive are plug in, pre-warm mode keep monitoring 4G network
+                            if dCryptProc == True:
+                                netMonChkCnt = 2
+                            else:
+                                netMonChkCnt = 0
+
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: 4G network OK")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: 4G network OK"
+                                
+                        # 4G network FAILED!
+                        elif '0 received' or 'failure' in stdout:
+                            # Increment attempt to check 4G network by pinging process
+                            net4gAtmptCnt += 1
+
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: PING google.com FAILED! - PING google.com attempt FAILED! [%s]" % (net4gAtmptCnt))
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: PING google.com FAILED! - PING google.com attempt FAILED! [%s]" % (net4gAtmptCnt)
+                                
+                            # After  checking 5 times, still 4G network failed, do:
+                            # 1 - Stop 4G modem properly
+                            # 2 - Bring wwan0 interface DOWN
+                            if net4gAtmptCnt == 5:
+                                net4gAtmptCnt = 0
+
+                                # STOP 4G LTE modem
+                                retCode, stdout = stopAll4GModem()
+
+                                # NO error after command execution
+                                if retCode == 0:
+                                    if 'HW restricted:' in stdout:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_NETMON: STOP 4G LTE modem successful - PING google.com attempt FAILED!")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_NETMON: STOP 4G LTE modem successful - PING google.com attempt FAILED!"
+                                        
+                                        # Wait before execute another command
+                                        time.sleep(1)
+
+                                        # Bring wwan0 interface DOWN
+                                        retCode, stdout = runCommand(['ifconfig', get4GModemNetIf(), 'down'], 10)
+
+                                        # NO error after command execution
+                                        if retCode == 0:
+                                            # Write to logger
+                                            if backLogger == True:
+                                                logger.info("DEBUG_NETMON: Bringing DOWN wwan0 successful - PING google.com attempt FAILED!")
+                                            # Print statement
+                                            else:
+                                                print "DEBUG_NETMON: Bringing DOWN wwan0 successful - PING google.com attempt FAILED!"
+
+                                            # Wait before execute another command
+                                            time.sleep(1)
+
+                                            # KILL udhcpc instance of the primary 4G LTE modem network interface only
+                                            retCode, stdout = runCommand(['pkill', '-f', 'udhcpc -i ' + get4GModemNetIf()], 10)
+
+                                            # NO error after command execution
+                                            if retCode != None:
+                                                # Write to logger
+                                                if backLogger == True:
+                                                    logger.info("DEBUG_NETMON: KILL  udhcpc SUCCESSFUL")
+                                                    logger.info("DEBUG_NETMON: Initiate 4G LTE modem on the next cycle...")
+                                                # Print statement
+                                                else:
+                                                    print "DEBUG_NETMON: KILL  udhcpc SUCCESSFUL"
+                                                    print "DEBUG_NETMON: Initiate 4G LTE modem on the next cycle..."
+                                                    
+                                                # Retry again the sequence, start with pinging client process  
+                                                net4gValid = False
+                                                netMonChkCnt = 0
+
+                                        # Operation failed
+                                        else:
+                                            # Write to logger
+                                            if backLogger == True:
+                                                logger.info("DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - PING google.com attempt FAILED!")
+                                            # Print statement
+                                            else:
+                                                print "DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - PING google.com attempt FAILED!"
+
+                                    # Operation failed
+                                    else:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_NETMON: STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_NETMON: STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!"
+
+                                # Operation failed
+                                else:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!"    
+
+                    # Operation failed
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_NETMON: Command execution to PING google.com FAILED!")
+                        # Print statement
+                        else:
+                            print "DEBUG_NETMON: Command execution to PING google.com FAILED!"
+                        
+            # Start nc2vpn tunnel if not start yet and continuously monitored the tunnel
+            elif netMonChkCnt == 2 and dCryptProc == True:
+                # VPN tunnel not start yet
+                if tunnelValid == False:
+                    fileDel = False
+                    
+                    # Check and retrieve nc2vpn OpenVPN configuration (sealed memory file)
+                    fileName = getDecryptedOvpn()
+                    fileExist = fileName != ''
+
+                    # NO file or previously has been deleted, decrypt back nc2vpn key
+                    if fileExist == False:
+                        # Start decrypt the nc2vpn key and stored it inside temporary folder
+                        # Command:
+                        # python3 decrypt.py --source=/path/to/your/drive/ --destination=/path/to/your/drive/ --private-key=/path/to/your/key.private
+                        tempPrivKeyPath = currUSBPath + '/key.private'
+                        retCode, stdout = decryptNc2Vpn(nc2VpnKeyPath, nc2VpnKeyTPath, tempPrivKeyPath)
+
+                        # NO error after command execution
+                        if retCode == 0:
+                            if 'Decrypting:' in stdout:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_NETMON: Decrypt nc2vpn key successful")
+                                # Print statement
+                                else:
+                                    print "DEBUG_NETMON: Decrypt nc2vpn key successful"
+
+                            # Operation failed
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_NETMON: Decrypt nc2vpn key FAILED!")
+                                # Print statement
+                                else:
+                                    print "DEBUG_NETMON: Decrypt nc2vpn key FAILED!"
+
+                        # Operation failed
+                        else:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: Decrypt nc2vpn key FAILED!")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: Decrypt nc2vpn key FAILED!"
+                                    
+                    # Invalid OpenVPN configuration (pre-flight check), NOT started until the nc2vpn key replaced
+                    elif preflightOvpn(fileName) == False:
+                        pass
+
+                    # Temporary nc2vpn key exist
+                    else:
+                        # VPN remote server resolved through the DNS cache
+                        ovpnRemote = resolveOvpnRemote(fileName)
+
+                        # Release warm-standby OpenVPN (pre-warm, USB key re-inserted within grace window), remote query
+                        # are answered with the resolved VPN remote server
+                        if 'key' in ovpnMgmtCred and startOvpnStandby() == True and releaseOpenVpnHold() == True:
+                            retCode = 0
+
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: Release warm-standby OpenVPN successful - Init. OpenVPN")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: Release warm-standby OpenVPN successful - Init. OpenVPN"
+
+                        # START VPN tunnel, warm-standby OpenVPN NOT available
+                        else:
+                            if ovpnMgmtSock != None:
+                                runCommand(['pkill', '-f', ovpnMgmtPath], 10)
+
+                            tempArgs = ['openvpn']
+                            for remoteAddr, remotePort, remoteProto in ovpnRemote:
+                                tempArgs += ['--remote', remoteAddr, remotePort, remoteProto]
+                            tempArgs += ['--config', fileName, '--writepid', ovpnPidPath, '--daemon']
+                            retCode, stdout = runCommand(tempArgs, 30, cmdDir=nc2VpnKeyTPath)
+
+                        # NO error after command execution
+                        if retCode == 0:
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: Init. OpenVPN sequence completed - Init. OpenVPN")
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: Init. OpenVPN sequence completed - Init. OpenVPN"
+                            
+                            tunnelValid = True
+                            netMonChkCnt = 0
+
+                            # Change LCD operation mode
+                            lcdOperSel = 11
+
+                            # START secondary VPN tunnel before the temporary nc2vpn key files are deleted
+                            if multiPath == True:
+                                startMultiPathTunnel(fileName)
+                                             
+                        # Operation failed
+                        else:
+                            # Write to logger
                             if backLogger == True:
-                                logger.info("DEBUG_NETMON: 4G network OK")
+                                logger.info("DEBUG_NETMON: Command execution to initiate OpenVPN FAILED! - Init. OpenVPN")
                             # Print statement
                             else:
-                                print "DEBUG_NETMON: 4G network OK"
+                                print "DEBUG_NETMON: Command execution to initiate OpenVPN FAILED! - Init. OpenVPN"
+
+                # OpenVPN checking by checking tun0 interface 
+                else:
+                    # Check tun0 interface
+                    retCode, stdout = runCommand(['ifconfig'], 10)
+
+                    # NO error after command execution
+                    if retCode == 0:
+                        # VPN tunnel still exist
+                        if 'tun0' in stdout:
+                            if fileDel == False:
+                                # Close nc2vpn key sealed memory file and remove the contents of temporary folder
+                                if releaseOvpnMemfd() == True:
+                                    tunnelValid = True
+                                    netMonChkCnt = 0
+
+                                    # Change LCD operation mode
+                                    lcdOperSel = 11
+                                    
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_NETMON: Delete temporary nc2vpn key files successful")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_NETMON: Delete temporary nc2vpn key files successful"    
+
+                                fileDel = True
                                 
-                        # 4G network FAILED!
-                        elif '0 received' or 'failure' in stdout:
-                            # Increment attempt to check 4G network by pinging process
-                            net4gAtmptCnt += 1
+                            tunnelValid = True
+                            vpnAtmptCnt = 0
+                            netMonChkCnt = 0
 
                             # Write to logger
                             if backLogger == True:
-                                logger.info("DEBUG_NETMON: PING google.com FAILED! - PING google.com attempt FAILED! [%s]" % (net4gAtmptCnt))
+                                logger.info("DEBUG_NETMON: VPN tunnel OK")
                             # Print statement
                             else:
-                                print "DEBUG_NETMON: PING google.com FAILED! - PING google.com attempt FAILED! [%s]" % (net4gAtmptCnt)
+                                print "DEBUG_NETMON: VPN tunnel OK"
                                 
-                            # After  checking 5 times, still 4G network failed, do:
-                            # 1 - Stop 4G modem properly
-                            # 2 - Bring wwan0 interface DOWN
-                            if net4gAtmptCnt == 5:
-                                net4gAtmptCnt = 0
+                        # VPN tunnel not exist
+                        else:
+                            # Increment attempt to check VPN tunnel by checking tun0 interface existense
+                            vpnAtmptCnt += 1
+
+                            # Write to logger
+                            if backLogger == True:
+                                logger.info("DEBUG_NETMON: VPN tunnel tun0 NOT exist! - tun0 identification attempt FAILED! [%s]" % (vpnAtmptCnt))
+                            # Print statement
+                            else:
+                                print "DEBUG_NETMON: VPN tunnel tun0 NOT exist! - tun0 identification attempt FAILED! [%s]" % (vpnAtmptCnt)
+
+                            # After  checking 5 times, still tun0 not exist, do:
+                            # KILL VPN tunnel
+                            if vpnAtmptCnt == 5:
+                                vpnAtmptCnt = 0
+
+                                # STOP VPN tunnel, secondary VPN tunnel are restarted with the primary VPN tunnel
+                                retCode, stdout = runCommand(['killall', 'openvpn'], 10)
+                                if multiPath == True:
+                                    stopMultiPathTunnel()
+
+                                # NO error after command execution
+                                if retCode != None:
+                                    if 'no process found' in stdout:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_NETMON: Openvpn process NOT found - tun0 identification attempt FAILED!")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_NETMON: Openvpn process NOT found - tun0 identification attempt FAILED!"
+                                    else:
+                                        # Write to logger
+                                        if backLogger == True:
+                                            logger.info("DEBUG_NETMON: KILL openvpn successful - tun0 identification attempt FAILED!")
+                                        # Print statement
+                                        else:
+                                            print "DEBUG_NETMON: KILL openvpn successful - tun0 identification attempt FAILED!"
+
+                                    # Retry again the sequence, start with pinging client process  
+                                    tunnelValid = False
+                                    netMonChkCnt = 0
+
+                                # Operation failed
+                                else:
+                                    # Write to logger
+                                    if backLogger == True:
+                                        logger.info("DEBUG_NETMON: KILL openvpn FAILED! - tun0 identification attempt FAILED!")
+                                    # Print statement
+                                    else:
+                                        print "DEBUG_NETMON: KILL openvpn FAILED! - tun0 identification attempt FAILED!"
+
+                    # Operation failed
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_NETMON: Command execution to check tun0 interface FAILED!")
+                        # Print statement
+                        else:
+                            print "DEBUG_NETMON: Command execution to check tun0 interface FAILED!"
+                            
+# Display information on the i2c LCD
+def lcdOperation (threadname, delay):
+    global lcdOperSel
+    global lcdDlyStatCnt
+    global lcdBattVolt        
+    global lcdBattCap
+    global lcdBlTimeOut
+    global scrollUP
+    global scrollDWN
+    global tunnelValid
+    global net4gValid
+    global radioMode
+    global radioValid
+    global i2cLcd
+    
+    # Forever loop
+    while True:
+        # Loop every 0.5s
+        time.sleep(delay)
+
+        # Try execution
+        try:
+            # Default LCD display information
+            if lcdOperSel == 0:
+                # Turn ON LCD back light for 10s
+                if GPIO.input(17) == False or GPIO.input(24) == False:
+                    # Turn ON LCD back light
+                    GPIO.output(27, GPIO.HIGH)
+                    lcdBlTimeOut = 0
+                elif lcdBlTimeOut == 20:
+                    # Turn OFF LCD back light
+                    GPIO.output(27, GPIO.LOW)
+                    lcdBlTimeOut = 0
+                else:
+                    # Increment LCD back light counter
+                    lcdBlTimeOut += 1
+
+                lcdDlyStatCnt += 1
+                # Display security gw current status
+                if lcdDlyStatCnt < 10:
+                    if lcdDlyStatCnt == 0:
+                        mylcd.lcd_clear()
+
+                    # Security gateway mode
+                    if radioMode == False:
+                        if tunnelValid == False and net4gValid == False:
+                            # Previously i2c LCD initialization are successful
+                            if i2cLcd == True:
+                                mylcd.lcd_display_string('NC2VPN Secure GW', 1)
+                                mylcd.lcd_display_string('    OFFLINE     ', 2)
+
+                            # Previously i2c LCD initialization are failed
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_LCD: NC2VPN Secure GW")
+                                    logger.info("DEBUG_LCD: OFFLINE")
+                                # Print statement
+                                else:
+                                    print "DEBUG_LCD: NC2VPN Secure GW"
+                                    print "DEBUG_LCD: OFFLINE"
+                                
+                        elif tunnelValid == True and net4gValid == True:
+                            # Previously i2c LCD initialization are successful
+                            if i2cLcd == True:
+                                mylcd.lcd_display_string('NC2VPN Secure GW', 1)
+                                mylcd.lcd_display_string('     ONLINE     ', 2)
+
+                            # Previously i2c LCD initialization are failed    
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_LCD: NC2VPN Secure GW")
+                                    logger.info("DEBUG_LCD: ONLINE")
+                                # Print statement
+                                else:
+                                    print "DEBUG_LCD: NC2VPN Secure GW"
+                                    print "DEBUG_LCD: ONLINE"
+                    # Radio mode
+                    else:
+                        if radioValid == False and net4gValid == False:
+                            # Previously i2c LCD initialization are successful
+                            if i2cLcd == True:
+                                mylcd.lcd_display_string(' Radio Mon. Svr ', 1)
+                                mylcd.lcd_display_string('    OFFLINE     ', 2)
+
+                            # Previously i2c LCD initialization are failed
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_LCD: Radio Mon. Svr")
+                                    logger.info("DEBUG_LCD: OFFLINE")
+                                # Print statement
+                                else:
+                                    print "DEBUG_LCD: NC2VPN Secure GW"
+                                    print "DEBUG_LCD: OFFLINE"
+                                    
+                        elif radioValid == True and net4gValid == True:
+                            # Previously i2c LCD initialization are successful
+                            if i2cLcd == True:
+                                mylcd.lcd_display_string(' Radio Mon. Svr ', 1)
+                                mylcd.lcd_display_string('     ONLINE     ', 2)
+
+                            # Previously i2c LCD initialization are failed
+                            else:
+                                # Write to logger
+                                if backLogger == True:
+                                    logger.info("DEBUG_LCD: Radio Mon. Svr")
+                                    logger.info("DEBUG_LCD: ONLINE")
+                                # Print statement
+                                else:
+                                    print "DEBUG_LCD: NC2VPN Secure GW"
+                                    print "DEBUG_LCD: ONLINE"
+                    
+                # Display date and time for 5s
+                elif lcdDlyStatCnt >= 10 and lcdDlyStatCnt < 20:
+                    if lcdDlyStatCnt == 10:
+                        mylcd.lcd_clear()
+
+                    # Previously i2c LCD initialization are successful
+                    if i2cLcd == True:
+                        mylcd.lcd_display_string("Time: %s" %time.strftime("%H:%M:%S"), 1)
+                        mylcd.lcd_display_string("Date: %s" %time.strftime("%m/%d/%Y"), 2)
+
+                    # Previously i2c LCD initialization are failed
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_LCD: Time: %s" %time.strftime("%H:%M:%S"))
+                            logger.info("DEBUG_LCD: Date: %s" %time.strftime("%m/%d/%Y"))
+                        # Print statement
+                        else:
+                            print "DEBUG_LCD: Time: %s" %time.strftime("%H:%M:%S")
+                            print "DEBUG_LCD: Date: %s" %time.strftime("%m/%d/%Y")
+                                    
+                # Display battery status for 5s
+                elif lcdDlyStatCnt >= 20 and lcdDlyStatCnt < 30:
+                    if lcdDlyStatCnt == 20:
+                        mylcd.lcd_clear()
+
+                    if lcdBattCap > 100:
+                        lcdBattCap = 100
+
+                    # Previously i2c LCD initialization are successful
+                    if i2cLcd == True:
+                        mylcd.lcd_display_string("Volt: %5.2fV" % lcdBattVolt, 1)
+                        mylcd.lcd_display_string("Cap: %5i%%" % lcdBattCap, 2)
 
-                                # STOP 4G LTE modem
-                                out = subprocess.Popen(['qmicli', '-d', '/dev/cdc-wdm0', '--device-open-sync', '--dms-get-operating-mode'], \
-                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
+                    # Previously i2c LCD initialization are failed
+                    else:
+                        # Write to logger
+                        if backLogger == True:
+                            logger.info("DEBUG_LCD: Volt: %5.2fV" % lcdBattVolt)
+                            logger.info("DEBUG_LCD: Cap: %5i%%" % lcdBattCap)
+                        # Print statement
+                        else:
+                            print "DEBUG_LCD: Volt: %5.2fV" % lcdBattVolt
+                            print "DEBUG_LCD: Cap: %5i%%" % lcdBattCap
+                            
+                # Reset counter
+                elif lcdDlyStatCnt == 30:
+                    lcdDlyStatCnt = 0
 
-                                # NO error after command execution
-                                if stderr == None:
-                                    if 'HW restricted:' in stdout:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_NETMON: STOP 4G LTE modem successful - PING google.com attempt FAILED!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_NETMON: STOP 4G LTE modem successful - PING google.com attempt FAILED!"
-                                        
-                                        # Wait before execute another command
-                                        time.sleep(1)
+            elif lcdOperSel == 1:
+                # Turn ON LCD back light
+                GPIO.output(27, GPIO.HIGH)
 
-                                        # Bring wwan0 interface DOWN
-                                        out = subprocess.Popen(['ifconfig', 'wwan0', 'down'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                        stdout,stderr = out.communicate()
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    mylcd.lcd_display_string('ENCRYPT Process ', 1)
+                    mylcd.lcd_display_string('Please wait.....', 2)
 
-                                        # NO error after command execution
-                                        if stderr == None:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_NETMON: Bringing DOWN wwan0 successful - PING google.com attempt FAILED!")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_NETMON: Bringing DOWN wwan0 successful - PING google.com attempt FAILED!"
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: ENCRYPT Process")
+                        logger.info("DEBUG_LCD: Please wait.....")
+                    # Print statement
+                    else:
+                        print "DEBUG_LCD: ENCRYPT Process"
+                        print "DEBUG_LCD: Please wait....."
+                            
+                lcdOperSel = 2
 
-                                            # Wait before execute another command
-                                            time.sleep(1)
+            elif lcdOperSel == 3:
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    mylcd.lcd_display_string('ENCRYPT Process ', 1)
+                    mylcd.lcd_display_string('Successful      ', 2)
 
-                                            # KILL udhcpc instances
-                                            out = subprocess.Popen(['killall', 'udhcpc'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                            stdout,stderr = out.communicate()
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: ENCRYPT Process")
+                        logger.info("DEBUG_LCD: Successful")
+                    # Print statement
+                    else:
+                        print "DEBUG_LCD: ENCRYPT Process"
+                        print "DEBUG_LCD: Successful"
+                        
+                # Delay a bit, to display another info
+                time.sleep(3)
 
-                                            # NO error after command execution
-                                            if stderr == None:
-                                                # Write to logger
-                                                if backLogger == True:
-                                                    logger.info("DEBUG_NETMON: KILL  udhcpc SUCCESSFUL")
-                                                    logger.info("DEBUG_NETMON: Initiate 4G LTE modem on the next cycle...")
-                                                # Print statement
-                                                else:
-                                                    print "DEBUG_NETMON: KILL  udhcpc SUCCESSFUL"
-                                                    print "DEBUG_NETMON: Initiate 4G LTE modem on the next cycle..."
-                                            
-                                                # Retry again the sequence, start with pinging client process  
-                                                net4gValid = False
-                                                netMonChkCnt = 0
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    mylcd.lcd_display_string('Please remove   ', 1)
+                    mylcd.lcd_display_string('USB stick.......', 2)
 
-                                        # Operation failed
-                                        else:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - PING google.com attempt FAILED!")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - PING google.com attempt FAILED!"
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: Please remove")
+                        logger.info("DEBUG_LCD: USB stick.......")
+                    # Print statement
+                    else:
+                        print "DEBUG_LCD: Please remove"
+                        print "DEBUG_LCD: USB stick......."
+                
+                lcdOperSel = 4
 
-                                    # Operation failed
-                                    else:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_NETMON: STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_NETMON: STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!"
+            elif lcdOperSel == 5:
+                # Turn ON LCD back light
+                GPIO.output(27, GPIO.HIGH)
 
-                                # Operation failed
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!"    
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    mylcd.lcd_display_string('DECRYPT Process ', 1)
+                    mylcd.lcd_display_string('Please wait.....', 2)
 
-                    # Operation failed
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: DECRYPT Process")
+                        logger.info("DEBUG_LCD: Please wait.....")
+                    # Print statement
                     else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_NETMON: Command execution to PING google.com FAILED!")
-                        # Print statement
-                        else:
-                            print "DEBUG_NETMON: Command execution to PING google.com FAILED!"
-                            
-            # Initiate and check SDR radio monitoring server
-            elif netMonChkCnt == 1:
-                # Radio monitoring server not start yet, or previously has already terminated
-                if radioValid == False:
-                    # Checking SDR availability
-                    out = subprocess.Popen(["lsusb"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+                        print "DEBUG_LCD: DECRYPT Process"
+                        print "DEBUG_LCD: Please wait....."
 
-                    # NO error after command execution
-                    if stderr == None:
-                        # SDR USB bus ID
-                        if '1df7:3000' in stdout:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: SDR module available")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: SDR module available"
-                                    
-                            # Wait before execute another command
-                            time.sleep(1)
+                lcdOperSel = 6
 
-                            # Option for soapy sdr server
-                            if radioOpt == 0:
-                                tempArg = "SoapySDRServer --bind=" + "'" + publicIPaddr + ":1234' " + "> /dev/null 2>&1 &"
-                                out = subprocess.Popen([tempArg], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                
-                            # Option for RSPTCP server
-                            elif radioOpt == 1:
-                                tempArg = "rsp_tcp -E -a " + publicIPaddr + " > /dev/null 2>&1 &"
-                                out = subprocess.Popen([tempArg], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            elif lcdOperSel == 7:
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    mylcd.lcd_display_string('DECRYPT Process ', 1)
+                    mylcd.lcd_display_string('Successful      ', 2)
 
-                            # Option for custom gnuradio radio data server
-                            elif radioOpt == 2:
-                                out = subprocess.Popen(["/sources/common/sourcecode/radio-server; /usr/bin/python radio_server.py > /dev/null 2>&1 &"], \
-                                                       shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                            stdout,stderr = out.communicate()
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: DECRYPT Process")
+                        logger.info("DEBUG_LCD: Successful")
+                    # Print statement
+                    else:
+                        print "DEBUG_LCD: DECRYPT Process"
+                        print "DEBUG_LCD: Successful"
 
-                            # NO error after command execution
-                            if stderr == None:
-                                radioValid = True
-                                netMonChkCnt = 0
+                lcdOperSel = 8
 
-                                # Change LCD operation mode
-                                lcdOperSel = 14
-                                
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_NETMON: Initiate radio monitoring server successful")
-                                # Print statement
-                                else:
-                                    print "DEBUG_NETMON: Initiate radio monitoring server successful"
-                                
-                            # Operation failed
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_NETMON: Command execution to initiate radio monitoring server FAILED!")
-                                # Print statement
-                                else:
-                                    print "DEBUG_NETMON: Command execution to initiate radio monitoring server FAILED!"
-                                    
-                        # SDR NOT available
-                        else:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: SDR module NOT available")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: SDR module NOT available"
+            elif lcdOperSel == 9:
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    mylcd.lcd_display_string('Init. 4G modem  ', 1)
+                    mylcd.lcd_display_string('Successful      ', 2)
 
-                            # Change LCD operation mode
-                            lcdOperSel = 15
-                    
-                # Radio monitoring server status check by checking the server process ID
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: Init. 4G modem")
+                        logger.info("DEBUG_LCD: Successful")
+                    # Print statement
+                    else:
+                        print "DEBUG_LCD: Init. 4G modem"
+                        print "DEBUG_LCD: Successful"
+                        
+                lcdOperSel = 10
+
+            elif lcdOperSel == 11:
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    mylcd.lcd_display_string('Init. NC2VPN    ', 1)
+                    mylcd.lcd_display_string('Successful      ', 2)
+
+                # Previously i2c LCD initialization are failed
                 else:
-                    # Option for soapy sdr server
-                    if radioOpt == 0:
-                        out = subprocess.Popen(["ps aux | grep -v grep | grep SoapySDRServer"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: Init. NC2VPN")
+                        logger.info("DEBUG_LCD: Successful")
+                    # Print statement
+                    else:
+                        print "DEBUG_LCD: Init. NC2VPN"
+                        print "DEBUG_LCD: Successful"
+                        
+                # Delay a bit, to display another info
+                time.sleep(3)
 
-                    # Option for RSPTCP server
-                    elif radioOpt == 1:
-                        out = subprocess.Popen(["ps aux | grep -v grep | grep rsp_tcp"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+                lcdOperSel = 0
+                lcdDlyStatCnt = 0
+                lcdBlTimeOut = 0
 
-                    # Option for custom gnuradio radio data server
-                    elif radioOpt == 2:
-                        out = subprocess.Popen(["ps aux | grep -v grep | grep radio_server"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()    
+            elif lcdOperSel == 12:
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    # Write to LCD info
+                    mylcd.lcd_display_string('DECRYPT Process ', 1)
+                    mylcd.lcd_display_string('Failed!         ', 2)
 
-                    # NO error after command execution
-                    if stderr == None:
-                        foundDig = False
-                        pidNo = ''
-                        respLen = len(stdout)
-                        for a in range(0, (respLen + 1)):
-                            oneChar = mid(stdout, a, 1)
-                            # Check PID digit
-                            if oneChar.isdigit():
-                                foundDig = True
-                                pidNo += oneChar
-                            elif foundDig == True and oneChar == ' ':
-                                break
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: DECRYPT Process")
+                        logger.info("DEBUG_LCD: Failed!")
+                    # Print statement
+                    else:
+                        print "DEBUG_LCD: DECRYPT Process"
+                        print "DEBUG_LCD: Failed!"
 
-                        # PID found
-                        if foundDig == True and pidNo != '':
-                            radioValid = True
-                            netMonChkCnt = 0
+                # Delay a bit, to display another info
+                time.sleep(3)
 
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: Radio monitoring server OK: PID: [%s]" % (pidNo))
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: Radio monitoring server OK: PID: [%s]" % (pidNo)
+                lcdOperSel = 0
+                lcdDlyStatCnt = 0
+                lcdBlTimeOut = 0
+                
+            elif lcdOperSel == 13:
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    # Write to LCD info
+                    mylcd.lcd_display_string('ENCRYPT Process ', 1)
+                    mylcd.lcd_display_string('Failed!         ', 2)
 
-                        # PID not found
-                        else:
-                            radioValid = False
-                            netMonChkCnt = 0
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: ENCRYPT Process")
+                        logger.info("DEBUG_LCD: Failed!")
+                    # Print statement
+                    else:
+                        print "DEBUG_LCD: ENCRYPT Process"
+                        print "DEBUG_LCD: Failed!"
 
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: Radio monitoring server TERMINATED, will be restarted on the next cycle")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: Radio monitoring server TERMINATED, will be restarted on the next cycle"
+                # Delay a bit, to display another info
+                time.sleep(3)
 
-                    # Operation failed
+                lcdOperSel = 0
+                lcdDlyStatCnt = 0
+                lcdBlTimeOut = 0
+
+            elif lcdOperSel == 14:
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    # Write to LCD info
+                    mylcd.lcd_display_string('Init. Radio Svr ', 1)
+                    mylcd.lcd_display_string('Successful      ', 2)
+
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: Init. Radio Svr")
+                        logger.info("DEBUG_LCD: Successful")
+                    # Print statement
                     else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_NETMON: Command execution to check radio monitoring server status FAILED!")
-                        # Print statement
-                        else:
-                            print "DEBUG_NETMON: Command execution to radio monitoring server status FAILED!"        
-                            
-        # Security gateway mode
-        else:
-            # Check the client computer network, by pinging process
-            if netMonChkCnt == 0:
-                # Start PING client computer
-                out = subprocess.Popen(['ping', '-c', '1', clientIPAddr], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
+                        print "DEBUG_LCD: Init. Radio Svr"
+                        print "DEBUG_LCD: Successful"
+                        
+                # Delay a bit, to display another info
+                time.sleep(3)
 
-                # NO error after command execution
-                if stderr == None:
-                    # Client computer already connected to wifi
-                    if '1 received' in stdout:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_NETMON: PING client computer successful")
-                        # Print statement
-                        else:
-                            print "DEBUG_NETMON: PING client computer successful"
+                lcdOperSel = 0
+                lcdDlyStatCnt = 0
+                lcdBlTimeOut = 0
 
-                    # Client computer disconnected from wifi
-                    # To check whether client computer still connected to wifi network
-                    elif '0 received' in stdout:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_NETMON: PING client computer FAILED!")
-                        # Print statement
-                        else:
-                            print "DEBUG_NETMON: PING client computer FAILED!"
+            elif lcdOperSel == 15:
+                # Previously i2c LCD initialization are successful
+                if i2cLcd == True:
+                    mylcd.lcd_clear()
+                    # Write to LCD info
+                    mylcd.lcd_display_string('SDR NOT Exist!  ', 1)
+                    mylcd.lcd_display_string('Please reconnect', 2)
 
-                    # Only check other networks process when USB thumbdrive are plug in
-                    if dCryptProc == True:
-                        netMonChkCnt = 1
+                # Previously i2c LCD initialization are failed
+                else:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_LCD: SDR NOT Exist!")
+                        logger.info("DEBUG_LCD: Please reconnect")
+                    # Print statement
                     else:
-                        netMonChkCnt = 0
+                        print "DEBUG_LCD: SDR NOT Exist!"
+                        print "DEBUG_LCD: Please reconnect"
                         
-                # Operation failed
-                else:
+                # Delay a bit, to display another info
+                time.sleep(3)
+
+                lcdOperSel = 0
+                lcdDlyStatCnt = 0
+                lcdBlTimeOut = 0
+                
+        # Error in execution
+        except:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_LCD: LCD FAILED!")
+            # Print statement
+            else:
+                print "DEBUG_LCD: LCD FAILED!"
+            
+# Check UPS lite HAT battery status
+def checkBattStatus (threadname, delay):
+    global backLogger
+    global delayRdBatt
+    global lcdBattVolt        
+    global lcdBattCap
+    global i2cUps
+    
+    delayFlag = False     
+
+    # Forever loop
+    while True:
+        # Loop every 0.5s
+        time.sleep(delay)
+
+        # Try execution
+        try:
+            delayRdBatt += 1
+
+            # Read current battery voltage every 5s
+            if delayRdBatt == 10:
+                # Previously i2c LCD initialization are successful
+                if i2cUps == True:
+                    # Read current battery voltage and capacity
+                    # Stored it to local variable
+                    lcdBattVolt = readBattVoltage(i2cBus)
+                    lcdBattCap = readBattCapacity(i2cBus)
+
                     # Write to logger
                     if backLogger == True:
-                        logger.info("DEBUG_NETMON: Command execution to PING client computer FAILED!")
+                        logger.info("DEBUG_BATT: Volt: %5.2fV" % lcdBattVolt)
+                        logger.info("DEBUG_BATT: Cap: %5i%%" % lcdBattCap)
                     # Print statement
                     else:
-                        print "DEBUG_NETMON: Command execution to PING client computer FAILED!"
-                            
-            # Start 4G network if its not start yet and continuously monitored the network
-            elif netMonChkCnt == 1 and dCryptProc == True:
-                # 4G network not start yet, or previously has already terminated
-                if net4gValid == False:
-                    # Start initiate 4G network
-                    retResult = initiate4GModem()
-                    # Successful
-                    if retResult == True:
-                        net4gValid = True
-                        netMonChkCnt = 2
+                        print "DEBUG_BATT: Volt: %5.2fV" % lcdBattVolt
+                        print "DEBUG_BATT: Cap: %5i%%" % lcdBattCap
 
-                        # Change LCD operation mode
-                        lcdOperSel = 9
+                # Previously i2c LCD initialization are failed
+                else:
+                    lcdBattVolt = 'NA'
+                    lcdBattCap = 'NA'
                     
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_NETMON: Initiate 4G LTE modem successful")
-                        # Print statement
-                        else:
-                            print "DEBUG_NETMON: Initiate 4G LTE modem successful"
-                        
-                    # Failed
-                    else:
-                        # STOP 4G LTE modem 
-                        out = subprocess.Popen(['qmicli', '-d', '/dev/cdc-wdm0', '--device-open-sync', '--dms-get-operating-mode'], \
-                           stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                        stdout,stderr = out.communicate()
+                delayRdBatt = 0
+
+        # Error in execution
+        except:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_BATT: UPS-Lite FAILED!")
+            # Print statement
+            else:
+                print "DEBUG_BATT: UPS-Lite FAILED!"
 
-                        # NO error after command execution
-                        if stderr == None:
-                            if 'HW restricted:' in stdout:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_NETMON: STOP 4G LTE modem successful - Init. 4G LTE modem")
-                                # Print statement
-                                else:
-                                    print "DEBUG_NETMON: STOP 4G LTE modem successful - Init. 4G LTE modem"
-                                        
-                                # Wait before execute another command
-                                time.sleep(1)
+# Read mount table (/proc/self/mountinfo)
+# Return: Mount point list, key: mount point, value: {'dev': source device, 'fsType': filesystem type}
+def readMountInfo (mountFile):
+    mountList = {}
+
+    mountFile.seek(0)
+    for oneLine in mountFile.read().split('\n'):
+        # <id> <parent id> <major:minor> <root> <mount point> <options> [optional fields] - <fs type> <source> <super options>
+        mountField = oneLine.split(' - ')
+        if len(mountField) < 2:
+            continue
+
+        mountPoint = mountField[0].split()[4]
+        fsField = mountField[1].split()
+        # Octal escaped space, tab, new line and back slash
+        mountPoint = re.sub(r'\\([0-7]{3})', lambda x: chr(int(x.group(1), 8)), mountPoint)
+        mountList[mountPoint] = {'dev': fsField[1] if len(fsField) > 1 else '', 'fsType': fsField[0]}
+
+    return mountList
+
+# Get filesystem UUID of a block device
+# Return: UUID, empty string when not available
+def getVolumeUuid (devPath):
+    if devPath.startswith('/dev/') == False:
+        return ''
+
+    devReal = os.path.realpath(devPath)
+    for uuidPath in glob.glob('/dev/disk/by-uuid/*'):
+        if os.path.realpath(uuidPath) == devReal:
+            return os.path.basename(uuidPath)
+
+    # udev by-uuid link not available
+    retCode, stdout = runCommand(['blkid', '-s', 'UUID', '-o', 'value', devPath], 10)
+    if retCode == 0:
+        return stdout.strip()
+
+    return ''
+
+# Scan USB volume top level files
+# Return: Volume manifest, key: file name, value: {'size', 'mtime', 'hash': SHA-256 content hash or None when too large}
+def scanVolManifest (volPath):
+    global manifestHashMax
+
+    volManifest = {}
+    try:
+        fileList = os.listdir(volPath)
+    except OSError:
+        return volManifest
 
-                                # Bring wwan0 interface DOWN
-                                out = subprocess.Popen(['ifconfig', 'wwan0', 'down'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
+    for fileName in fileList:
+        filePath = os.path.join(volPath, fileName)
+        try:
+            fileStat = os.lstat(filePath)
+        except OSError:
+            continue
 
-                                # NO error after command execution
-                                if stderr == None:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_NETMON: Bringing DOWN wwan0 successful - Init. 4G LTE modem")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_NETMON: Bringing DOWN wwan0 successful - Init. 4G LTE modem"
+        # Regular file only
+        if (fileStat.st_mode & 0o170000) != 0o100000:
+            continue
 
-                                # Operation failed
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - Init. 4G LTE modem")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - Init. 4G LTE modem"
+        fileHash = None
+        if fileStat.st_size <= manifestHashMax:
+            fileHash = hashFile(filePath)
 
-                            # Operation failed
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_NETMON: STOP 4G LTE modem FAILED! - Init. 4G LTE modem")
-                                # Print statement
-                                else:
-                                    print "DEBUG_NETMON: STOP 4G LTE modem FAILED! - Init. 4G LTE modem"
+        volManifest[fileName] = {'size': fileStat.st_size, 'mtime': fileStat.st_mtime, 'hash': fileHash}
 
-                        # Operation failed
-                        else:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - init. 4G LTE modem")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - init. 4G LTE modem"
+    return volManifest
 
-                        # Retry again the sequence, start with pinging client process 
-                        netMonChkCnt = 0
+# USB volume job, each mounted USB volume are processed by its own thread
+def volumeJob (threadname, handler, event):
+    handler.process_IN_CREATE(event)
 
-                # 4G network checking by pinging process to google.com 
-                else:
-                    # Start PING google.com
-                    out = subprocess.Popen(['ping', '-c', '1', 'google.com'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+# Mount table monitoring, report USB volume to the event handler only after the volume are actually mounted
+# Kernel report mount table changes by POLLPRI on /proc/self/mountinfo
+# Parameters:
+# watchPath - USB volume mount path
+# handler   - Event handler, process_IN_CREATE called with MountEvent inside USB volume job thread
+def mountWatch (watchPath, handler):
+    global backLogger
+    global usbMountList
+    global mountPollTimeOut
 
-                    # NO error after command execution
-                    if stderr == None:
-                        # 4G network OK
-                        if '1 received' in stdout:
-                            net4gValid = True
+    mountFile = open('/proc/self/mountinfo', 'r')
+    mountPoll = select.poll()
+    mountPoll.register(mountFile.fileno(), select.POLLPRI | select.POLLERR)
 
-                            net4gAtmptCnt = 0
-                            netMonChkCnt = 2
+    # Volume already mounted before start are not reported
+    for mountPoint, mountInfo in readMountInfo(mountFile).items():
+        if mountPoint.startswith(watchPath + '/') == True:
+            usbMountList[mountPoint] = {'dev': mountInfo['dev'], 'uuid': getVolumeUuid(mountInfo['dev']), 'fsType': mountInfo['fsType']}
 
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: 4G network OK")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: 4G network OK"
-                                
-                        # 4G network FAILED!
-                        elif '0 received' or 'failure' in stdout:
-                            # Increment attempt to check 4G network by pinging process
-                            net4gAtmptCnt += 1
+    # Forever loop
+    while True:
+        mountPoll.poll(mountPollTimeOut)
+        mountList = readMountInfo(mountFile)
 
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: PING google.com FAILED! - PING google.com attempt FAILED! [%s]" % (net4gAtmptCnt))
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: PING google.com FAILED! - PING google.com attempt FAILED! [%s]" % (net4gAtmptCnt)
-                                
-                            # After  checking 5 times, still 4G network failed, do:
-                            # 1 - Stop 4G modem properly
-                            # 2 - Bring wwan0 interface DOWN
-                            if net4gAtmptCnt == 5:
-                                net4gAtmptCnt = 0
+        # Removed volume
+        for mountPoint in usbMountList.keys():
+            if mountPoint not in mountList:
+                del usbMountList[mountPoint]
 
-                                # STOP 4G LTE modem
-                                out = subprocess.Popen(['qmicli', '-d', '/dev/cdc-wdm0', '--device-open-sync', '--dms-get-operating-mode'], \
-                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
+                # Write to logger
+                if backLogger == True:
+                    logger.info("DEBUG_USBMON: Volume unmounted: %s" % (mountPoint))
+                # Print statement
+                else:
+                    print "DEBUG_USBMON: Volume unmounted: %s" % (mountPoint)
+
+        # New mounted volume
+        for mountPoint in sorted(mountList.keys()):
+            if mountPoint.startswith(watchPath + '/') == True and mountPoint not in usbMountList:
+                mountInfo = mountList[mountPoint]
+                usbMountList[mountPoint] = {'dev': mountInfo['dev'], 'uuid': getVolumeUuid(mountInfo['dev']), 'fsType': mountInfo['fsType']}
+
+                # USB volume job
+                try:
+                    thread.start_new_thread(volumeJob, ("[volumeJob]", handler, MountEvent(mountPoint, mountInfo['dev'], usbMountList[mountPoint]['uuid'], mountInfo['fsType'])))
+                except:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("THREAD_ERROR: Unable to start [volumeJob] thread")
+                    # Print statement
+                    else:
+                        print "THREAD_ERROR: Unable to start [volumeJob] thread"
 
-                                # NO error after command execution
-                                if stderr == None:
-                                    if 'HW restricted:' in stdout:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_NETMON: STOP 4G LTE modem successful - PING google.com attempt FAILED!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_NETMON: STOP 4G LTE modem successful - PING google.com attempt FAILED!"
-                                        
-                                        # Wait before execute another command
-                                        time.sleep(1)
+# Check and monitor USB thumb drive plug in status
+def checkUSBStatus (threadname, delay):
+    global eCryptProc
+    global dCryptProc
+    global tunnelValid
+    global net4gValid
+    global lcdOperSel
+    global lcdDlyStatCnt
+    global lcdBlTimeOut
+    global netMonChkCnt
+    global backLogger
+    global usbGraceTime
 
-                                        # Bring wwan0 interface DOWN
-                                        out = subprocess.Popen(['ifconfig', 'wwan0', 'down'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                        stdout,stderr = out.communicate()
+    # Forever loop
+    while True:
+        # Loop every 0.5s
+        time.sleep(delay)
 
-                                        # NO error after command execution
-                                        if stderr == None:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_NETMON: Bringing DOWN wwan0 successful - PING google.com attempt FAILED!")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_NETMON: Bringing DOWN wwan0 successful - PING google.com attempt FAILED!"
+        context = pyudev.Context()
+        monitor = pyudev.Monitor.from_netlink(context)
+        monitor.filter_by(subsystem='usb')
 
-                                            # Wait before execute another command
-                                            time.sleep(1)
+        monitor.start()
+        for device in iter(monitor.poll, None):
+            evtTime = time.time()
+            if device.action != 'add':
+                # USB key removal grace window, cut VPN tunnel immediately and keep 4G LTE modem data session
+                if usbGraceTime > 0 and dCryptProc == True and net4gValid == True and startUsbGrace() == True:
+                    # Turn ON LCD back light
+                    GPIO.output(27, GPIO.HIGH)
 
-                                            # KILL udhcpc instances
-                                            out = subprocess.Popen(['killall', 'udhcpc'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                            stdout,stderr = out.communicate()
+                    # Reset necessary LCD operation variable
+                    lcdDlyStatCnt = 0
+                    lcdOperSel = 0
+                    lcdBlTimeOut = 0
 
-                                            # NO error after command execution
-                                            if stderr == None:
-                                                # Write to logger
-                                                if backLogger == True:
-                                                    logger.info("DEBUG_NETMON: KILL  udhcpc SUCCESSFUL")
-                                                    logger.info("DEBUG_NETMON: Initiate 4G LTE modem on the next cycle...")
-                                                # Print statement
-                                                else:
-                                                    print "DEBUG_NETMON: KILL  udhcpc SUCCESSFUL"
-                                                    print "DEBUG_NETMON: Initiate 4G LTE modem on the next cycle..."
-                                                    
-                                                # Retry again the sequence, start with pinging client process  
-                                                net4gValid = False
-                                                netMonChkCnt = 0
+                elif eCryptProc == True or dCryptProc == True:
+                    # Network monitoring must NOT restart the VPN tunnel during lockdown
+                    eCryptProc = False
+                    dCryptProc = False
+                    tunnelValid = False
 
-                                        # Operation failed
-                                        else:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - PING google.com attempt FAILED!")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_NETMON: Bringing DOWN wwan0 FAILED! - PING google.com attempt FAILED!"
+                    # Stop forwarding immediately, then STOP VPN tunnel, DHCP client and 4G LTE modem concurrently
+                    usbLockdown(evtTime)
 
-                                    # Operation failed
-                                    else:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_NETMON: STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_NETMON: STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!"
+                    # Turn ON LCD back light
+                    GPIO.output(27, GPIO.HIGH)
 
-                                # Operation failed
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_NETMON: Command execution to STOP 4G LTE modem FAILED! - PING google.com attempt FAILED!"    
+                    # Reset necessary LCD operation variable
+                    lcdDlyStatCnt = 0
+                    lcdOperSel = 0
+                    lcdBlTimeOut = 0
 
-                    # Operation failed
-                    else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_NETMON: Command execution to PING google.com FAILED!")
-                        # Print statement
-                        else:
-                            print "DEBUG_NETMON: Command execution to PING google.com FAILED!"
-                        
-            # Start nc2vpn tunnel if not start yet and continuously monitored the tunnel
-            elif netMonChkCnt == 2 and dCryptProc == True:
-                # VPN tunnel not start yet
-                if tunnelValid == False:
-                    fileDel = False
-                    
-                    # Check and retrieve nc2vpn .ovpn file name
-                    tempData = os.listdir(nc2VpnKeyTPath)
+                    netMonChkCnt = 0
+                    net4gValid = False
                     
-                    # Go through the resulted data
-                    for files in tempData:
-                        if '.ovpn' in files:
-                            fileName = files
-                            fileExist = True
-                            break
+# Build DNS query packet for host name IPv4 address (A record), recursion desired
+# Return: DNS query packet
+def dnsBuildQuery (queryId, hostName):
+    qName = b''
+    for oneLabel in hostName.rstrip('.').split('.'):
+        qName += struct.pack(b'!B', len(oneLabel)) + oneLabel.encode('ascii')
+
+    return struct.pack(b'!HHHHHH', queryId, 0x0100, 1, 0, 0, 0) + qName + b'\x00' + struct.pack(b'!HH', 1, 1)
+
+# Skip DNS name (labels, or compression pointer) inside DNS packet
+# Return: Offset after the name
+def dnsSkipName (data, offset):
+    while True:
+        labelLen = ord(data[offset:offset + 1])
+        # Compression pointer
+        if (labelLen & 0xc0) == 0xc0:
+            return offset + 2
+        offset += 1
+        if labelLen == 0:
+            return offset
+        offset += labelLen
+
+# Parse DNS response of the query
+# Return: (IP address list, minimum TTL of the answer), None when the response are NOT valid or server failure
+def dnsParseResponse (queryId, data):
+    global dnsMinTtl
+
+    if len(data) < 12:
+        return None
+
+    respId, respFlag, qdCnt, anCnt, nsCnt, arCnt = struct.unpack(b'!HHHHHH', data[:12])
+    if respId != queryId or (respFlag & 0x8000) == 0:
+        return None
+    # Host name NOT exist (NXDOMAIN)
+    if (respFlag & 0x000f) == 3:
+        return [], dnsMinTtl
+    if (respFlag & 0x000f) != 0:
+        return None
+
+    addrList = []
+    minTtl = None
+    try:
+        offset = 12
+        for a in range(qdCnt):
+            offset = dnsSkipName(data, offset) + 4
+
+        # Answer record, CNAME chain TTL are included
+        for a in range(anCnt):
+            offset = dnsSkipName(data, offset)
+            rrType, rrClass, rrTtl, rdLen = struct.unpack(b'!HHIH', data[offset:offset + 10])
+            offset += 10
+            if rrType == 1 and rrClass == 1 and rdLen == 4:
+                addrList.append(socket.inet_ntoa(data[offset:offset + 4]))
+            if minTtl == None or rrTtl < minTtl:
+                minTtl = rrTtl
+            offset += rdLen
+    except (struct.error, TypeError):
+        return None
+
+    if minTtl == None:
+        minTtl = dnsMinTtl
+
+    return addrList, minTtl
+
+# Query host name IPv4 address directly to the name server, TTL are NOT available through the resolver library
+# Return: (IP address list, TTL), None when all name server failed
+def dnsQuery (hostName):
+    global dnsResolvPath
+    global dnsTimeOut
+
+    for oneLine in readSysFile(dnsResolvPath).split('\n'):
+        nsField = oneLine.split()
+        if len(nsField) < 2 or nsField[0] != 'nameserver' or ':' in nsField[1]:
+            continue
+
+        queryId = struct.unpack(b'!H', os.urandom(2))[0]
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.connect((nsField[1], 53))
+            sock.send(dnsBuildQuery(queryId, hostName))
 
-                    # NO file or previously has been deleted, decrypt back nc2vpn key
-                    if fileExist == False:
-                        # Start decrypt the nc2vpn key and stored it inside temporary folder
-                        # Command:
-                        # python3 decrypt.py --source=/path/to/your/drive/ --destination=/path/to/your/drive/ --private-key=/path/to/your/key.private
-                        tempPrivKeyPath = currUSBPath + '/key.private'
-                        out = subprocess.Popen(['python3', 'decrypt.py', '--source', nc2VpnKeyPath, '--destination', nc2VpnKeyTPath, '--private-key', tempPrivKeyPath], \
-                                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                        stdout,stderr = out.communicate()
+            deadLine = time.time() + dnsTimeOut
+            while True:
+                remTime = deadLine - time.time()
+                if remTime <= 0:
+                    break
+                rdList, wrList, exList = select.select([sock], [], [], remTime)
+                if len(rdList) == 0:
+                    break
 
-                        # NO error after command execution
-                        if stderr == None:
-                            if 'Decrypting:' in stdout:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_NETMON: Decrypt nc2vpn key successful")
-                                # Print statement
-                                else:
-                                    print "DEBUG_NETMON: Decrypt nc2vpn key successful"
+                # Response of other query are skipped
+                dnsResult = dnsParseResponse(queryId, sock.recv(4096))
+                if dnsResult != None:
+                    return dnsResult
+        except (socket.error, UnicodeError):
+            pass
+        finally:
+            sock.close()
+
+    return None
+
+# Resolve host name IPv4 address through the DNS cache, literal IP address are returned as is
+# Parameters:
+# hostName - Host name to resolve
+# cacheMiss - True to query the name server without checking the cache (cache refresh)
+# Return: IP address list, empty when failed
+def resolveHost (hostName, cacheMiss=False):
+    global backLogger
+    global dnsCache
+    global dnsMinTtl
+    global dnsMaxTtl
 
-                            # Operation failed
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_NETMON: Decrypt nc2vpn key FAILED!")
-                                # Print statement
-                                else:
-                                    print "DEBUG_NETMON: Decrypt nc2vpn key FAILED!"
+    if re.match(r'^[0-9]+\.[0-9]+\.[0-9]+\.[0-9]+$', hostName):
+        return [hostName]
 
-                        # Operation failed
-                        else:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: Decrypt nc2vpn key FAILED!")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: Decrypt nc2vpn key FAILED!"
-                                    
-                    # Temporary nc2vpn key exist
-                    else:
-                        # START VPN tunnel
-                        tempArgs = 'cd ' + nc2VpnKeyTPath + ';openvpn --config ' + fileName + ' --daemon'
-                        out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                        stdout,stderr = out.communicate()
+    dnsCacheLock.acquire()
+    cacheInfo = dnsCache.get(hostName)
+    dnsCacheLock.release()
+    if cacheMiss == False and cacheInfo != None and cacheInfo[1] > time.time():
+        return cacheInfo[0][:]
+
+    startTime = time.time()
+    dnsResult = dnsQuery(hostName)
+
+    # Name server query failed, use resolver library (e.g. /etc/hosts) with minimum TTL
+    if dnsResult == None or len(dnsResult[0]) == 0:
+        try:
+            addrList = []
+            for addrInfo in socket.getaddrinfo(hostName, None, socket.AF_INET, socket.SOCK_DGRAM):
+                if addrInfo[4][0] not in addrList:
+                    addrList.append(addrInfo[4][0])
+            dnsResult = addrList, dnsMinTtl
+        except (socket.error, UnicodeError):
+            pass
+
+    # Resolve failed, previously resolved IP address are used until successfully refreshed
+    if dnsResult == None:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_DNS: Resolve %s FAILED!" % (hostName))
+        # Print statement
+        else:
+            print "DEBUG_DNS: Resolve %s FAILED!" % (hostName)
+
+        if cacheInfo != None:
+            return cacheInfo[0][:]
+        return []
+
+    addrList, dnsTtl = dnsResult
+    dnsTtl = min(max(dnsTtl, dnsMinTtl), dnsMaxTtl)
+    dnsCacheLock.acquire()
+    dnsCache[hostName] = (addrList, time.time() + dnsTtl, dnsTtl)
+    dnsCacheLock.release()
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_DNS: Resolve %s -> %s, TTL %ss, %.3fs" % (hostName, ','.join(addrList), dnsTtl, time.time() - startTime))
+    # Print statement
+    else:
+        print "DEBUG_DNS: Resolve %s -> %s, TTL %ss, %.3fs" % (hostName, ','.join(addrList), dnsTtl, time.time() - startTime)
+
+    return addrList[:]
+
+# Get health check probe address - Cached IP address of the probe host, the host name when NOT resolved
+def getProbeAddr (hostName):
+    addrList = resolveHost(hostName)
+    if len(addrList) == 0:
+        return hostName
+
+    return addrList[0]
+
+# Seed the DNS cache with the VPN remote server host name of the loaded nc2vpn key OpenVPN configuration, resolved by
+# dnsCacheMon() without waiting for the first OpenVPN start
+def seedDnsRemote (fileName):
+    global dnsRemoteHost
+
+    remoteList, connBlock = getOvpnRemote(fileName)
+    hostList = []
+    for hostName, remotePort, remoteProto in remoteList:
+        if hostName not in hostList:
+            hostList.append(hostName)
+    dnsRemoteHost = hostList
+
+# DNS cache monitoring - Pre-resolve probe host, VPN remote server of the loaded nc2vpn key and previously resolved
+# host once the WAN uplink are up (or changed), VPN remote server also once the nc2vpn key are loaded, and refresh the
+# cached host before TTL expired
+def dnsCacheMon (threadname, delay):
+    global dnsCache
+    global dnsProbeHost
+    global dnsRemoteHost
+
+    prevIf = ''
+    prevRemote = []
+    while True:
+        routeIf = getDefaultRouteIf()
+        if routeIf != '':
+            dnsCacheLock.acquire()
+            cacheList = dnsCache.items()
+            dnsCacheLock.release()
+            remoteHost = dnsRemoteHost[:]
+
+            # WAN uplink are up or changed
+            if routeIf != prevIf:
+                seedList = dnsProbeHost + [x for x in remoteHost if x not in dnsProbeHost]
+                for hostName in seedList + [x[0] for x in cacheList if x[0] not in seedList]:
+                    resolveHost(hostName, True)
+
+            # nc2vpn key decrypted or loaded from the cache
+            elif remoteHost != prevRemote:
+                for hostName in [x for x in remoteHost if x not in prevRemote]:
+                    resolveHost(hostName)
+
+            # Refresh when remaining TTL below 20%
+            else:
+                for hostName, cacheInfo in cacheList:
+                    if cacheInfo[1] - time.time() < cacheInfo[2] * 0.2:
+                        resolveHost(hostName, True)
+
+            prevRemote = remoteHost
+        prevIf = routeIf
+        time.sleep(delay)
+
+# Calculate ICMP checksum
+def icmpChecksum (data):
+    if len(data) % 2 == 1:
+        data += b'\x00'
+
+    csum = sum(struct.unpack(b'!%dH' % (len(data) // 2), data))
+    csum = (csum >> 16) + (csum & 0xffff)
+    csum += csum >> 16
+
+    return ~csum & 0xffff
+
+# Get network interface default gateway from kernel routing table
+# /proc/net/route: Iface Destination Gateway Flags RefCnt Use Metric Mask MTU Window IRTT
+# Return: Default gateway IP address, empty string when no default route through the network interface
+def getDefaultGateway (netIf):
+    routeInfo = readSysFile('/proc/net/route')
+    for oneLine in routeInfo.split('\n')[1:]:
+        routeField = oneLine.split()
+        if len(routeField) > 3 and routeField[0] == netIf and routeField[1] == '00000000':
+            # Gateway flag (RTF_GATEWAY)
+            if int(routeField[3], 16) & 0x2 == 0x2:
+                return socket.inet_ntoa(struct.pack(b'<L', int(routeField[2], 16)))
+
+    return ''
+
+# Get candidate WAN uplink - Candidate network interface and 4G LTE modem network interface that are UP with IPv4 address
+def getUplinkCandList ():
+    global modemList
+    global uplinkCandList
+
+    candList = list(uplinkCandList)
+    for qmiDev in modemList.keys():
+        if modemList[qmiDev]['valid'] == True and modemList[qmiDev]['netIf'] not in candList:
+            candList.append(modemList[qmiDev]['netIf'])
+
+    return [x for x in candList if chkIfUp(x) == True and getIfIpAddress(x) != '']
+
+# Get network interface of the default route with lowest metric from kernel routing table
+# Return: Network interface, empty string when no default route
+def getDefaultRouteIf ():
+    routeIf = ''
+    routeMetric = -1
+
+    routeInfo = readSysFile('/proc/net/route')
+    for oneLine in routeInfo.split('\n')[1:]:
+        routeField = oneLine.split()
+        if len(routeField) > 6 and routeField[1] == '00000000':
+            if routeMetric == -1 or int(routeField[6]) < routeMetric:
+                routeIf = routeField[0]
+                routeMetric = int(routeField[6])
+
+    return routeIf
+
+# Get primary VPN tunnel OpenVPN PID from the PID file (--writepid)
+# Return: PID, 0 when NOT running
+def getOpenVpnPid ():
+    global ovpnPidPath
+
+    ovpnPid = readSysFile(ovpnPidPath)
+    if ovpnPid.isdigit() == False:
+        return 0
+
+    # Stale PID file, PID reused by other process
+    if readSysFile('/proc/%s/comm' % (ovpnPid)) != 'openvpn':
+        return 0
+
+    return int(ovpnPid)
+
+# Switch default route to the WAN uplink, and restart the primary VPN tunnel OpenVPN connection (SIGUSR1) over the new
+# WAN uplink
+# Return: True when default route switched
+def switchUplink (netIf, reason):
+    global backLogger
+    global uplinkActive
+    global uplinkStat
 
-                        # NO error after command execution
-                        if stderr == None:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: Init. OpenVPN sequence completed - Init. OpenVPN")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: Init. OpenVPN sequence completed - Init. OpenVPN"
-                            
-                            tunnelValid = True
-                            netMonChkCnt = 0
+    startTime = time.time()
 
-                            # Change LCD operation mode
-                            lcdOperSel = 11
-                                             
-                        # Operation failed
-                        else:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: Command execution to initiate OpenVPN FAILED! - Init. OpenVPN")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: Command execution to initiate OpenVPN FAILED! - Init. OpenVPN"
+    # Default route keep removed by DHCP client of other WAN uplink, use last known gateway
+    gwAddr = getDefaultGateway(netIf)
+    if gwAddr != '':
+        uplinkStat[netIf]['gw'] = gwAddr
+    else:
+        gwAddr = uplinkStat[netIf]['gw']
 
-                # OpenVPN checking by checking tun0 interface 
-                else:
-                    # Check tun0 interface
-                    out = subprocess.Popen(['ifconfig'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+    # Command: ip route replace default via 192.168.1.1 dev wlan0
+    if gwAddr != '':
+        retCode, stdout = runCommand(['ip', 'route', 'replace', 'default', 'via', gwAddr, 'dev', netIf], 5)
+    # Point to point WAN uplink, e.g. 4G LTE modem raw IP
+    else:
+        retCode, stdout = runCommand(['ip', 'route', 'replace', 'default', 'dev', netIf], 5)
+
+    # Operation failed
+    if retCode != 0:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_UPLINK: Switch WAN uplink %s -> %s FAILED! [%s]" % (uplinkActive, netIf, stdout.strip()))
+        # Print statement
+        else:
+            print "DEBUG_UPLINK: Switch WAN uplink %s -> %s FAILED! [%s]" % (uplinkActive, netIf, stdout.strip())
 
-                    # NO error after command execution
-                    if stderr == None:
-                        # VPN tunnel still exist
-                        if 'tun0' in stdout:
-                            if fileDel == False:
-                                # Delete the contents of nc2vpn key inside temporary folder
-                                tempArgs = 'cd ' + nc2VpnKeyTPath + ';rm -rf *'
-                                out = subprocess.Popen([tempArgs], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
-                                
-                                # NO error after command execution
-                                if stderr == None:
-                                    tunnelValid = True
-                                    netMonChkCnt = 0
+        return False
 
-                                    # Change LCD operation mode
-                                    lcdOperSel = 11
-                                    
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_NETMON: Delete temporary nc2vpn key files successful")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_NETMON: Delete temporary nc2vpn key files successful"    
+    # Primary VPN tunnel OpenVPN soft restart, reconnect to VPN server through the new default route. Secondary VPN
+    # tunnel are bound to its own WAN uplink
+    ovpnPid = getOpenVpnPid()
+    if ovpnPid != 0:
+        try:
+            os.kill(ovpnPid, signal.SIGUSR1)
+        except OSError:
+            pass
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_UPLINK: Switch WAN uplink %s -> %s [%s], time: %.3fs" % (uplinkActive, netIf, reason, time.time() - startTime))
+    # Print statement
+    else:
+        print "DEBUG_UPLINK: Switch WAN uplink %s -> %s [%s], time: %.3fs" % (uplinkActive, netIf, reason, time.time() - startTime)
+
+    uplinkActive = netIf
+    return True
+
+# WAN uplink manager - Continuously probe every candidate WAN uplink, score the WAN uplink by RTT and packet loss
+# and keep the default route on the best WAN uplink
+# Each candidate WAN uplink are probed in the same round through raw ICMP socket bound to the network interface
+# (SO_BINDTODEVICE), the network interface require its own default route (DHCP client route metric) for the probe
+# Switching:
+# 1 - Failover immediately when active WAN uplink lost uplinkFailCnt consecutive probe
+# 2 - Switch to better WAN uplink when its score are 30% lower for uplinkHoldCnt consecutive probe round
+def uplinkMon (threadname, delay):
+    global backLogger
+    global uplinkProbeAddr
+    global uplinkFailCnt
+    global uplinkHoldCnt
+    global uplinkActive
+    global uplinkStat
 
-                                fileDel = True
-                                
-                            tunnelValid = True
-                            vpnAtmptCnt = 0
-                            netMonChkCnt = 0
+    sockList = {}
+    seqNo = 0
+    betterCnt = 0
+    uplinkIdent = os.getpid() & 0xffff
 
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: VPN tunnel OK")
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: VPN tunnel OK"
-                                
-                        # VPN tunnel not exist
-                        else:
-                            # Increment attempt to check VPN tunnel by checking tun0 interface existense
-                            vpnAtmptCnt += 1
+    # Current default route WAN uplink, kept while healthy (NO default route switch and OpenVPN restart at start up)
+    uplinkActive = getDefaultRouteIf()
 
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_NETMON: VPN tunnel tun0 NOT exist! - tun0 identification attempt FAILED! [%s]" % (vpnAtmptCnt))
-                            # Print statement
-                            else:
-                                print "DEBUG_NETMON: VPN tunnel tun0 NOT exist! - tun0 identification attempt FAILED! [%s]" % (vpnAtmptCnt)
+    # Forever loop
+    while True:
+        roundStart = time.time()
+        seqNo = (seqNo + 1) & 0xffff
+
+        # Candidate WAN uplink
+        candList = getUplinkCandList()
+
+        # Remove WAN uplink no longer available
+        for netIf in sockList.keys():
+            if netIf not in candList:
+                sockList.pop(netIf).close()
+                uplinkStat.pop(netIf, None)
+
+        # Send ICMP echo request through each candidate WAN uplink
+        sendTime = {}
+        probePkt = struct.pack(b'!BBHHH', 8, 0, 0, uplinkIdent, seqNo) + b'scssgw'
+        probePkt = struct.pack(b'!BBHHH', 8, 0, icmpChecksum(probePkt), uplinkIdent, seqNo) + b'scssgw'
+        for netIf in candList:
+            if netIf not in sockList:
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.getprotobyname('icmp'))
+                    # SO_BINDTODEVICE
+                    sock.setsockopt(socket.SOL_SOCKET, 25, netIf.encode('ascii') + b'\x00')
+                    sock.setblocking(0)
+                except socket.error as e:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("DEBUG_UPLINK: Open probe socket for %s FAILED! [%s]" % (netIf, e))
+                    # Print statement
+                    else:
+                        print "DEBUG_UPLINK: Open probe socket for %s FAILED! [%s]" % (netIf, e)
+                    continue
 
-                            # After  checking 5 times, still tun0 not exist, do:
-                            # KILL VPN tunnel
-                            if vpnAtmptCnt == 5:
-                                vpnAtmptCnt = 0
+                sockList[netIf] = sock
+                uplinkStat[netIf] = {'rtt': 0.0, 'loss': 0.0, 'lossCnt': 0, 'score': 0.0, 'gw': getDefaultGateway(netIf)}
 
-                                # STOP VPN tunnel
-                                out = subprocess.Popen(['killall', 'openvpn'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
+            try:
+                sockList[netIf].sendto(probePkt, (uplinkProbeAddr, 0))
+            except socket.error:
+                pass
+            sendTime[netIf] = time.time()
+
+        # Collect ICMP echo reply within the probe round
+        replyTime = {}
+        deadLine = roundStart + delay * 0.8
+        while len(replyTime) < len(sendTime):
+            remTime = deadLine - time.time()
+            if remTime <= 0:
+                break
 
-                                # NO error after command execution
-                                if stderr == None:
-                                    if 'no process found' in stdout:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_NETMON: Openvpn process NOT found - tun0 identification attempt FAILED!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_NETMON: Openvpn process NOT found - tun0 identification attempt FAILED!"
-                                    else:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_NETMON: KILL openvpn successful - tun0 identification attempt FAILED!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_NETMON: KILL openvpn successful - tun0 identification attempt FAILED!"
+            waitList = [sockList[x] for x in sendTime.keys() if x not in replyTime]
+            rdList, wrList, exList = select.select(waitList, [], [], remTime)
+            for netIf in sendTime.keys():
+                if sockList[netIf] not in rdList:
+                    continue
+                try:
+                    data = sockList[netIf].recv(1024)
+                except socket.error:
+                    continue
+
+                # Skip IP header, ICMP echo reply (type 0) with the same identifier and sequence number
+                ipHdrLen = (ord(data[0:1]) & 0x0f) * 4
+                if len(data) >= ipHdrLen + 8:
+                    icmpType, icmpCode, icmpCsum, icmpIdent, icmpSeq = struct.unpack(b'!BBHHH', data[ipHdrLen:ipHdrLen + 8])
+                    if icmpType == 0 and icmpIdent == uplinkIdent and icmpSeq == seqNo:
+                        replyTime[netIf] = time.time()
+
+        # Update WAN uplink score (EWMA): score = RTT (ms) + 1000 x packet loss ratio
+        bestIf = ''
+        for netIf in sendTime.keys():
+            uplinkInfo = uplinkStat[netIf]
+            if netIf in replyTime:
+                probeRtt = (replyTime[netIf] - sendTime[netIf]) * 1000
+                if uplinkInfo['rtt'] == 0:
+                    uplinkInfo['rtt'] = probeRtt
+                else:
+                    uplinkInfo['rtt'] = uplinkInfo['rtt'] * 0.8 + probeRtt * 0.2
+                uplinkInfo['loss'] = uplinkInfo['loss'] * 0.8
+                uplinkInfo['lossCnt'] = 0
+            else:
+                uplinkInfo['loss'] = uplinkInfo['loss'] * 0.8 + 0.2
+                uplinkInfo['lossCnt'] += 1
+            uplinkInfo['score'] = uplinkInfo['rtt'] + 1000 * uplinkInfo['loss']
+
+            if uplinkInfo['lossCnt'] == 0 and (bestIf == '' or uplinkInfo['score'] < uplinkStat[bestIf]['score']):
+                bestIf = netIf
+
+        # Active WAN uplink removed or lost consecutive probe, failover immediately
+        if uplinkActive not in uplinkStat or uplinkStat[uplinkActive]['lossCnt'] >= uplinkFailCnt:
+            betterCnt = 0
+            if bestIf != '' and bestIf != uplinkActive:
+                switchUplink(bestIf, 'failover')
+
+        # Better WAN uplink available
+        elif bestIf != '' and bestIf != uplinkActive and uplinkStat[bestIf]['score'] < uplinkStat[uplinkActive]['score'] * 0.7:
+            betterCnt += 1
+            if betterCnt >= uplinkHoldCnt:
+                betterCnt = 0
+                switchUplink(bestIf, 'better score %.1f/%.1f' % (uplinkStat[bestIf]['score'], uplinkStat[uplinkActive]['score']))
+        else:
+            betterCnt = 0
+
+        # Wait for the next probe round
+        remTime = roundStart + delay - time.time()
+        if remTime > 0:
+            time.sleep(remTime)
+
+# Start multipath VPN tunnel - Start secondary VPN tunnel (tun1, tun2, ...) over each WAN uplink other than the
+# primary VPN tunnel (tun0) WAN uplink. Secondary VPN tunnel bind to the WAN uplink IP address, and source policy
+# routing send its traffic through the WAN uplink. VPN route are installed by the primary VPN tunnel only
+# (--route-noexec), the VPN server must accept concurrent connection with the same certificate (duplicate-cn)
+# Parameters:
+# fileName - OpenVPN configuration path
+def startMultiPathTunnel (fileName):
+    global backLogger
+    global nc2VpnKeyTPath
+    global mpathTunnel
+    global mpathRouteList
+    global mpathWeight
+    global mpathTableBase
+
+    primaryIf = getDefaultRouteIf()
+    mpathTunnel.clear()
+    mpathWeight.clear()
+    del mpathRouteList[:]
+    mpathTunnel['tun0'] = {'netIf': primaryIf, 'addr': '', 'table': 0, 'bytes': 0, 'cap': 0.0, 'proc': None}
+
+    # Per flow (L4 hash) balancing for multipath route
+    writeSysFile('/proc/sys/net/ipv4/fib_multipath_hash_policy', '1')
+
+    tunIdx = 1
+    for netIf in getUplinkCandList():
+        if netIf == primaryIf:
+            continue
+
+        # WAN uplink without IPv4 address (e.g. DHCP lease NOT acquired yet) can NOT be bound
+        ifAddr = getIfIpAddress(netIf)
+        if ifAddr == '':
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_MPATH: Secondary VPN tunnel over %s SKIP, NO IP address" % (netIf))
+            # Print statement
+            else:
+                print "DEBUG_MPATH: Secondary VPN tunnel over %s SKIP, NO IP address" % (netIf)
+
+            continue
+
+        tunDev = 'tun%d' % (tunIdx)
+        gwAddr = getDefaultGateway(netIf)
+        tableNo = str(mpathTableBase + tunIdx)
+        tunIdx += 1
+
+        # Source policy routing through the WAN uplink
+        # Command: ip rule add from 10.1.1.2 table 101
+        #          ip route replace default via 10.1.1.1 dev wlan0 table 101
+        runCommand(['ip', 'rule', 'del', 'from', ifAddr, 'table', tableNo], 5)
+        runCommand(['ip', 'rule', 'add', 'from', ifAddr, 'table', tableNo], 5)
+        if gwAddr != '':
+            runCommand(['ip', 'route', 'replace', 'default', 'via', gwAddr, 'dev', netIf, 'table', tableNo], 5)
+        else:
+            runCommand(['ip', 'route', 'replace', 'default', 'dev', netIf, 'table', tableNo], 5)
 
-                                    # Retry again the sequence, start with pinging client process  
-                                    tunnelValid = False
-                                    netMonChkCnt = 0
+        # START secondary VPN tunnel, the OpenVPN process are kept (NOT daemon) for termination
+        tempArgs = ['openvpn', '--config', fileName, '--dev', tunDev, '--local', ifAddr, '--lport', '0', '--bind', \
+                    '--route-noexec']
+        tunProc = spawnCommand(tempArgs, cmdDir=nc2VpnKeyTPath)
 
-                                # Operation failed
-                                else:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_NETMON: KILL openvpn FAILED! - tun0 identification attempt FAILED!")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_NETMON: KILL openvpn FAILED! - tun0 identification attempt FAILED!"
+        # OpenVPN still running after configuration parsing
+        if tunProc != None and waitForCondition(lambda: tunProc.poll() != None, 1) == False:
+            mpathTunnel[tunDev] = {'netIf': netIf, 'addr': ifAddr, 'table': tableNo, 'bytes': 0, 'cap': 0.0, 'proc': tunProc}
 
-                    # Operation failed
-                    else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_NETMON: Command execution to check tun0 interface FAILED!")
-                        # Print statement
-                        else:
-                            print "DEBUG_NETMON: Command execution to check tun0 interface FAILED!"
-                            
-# Display information on the i2c LCD
-def lcdOperation (threadname, delay):
-    global lcdOperSel
-    global lcdDlyStatCnt
-    global lcdBattVolt        
-    global lcdBattCap
-    global lcdBlTimeOut
-    global scrollUP
-    global scrollDWN
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_MPATH: Init. secondary VPN tunnel %s over %s successful" % (tunDev, netIf))
+            # Print statement
+            else:
+                print "DEBUG_MPATH: Init. secondary VPN tunnel %s over %s successful" % (tunDev, netIf)
+
+        # Operation failed
+        else:
+            runCommand(['ip', 'rule', 'del', 'from', ifAddr, 'table', tableNo], 5)
+
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_MPATH: Init. secondary VPN tunnel %s over %s FAILED!" % (tunDev, netIf))
+            # Print statement
+            else:
+                print "DEBUG_MPATH: Init. secondary VPN tunnel %s over %s FAILED!" % (tunDev, netIf)
+
+# STOP multipath VPN tunnel - Terminate secondary VPN tunnel and remove its source policy routing
+def stopMultiPathTunnel ():
+    global mpathTunnel
+    global mpathRouteList
+    global mpathWeight
+
+    for tunDev in mpathTunnel.keys():
+        if tunDev != 'tun0':
+            # Terminate the secondary VPN tunnel OpenVPN process, KILL when NOT exit
+            tunProc = mpathTunnel[tunDev]['proc']
+            try:
+                tunProc.terminate()
+                if waitForCondition(lambda: tunProc.poll() != None, 5) == False:
+                    tunProc.kill()
+                    tunProc.wait()
+            except OSError:
+                pass
+            runCommand(['ip', 'rule', 'del', 'from', mpathTunnel[tunDev]['addr'], 'table', mpathTunnel[tunDev]['table']], 5)
+
+    mpathTunnel.clear()
+    mpathWeight.clear()
+    del mpathRouteList[:]
+
+# Multipath VPN tunnel monitoring - Measure each WAN uplink throughput and balance the VPN route across all VPN
+# tunnel by ECMP multipath route, weighted by the WAN uplink measured capacity (decaying peak throughput)
+def multiPathMon (threadname, delay):
+    global backLogger
     global tunnelValid
-    global net4gValid
-    global radioMode
-    global radioValid
-    global i2cLcd
-    
+    global mpathTunnel
+    global mpathRouteList
+    global mpathWeight
+
     # Forever loop
     while True:
-        # Loop every 0.5s
         time.sleep(delay)
 
-        # Try execution
-        try:
-            # Default LCD display information
-            if lcdOperSel == 0:
-                # Turn ON LCD back light for 10s
-                if GPIO.input(17) == False or GPIO.input(24) == False:
-                    # Turn ON LCD back light
-                    GPIO.output(27, GPIO.HIGH)
-                    lcdBlTimeOut = 0
-                elif lcdBlTimeOut == 20:
-                    # Turn OFF LCD back light
-                    GPIO.output(27, GPIO.LOW)
-                    lcdBlTimeOut = 0
-                else:
-                    # Increment LCD back light counter
-                    lcdBlTimeOut += 1
+        # VPN tunnel terminated
+        if tunnelValid == False:
+            if len(mpathTunnel) > 0:
+                stopMultiPathTunnel()
+            continue
+
+        # Only balance VPN tunnel that are UP
+        tunList = [x for x in sorted(mpathTunnel.keys()) if chkIfUp(x) == True]
+        if len(tunList) < 2:
+            continue
+
+        # WAN uplink measured capacity (bytes/s): peak throughput with slow decay
+        for tunDev in tunList:
+            tunInfo = mpathTunnel[tunDev]
+            statPath = '/sys/class/net/' + tunInfo['netIf'] + '/statistics/'
+            currBytes = readSysFile(statPath + 'rx_bytes')
+            currBytes2 = readSysFile(statPath + 'tx_bytes')
+            if currBytes == '' or currBytes2 == '':
+                continue
+            currBytes = int(currBytes) + int(currBytes2)
+
+            if tunInfo['bytes'] != 0:
+                currRate = (currBytes - tunInfo['bytes']) / float(delay)
+                tunInfo['cap'] = max(tunInfo['cap'] * 0.99, currRate)
+            tunInfo['bytes'] = currBytes
+
+        # VPN route installed by primary VPN tunnel
+        # Command: ip -4 route show dev tun0
+        # Reply:
+        # 10.8.0.0/24 proto kernel scope link src 10.8.0.6
+        # 192.168.100.0/24 via 10.8.0.5
+        if len(mpathRouteList) == 0:
+            retCode, stdout = runCommand(['ip', '-4', 'route', 'show', 'dev', 'tun0'], 5)
+            if retCode == 0:
+                for oneLine in stdout.split(b'\n'):
+                    if oneLine.strip() != b'' and b'scope link' not in oneLine:
+                        mpathRouteList.append(oneLine.split()[0].decode('ascii'))
+
+        # Route weight 1 - 10 relative to the highest capacity, equal weight before any capacity measured
+        maxCap = max([mpathTunnel[x]['cap'] for x in tunList])
+        newWeight = {}
+        for tunDev in tunList:
+            if maxCap > 0:
+                newWeight[tunDev] = max(1, int(round(10 * mpathTunnel[tunDev]['cap'] / maxCap)))
+            else:
+                newWeight[tunDev] = 1
 
-                lcdDlyStatCnt += 1
-                # Display security gw current status
-                if lcdDlyStatCnt < 10:
-                    if lcdDlyStatCnt == 0:
-                        mylcd.lcd_clear()
+        if newWeight == mpathWeight:
+            continue
 
-                    # Security gateway mode
-                    if radioMode == False:
-                        if tunnelValid == False and net4gValid == False:
-                            # Previously i2c LCD initialization are successful
-                            if i2cLcd == True:
-                                mylcd.lcd_display_string('NC2VPN Secure GW', 1)
-                                mylcd.lcd_display_string('    OFFLINE     ', 2)
+        # Command: ip route replace 192.168.100.0/24 nexthop dev tun0 weight 10 nexthop dev tun1 weight 4
+        for routeDest in mpathRouteList:
+            tempArgs = ['ip', 'route', 'replace', routeDest]
+            for tunDev in tunList:
+                tempArgs += ['nexthop', 'dev', tunDev, 'weight', str(newWeight[tunDev])]
+            runCommand(tempArgs, 5)
 
-                            # Previously i2c LCD initialization are failed
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_LCD: NC2VPN Secure GW")
-                                    logger.info("DEBUG_LCD: OFFLINE")
-                                # Print statement
-                                else:
-                                    print "DEBUG_LCD: NC2VPN Secure GW"
-                                    print "DEBUG_LCD: OFFLINE"
-                                
-                        elif tunnelValid == True and net4gValid == True:
-                            # Previously i2c LCD initialization are successful
-                            if i2cLcd == True:
-                                mylcd.lcd_display_string('NC2VPN Secure GW', 1)
-                                mylcd.lcd_display_string('     ONLINE     ', 2)
+        mpathWeight.clear()
+        mpathWeight.update(newWeight)
 
-                            # Previously i2c LCD initialization are failed    
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_LCD: NC2VPN Secure GW")
-                                    logger.info("DEBUG_LCD: ONLINE")
-                                # Print statement
-                                else:
-                                    print "DEBUG_LCD: NC2VPN Secure GW"
-                                    print "DEBUG_LCD: ONLINE"
-                    # Radio mode
-                    else:
-                        if radioValid == False and net4gValid == False:
-                            # Previously i2c LCD initialization are successful
-                            if i2cLcd == True:
-                                mylcd.lcd_display_string(' Radio Mon. Svr ', 1)
-                                mylcd.lcd_display_string('    OFFLINE     ', 2)
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_MPATH: VPN route weight %s" % (' '.join(['%s:%d' % (x, newWeight[x]) for x in tunList])))
+        # Print statement
+        else:
+            print "DEBUG_MPATH: VPN route weight %s" % (' '.join(['%s:%d' % (x, newWeight[x]) for x in tunList]))
+
+# Forwarding lockdown - Forwarded client computer traffic are only allowed to leave through VPN tunnel (tun+),
+# nothing are forwarded to the WAN uplink before the VPN tunnel are UP
+# Command: iptables -n -L SCSSGW_LOCK, iptables -F SCSSGW_LOCK (exist) or iptables -N SCSSGW_LOCK
+#          iptables -A SCSSGW_LOCK -o tun+ -j RETURN
+#          iptables -A SCSSGW_LOCK -j DROP
+#          iptables -I FORWARD 1 -j SCSSGW_LOCK
+# Return: True when forwarding lockdown are applied
+def lockdownForward ():
+    global backLogger
 
-                            # Previously i2c LCD initialization are failed
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_LCD: Radio Mon. Svr")
-                                    logger.info("DEBUG_LCD: OFFLINE")
-                                # Print statement
-                                else:
-                                    print "DEBUG_LCD: NC2VPN Secure GW"
-                                    print "DEBUG_LCD: OFFLINE"
-                                    
-                        elif radioValid == True and net4gValid == True:
-                            # Previously i2c LCD initialization are successful
-                            if i2cLcd == True:
-                                mylcd.lcd_display_string(' Radio Mon. Svr ', 1)
-                                mylcd.lcd_display_string('     ONLINE     ', 2)
+    # Chain created on demand, flushed when already exist from previous run
+    retCode, stdout = runCommand(['iptables', '-n', '-L', 'SCSSGW_LOCK'], 10)
+    if retCode == 0:
+        retCode, stdout = runCommand(['iptables', '-F', 'SCSSGW_LOCK'], 10)
+    else:
+        retCode, stdout = runCommand(['iptables', '-N', 'SCSSGW_LOCK'], 10)
+    if retCode == 0:
+        retCode, stdout = runCommand(['iptables', '-A', 'SCSSGW_LOCK', '-o', 'tun+', '-j', 'RETURN'], 10)
+    if retCode == 0:
+        retCode, stdout = runCommand(['iptables', '-A', 'SCSSGW_LOCK', '-j', 'DROP'], 10)
+    if retCode == 0:
+        retCode, stdout = runCommand(['iptables', '-C', 'FORWARD', '-j', 'SCSSGW_LOCK'], 10)
+        if retCode != 0:
+            retCode, stdout = runCommand(['iptables', '-I', 'FORWARD', '1', '-j', 'SCSSGW_LOCK'], 10)
+
+    # NO error after command execution
+    if retCode == 0:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_NETMON: Forwarding lockdown successful")
+        # Print statement
+        else:
+            print "DEBUG_NETMON: Forwarding lockdown successful"
+
+        return True
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_NETMON: Forwarding lockdown FAILED!")
+    # Print statement
+    else:
+        print "DEBUG_NETMON: Forwarding lockdown FAILED!"
+
+    return False
+
+# Stop kernel IP forwarding (IPv4 and IPv6) in-process, client computer traffic are dropped without any external command
+# Return: Previous forwarding switch value, key: forwarding switch path
+def blackholeForward ():
+    global fwdSysPath
+
+    fwdState = {}
+    for fwdPath in fwdSysPath:
+        fwdState[fwdPath] = readSysFile(fwdPath)
+        if fwdState[fwdPath] not in ['', '0']:
+            writeSysFile(fwdPath, '0')
+
+    return fwdState
+
+# Restore kernel IP forwarding switch
+# fwdState - Previous forwarding switch value from blackholeForward
+def restoreForward (fwdState):
+    for fwdPath in fwdState.keys():
+        if fwdState[fwdPath] not in ['', '0']:
+            writeSysFile(fwdPath, fwdState[fwdPath])
+
+# USB key removal lockdown worker
+# resultQueue - Queue to report the job result: (job name, result, elapsed time)
+def lockdownWorker (threadname, jobName, jobFunc, jobArgs, resultQueue):
+    startTime = time.time()
+    try:
+        jobResult = jobFunc(*jobArgs)
+    except Exception as e:
+        jobResult = e
+    resultQueue.put((jobName, jobResult, time.time() - startTime))
+
+# STOP 4G LTE modem and bring DOWN its network interface
+# Return: STOP 4G LTE modem command return code and output
+def shutdown4GModem ():
+    retCode, stdout = stopAll4GModem()
+    runCommand(['ifconfig', get4GModemNetIf(), 'down'], 10)
+
+    return retCode, stdout
+
+# USB key removal lockdown - Stop forwarding in-process first, then STOP VPN tunnel (secondary VPN tunnel included),
+# DHCP client, 4G LTE modem, revoke the cached nc2vpn key and install the forwarding lockdown chain (only VPN tunnel
+# allowed) concurrently. Forwarding are restored after all completed ONLY when the lockdown chain in place, as
+# multi-WAN uplink can stay UP, otherwise forwarding kept STOP until the VPN tunnel UP again
+# evtTime - USB removal event time
+def usbLockdown (evtTime):
+    global backLogger
+    global usbLockDeadline
+    global fwdHoldState
+    global multiPath
+
+    fwdState = blackholeForward()
+    blackholeTime = time.time() - evtTime
+    recordCmdLatency('usb-blackhole', blackholeTime)
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_USBMON: USB key removed, forwarding STOP, time-to-blackhole: %.1fms, deadline: %s" % (blackholeTime * 1000, blackholeTime <= usbLockDeadline))
+    # Print statement
+    else:
+        print "DEBUG_USBMON: USB key removed, forwarding STOP, time-to-blackhole: %.1fms, deadline: %s" % (blackholeTime * 1000, blackholeTime <= usbLockDeadline)
+
+    jobList = [('openvpn', runCommand, (['killall', 'openvpn'], 10)),
+               ('udhcpc', runCommand, (['pkill', '-f', 'udhcpc -i ' + get4GModemNetIf()], 10)),
+               ('modem', shutdown4GModem, ()),
+               ('keycache', revokeOvpnKeyCache, ()),
+               ('lockdown', lockdownForward, ())]
+    if multiPath == True:
+        jobList.append(('mpath', stopMultiPathTunnel, ()))
+    resultQueue = Queue.Queue()
+    for jobName, jobFunc, jobArgs in jobList:
+        thread.start_new_thread(lockdownWorker, ("[lockdownWorker]", jobName, jobFunc, jobArgs, resultQueue))
+
+    fwdLocked = False
+    for a in range(len(jobList)):
+        jobName, jobResult, jobTime = resultQueue.get()
+        if isinstance(jobResult, tuple) == True:
+            jobResult = jobResult[0]
+        if jobName == 'lockdown' and jobResult == True:
+            fwdLocked = True
+
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_USBMON: Lockdown [%s] completed, %.3fs, status: %s" % (jobName, jobTime, jobResult))
+        # Print statement
+        else:
+            print "DEBUG_USBMON: Lockdown [%s] completed, %.3fs, status: %s" % (jobName, jobTime, jobResult)
+
+    # Client computer traffic never leave through other uplink outside VPN tunnel
+    if fwdLocked == True:
+        restoreForward(fwdState)
+    else:
+        fwdHoldState = fwdState
+
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_USBMON: Forwarding lockdown chain NOT in place, forwarding kept STOP until VPN tunnel UP")
+        # Print statement
+        else:
+            print "DEBUG_USBMON: Forwarding lockdown chain NOT in place, forwarding kept STOP until VPN tunnel UP"
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_USBMON: USB key removal lockdown completed, %.3fs" % (time.time() - evtTime))
+    # Print statement
+    else:
+        print "DEBUG_USBMON: USB key removal lockdown completed, %.3fs" % (time.time() - evtTime)
+
+# Start USB key removal grace window - Forwarding lockdown and STOP VPN tunnel immediately, 4G LTE modem data session,
+# DHCP lease and the cached nc2vpn key are kept until the grace window expired
+# Return: True when grace window started, False when forwarding lockdown failed
+def startUsbGrace ():
+    global backLogger
+    global eCryptProc
+    global dCryptProc
+    global tunnelValid
+    global netMonChkCnt
+    global multiPath
+    global usbGraceTime
+    global usbGraceExp
+
+    # Client computer traffic never leave through 4G LTE modem outside VPN tunnel, stop forwarding during lockdown
+    fwdState = blackholeForward()
+    if lockdownForward() == False:
+        restoreForward(fwdState)
+        return False
+    restoreForward(fwdState)
+
+    # STOP VPN tunnel
+    retCode, stdout = runCommand(['killall', 'openvpn'], 10)
+    if multiPath == True:
+        stopMultiPathTunnel()
+    releaseOvpnMemfd()
+
+    eCryptProc = False
+    dCryptProc = False
+    tunnelValid = False
+    netMonChkCnt = 0
+    usbGraceExp = time.time() + usbGraceTime
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_USBMON: USB key removed, VPN tunnel STOP, 4G LTE modem kept for %ss grace window" % (usbGraceTime))
+    # Print statement
+    else:
+        print "DEBUG_USBMON: USB key removed, VPN tunnel STOP, 4G LTE modem kept for %ss grace window" % (usbGraceTime)
 
-                            # Previously i2c LCD initialization are failed
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_LCD: Radio Mon. Svr")
-                                    logger.info("DEBUG_LCD: ONLINE")
-                                # Print statement
-                                else:
-                                    print "DEBUG_LCD: NC2VPN Secure GW"
-                                    print "DEBUG_LCD: ONLINE"
-                    
-                # Display date and time for 5s
-                elif lcdDlyStatCnt >= 10 and lcdDlyStatCnt < 20:
-                    if lcdDlyStatCnt == 10:
-                        mylcd.lcd_clear()
+    return True
 
-                    # Previously i2c LCD initialization are successful
-                    if i2cLcd == True:
-                        mylcd.lcd_display_string("Time: %s" %time.strftime("%H:%M:%S"), 1)
-                        mylcd.lcd_display_string("Date: %s" %time.strftime("%m/%d/%Y"), 2)
+# USB key removal grace window expired - Revoke the cached nc2vpn key and STOP 4G LTE modem, 4G LTE modem are kept
+# under pre-warm mode
+def expireUsbGrace ():
+    global backLogger
+    global net4gValid
+    global netMonChkCnt
+    global preWarmLock
 
-                    # Previously i2c LCD initialization are failed
-                    else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_LCD: Time: %s" %time.strftime("%H:%M:%S"))
-                            logger.info("DEBUG_LCD: Date: %s" %time.strftime("%m/%d/%Y"))
-                        # Print statement
-                        else:
-                            print "DEBUG_LCD: Time: %s" %time.strftime("%H:%M:%S")
-                            print "DEBUG_LCD: Date: %s" %time.strftime("%m/%d/%Y")
-                                    
-                # Display battery status for 5s
-                elif lcdDlyStatCnt >= 20 and lcdDlyStatCnt < 30:
-                    if lcdDlyStatCnt == 20:
-                        mylcd.lcd_clear()
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_USBMON: USB key removal grace window expired")
+    # Print statement
+    else:
+        print "DEBUG_USBMON: USB key removal grace window expired"
 
-                    if lcdBattCap > 100:
-                        lcdBattCap = 100
+    revokeOvpnKeyCache()
 
-                    # Previously i2c LCD initialization are successful
-                    if i2cLcd == True:
-                        mylcd.lcd_display_string("Volt: %5.2fV" % lcdBattVolt, 1)
-                        mylcd.lcd_display_string("Cap: %5i%%" % lcdBattCap, 2)
+    if preWarmLock == True:
+        return
 
-                    # Previously i2c LCD initialization are failed
-                    else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_LCD: Volt: %5.2fV" % lcdBattVolt)
-                            logger.info("DEBUG_LCD: Cap: %5i%%" % lcdBattCap)
-                        # Print statement
-                        else:
-                            print "DEBUG_LCD: Volt: %5.2fV" % lcdBattVolt
-                            print "DEBUG_LCD: Cap: %5i%%" % lcdBattCap
-                            
-                # Reset counter
-                elif lcdDlyStatCnt == 30:
-                    lcdDlyStatCnt = 0
+    # STOP 4G LTE modem
+    retCode, stdout = stopAll4GModem()
+    runCommand(['ifconfig', get4GModemNetIf(), 'down'], 10)
+    runCommand(['pkill', '-f', 'udhcpc -i ' + get4GModemNetIf()], 10)
 
-            elif lcdOperSel == 1:
-                # Turn ON LCD back light
-                GPIO.output(27, GPIO.HIGH)
+    net4gValid = False
+    netMonChkCnt = 0
 
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    mylcd.lcd_display_string('ENCRYPT Process ', 1)
-                    mylcd.lcd_display_string('Please wait.....', 2)
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_USBMON: STOP 4G LTE modem after grace window, status: %s" % (retCode))
+    # Print statement
+    else:
+        print "DEBUG_USBMON: STOP 4G LTE modem after grace window, status: %s" % (retCode)
+
+# Check 4G LTE modem pre-warm - Pre-warm are allowed at boot or after client computer detected, only after
+# forwarding lockdown are applied. The lockdown are kept, so the client computer traffic never leave outside VPN tunnel
+# Parameters:
+# clientSeen - Client computer detected by pinging process
+# Return: True when 4G LTE modem pre-warm are allowed
+def chkPreWarm (clientSeen):
+    global preWarmMode
+    global preWarmLock
+
+    if preWarmLock == True:
+        return True
+    if preWarmMode == 1 or (preWarmMode == 2 and clientSeen == True):
+        preWarmLock = lockdownForward()
+
+    return preWarmLock
+
+# Stage graph executor - Each stage are executed in its own thread as soon as all of its dependency stages are
+# successful, independent stages are executed concurrently. Stage with failed dependency are skipped (failed)
+# Parameters:
+# stageList - List of (stage name, stage function, dependency stage name list), stage function return True when successful
+# Return:
+# stageResult - Key: stage name, value: True when successful
+# stageTime   - Key: stage name, value: (start time, end time)
+def runStageGraph (stageList):
+    stageResult = {}
+    stageTime = {}
+    stageStart = []
+    doneQueue = Queue.Queue()
+    runCnt = 0
+
+    # Stage thread
+    def stageProc (threadname, stageName, stageFunc):
+        retResult = False
+        startTime = time.time()
+        try:
+            retResult = stageFunc() == True
+        finally:
+            doneQueue.put((stageName, retResult, startTime, time.time()))
 
-                # Previously i2c LCD initialization are failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_LCD: ENCRYPT Process")
-                        logger.info("DEBUG_LCD: Please wait.....")
-                    # Print statement
-                    else:
-                        print "DEBUG_LCD: ENCRYPT Process"
-                        print "DEBUG_LCD: Please wait....."
-                            
-                lcdOperSel = 2
+    while True:
+        # Start every ready stage, skip stage with failed dependency
+        stageChg = True
+        while stageChg == True:
+            stageChg = False
+            for stageName, stageFunc, depList in stageList:
+                if stageName in stageStart:
+                    continue
+
+                if False in [stageResult.get(x) for x in depList]:
+                    stageStart.append(stageName)
+                    stageResult[stageName] = False
+                    stageTime[stageName] = (time.time(), time.time())
+                    stageChg = True
+
+                elif len([x for x in depList if stageResult.get(x) == True]) == len(depList):
+                    stageStart.append(stageName)
+                    thread.start_new_thread(stageProc, ("[stageProc]", stageName, stageFunc))
+                    runCnt += 1
+
+        if runCnt == 0:
+            break
 
-            elif lcdOperSel == 3:
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    mylcd.lcd_display_string('ENCRYPT Process ', 1)
-                    mylcd.lcd_display_string('Successful      ', 2)
+        # Wait for any stage completed
+        stageName, retResult, startTime, endTime = doneQueue.get()
+        runCnt -= 1
+        stageResult[stageName] = retResult
+        stageTime[stageName] = (startTime, endTime)
 
-                # Previously i2c LCD initialization are failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_LCD: ENCRYPT Process")
-                        logger.info("DEBUG_LCD: Successful")
-                    # Print statement
-                    else:
-                        print "DEBUG_LCD: ENCRYPT Process"
-                        print "DEBUG_LCD: Successful"
-                        
-                # Delay a bit, to display another info
-                time.sleep(3)
+    return stageResult, stageTime
 
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    mylcd.lcd_display_string('Please remove   ', 1)
-                    mylcd.lcd_display_string('USB stick.......', 2)
+# Write stage graph timing breakdown and critical path (chain of the latest completed dependency stage)
+def logStageTiming (stageList, stageResult, stageTime, startTime):
+    global backLogger
 
-                # Previously i2c LCD initialization are failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_LCD: Please remove")
-                        logger.info("DEBUG_LCD: USB stick.......")
-                    # Print statement
-                    else:
-                        print "DEBUG_LCD: Please remove"
-                        print "DEBUG_LCD: USB stick......."
-                
-                lcdOperSel = 4
+    stageDep = {}
+    for stageName, stageFunc, depList in stageList:
+        stageDep[stageName] = depList
 
-            elif lcdOperSel == 5:
-                # Turn ON LCD back light
-                GPIO.output(27, GPIO.HIGH)
+        tempData = "DEBUG_STAGE: %-8s start +%.2fs duration %.2fs %s" % (stageName, stageTime[stageName][0] - startTime, \
+                   stageTime[stageName][1] - stageTime[stageName][0], 'OK' if stageResult[stageName] == True else 'FAILED!')
+        # Write to logger
+        if backLogger == True:
+            logger.info(tempData)
+        # Print statement
+        else:
+            print tempData
+
+    # Critical path, start from the latest completed stage
+    critPath = [max(stageTime.keys(), key=lambda x: stageTime[x][1])]
+    while len(stageDep[critPath[0]]) > 0:
+        critPath.insert(0, max(stageDep[critPath[0]], key=lambda x: stageTime[x][1]))
+
+    tempData = "DEBUG_STAGE: Critical path %s, total %.2fs" % (' -> '.join(critPath), max([x[1] for x in stageTime.values()]) - startTime)
+    # Write to logger
+    if backLogger == True:
+        logger.info(tempData)
+    # Print statement
+    else:
+        print tempData
+
+# Parse OpenVPN configuration file - Remote server, protocol, inline (or referenced) key files, route directive and
+# the other options, then validate the configuration and check the certificate expiry
+# Parse result are cached by the configuration content hash, the same configuration are parsed once. Certificate
+# expiry are NOT cached, checked against the current time by chkOvpnCertExpiry()
+# Return: Parse result (dict), None when the configuration can not be read
+# hash      - Configuration content SHA-256 hex digest
+# remote    - List of (host, port, proto), remote without port and proto use the configuration default
+# connBlock - True when the configuration use <connection> block
+# route     - List of route directive arguments, 'route' and 'route-ipv6'
+# inline    - Key files content, key: tag, e.g. 'ca', 'cert', 'key', 'tls-auth'
+# option    - The other options arguments, key: option name
+# cert      - List of (tag, subject, notAfter, notAfter epoch time)
+# error     - List of validation error (certificate expiry excluded), empty when the configuration is valid
+def parseOvpnConfig (filePath):
+    global backLogger
+    global ovpnParseCache
+    global ovpnParseMax
 
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    mylcd.lcd_display_string('DECRYPT Process ', 1)
-                    mylcd.lcd_display_string('Please wait.....', 2)
+    inlineTag = ['ca', 'cert', 'key', 'dh', 'extra-certs', 'tls-auth', 'tls-crypt', 'tls-crypt-v2', 'secret', 'pkcs12']
+    fileDir = os.path.dirname(filePath)
 
-                # Previously i2c LCD initialization are failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_LCD: DECRYPT Process")
-                        logger.info("DEBUG_LCD: Please wait.....")
-                    # Print statement
-                    else:
-                        print "DEBUG_LCD: DECRYPT Process"
-                        print "DEBUG_LCD: Please wait....."
+    try:
+        ovpnFile = open(filePath, 'r')
+        try:
+            ovpnData = ovpnFile.read()
+        finally:
+            ovpnFile.close()
+    except (IOError, OSError):
+        return None
+
+    confHash = hashlib.sha256(ovpnData).hexdigest()
+    if confHash in ovpnParseCache:
+        return ovpnParseCache[confHash]
+
+    startTime = time.time()
+    ovpnInfo = {'hash': confHash, 'remote': [], 'connBlock': False, 'route': [], 'inline': {}, 'option': {}, \
+                'cert': [], 'error': []}
+    defPort = '1194'
+    defProto = 'udp'
+    blockTag = None
+    blockData = []
+
+    for oneLine in ovpnData.split(b'\n'):
+        ovpnLine = oneLine.strip()
+
+        # Inline block content
+        if blockTag != None:
+            if ovpnLine == '</%s>' % (blockTag):
+                ovpnInfo['inline'][blockTag] = b'\n'.join(blockData)
+                blockTag = None
+            else:
+                blockData.append(ovpnLine)
+            continue
+
+        ovpnField = ovpnLine.split()
+        if len(ovpnField) == 0 or ovpnField[0][0] in b'#;':
+            continue
+
+        if ovpnField[0] == '<connection>':
+            ovpnInfo['connBlock'] = True
+        elif ovpnField[0] == '</connection>':
+            pass
+        elif re.match(r'^<[a-z0-9-]+>$', ovpnField[0]):
+            blockTag = ovpnField[0][1:-1]
+            blockData = []
+        elif ovpnField[0] in ['port', 'rport'] and len(ovpnField) > 1:
+            defPort = ovpnField[1]
+        elif ovpnField[0] == 'proto' and len(ovpnField) > 1:
+            defProto = ovpnField[1]
+        elif ovpnField[0] == 'remote' and len(ovpnField) > 1:
+            ovpnInfo['remote'].append(ovpnField[1:4])
+        elif ovpnField[0] in ['route', 'route-ipv6'] and len(ovpnField) > 1:
+            ovpnInfo['route'].append(ovpnField[:])
+        # Referenced key file, relative to the configuration directory
+        elif ovpnField[0] in inlineTag and len(ovpnField) > 1 and ovpnField[1] != '[inline]':
+            try:
+                keyFile = open(os.path.join(fileDir, ovpnField[1]), 'r')
+                try:
+                    ovpnInfo['inline'][ovpnField[0]] = keyFile.read().strip()
+                finally:
+                    keyFile.close()
+            except (IOError, OSError):
+                ovpnInfo['error'].append('Referenced %s file %s NOT exist' % (ovpnField[0], ovpnField[1].decode('utf-8', 'replace')))
+            ovpnInfo['option'][ovpnField[0]] = ovpnField[1:]
+        else:
+            ovpnInfo['option'][ovpnField[0]] = ovpnField[1:]
+
+    # Remote without port and proto use the configuration default
+    for a in range(len(ovpnInfo['remote'])):
+        remoteInfo = ovpnInfo['remote'][a] + [defPort, defProto][len(ovpnInfo['remote'][a]) - 1:]
+        ovpnInfo['remote'][a] = (remoteInfo[0], remoteInfo[1], remoteInfo[2])
+
+    # Validate the configuration
+    if blockTag != None:
+        ovpnInfo['error'].append('Inline <%s> block NOT terminated' % (blockTag))
+    if len(ovpnInfo['remote']) == 0:
+        ovpnInfo['error'].append('NO remote server')
+    if 'ca' not in ovpnInfo['inline'] and 'pkcs12' not in ovpnInfo['inline']:
+        ovpnInfo['error'].append('NO CA certificate')
+    if ('cert' in ovpnInfo['inline']) != ('key' in ovpnInfo['inline']):
+        ovpnInfo['error'].append('Client certificate and private key NOT paired')
+
+    # Certificate expiry
+    for certTag in ['ca', 'cert', 'extra-certs']:
+        certList = re.findall(r'-----BEGIN CERTIFICATE-----.*?-----END CERTIFICATE-----', \
+                              ovpnInfo['inline'].get(certTag, ''), re.DOTALL)
+        for oneCert in certList:
+            # Command: openssl x509 -noout -subject -enddate, e.g. notAfter=Jan  1 00:00:00 2030 GMT
+            retCode, stdout = runCommand(['openssl', 'x509', '-noout', '-subject', '-enddate'], 10, cmdInput=oneCert + b'\n', \
+                                         errList=[])
+            certInfo = dict(re.findall(r'^(subject|notAfter)\s*=\s*(.*)$', stdout, re.MULTILINE))
+            endTime = parseCertTime(certInfo.get('notAfter', ''))
+            if retCode != 0 or endTime == None:
+                ovpnInfo['error'].append('Invalid <%s> certificate' % (certTag))
+                continue
+
+            ovpnInfo['cert'].append((certTag, certInfo.get('subject', ''), certInfo['notAfter'], endTime))
+
+    if len(ovpnParseCache) >= ovpnParseMax:
+        ovpnParseCache.clear()
+    ovpnParseCache[confHash] = ovpnInfo
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_OVPN_CHK: Parse OpenVPN configuration, %s remotes, %s routes, %s certificates, %.3fs" % \
+                    (len(ovpnInfo['remote']), len(ovpnInfo['route']), len(ovpnInfo['cert']), time.time() - startTime))
+        for oneError in ovpnInfo['error']:
+            logger.info("DEBUG_OVPN_CHK: OpenVPN configuration INVALID! - %s" % (oneError))
+    # Print statement
+    else:
+        print "DEBUG_OVPN_CHK: Parse OpenVPN configuration, %s remotes, %s routes, %s certificates, %.3fs" % \
+              (len(ovpnInfo['remote']), len(ovpnInfo['route']), len(ovpnInfo['cert']), time.time() - startTime)
+        for oneError in ovpnInfo['error']:
+            print "DEBUG_OVPN_CHK: OpenVPN configuration INVALID! - %s" % (oneError)
+
+    return ovpnInfo
+
+# Convert openssl certificate time into epoch time, e.g. 'Jan  1 00:00:00 2030 GMT' (month name NOT locale dependent)
+# Return: Epoch time, None when invalid
+def parseCertTime (certTime):
+    monthName = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+    timeField = re.match(r'^([A-Z][a-z]{2})\s+(\d+)\s+(\d+):(\d+):(\d+)\s+(\d+)\s+GMT$', certTime.strip())
+    if timeField == None or timeField.group(1) not in monthName:
+        return None
+
+    return calendar.timegm((int(timeField.group(6)), monthName.index(timeField.group(1)) + 1, int(timeField.group(2)), \
+                            int(timeField.group(3)), int(timeField.group(4)), int(timeField.group(5)), 0, 0, 0))
+
+# Check the certificate expiry of parsed OpenVPN configuration against the current time
+# Return: List of expired certificate error, empty when NO certificate expired
+def chkOvpnCertExpiry (ovpnInfo):
+    currTime = time.time()
+
+    return ['<%s> certificate [%s] EXPIRED! since %s' % (certTag, certSubj, certEnd) \
+            for certTag, certSubj, certEnd, endTime in ovpnInfo['cert'] if endTime <= currTime]
+
+# Pre-flight check OpenVPN configuration before start the VPN tunnel, certificate expiry checked on every check
+# Return: True when the configuration is valid
+def preflightOvpn (filePath):
+    global backLogger
 
-                lcdOperSel = 6
+    ovpnInfo = parseOvpnConfig(filePath)
+    if ovpnInfo == None:
+        return False
 
-            elif lcdOperSel == 7:
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    mylcd.lcd_display_string('DECRYPT Process ', 1)
-                    mylcd.lcd_display_string('Successful      ', 2)
+    certError = chkOvpnCertExpiry(ovpnInfo)
+    for oneError in certError:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_OVPN_CHK: OpenVPN configuration INVALID! - %s" % (oneError))
+        # Print statement
+        else:
+            print "DEBUG_OVPN_CHK: OpenVPN configuration INVALID! - %s" % (oneError)
 
-                # Previously i2c LCD initialization are failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_LCD: DECRYPT Process")
-                        logger.info("DEBUG_LCD: Successful")
-                    # Print statement
-                    else:
-                        print "DEBUG_LCD: DECRYPT Process"
-                        print "DEBUG_LCD: Successful"
+    return len(ovpnInfo['error']) == 0 and len(certError) == 0
 
-                lcdOperSel = 8
+# Get OpenVPN remote server from OpenVPN configuration file
+# Return:
+# remoteList - List of (host, port, proto)
+# connBlock  - True when the configuration use <connection> block
+def getOvpnRemote (filePath):
+    ovpnInfo = parseOvpnConfig(filePath)
+    if ovpnInfo == None:
+        return [], False
 
-            elif lcdOperSel == 9:
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    mylcd.lcd_display_string('Init. 4G modem  ', 1)
-                    mylcd.lcd_display_string('Successful      ', 2)
+    return ovpnInfo['remote'][:], ovpnInfo['connBlock']
 
-                # Previously i2c LCD initialization are failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_LCD: Init. 4G modem")
-                        logger.info("DEBUG_LCD: Successful")
-                    # Print statement
-                    else:
-                        print "DEBUG_LCD: Init. 4G modem"
-                        print "DEBUG_LCD: Successful"
-                        
-                lcdOperSel = 10
+# Get OpenVPN static key (tls-auth, tls-crypt) from parsed OpenVPN configuration
+# Return: Static key (256 bytes), None when NOT valid
+def getOvpnStaticKey (keyData):
+    keyMatch = re.search(r'-----BEGIN OpenVPN Static key V1-----(.*?)-----END OpenVPN Static key V1-----', keyData, re.DOTALL)
+    if keyMatch == None:
+        return None
 
-            elif lcdOperSel == 11:
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    mylcd.lcd_display_string('Init. NC2VPN    ', 1)
-                    mylcd.lcd_display_string('Successful      ', 2)
+    try:
+        staticKey = base64.b16decode(re.sub(r'\s', '', keyMatch.group(1)).upper())
+    except TypeError:
+        return None
+    if len(staticKey) != 256:
+        return None
+
+    return staticKey
+
+# Build VPN remote server UDP reachability probe - OpenVPN P_CONTROL_HARD_RESET_CLIENT_V2 (key ID 0), session ID,
+# ACK array length 0, message packet ID 0
+# tls-auth  - HMAC (auth digest, default SHA1) over packet ID, net time and the packet, inserted after the session ID
+# tls-crypt - HMAC-SHA256 tag over the header and the packet, packet encrypted with AES-256-CTR (IV: tag)
+# Static key direction: key 0 - Bidirectional or key-direction 0, key 1 - key-direction 1 (tls-crypt always key 1),
+# each key: cipher key (64 bytes), HMAC key (64 bytes)
+# Return: (probe packet, session ID, reply ACK array offset), None when the static key can not be used
+# Reply ACK array offset None - Reply encrypted (tls-crypt), reply opcode only checked
+def buildRemoteProbe (ovpnInfo):
+    sessId = os.urandom(8)
+    opCode = struct.pack(b'!B', 7 << 3)
+    ctrlData = b'\x00' + struct.pack(b'!I', 0)
+    replayId = struct.pack(b'!II', 1, int(time.time()))
+
+    if ovpnInfo == None or 'tls-crypt-v2' in ovpnInfo['inline']:
+        return None
+
+    if 'tls-crypt' in ovpnInfo['inline']:
+        staticKey = getOvpnStaticKey(ovpnInfo['inline']['tls-crypt'])
+        if staticKey == None:
+            return None
+
+        probeTag = hmac.new(staticKey[192:224], opCode + sessId + replayId + ctrlData, hashlib.sha256).digest()
+        # Command: openssl enc -aes-256-ctr -K <cipher key> -iv <tag>
+        retCode, stdout = runCommand(['openssl', 'enc', '-aes-256-ctr', '-K', base64.b16encode(staticKey[128:160]), \
+                                      '-iv', base64.b16encode(probeTag[:16])], 10, cmdInput=ctrlData, errList=[])
+        if retCode != 0 or len(stdout) != len(ctrlData):
+            return None
+
+        return opCode + sessId + replayId + probeTag + stdout, sessId, None
+
+    if 'tls-auth' in ovpnInfo['inline']:
+        staticKey = getOvpnStaticKey(ovpnInfo['inline']['tls-auth'])
+        if staticKey == None:
+            return None
+
+        # tls-auth <file> <direction>, or key-direction for inline <tls-auth>
+        keyDir = ovpnInfo['option'].get('key-direction', [])[:1] + ovpnInfo['option'].get('tls-auth', [])[1:2]
+        keyIdx = 1 if b'1' in keyDir else 0
+        try:
+            hashFunc = getattr(hashlib, ovpnInfo['option'].get('auth', [b'SHA1'])[0].lower().replace(b'-', b'').decode('ascii'))
+            hmacKey = staticKey[keyIdx * 128 + 64:keyIdx * 128 + 64 + hashFunc().digest_size]
+        except (AttributeError, TypeError, UnicodeDecodeError):
+            return None
 
-                # Previously i2c LCD initialization are failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_LCD: Init. NC2VPN")
-                        logger.info("DEBUG_LCD: Successful")
-                    # Print statement
-                    else:
-                        print "DEBUG_LCD: Init. NC2VPN"
-                        print "DEBUG_LCD: Successful"
-                        
-                # Delay a bit, to display another info
-                time.sleep(3)
+        probeHmac = hmac.new(hmacKey, replayId + opCode + sessId + ctrlData, hashFunc).digest()
 
-                lcdOperSel = 0
-                lcdDlyStatCnt = 0
-                lcdBlTimeOut = 0
+        return opCode + sessId + probeHmac + replayId + ctrlData, sessId, 9 + len(probeHmac) + 8
 
-            elif lcdOperSel == 12:
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    # Write to LCD info
-                    mylcd.lcd_display_string('DECRYPT Process ', 1)
-                    mylcd.lcd_display_string('Failed!         ', 2)
+    return opCode + sessId + ctrlData, sessId, 9
 
-                # Previously i2c LCD initialization are failed
-                else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_LCD: DECRYPT Process")
-                        logger.info("DEBUG_LCD: Failed!")
-                    # Print statement
-                    else:
-                        print "DEBUG_LCD: DECRYPT Process"
-                        print "DEBUG_LCD: Failed!"
+# Start VPN remote server reachability probe
+# UDP - OpenVPN P_CONTROL_HARD_RESET_CLIENT_V2 from buildRemoteProbe(), server reply P_CONTROL_HARD_RESET_SERVER_V2
+# TCP - TCP connect handshake
+# Return: (probe socket, session ID), socket None when failed
+def startRemoteProbe (remoteAddr, remotePort, remoteProto, udpProbe):
+    sessId = udpProbe[1] if udpProbe != None else os.urandom(8)
+    try:
+        if remoteProto.startswith('udp'):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setblocking(0)
+            sock.connect((remoteAddr, int(remotePort)))
+            sock.send(udpProbe[0])
+        else:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(0)
+            # Immediate connect failure, e.g. network unreachable
+            if sock.connect_ex((remoteAddr, int(remotePort))) not in [0, errno.EINPROGRESS]:
+                sock.close()
+                return None, sessId
+    except (socket.error, ValueError):
+        return None, sessId
+
+    return sock, sessId
+
+# Check VPN remote server reachability probe reply
+# ackIdx - Reply ACK array offset, None when the reply are encrypted (tls-crypt)
+# Return: True - Reachable, False - NOT reachable, None - Wait for other reply
+def chkRemoteProbe (sock, sessId, ackIdx=9):
+    # TCP connect handshake result
+    if sock.type == socket.SOCK_STREAM:
+        return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
 
-                # Delay a bit, to display another info
-                time.sleep(3)
+    try:
+        data = sock.recv(2048)
+    except socket.error:
+        # ICMP port unreachable
+        return False
+
+    # Opcode 8 (P_CONTROL_HARD_RESET_SERVER_V2), ACK of the probe carry our session ID
+    if len(data) < 10 or (ord(data[0:1]) >> 3) != 8:
+        return None
+    # Server reply only after the probe HMAC verified
+    if ackIdx == None:
+        return True
+    if len(data) <= ackIdx:
+        return None
+    ackLen = ord(data[ackIdx:ackIdx + 1])
+    if ackLen > 0 and data[ackIdx + 1 + ackLen * 4:ackIdx + 9 + ackLen * 4] != sessId:
+        return None
+
+    return True
+
+# Happy eyeballs - Race reachability probe to all VPN remote server (UDP and TCP) concurrently, probe started with
+# a short delay in last ranking order, and rank the VPN remote server by the handshake RTT
+# Parameters:
+# remoteList - List of (IP address, port, proto)
+# udpProbe   - UDP probe from buildRemoteProbe(), None when the UDP probe can not be built, UDP remote are NOT probed
+# Return: Ranked list of (IP address, port, proto) - Reachable by RTT, NO RTT (last ranking), then NOT reachable
+def raceOvpnRemote (remoteList, udpProbe):
+    global backLogger
+    global remoteRank
+    global remoteProbeTimeOut
+    global remoteProbeDelay
+    global remoteProbeGrace
+
+    if len(remoteList) < 2:
+        return remoteList[:]
+
+    # Last ranking first, new remote follow the configuration order
+    def lastRank (remoteInfo):
+        if remoteRank.get(remoteInfo) != None:
+            return (0, remoteRank[remoteInfo], 0)
+        if remoteInfo in remoteRank:
+            return (2, 0, remoteList.index(remoteInfo))
+        return (1, 0, remoteList.index(remoteInfo))
+
+    probeList = [x for x in sorted(remoteList, key=lastRank) if udpProbe != None or x[2].startswith('udp') == False]
+    probeInfo = {}
+    probeRtt = {}
+    startTime = time.time()
+    deadLine = startTime + remoteProbeTimeOut
+    probeIdx = 0
+    firstReply = None
 
-                lcdOperSel = 0
-                lcdDlyStatCnt = 0
-                lcdBlTimeOut = 0
-                
-            elif lcdOperSel == 13:
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    # Write to LCD info
-                    mylcd.lcd_display_string('ENCRYPT Process ', 1)
-                    mylcd.lcd_display_string('Failed!         ', 2)
+    while True:
+        currTime = time.time()
+
+        # Start the next probe
+        if probeIdx < len(probeList) and currTime >= startTime + probeIdx * remoteProbeDelay:
+            sock, sessId = startRemoteProbe(*(probeList[probeIdx] + (udpProbe,)))
+            if sock != None:
+                probeInfo[sock] = (probeList[probeIdx], sessId, currTime)
+            else:
+                probeRtt[probeList[probeIdx]] = None
+            probeIdx += 1
+            continue
+
+        # All probe completed, time out, or the other probe reply grace period expired
+        stopTime = deadLine
+        if firstReply != None:
+            stopTime = min(stopTime, firstReply + remoteProbeGrace)
+        if currTime >= stopTime or (probeIdx == len(probeList) and len(probeInfo) == 0):
+            break
+
+        waitTime = stopTime
+        if probeIdx < len(probeList):
+            waitTime = min(waitTime, startTime + probeIdx * remoteProbeDelay)
+
+        rdList = [x for x in probeInfo if x.type == socket.SOCK_DGRAM]
+        wrList = [x for x in probeInfo if x.type == socket.SOCK_STREAM]
+        rdList, wrList, exList = select.select(rdList, wrList, [], max(waitTime - currTime, 0))
+        for sock in rdList + wrList:
+            probeResult = chkRemoteProbe(sock, probeInfo[sock][1], udpProbe[2] if udpProbe != None else 9)
+            if probeResult == None:
+                continue
+
+            remoteInfo, sessId, sendTime = probeInfo.pop(sock)
+            probeRtt[remoteInfo] = (time.time() - sendTime) * 1000 if probeResult == True else None
+            sock.close()
+            if probeResult == True and firstReply == None:
+                firstReply = time.time()
+
+    # NO reply within the time out, probe without reply within the grace period keep the last ranking
+    for sock in probeInfo:
+        if time.time() >= deadLine:
+            probeRtt[probeInfo[sock][0]] = None
+        sock.close()
+
+    # Remember the ranking for the next reconnect
+    for remoteInfo in probeRtt:
+        remoteRank[remoteInfo] = probeRtt[remoteInfo]
+
+    rankList = sorted([x for x in probeRtt if probeRtt[x] != None], key=lambda x: probeRtt[x])
+    rankList += [x for x in sorted(remoteList, key=lastRank) if x not in probeRtt]
+    rankList += [x for x in probeList if x in probeRtt and probeRtt[x] == None]
+
+    rankInfo = ', '.join(['%s:%s/%s %s' % (x[0], x[1], x[2], ('%.1fms' % probeRtt[x]) if probeRtt.get(x) != None else \
+                          ('NO RTT' if x not in probeRtt else 'FAILED!')) for x in rankList])
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_NETMON: VPN remote ranking [%s], %.3fs" % (rankInfo, time.time() - startTime))
+    # Print statement
+    else:
+        print "DEBUG_NETMON: VPN remote ranking [%s], %.3fs" % (rankInfo, time.time() - startTime)
+
+    return rankList
+
+# Resolve OpenVPN remote server through the DNS cache and rank the resolved VPN remote server by reachability probe,
+# resolved IP address are passed to OpenVPN as command line remote (tried first, best ranked first), and used to
+# answer OpenVPN management interface remote query
+# Return: List of (IP address, port, proto), empty when the configuration use <connection> block
+def resolveOvpnRemote (fileName):
+    global ovpnRemoteMap
+    global ovpnRemoteBest
+
+    remoteAddr = []
+    remoteHost = {}
+    ovpnRemoteBest.clear()
+    remoteList, connBlock = getOvpnRemote(fileName)
+    # Remote inside <connection> block can not be combined with command line remote
+    if connBlock == True:
+        return remoteAddr
+
+    # Unresolved remote server are still resolved by OpenVPN itself
+    for hostName, remotePort, remoteProto in remoteList:
+        for oneAddr in resolveHost(hostName):
+            if (oneAddr, remotePort, remoteProto) not in remoteAddr:
+                remoteAddr.append((oneAddr, remotePort, remoteProto))
+                remoteHost[(oneAddr, remotePort, remoteProto)] = hostName
+
+    # UDP probe signed or encrypted with the tls-auth/tls-crypt static key, otherwise dropped by the server
+    remoteAddr = raceOvpnRemote(remoteAddr, buildRemoteProbe(parseOvpnConfig(fileName)))
+
+    # Best ranked IP address for each remote server host name
+    for remoteInfo in reversed(remoteAddr):
+        ovpnRemoteMap[remoteHost[remoteInfo]] = remoteInfo[0]
+    if len(remoteAddr) > 0:
+        ovpnRemoteBest['remote'] = (remoteHost[remoteAddr[0]], remoteAddr[0][1], remoteAddr[0][2])
+        ovpnRemoteBest['addr'] = remoteAddr[0][0]
+        ovpnRemoteBest['used'] = False
+
+    return remoteAddr
+
+# Send command to OpenVPN management interface
+# Return: True when the command are sent
+def ovpnMgmtSend (cmdLine):
+    global ovpnMgmtSock
+
+    ovpnMgmtLock.acquire()
+    try:
+        if ovpnMgmtSock == None:
+            return False
+        ovpnMgmtSock.sendall(cmdLine.encode('ascii') + b'\n')
+    except socket.error:
+        return False
+    finally:
+        ovpnMgmtLock.release()
+
+    return True
+
+# Sign OpenVPN private key signature request with the decrypted private key, the private key are passed to openssl
+# through sealed memory file
+# Parameters:
+# sigData - Data to be signed (TLS handshake digest)
+# sigAlg - OpenVPN signature algorithm, e.g. 'RSA_PKCS1_PADDING', 'RSA_PKCS1_PSS_PADDING,hashalg=SHA256,saltlen=digest',
+#          'ECDSA', empty for OpenVPN 2.4 RSA_SIGN (PKCS#1 padding)
+# Return: Signature, None when failed
+def ovpnMgmtSign (sigData, sigAlg):
+    global ovpnMgmtCred
+
+    if 'key' not in ovpnMgmtCred:
+        return None
+
+    keyFd = createSealedMemfd('scssgw-pk', ovpnMgmtCred['key'])
+    if keyFd < 0:
+        return None
+
+    # Command: openssl pkeyutl -sign -inkey /proc/<pid>/fd/<fd> -pkeyopt rsa_padding_mode:pss -pkeyopt rsa_pss_saltlen:digest -pkeyopt digest:sha256
+    tempArgs = ['openssl', 'pkeyutl', '-sign', '-inkey', '/proc/%d/fd/%d' % (os.getpid(), keyFd)]
+    sigOpt = sigAlg.split(',')
+    if sigOpt[0] == 'RSA_PKCS1_PSS_PADDING':
+        tempArgs += ['-pkeyopt', 'rsa_padding_mode:pss']
+        for oneOpt in sigOpt[1:]:
+            if oneOpt.startswith('hashalg='):
+                tempArgs += ['-pkeyopt', 'digest:' + oneOpt[len('hashalg='):].lower()]
+            elif oneOpt.startswith('saltlen='):
+                tempArgs += ['-pkeyopt', 'rsa_pss_saltlen:' + oneOpt[len('saltlen='):]]
+    elif sigOpt[0] == 'RSA_NO_PADDING':
+        tempArgs += ['-pkeyopt', 'rsa_padding_mode:none']
+    elif sigOpt[0] == 'RSA_PKCS1_PADDING':
+        tempArgs += ['-pkeyopt', 'rsa_padding_mode:pkcs1']
+
+    try:
+        retCode, stdout = runCommand(tempArgs, 10, cmdInput=sigData, errList=[])
+    finally:
+        os.close(keyFd)
+
+    if retCode != 0 or stdout == b'':
+        return None
+
+    return stdout
+
+# Quote string for OpenVPN management interface command
+def ovpnMgmtQuote (value):
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+# OpenVPN management interface monitoring - Track hold and OpenVPN state, answer remote query with resolved VPN
+# remote server IP address, answer private key signature and auth-user-pass request with the decrypted nc2vpn key
+# Notification:
+# >HOLD:Waiting for hold release:0
+# >REMOTE:vpn.example.com,1194,udp
+# >PK_SIGN:<base64 data>,RSA_PKCS1_PADDING (OpenVPN 2.4: >RSA_SIGN:<base64 data>)
+# >PASSWORD:Need 'Auth' username/password
+# >STATE:1608101010,CONNECTED,SUCCESS,10.8.0.6,1.2.3.4,1194,,
+def ovpnMgmtMon (threadname, mgmtSock):
+    global backLogger
+    global ovpnMgmtSock
+    global ovpnMgmtState
+    global ovpnMgmtCred
+    global ovpnRemoteMap
+    global ovpnRemoteBest
 
-                # Previously i2c LCD initialization are failed
+    lineBuff = b''
+    while True:
+        try:
+            chunk = mgmtSock.recv(4096)
+        except socket.error:
+            chunk = b''
+        # OpenVPN terminated
+        if chunk == b'':
+            break
+
+        lineBuff += chunk
+        while b'\n' in lineBuff:
+            oneLine, lineBuff = lineBuff.split(b'\n', 1)
+            oneLine = oneLine.strip().decode('ascii', 'replace')
+
+            if oneLine.startswith('>HOLD:'):
+                ovpnMgmtState['hold'] = True
+
+            # Remote before the best ranked VPN remote server are skipped, the following remote query (best ranked
+            # VPN remote server failed) are answered with the best ranked IP address of the remote host
+            elif oneLine.startswith('>REMOTE:'):
+                remoteInfo = oneLine[len('>REMOTE:'):].split(',')
+                if ovpnRemoteBest.get('used') == False and len(remoteInfo) > 2:
+                    bestHost, bestPort, bestProto = ovpnRemoteBest['remote']
+                    if remoteInfo[0] == bestHost and remoteInfo[1] == bestPort and remoteInfo[2][:3] == bestProto[:3]:
+                        ovpnRemoteBest['used'] = True
+                        ovpnMgmtSend('remote MOD %s %s' % (ovpnRemoteBest['addr'], remoteInfo[1]))
+                    else:
+                        ovpnMgmtSend('remote SKIP')
+                elif remoteInfo[0] in ovpnRemoteMap and len(remoteInfo) > 1:
+                    ovpnMgmtSend('remote MOD %s %s' % (ovpnRemoteMap[remoteInfo[0]], remoteInfo[1]))
                 else:
+                    ovpnMgmtSend('remote ACCEPT')
+
+            # Reply: pk-sig (OpenVPN 2.4: rsa-sig), base64 signature lines, END
+            elif oneLine.startswith('>PK_SIGN:') or oneLine.startswith('>RSA_SIGN:'):
+                sigInfo = oneLine.split(':', 1)[1].split(',', 1)
+                try:
+                    sigData = ovpnMgmtSign(base64.b64decode(sigInfo[0]), sigInfo[1] if len(sigInfo) > 1 else '')
+                except TypeError:
+                    sigData = None
+
+                # Empty signature fail the TLS handshake instead of leaving OpenVPN waiting
+                if sigData == None:
+                    sigData = b''
+
                     # Write to logger
                     if backLogger == True:
-                        logger.info("DEBUG_LCD: ENCRYPT Process")
-                        logger.info("DEBUG_LCD: Failed!")
+                        logger.info("DEBUG_OVPN_MGMT: Private key signature FAILED!")
                     # Print statement
                     else:
-                        print "DEBUG_LCD: ENCRYPT Process"
-                        print "DEBUG_LCD: Failed!"
-
-                # Delay a bit, to display another info
-                time.sleep(3)
+                        print "DEBUG_OVPN_MGMT: Private key signature FAILED!"
 
-                lcdOperSel = 0
-                lcdDlyStatCnt = 0
-                lcdBlTimeOut = 0
+                sigData = base64.b64encode(sigData).decode('ascii')
+                ovpnMgmtSend('\n'.join(['pk-sig' if oneLine.startswith('>PK_SIGN:') else 'rsa-sig'] + \
+                                       [sigData[x:x + 64] for x in range(0, len(sigData), 64)] + ['END']))
 
-            elif lcdOperSel == 14:
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    # Write to LCD info
-                    mylcd.lcd_display_string('Init. Radio Svr ', 1)
-                    mylcd.lcd_display_string('Successful      ', 2)
+            # Reply: username "Auth" <user>, password "Auth" <pass>
+            elif oneLine.startswith(">PASSWORD:Need 'Auth'"):
+                if 'user' in ovpnMgmtCred:
+                    ovpnMgmtSend('username "Auth" %s\npassword "Auth" %s' % (ovpnMgmtQuote(ovpnMgmtCred['user']), \
+                                 ovpnMgmtQuote(ovpnMgmtCred['pass'])))
 
-                # Previously i2c LCD initialization are failed
+            elif oneLine.startswith('>PASSWORD:Verification Failed'):
+                # Write to logger
+                if backLogger == True:
+                    logger.info("DEBUG_OVPN_MGMT: OpenVPN credential verification FAILED!")
+                # Print statement
                 else:
+                    print "DEBUG_OVPN_MGMT: OpenVPN credential verification FAILED!"
+
+            elif oneLine.startswith('>STATE:'):
+                stateInfo = oneLine[len('>STATE:'):].split(',')
+                if len(stateInfo) > 1:
+                    ovpnMgmtState['state'] = stateInfo[1]
+
                     # Write to logger
                     if backLogger == True:
-                        logger.info("DEBUG_LCD: Init. Radio Svr")
-                        logger.info("DEBUG_LCD: Successful")
+                        logger.info("DEBUG_OVPN_MGMT: OpenVPN state %s" % (stateInfo[1]))
                     # Print statement
                     else:
-                        print "DEBUG_LCD: Init. Radio Svr"
-                        print "DEBUG_LCD: Successful"
-                        
-                # Delay a bit, to display another info
-                time.sleep(3)
+                        print "DEBUG_OVPN_MGMT: OpenVPN state %s" % (stateInfo[1])
+
+    ovpnMgmtLock.acquire()
+    if ovpnMgmtSock is mgmtSock:
+        ovpnMgmtSock = None
+    ovpnMgmtLock.release()
+    mgmtSock.close()
+
+    ovpnMgmtState['hold'] = False
+    ovpnMgmtState['state'] = 'EXITING'
+
+# START warm-standby OpenVPN - OpenVPN process start up, configuration parsing and plugin loading are done while the
+# OpenVPN are held at the management interface (--management-hold), until released by releaseOpenVpnHold()
+# Parameters:
+# fileName - OpenVPN configuration path
+# extKey - Private key signature and auth-user-pass are handed over through the management interface
+# Return: True when OpenVPN are held at the management interface
+def startOpenVpnHold (fileName, extKey=False):
+    global backLogger
+    global nc2VpnKeyTPath
+    global ovpnMgmtPath
+    global ovpnMgmtSock
+    global ovpnMgmtState
 
-                lcdOperSel = 0
-                lcdDlyStatCnt = 0
-                lcdBlTimeOut = 0
+    try:
+        os.remove(ovpnMgmtPath)
+    except OSError:
+        pass
+    ovpnMgmtState['hold'] = False
+    ovpnMgmtState['state'] = ''
+
+    # Command: openvpn --config nc2vpn.ovpn --management /run/scssgw-ovpn.sock unix --management-hold --management-query-remote
+    #          [--management-external-key --management-query-passwords] --writepid /run/scssgw-ovpn.pid --daemon
+    tempArgs = ['openvpn', '--config', fileName, '--management', ovpnMgmtPath, 'unix', '--management-hold', \
+                '--management-query-remote']
+    if extKey == True:
+        tempArgs += ['--management-external-key', '--management-query-passwords']
+    tempArgs += ['--writepid', ovpnPidPath, '--daemon']
+    retCode, stdout = runCommand(tempArgs, 30, cmdDir=nc2VpnKeyTPath)
+
+    # Connect to OpenVPN management interface
+    mgmtSock = None
+    if retCode == 0 and waitForCondition(lambda: path.exists(ovpnMgmtPath), 10) == True:
+        try:
+            mgmtSock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            mgmtSock.connect(ovpnMgmtPath)
+        except socket.error:
+            mgmtSock.close()
+            mgmtSock = None
+
+    # Operation failed
+    if mgmtSock == None:
+        runCommand(['pkill', '-f', ovpnMgmtPath], 10)
+
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_NETMON: Init. warm-standby OpenVPN FAILED!")
+        # Print statement
+        else:
+            print "DEBUG_NETMON: Init. warm-standby OpenVPN FAILED!"
 
-            elif lcdOperSel == 15:
-                # Previously i2c LCD initialization are successful
-                if i2cLcd == True:
-                    mylcd.lcd_clear()
-                    # Write to LCD info
-                    mylcd.lcd_display_string('SDR NOT Exist!  ', 1)
-                    mylcd.lcd_display_string('Please reconnect', 2)
+        return False
 
-                # Previously i2c LCD initialization are failed
+    ovpnMgmtSock = mgmtSock
+    thread.start_new_thread(ovpnMgmtMon, ("[ovpnMgmtMon]", mgmtSock))
+    ovpnMgmtSend('state on')
+
+    # OpenVPN notify hold once the management interface are connected
+    retResult = waitForCondition(lambda: ovpnMgmtState['hold'] == True, 10)
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_NETMON: Init. warm-standby OpenVPN %s" % ('successful' if retResult == True else 'FAILED!'))
+    # Print statement
+    else:
+        print "DEBUG_NETMON: Init. warm-standby OpenVPN %s" % ('successful' if retResult == True else 'FAILED!')
+
+    return retResult
+
+# Release warm-standby OpenVPN held at the management interface
+# Return: True when hold release are sent
+def releaseOpenVpnHold ():
+    global ovpnMgmtState
+
+    if ovpnMgmtState.get('hold') != True:
+        return False
+    if ovpnMgmtSend('hold release') == False:
+        return False
+    ovpnMgmtState['hold'] = False
+
+    return True
+
+# Split decrypted nc2vpn key OpenVPN configuration into warm-standby OpenVPN profile and the credential handed over
+# through the management interface (<key>, <auth-user-pass>), profile are only rewritten when changed
+# Parameters:
+# ovpnConf - OpenVPN configuration with the key files inline
+# Return: True when warm-standby OpenVPN profile are available
+def saveOvpnStandby (ovpnConf):
+    global ovpnStandbyPath
+    global ovpnMgmtCred
+
+    ovpnProf = []
+    ovpnCred = {}
+    blockTag = None
+    for oneLine in ovpnConf.split(b'\n'):
+        ovpnField = oneLine.strip()
+        if blockTag != None:
+            if ovpnField == b'</' + blockTag + b'>':
+                blockTag = None
+            else:
+                ovpnCred[blockTag].append(oneLine)
+        elif ovpnField in [b'<key>', b'<auth-user-pass>']:
+            blockTag = ovpnField[1:-1]
+            ovpnCred[blockTag] = []
+        else:
+            ovpnProf.append(oneLine)
+
+    ovpnMgmtCred.clear()
+    # Private key handed over through the management interface need the certificate inside the profile
+    if b'key' not in ovpnCred or b'<cert>' not in [x.strip() for x in ovpnProf]:
+        try:
+            os.remove(ovpnStandbyPath)
+        except OSError:
+            pass
+        return False
+
+    ovpnMgmtCred['key'] = b'\n'.join(ovpnCred[b'key']) + b'\n'
+    # auth-user-pass without file are queried through the management interface
+    if b'auth-user-pass' in ovpnCred:
+        authInfo = [x.strip() for x in ovpnCred[b'auth-user-pass'] if x.strip() != b''] + [b'', b'']
+        ovpnMgmtCred['user'] = authInfo[0].decode('utf-8')
+        ovpnMgmtCred['pass'] = authInfo[1].decode('utf-8')
+        ovpnProf.append(b'auth-user-pass')
+    ovpnProf = b'\n'.join(ovpnProf)
+
+    try:
+        profFile = open(ovpnStandbyPath, 'rb')
+        try:
+            if profFile.read() == ovpnProf:
+                return True
+        finally:
+            profFile.close()
+    except IOError:
+        pass
+
+    try:
+        tempFd = os.open(ovpnStandbyPath + '.tmp', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            tempData = ovpnProf
+            while len(tempData) > 0:
+                tempData = tempData[os.write(tempFd, tempData):]
+        finally:
+            os.close(tempFd)
+        os.rename(ovpnStandbyPath + '.tmp', ovpnStandbyPath)
+    except OSError:
+        return False
+
+    return True
+
+# START warm-standby OpenVPN with the warm-standby OpenVPN profile, already held warm-standby OpenVPN are kept when
+# the profile are unchanged, otherwise restarted
+# Return: True when warm-standby OpenVPN are held at the management interface
+def startOvpnStandby ():
+    global ovpnMgmtPath
+    global ovpnMgmtSock
+    global ovpnMgmtState
+    global ovpnStandbyPath
+
+    ovpnStandbyLock.acquire()
+    try:
+        try:
+            profFile = open(ovpnStandbyPath, 'rb')
+            try:
+                profHash = hashlib.sha256(profFile.read()).hexdigest()
+            finally:
+                profFile.close()
+        except IOError:
+            return False
+
+        if ovpnMgmtSock != None and ovpnMgmtState.get('hold') == True and ovpnMgmtState.get('profile') == profHash:
+            return True
+
+        # Warm-standby OpenVPN held with previous profile
+        if ovpnMgmtSock != None:
+            runCommand(['pkill', '-f', ovpnMgmtPath], 10)
+            waitForCondition(lambda: ovpnMgmtSock == None, 5)
+
+        retResult = startOpenVpnHold(ovpnStandbyPath, True)
+        if retResult == True:
+            ovpnMgmtState['profile'] = profHash
+
+        return retResult
+    finally:
+        ovpnStandbyLock.release()
+
+# Warm-standby OpenVPN monitoring - Keep warm-standby OpenVPN held at the management interface while waiting for the
+# USB key, OpenVPN process start up and configuration parsing are done before the USB key are inserted
+def ovpnStandbyMon (threadname, delay):
+    global dCryptProc
+    global tunnelValid
+    global ovpnMgmtSock
+    global ovpnStandbyPath
+    global ovpnStandbyRetry
+
+    retryTime = 0
+    # Forever loop
+    while True:
+        time.sleep(delay)
+
+        # USB key inserted, the bring-up pipeline take over the warm-standby OpenVPN
+        if dCryptProc == True or tunnelValid == True or ovpnMgmtSock != None:
+            continue
+        if path.exists(ovpnStandbyPath) == False or time.time() < retryTime:
+            continue
+
+        if startOvpnStandby() == False:
+            retryTime = time.time() + ovpnStandbyRetry
+
+# Bring-up pipeline - Initiate 4G LTE modem, decrypt nc2vpn key, resolve VPN remote server and start VPN tunnel
+# Stage graph:
+# modem   ---------+
+#                  +--> dns ---+
+# decrypt -+-------+           +--> openvpn
+#          +--> ovpnhold ------+
+# Return: Stage result, key: 'modem', 'decrypt', 'ovpnhold', 'dns', 'openvpn'
+def initiateBringUpPipeline ():
+    global backLogger
+    global nc2VpnKeyPath
+    global nc2VpnKeyTPath
+    global currUSBPath
+    global tunnelValid
+    global multiPath
+    global ovpnRemoteMap
+    global ovpnMgmtCred
+
+    pipeInfo = {'fileName': '', 'remote': [], 'hold': False}
+
+    # 4G LTE modem stage
+    def stageModem ():
+        return initiateAll4GModem()
+
+    # nc2vpn key decryption stage, previously decrypted nc2vpn key are used when exist
+    def stageDecrypt ():
+        for a in range(2):
+            pipeInfo['fileName'] = getDecryptedOvpn()
+            if pipeInfo['fileName'] != '':
+                # Invalid configuration are NOT started
+                return preflightOvpn(pipeInfo['fileName'])
+            if a == 1:
+                break
+
+            # Start decrypt the nc2vpn key and stored it inside temporary folder
+            # Command:
+            # python3 decrypt.py --source=/path/to/your/drive/ --destination=/path/to/your/drive/ --private-key=/path/to/your/key.private
+            tempPrivKeyPath = currUSBPath + '/key.private'
+            retCode, stdout = decryptNc2Vpn(nc2VpnKeyPath, nc2VpnKeyTPath, tempPrivKeyPath)
+
+            # Operation failed
+            if retCode != 0 or 'Decrypting:' not in stdout:
+                # Write to logger
+                if backLogger == True:
+                    logger.info("DEBUG_NETMON: Decrypt nc2vpn key FAILED!")
+                # Print statement
                 else:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_LCD: SDR NOT Exist!")
-                        logger.info("DEBUG_LCD: Please reconnect")
-                    # Print statement
-                    else:
-                        print "DEBUG_LCD: SDR NOT Exist!"
-                        print "DEBUG_LCD: Please reconnect"
-                        
-                # Delay a bit, to display another info
-                time.sleep(3)
+                    print "DEBUG_NETMON: Decrypt nc2vpn key FAILED!"
+                return False
 
-                lcdOperSel = 0
-                lcdDlyStatCnt = 0
-                lcdBlTimeOut = 0
-                
-        # Error in execution
-        except:
             # Write to logger
             if backLogger == True:
-                logger.info("DEBUG_LCD: LCD FAILED!")
+                logger.info("DEBUG_NETMON: Decrypt nc2vpn key successful")
             # Print statement
             else:
-                print "DEBUG_LCD: LCD FAILED!"
-            
-# Check UPS lite HAT battery status
-def checkBattStatus (threadname, delay):
-    global backLogger
-    global delayRdBatt
-    global lcdBattVolt        
-    global lcdBattCap
-    global i2cUps
-    
-    delayFlag = False     
+                print "DEBUG_NETMON: Decrypt nc2vpn key successful"
 
-    # Forever loop
-    while True:
-        # Loop every 0.5s
-        time.sleep(delay)
+        return False
 
-        # Try execution
-        try:
-            delayRdBatt += 1
+    # VPN remote server resolution stage, resolved IP address are tried first by OpenVPN
+    def stageDns ():
+        pipeInfo['remote'] = resolveOvpnRemote(pipeInfo['fileName'])
+        return True
 
-            # Read current battery voltage every 5s
-            if delayRdBatt == 10:
-                # Previously i2c LCD initialization are successful
-                if i2cUps == True:
-                    # Read current battery voltage and capacity
-                    # Stored it to local variable
-                    lcdBattVolt = readBattVoltage(i2cBus)
-                    lcdBattCap = readBattCapacity(i2cBus)
+    # Warm-standby OpenVPN stage, warm-standby OpenVPN held before the USB key are inserted are reused when the
+    # profile are unchanged, the VPN tunnel stage start a new OpenVPN when warm-standby OpenVPN failed
+    def stageHold ():
+        if 'key' in ovpnMgmtCred:
+            pipeInfo['hold'] = startOvpnStandby()
+        else:
+            pipeInfo['hold'] = startOpenVpnHold(pipeInfo['fileName'])
+        return True
 
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_BATT: Volt: %5.2fV" % lcdBattVolt)
-                        logger.info("DEBUG_BATT: Cap: %5i%%" % lcdBattCap)
-                    # Print statement
-                    else:
-                        print "DEBUG_BATT: Volt: %5.2fV" % lcdBattVolt
-                        print "DEBUG_BATT: Cap: %5i%%" % lcdBattCap
+    # VPN tunnel stage
+    def stageVpn ():
+        global tunnelValid
 
-                # Previously i2c LCD initialization are failed
+        # Release warm-standby OpenVPN, remote query are answered with the resolved VPN remote server
+        if pipeInfo['hold'] == True:
+            if releaseOpenVpnHold() == True:
+                # Write to logger
+                if backLogger == True:
+                    logger.info("DEBUG_NETMON: Release warm-standby OpenVPN successful - Init. OpenVPN")
+                # Print statement
                 else:
-                    lcdBattVolt = 'NA'
-                    lcdBattCap = 'NA'
-                    
-                delayRdBatt = 0
+                    print "DEBUG_NETMON: Release warm-standby OpenVPN successful - Init. OpenVPN"
 
-        # Error in execution
-        except:
+                tunnelValid = True
+
+                # START secondary VPN tunnel before the temporary nc2vpn key files are deleted
+                if multiPath == True:
+                    startMultiPathTunnel(pipeInfo['fileName'])
+
+                return True
+
+            runCommand(['pkill', '-f', ovpnMgmtPath], 10)
+
+        # START VPN tunnel
+        tempArgs = ['openvpn']
+        for remoteAddr, remotePort, remoteProto in pipeInfo['remote']:
+            tempArgs += ['--remote', remoteAddr, remotePort, remoteProto]
+        tempArgs += ['--config', pipeInfo['fileName'], '--writepid', ovpnPidPath, '--daemon']
+        retCode, stdout = runCommand(tempArgs, 30, cmdDir=nc2VpnKeyTPath)
+
+        # Operation failed
+        if retCode != 0:
             # Write to logger
             if backLogger == True:
-                logger.info("DEBUG_BATT: UPS-Lite FAILED!")
+                logger.info("DEBUG_NETMON: Command execution to initiate OpenVPN FAILED! - Init. OpenVPN")
             # Print statement
             else:
-                print "DEBUG_BATT: UPS-Lite FAILED!"
+                print "DEBUG_NETMON: Command execution to initiate OpenVPN FAILED! - Init. OpenVPN"
+            return False
 
-# Check and monitor USB thumb drive plug in status
-def checkUSBStatus (threadname, delay):
-    global eCryptProc
-    global dCryptProc
-    global tunnelValid
-    global net4gValid
-    global lcdOperSel
-    global lcdDlyStatCnt
-    global lcdBlTimeOut
-    global netMonChkCnt
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_NETMON: Init. OpenVPN sequence completed - Init. OpenVPN")
+        # Print statement
+        else:
+            print "DEBUG_NETMON: Init. OpenVPN sequence completed - Init. OpenVPN"
+
+        tunnelValid = True
+
+        # START secondary VPN tunnel before the temporary nc2vpn key files are deleted
+        if multiPath == True:
+            startMultiPathTunnel(pipeInfo['fileName'])
+
+        return True
+
+    stageList = [('modem', stageModem, []),
+                 ('decrypt', stageDecrypt, []),
+                 ('ovpnhold', stageHold, ['decrypt']),
+                 ('dns', stageDns, ['modem', 'decrypt']),
+                 ('openvpn', stageVpn, ['dns', 'ovpnhold'])]
+
+    startTime = time.time()
+    stageResult, stageTime = runStageGraph(stageList)
+    logStageTiming(stageList, stageResult, stageTime, startTime)
+
+    return stageResult
+
+# Send QMI request through qmi-proxy, reusing the QMI client ID previously allocated for the service
+# Parameters:
+# service - QMI service of the request, e.g. 'dms', 'wds', 'nas'
+# qmiArgs - qmicli request arguments, e.g. ['--dms-get-operating-mode']
+# Return: retCode, stdout of the qmicli command
+def qmiRequest (service, qmiArgs, timeOut=30, qmiDev=None):
     global backLogger
+    global qmiCliBin
+    global qmiDevice
+    global qmiClientCid
+    global qmiPktHandle
+    global qmiDevLock
+
+    if qmiDev == None:
+        qmiDev = qmiDevice
+    cidKey = qmiDev + ':' + service
+
+    # QMI request serialised per 4G LTE modem only, other 4G LTE modem request run in parallel
+    qmiLock.acquire()
+    if qmiDev not in qmiDevLock:
+        qmiDevLock[qmiDev] = thread.allocate_lock()
+    devLock = qmiDevLock[qmiDev]
+    qmiLock.release()
+
+    devLock.acquire()
+    try:
+        # Second attempt only when the kept client ID are no longer valid (e.g. modem reset or qmi-proxy restart)
+        for a in range(2):
+            cmdArgs = [qmiCliBin, '-p', '-d', qmiDev]
+            if cidKey in qmiClientCid:
+                cmdArgs.append('--client-cid=' + qmiClientCid[cidKey])
+            cmdArgs += qmiArgs
+            cmdArgs.append('--client-no-release-cid')
+
+            retCode, stdout = runCommand(cmdArgs, timeOut)
+
+            # Reply:
+            # [/dev/cdc-wdm0] Client ID not released:
+            # Service: 'wds'
+            # CID: '20'
+            cidMatch = re.search(r"CID: '(\d+)'", stdout)
+            if cidMatch:
+                qmiClientCid[cidKey] = cidMatch.group(1)
+
+            # Reply: Packet data handle: '2264423824'
+            pdhMatch = re.search(r"Packet data handle: '(\d+)'", stdout)
+            if pdhMatch:
+                qmiPktHandle[qmiDev] = pdhMatch.group(1)
+
+            # Request failed with kept client ID, release it and retry with new allocated client ID
+            if retCode != 0 and cidKey in qmiClientCid and retCode != None and a == 0:
+                del qmiClientCid[cidKey]
 
-    # Forever loop
-    while True:
-        # Loop every 0.5s
-        time.sleep(delay)
+                # Write to logger
+                if backLogger == True:
+                    logger.info("DEBUG_QMI: [%s] client ID for %s INVALID, allocate new client ID" % (qmiDev, service))
+                # Print statement
+                else:
+                    print "DEBUG_QMI: [%s] client ID for %s INVALID, allocate new client ID" % (qmiDev, service)
+            else:
+                break
+    finally:
+        devLock.release()
 
-        context = pyudev.Context()
-        monitor = pyudev.Monitor.from_netlink(context)
-        monitor.filter_by(subsystem='usb')
+    return retCode, stdout
 
-        monitor.start()
-        for device in iter(monitor.poll, None):
-            if device.action != 'add':
-                if eCryptProc == True or dCryptProc == True:
-                    # STOP 4G LTE modem
-                    out = subprocess.Popen(['qmicli', '-d', '/dev/cdc-wdm0', '--device-open-sync', '--dms-get-operating-mode'], \
-                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+# STOP 4G LTE modem - Stop the current data session through QMI session and check modem operating mode
+# Return: retCode, stdout of the operating mode request
+def stop4GModem (qmiDev=None):
+    global qmiDevice
+    global qmiPktHandle
+    global qmiFollowProc
 
-                    # NO error after command execution
-                    if stderr == None:
-                        if 'HW restricted:' in stdout:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_USBMON: STOP 4G LTE modem successful")
-                            # Print statement
-                            else:
-                                print "DEBUG_USBMON: STOP 4G LTE modem successful"
-                            
-                            # Wait before execute another command
-                            time.sleep(1)
+    if qmiDev == None:
+        qmiDev = qmiDevice
 
-                            # Bring wwan0 interface DOWN
-                            out = subprocess.Popen(['ifconfig', 'wwan0', 'down'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                            stdout,stderr = out.communicate()
+    # Terminate QMI indication listener first, so the intended stop are not reported as network drop
+    if qmiDev in qmiFollowProc:
+        for followProc in qmiFollowProc.pop(qmiDev):
+            try:
+                followProc.terminate()
+            except OSError:
+                pass
 
-                            # NO error after command execution
-                            if stderr == None:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_USBMON: Bringing DOWN wwan0 successful")
-                                # Print statement
-                                else:
-                                    print "DEBUG_USBMON: Bringing DOWN wwan0 successful"
+    # Stop data session with the same WDS client ID that started the network
+    if qmiDev in qmiPktHandle:
+        qmiRequest('wds', ['--wds-stop-network=' + qmiPktHandle[qmiDev]], qmiDev=qmiDev)
+        del qmiPktHandle[qmiDev]
 
-                                # Wait before execute another command
-                                time.sleep(1)
+    return qmiRequest('dms', ['--dms-get-operating-mode'], qmiDev=qmiDev)
 
-                                # KILL udhcpc instances
-                                out = subprocess.Popen(['killall', 'udhcpc'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
+# Reset 4G LTE modem - Stop 4G LTE modem, bring the network interface DOWN and KILL its udhcpc instance,
+# the 4G LTE modem will be initiated again by network monitoring
+def reset4GModem (qmiDev=None):
+    global backLogger
+    global qmiDevice
 
-                                # NO error after command execution
-                                if stderr == None:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_USBMON: KILL  udhcpc SUCCESSFUL")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_USBMON: KILL  udhcpc SUCCESSFUL"
-                                                        
-                                    # Wait before execute another command
-                                    time.sleep(1)
-                                
-                                    # STOP VPN tunnel
-                                    out = subprocess.Popen(['killall', 'openvpn'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                    stdout,stderr = out.communicate()
+    if qmiDev == None:
+        qmiDev = qmiDevice
+    netIf = get4GModemNetIf(qmiDev)
 
-                                    # NO error after command execution
-                                    if stderr == None:
-                                        if 'no process found' in stdout:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_USBMON: Openvpn process NOT found")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_USBMON: Openvpn process NOT found"
-                                        else:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_USBMON: KILL openvpn successful")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_USBMON: KILL openvpn successful"
+    # STOP 4G LTE modem
+    retCode, stdout = stop4GModem(qmiDev)
 
-                                    # Operation failed
-                                    else:
-                                        # Write to logger
-                                        if backLogger == True:
-                                            logger.info("DEBUG_USBMON: KILL openvpn FAILED!")
-                                        # Print statement
-                                        else:
-                                            print "DEBUG_USBMON: KILL openvpn FAILED!"
+    # NO error after command execution
+    if retCode == 0 and 'HW restricted:' in stdout:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_4G_MODEM: [%s] STOP 4G LTE modem successful" % (qmiDev))
+        # Print statement
+        else:
+            print "DEBUG_4G_MODEM: [%s] STOP 4G LTE modem successful" % (qmiDev)
+    # Operation failed
+    else:
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_4G_MODEM: [%s] STOP 4G LTE modem FAILED!" % (qmiDev))
+        # Print statement
+        else:
+            print "DEBUG_4G_MODEM: [%s] STOP 4G LTE modem FAILED!" % (qmiDev)
+
+    # Bring network interface DOWN
+    retCode, stdout = runCommand(['ifconfig', netIf, 'down'], 10)
+
+    # KILL udhcpc instance of the network interface only, other 4G LTE modem may still UP
+    runCommand(['pkill', '-f', 'udhcpc -i ' + netIf], 10)
+
+# STOP all 4G LTE modem - Secondary 4G LTE modem are reset, only the primary 4G LTE modem data session are stopped,
+# caller bring the primary 4G LTE modem network interface DOWN
+# Return: retCode, stdout of the primary 4G LTE modem operating mode request
+def stopAll4GModem ():
+    global qmiDevice
+    global modemList
+
+    for qmiDev in sorted(modemList.keys()):
+        modemList[qmiDev]['valid'] = False
+        if qmiDev != qmiDevice:
+            reset4GModem(qmiDev)
+
+    return stop4GModem()
+
+# Discover 4G LTE modem - Map each QMI control device to its network interface through sysfs
+# /sys/class/usbmisc/cdc-wdm0/device/net/wwan0
+# The first discovered QMI control device are used as primary 4G LTE modem
+def discover4GModem ():
+    global backLogger
+    global qmiDevice
+    global modemList
+
+    for netPath in sorted(glob.glob('/sys/class/usbmisc/cdc-wdm*/device/net/*')):
+        qmiDev = '/dev/' + netPath.split('/')[4]
+        netIf = os.path.basename(netPath)
+
+        # New 4G LTE modem
+        if qmiDev not in modemList:
+            modemList[qmiDev] = {'netIf': netIf, 'valid': False}
+
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_4G_MODEM: [%s] 4G LTE modem discovered, network interface %s" % (qmiDev, netIf))
+            # Print statement
+            else:
+                print "DEBUG_4G_MODEM: [%s] 4G LTE modem discovered, network interface %s" % (qmiDev, netIf)
+        else:
+            modemList[qmiDev]['netIf'] = netIf
 
-                            # Operation failed
-                            else:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_USBMON: Bringing DOWN wwan0 FAILED!")
-                                # Print statement
-                                else:
-                                    print "DEBUG_USBMON: Bringing DOWN wwan0 FAILED!"
+    # No 4G LTE modem discovered through sysfs, use default QMI control device
+    if len(modemList) == 0:
+        modemList[qmiDevice] = {'netIf': 'wwan0', 'valid': False}
 
-                        # Operation failed
-                        else:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_USBMON: STOP 4G LTE modem FAILED!")
-                            # Print statement
-                            else:
-                                print "DEBUG_USBMON: STOP 4G LTE modem FAILED!"
+    if qmiDevice not in modemList:
+        qmiDevice = sorted(modemList.keys())[0]
 
-                    # Operation failed
-                    else:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_USBMON: Command execution to STOP 4G LTE modem FAILED!")
-                        # Print statement
-                        else:
-                            print "DEBUG_USBMON: Command execution to STOP 4G LTE modem FAILED!"
+# Get 4G LTE modem network interface
+def get4GModemNetIf (qmiDev=None):
+    global qmiDevice
+    global modemList
 
-                    # Turn ON LCD back light
-                    GPIO.output(27, GPIO.HIGH)
+    if qmiDev == None:
+        qmiDev = qmiDevice
+    if qmiDev in modemList:
+        return modemList[qmiDev]['netIf']
 
-                    # Reset necessary LCD operation variable
-                    lcdDlyStatCnt = 0
-                    lcdOperSel = 0
-                    lcdBlTimeOut = 0
-                    
-                    eCryptProc = False
-                    dCryptProc = False
+    return 'wwan0'
 
-                    netMonChkCnt = 0
-                    tunnelValid = False
-                    net4gValid = False
-                    
-# Initiate 4G LTE modem - Prepare the 4G connection network with service provider
-def initiate4GModem ():
+# Check at least one 4G LTE modem are UP
+def chk4GModemValid ():
+    global modemList
+
+    for qmiDev in modemList.keys():
+        if modemList[qmiDev]['valid'] == True:
+            return True
+
+    return False
+
+# 4G LTE modem bring-up thread - Initiate one 4G LTE modem and report the result
+def modemBringUp (threadname, qmiDev, resultQueue):
     global backLogger
-    global publicIPaddr
-    
+
     retResult = False
-    
-    # Check current 4G LTE modem status first
-    # Command: qmicli -d /dev/cdc-wdm0 --dms-get-operating-mode
+    startTime = time.time()
+    try:
+        retResult = initiate4GModem(qmiDev)
+    finally:
+        resultQueue.put((qmiDev, retResult))
+
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_4G_MODEM: [%s] 4G LTE modem bring-up %s, time: %.2fs" % (qmiDev, retResult, time.time() - startTime))
+        # Print statement
+        else:
+            print "DEBUG_4G_MODEM: [%s] 4G LTE modem bring-up %s, time: %.2fs" % (qmiDev, retResult, time.time() - startTime)
+
+# Initiate all 4G LTE modem - Discover 4G LTE modem and bring up every 4G LTE modem that are not UP in parallel
+# Failed 4G LTE modem are reset when other 4G LTE modem are UP, otherwise network monitoring STOP all 4G LTE modem
+# Return: True when at least one 4G LTE modem are UP
+def initiateAll4GModem ():
+    global modemList
+    global modemLock
+
+    # Other bring-up still in progress
+    if modemLock.acquire(False) == False:
+        return chk4GModemValid()
+
+    try:
+        discover4GModem()
+
+        upList = [x for x in sorted(modemList.keys()) if modemList[x]['valid'] == False]
+        resultQueue = Queue.Queue()
+        for qmiDev in upList:
+            thread.start_new_thread(modemBringUp, ("[modemBringUp]", qmiDev, resultQueue))
+
+        for a in range(len(upList)):
+            qmiDev, retResult = resultQueue.get()
+            modemList[qmiDev]['valid'] = retResult
+
+        if chk4GModemValid() == True:
+            for qmiDev in upList:
+                if modemList[qmiDev]['valid'] == False:
+                    reset4GModem(qmiDev)
+    finally:
+        modemLock.release()
+
+    return chk4GModemValid()
+
+# QMI indication listener - Keep the qmicli process which started the network running with --wds-follow-network,
+# qmicli register for WDS packet service status indication and report every connection status changes
+# Parameters:
+# qmiDev     - 4G LTE modem QMI control device
+# cmdArgs    - qmicli start network command argument list
+# startQueue - Queue to report the start network result: (retCode, stdout)
+def qmiIndicationMon (threadname, qmiDev, cmdArgs, startQueue):
+    global backLogger
+    global qmiFollowTimeOut
+    global qmiFollowProc
+    global qmiPktHandle
+    global modemIndValid
+    global modemEvtQueue
+
+    startOut = []
+    startDone = [False]
+    followProc = []
+    qmiFollowProc[qmiDev] = followProc
+
+    # Process qmicli output line by line
+    # Reply:
+    # [/dev/cdc-wdm0] Network started
+    # Packet data handle: '2264423824'
+    # [/dev/cdc-wdm0] Connection status: 'connected'
+    # [/dev/cdc-wdm0] Connection status: 'disconnected'
+    def chkIndication (oneLine):
+        # Start network reply
+        if startDone[0] == False:
+            startOut.append(oneLine)
+
+            pdhMatch = re.search(r"Packet data handle: '(\d+)'", oneLine)
+            if pdhMatch:
+                qmiPktHandle[qmiDev] = pdhMatch.group(1)
+                modemIndValid[qmiDev] = True
+                startDone[0] = True
+                startQueue.put((0, b'\n'.join(startOut)))
+
+        # WDS packet service status indication
+        elif 'Connection status:' in oneLine:
+            if "'connected'" in oneLine:
+                modemEvtQueue.put((qmiDev, 'connected', ''))
+            elif "'disconnected'" in oneLine:
+                modemEvtQueue.put((qmiDev, 'disconnected', 'Packet service status'))
+
+        return False
+
+    retCode, stdout = runCommand(cmdArgs, qmiFollowTimeOut, streamFunc=chkIndication, procList=followProc)
+    modemIndValid[qmiDev] = False
+
+    # Start network FAILED!
+    if startDone[0] == False:
+        if retCode == 0:
+            retCode = 1
+        startQueue.put((retCode, stdout))
+
+    # Listener exit without stop request, e.g. modem reset or qmi-proxy terminated
+    elif qmiFollowProc.get(qmiDev) is followProc:
+        del qmiFollowProc[qmiDev]
+        modemEvtQueue.put((qmiDev, 'disconnected', 'QMI indication listener exit [%s]' % (retCode)))
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_QMI: [%s] QMI indication listener STOP" % (qmiDev))
+    # Print statement
+    else:
+        print "DEBUG_QMI: [%s] QMI indication listener STOP" % (qmiDev)
+
+# Start the 4G LTE modem data session with APN name and start the QMI indication listener
+# Command: qmicli -p -d /dev/cdc-wdm0 --client-cid=20 --device-open-net='net-raw-ip|net-no-qos-header' --wds-start-network="apn='celcom3g',username=' ',password=' ',ip-type=4" --wds-follow-network --client-no-release-cid
+# Return: retCode, stdout of the start network request
+def qmiStartNetwork (timeOut=30, qmiDev=None):
+    global qmiCliBin
+    global qmiDevice
+    global qmiClientCid
+    global qmiFollowProc
+
+    if qmiDev == None:
+        qmiDev = qmiDevice
+    cidKey = qmiDev + ':wds'
+
+    # Allocate WDS client ID first, the listener keeps running so the client ID will not be reported
+    if cidKey not in qmiClientCid:
+        qmiRequest('wds', ['--wds-get-packet-service-status'], qmiDev=qmiDev)
+    if cidKey not in qmiClientCid:
+        return None, b''
+
+    cmdArgs = [qmiCliBin, '-p', '-d', qmiDev, '--client-cid=' + qmiClientCid[cidKey],
+               "--device-open-net=net-raw-ip|net-no-qos-header", \
+               '--wds-start-network=', "apn='celcom3g',username=' ',password=' ',ip-type=4", \
+               '--wds-follow-network', '--client-no-release-cid']
+
+    startQueue = Queue.Queue()
+    thread.start_new_thread(qmiIndicationMon, ("[qmiIndicationMon]", qmiDev, cmdArgs, startQueue))
+
+    try:
+        retCode, stdout = startQueue.get(True, timeOut)
+    # Start network TIME OUT, terminate the listener
+    except Queue.Empty:
+        retCode, stdout = None, b''
+        for followProc in qmiFollowProc.pop(qmiDev, []):
+            try:
+                followProc.terminate()
+            except OSError:
+                pass
+
+    return retCode, stdout
+
+# NAS serving system monitoring - qmicli does not follow NAS serving system indication, poll the serving system
+# through the kept NAS client ID instead and report registration/roaming status changes
+def nasServingMon (threadname, delay):
+    global modemList
+    global modemEvtQueue
+
+    lastState = {}
+
+    # Forever loop
+    while True:
+        time.sleep(delay)
+
+        for qmiDev in sorted(modemList.keys()):
+            # 4G LTE modem not UP yet
+            if modemList[qmiDev]['valid'] == False:
+                lastState[qmiDev] = ''
+                continue
+
+            # Command: qmicli -p -d /dev/cdc-wdm0 --nas-get-serving-system --client-no-release-cid
+            # Reply:
+            # [/dev/cdc-wdm0] Successfully got serving system:
+            # Registration state: 'registered'
+            # CS: 'attached'
+            # PS: 'attached'
+            # Selected network: '3gpp'
+            # Radio interfaces: '1'
+            # [0]: 'lte'
+            # Roaming status: 'off'
+            retCode, stdout = qmiRequest('nas', ['--nas-get-serving-system'], 10, qmiDev)
+
+            # NO error after command execution
+            if retCode == 0:
+                regMatch = re.search(r"Registration state: '([^']*)'", stdout)
+                roamMatch = re.search(r"Roaming status: '([^']*)'", stdout)
+
+                currState = ''
+                if regMatch:
+                    currState = regMatch.group(1)
+                if roamMatch:
+                    currState += ' roaming ' + roamMatch.group(1)
+
+                # Registration/roaming status changed
+                if lastState.get(qmiDev, '') != '' and currState != lastState[qmiDev]:
+                    modemEvtQueue.put((qmiDev, 'registration', currState))
+                lastState[qmiDev] = currState
+
+# Read current 4G LTE modem and its network interface state for 4G LTE modem bring-up planning
+# Return: Dictionary of current state
+# opMode  - Modem operating mode, e.g. 'online', 'offline', 'low-power'
+# rawIp   - Network interface OS Raw IP Mode setting enabled
+# ifUp    - Network interface UP
+# session - Data session connected
+# ipAddr  - Network interface IPv4 address
+def probe4GModemState (qmiDev=None):
+    modemState = {'opMode': '', 'rawIp': False, 'ifUp': False, 'session': False, 'ipAddr': ''}
+    netIf = get4GModemNetIf(qmiDev)
+
+    # Command: qmicli -p -d /dev/cdc-wdm0 --dms-get-operating-mode --client-no-release-cid
     # Reply:
     # [/dev/cdc-wdm0] Operating mode retrieved:
     # Mode: 'online' or 'offline'
     # HW restricted: 'no'
-    out = subprocess.Popen(['qmicli', '-d', '/dev/cdc-wdm0', '--dms-get-operating-mode'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    stdout,stderr = out.communicate()
-
-    # NO error after command execution
-    if stderr == None:
-        execResult = stdout
-            
-        # 4G LTE modem OFFLINE, start to wake up 4G LTE modem
-        # Command: qmicli -d /dev/cdc-wdm0 --dms-set-operating-mode='online'
-        # Reply:
-        # [/dev/cdc-wdm0] Operating mode set successfully
-        if 'unknown' in execResult: 
-            out = subprocess.Popen(['qmicli', '-d', '/dev/cdc-wdm0', "--dms-set-operating-mode=online"], \
-                                   stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            stdout,stderr = out.communicate()
+    retCode, stdout = qmiRequest('dms', ['--dms-get-operating-mode'], 10, qmiDev)
+    if retCode == 0:
+        modeMatch = re.search(r"Mode: '([^']*)'", stdout)
+        if modeMatch:
+            modemState['opMode'] = modeMatch.group(1)
 
-            # NO error after command execution
-            if stderr == None:
-                execResult = stdout
+    # Read: /sys/class/net/wwan0/qmi/raw_ip
+    # Reply: Y or N
+    modemState['rawIp'] = readSysFile('/sys/class/net/' + netIf + '/qmi/raw_ip') == 'Y'
+    modemState['ifUp'] = chkIfUp(netIf)
 
-                # Wake up 4G LTE modem successful, start bring interface wwan0 down
-                # Command: ifconfig wwan0 down
-                # Reply: NA
-                if 'successfully' in execResult:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_4G_MODEM: Set modem operating mode SUCCESSFUL")
-                    # Print statement
-                    else:
-                        print "DEBUG_4G_MODEM: Set modem operating mode SUCCESSFUL"
+    # Data session only valid on online modem
+    if modemState['opMode'] == 'online':
+        # Command: qmicli -p -d /dev/cdc-wdm0 --wds-get-packet-service-status --client-no-release-cid
+        # Reply: [/dev/cdc-wdm0] Connection status: 'connected'
+        retCode, stdout = qmiRequest('wds', ['--wds-get-packet-service-status'], 10, qmiDev)
+        if retCode == 0 and "Connection status: 'connected'" in stdout:
+            modemState['session'] = True
 
-                    # Wait before execute another command
-                    time.sleep(1)
-                    
-                    out = subprocess.Popen(['ifconfig', 'wwan0', 'down'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()
+    modemState['ipAddr'] = getIfIpAddress(netIf)
 
-                    # NO error after command execution
-                    if stderr == None:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_4G_MODEM: Bringing DOWN interface wwan0 SUCCESSFUL")
-                        # Print statement
-                        else:
-                            print "DEBUG_4G_MODEM: Bringing DOWN interface wwan0 SUCCESSFUL"
+    return modemState
 
-                        # Wait before execute another command
-                        time.sleep(1)
-                    
-                        # Enable OS Raw IP Mode setting (not persistent)
-                        # Command (bash): echo Y > /sys/class/net/wwan0/qmi/raw_ip
-                        # Reply: NA
-                        out = subprocess.Popen(["echo Y > /sys/class/net/wwan0/qmi/raw_ip"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                        stdout,stderr = out.communicate()
+# Initiate 4G LTE modem - Prepare the 4G connection network with service provider
+# Current modem and interface state are probed first, and only the remaining bring-up steps are executed:
+# 1 - Set modem operating mode online
+# 2 - Enable OS Raw IP Mode setting (network interface must be DOWN)
+# 3 - Bring UP network interface
+# 4 - Register the network with APN name
+# 5 - Configure the IP address and the default route with udhcpc
+# Only primary 4G LTE modem are checked against the SIM card public IP address
+def initiate4GModem (qmiDev=None):
+    global backLogger
+    global publicIPaddr
+    global qmiDevice
+    
+    retResult = False
 
-                        # NO error after command execution
-                        if stderr == None:
-                            # Write to logger
-                            if backLogger == True:
-                                logger.info("DEBUG_4G_MODEM: Enable OS Raw IP Mode setting SUCCESSFUL")
-                            # Print statement
-                            else:
-                                print "DEBUG_4G_MODEM: Enable OS Raw IP Mode setting SUCCESSFUL"
+    if qmiDev == None:
+        qmiDev = qmiDevice
+    netIf = get4GModemNetIf(qmiDev)
+    if qmiDev == qmiDevice:
+        tempChk = publicIPaddr + ' obtained'
+    else:
+        tempChk = ' obtained'
 
-                            # Wait before execute another command
-                            time.sleep(1)
-                    
-                            # Enable back wwan0 interface
-                            # Command: ifconfig wwan0 up
-                            # Reply: NA 
-                            out = subprocess.Popen(['ifconfig', 'wwan0', 'up'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                            stdout,stderr = out.communicate()
+    # Check current 4G LTE modem status first
+    modemState = probe4GModemState(qmiDev)
+
+    # Operating mode request failed, 4G LTE modem not available
+    if modemState['opMode'] == '':
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_4G_MODEM: Get modem operating mode FAILED!")
+        # Print statement
+        else:
+            print "DEBUG_4G_MODEM: Get modem operating mode FAILED!"
 
-                            # NO error after command execution
-                            if stderr == None:
-                                # Write to logger
-                                if backLogger == True:
-                                    logger.info("DEBUG_4G_MODEM: Bringing UP interface wwan0 SUCCESSFUL")
-                                # Print statement
-                                else:
-                                    print "DEBUG_4G_MODEM: Bringing UP interface wwan0 SUCCESSFUL"
+        return retResult
 
-                                # Wait before execute another command
-                                time.sleep(1)
+    # Bring-up plan
+    setOnline = modemState['opMode'] != 'online'
+    setRawIp = modemState['rawIp'] == False
+    setIfUp = setRawIp == True or modemState['ifUp'] == False
+    startNet = setOnline == True or setRawIp == True or modemState['session'] == False
+    if qmiDev == qmiDevice:
+        startDhcp = startNet == True or modemState['ipAddr'] != publicIPaddr
+    else:
+        startDhcp = startNet == True or modemState['ipAddr'] == ''
 
-                                # Register the network with APN name
-                                # Command: qmicli -p -d /dev/cdc-wdm0 --device-open-net='net-raw-ip|net-no-qos-header' --wds-start-network="apn='celcom3g',username=' ',password=' ',ip-type=4" --client-no-release-cid
-                                # Reply;
-                                # [/dev/cdc-wdm0] Network started
-                                # Packet data handle: '2264423824'
-                                # [/dev/cdc-wdm0] Client ID not released:
-                                # Service: 'wds'
-                                # CID: '20'
-                                out = subprocess.Popen(['qmicli', '-p', '-d', '/dev/cdc-wdm0', "--device-open-net=net-raw-ip|net-no-qos-header", \
-                                                        '--wds-start-network=', "apn='celcom3g',username=' ',password=' ',ip-type=4", \
-                                                        '--client-no-release-cid'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                stdout,stderr = out.communicate()
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_4G_MODEM: [%s] Bring-up plan: online[%s] raw_ip[%s] %s up[%s] network[%s] udhcpc[%s]" % \
+                    (qmiDev, setOnline, setRawIp, netIf, setIfUp, startNet, startDhcp))
+    # Print statement
+    else:
+        print "DEBUG_4G_MODEM: [%s] Bring-up plan: online[%s] raw_ip[%s] %s up[%s] network[%s] udhcpc[%s]" % \
+              (qmiDev, setOnline, setRawIp, netIf, setIfUp, startNet, startDhcp)
 
-                                # NO error after command execution
-                                if stderr == None:
-                                    execResult = stdout
-                                    
-                                    if 'Network started' in execResult:
-                                        if 'CID' in execResult:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_4G_MODEM: 4G network registration SUCCESSFUL")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_4G_MODEM: 4G network registration SUCCESSFUL"
+    # 4G LTE modem NOT online, start to wake up 4G LTE modem
+    # Command: qmicli -p -d /dev/cdc-wdm0 --dms-set-operating-mode='online' --client-no-release-cid
+    # Reply:
+    # [/dev/cdc-wdm0] Operating mode set successfully
+    if setOnline == True:
+        retCode, stdout = qmiRequest('dms', ["--dms-set-operating-mode=online"], qmiDev=qmiDev)
 
-                                            # Wait before execute another command
-                                            time.sleep(1)
-                    
-                                            # Finally, configure the IP address and the default route with udhcpc
-                                            # Command: udhcpc -i wwan0
-                                            # Reply:
-                                            # udhcpc: sending discover
-                                            # udhcpc: sending select for 183.171.144.62
-                                            # udhcpc: lease of 183.171.144.62 obtained, lease time 7200
-                                            out = subprocess.Popen(['udhcpc', '-i', 'wwan0'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                            stdout,stderr = out.communicate()
+        # Wait until the modem report online operating mode
+        if retCode != 0 or 'successfully' not in stdout or \
+           waitForCondition(lambda: probe4GModemState(qmiDev)['opMode'] == 'online', 10, 0.2) == False:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_4G_MODEM: Set modem operating mode FAILED!")
+            # Print statement
+            else:
+                print "DEBUG_4G_MODEM: Set modem operating mode FAILED!"
 
-                                            # NO error after command execution
-                                            if stderr == None:
-                                                execResult = stdout
+            return retResult
 
-                                                # 4G LTE modem initialization with network provider completed
-                                                #if '183.171.144.62 obtained' in execResult:
-                                                tempChk = publicIPaddr + ' obtained'
-                                                if tempChk in execResult:
-                                                    # Write to logger
-                                                    if backLogger == True:
-                                                        logger.info("DEBUG_4G_MODEM: Obtained public IP address SUCCESSFUL")
-                                                    # Print statement
-                                                    else:
-                                                        print "DEBUG_4G_MODEM: Obtained public IP address SUCCESSFUL"
-                                                
-                                                    retResult = True
-                                                    return retResult
-                                        
-        # No need to initiate 4G LTE modem, previously has already initiated
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_4G_MODEM: Set modem operating mode SUCCESSFUL")
+        # Print statement
         else:
-            # Previously 4G LTE modem already online, start bring interface wwan0 down
-            # Command: ifconfig wwan0 down
-            # Reply: NA    
-            out = subprocess.Popen(['ifconfig', 'wwan0', 'down'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            stdout,stderr = out.communicate()
+            print "DEBUG_4G_MODEM: Set modem operating mode SUCCESSFUL"
 
-            # NO error after command execution
-            if stderr == None:
+    # Enable OS Raw IP Mode setting (not persistent), only allowed when network interface DOWN
+    if setRawIp == True:
+        # Command: ifconfig wwan0 down
+        # Reply: NA
+        if modemState['ifUp'] == True:
+            retCode, stdout = runCommand(['ifconfig', netIf, 'down'], 10)
+
+            # Wait until network interface DOWN
+            if retCode != 0 or waitForCondition(lambda: chkIfUp(netIf) == False, 5) == False:
                 # Write to logger
                 if backLogger == True:
-                    logger.info("DEBUG_4G_MODEM: Bringing DOWN interface wwan0 SUCCESSFUL")
+                    logger.info("DEBUG_4G_MODEM: Bringing DOWN interface %s FAILED!" % (netIf))
                 # Print statement
                 else:
-                    print "DEBUG_4G_MODEM: Bringing DOWN interface wwan0 SUCCESSFUL"
+                    print "DEBUG_4G_MODEM: Bringing DOWN interface %s FAILED!" % (netIf)
 
-                # Wait before execute another command
-                time.sleep(1)
-                    
-                # Enable OS Raw IP Mode setting (not persistent)
-                # Command (bash): echo Y > /sys/class/net/wwan0/qmi/raw_ip
-                # Reply: NA
-                out = subprocess.Popen(["echo Y > /sys/class/net/wwan0/qmi/raw_ip"], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
+                return retResult
 
-                # NO error after command execution
-                if stderr == None:
-                    # Write to logger
-                    if backLogger == True:
-                        logger.info("DEBUG_4G_MODEM: Enable OS Raw IP Mode setting SUCCESSFUL")
-                    # Print statement
-                    else:
-                        print "DEBUG_4G_MODEM: Enable OS Raw IP Mode setting SUCCESSFUL"
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_4G_MODEM: Bringing DOWN interface %s SUCCESSFUL" % (netIf))
+            # Print statement
+            else:
+                print "DEBUG_4G_MODEM: Bringing DOWN interface %s SUCCESSFUL" % (netIf)
 
-                    # Wait before execute another command
-                    time.sleep(1)
-                    
-                    # Enable back wwan0 interface
-                    # Command: ifconfig wwan0 up
-                    # Reply: NA 
-                    out = subprocess.Popen(['ifconfig', 'wwan0', 'up'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                    stdout,stderr = out.communicate()                
+        # Write: Y > /sys/class/net/wwan0/qmi/raw_ip
+        # Reply: NA
+        if writeSysFile('/sys/class/net/' + netIf + '/qmi/raw_ip', 'Y') == False:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_4G_MODEM: Enable OS Raw IP Mode setting FAILED!")
+            # Print statement
+            else:
+                print "DEBUG_4G_MODEM: Enable OS Raw IP Mode setting FAILED!"
 
-                    # NO error after command execution
-                    if stderr == None:
-                        # Write to logger
-                        if backLogger == True:
-                            logger.info("DEBUG_4G_MODEM: Bringing UP interface wwan0 SUCCESSFUL")
-                        # Print statement
-                        else:
-                            print "DEBUG_4G_MODEM: Bringing UP interface wwan0 SUCCESSFUL"
+            return retResult
 
-                        # Wait before execute another command
-                        time.sleep(1)
-                    
-                        # Register the network with APN name
-                        # Command: qmicli -p -d /dev/cdc-wdm0 --device-open-net='net-raw-ip|net-no-qos-header' --wds-start-network="apn='celcom3g',username=' ',password=' ',ip-type=4" --client-no-release-cid
-                        # Reply;
-                        # [/dev/cdc-wdm0] Network started
-                        # Packet data handle: '2264423824'
-                        # [/dev/cdc-wdm0] Client ID not released:
-                        # Service: 'wds'
-                        # CID: '20'
-                        out = subprocess.Popen(['qmicli', '-p', '-d', '/dev/cdc-wdm0', "--device-open-net=net-raw-ip|net-no-qos-header", \
-                                                '--wds-start-network=', "apn='celcom3g',username=' ',password=' ',ip-type=4", \
-                                                '--client-no-release-cid'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                        stdout,stderr = out.communicate()
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_4G_MODEM: Enable OS Raw IP Mode setting SUCCESSFUL")
+        # Print statement
+        else:
+            print "DEBUG_4G_MODEM: Enable OS Raw IP Mode setting SUCCESSFUL"
 
-                        # NO error after command execution
-                        if stderr == None:
-                            execResult = stdout
-                            
-                            if 'Network started' in execResult:
-                                if 'CID' in execResult:
-                                    # Write to logger
-                                    if backLogger == True:
-                                        logger.info("DEBUG_4G_MODEM: 4G network registration SUCCESSFUL")
-                                    # Print statement
-                                    else:
-                                        print "DEBUG_4G_MODEM: 4G network registration SUCCESSFUL"
+    # Enable back network interface
+    # Command: ifconfig wwan0 up
+    # Reply: NA 
+    if setIfUp == True:
+        retCode, stdout = runCommand(['ifconfig', netIf, 'up'], 10)
 
-                                    # Wait before execute another command
-                                    time.sleep(1)
-                    
-                                    # Finally, configure the IP address and the default route with udhcpc
-                                    # Command: udhcpc -i wwan0
-                                    # Reply:
-                                    # udhcpc: sending discover
-                                    # udhcpc: sending select for 183.171.144.62
-                                    # udhcpc: lease of 183.171.144.62 obtained, lease time 7200
-                                    out = subprocess.Popen(['udhcpc', '-i', 'wwan0'], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                                    stdout,stderr = out.communicate()
+        # Wait until network interface UP
+        if retCode != 0 or waitForCondition(lambda: chkIfUp(netIf) == True, 5) == False:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_4G_MODEM: Bringing UP interface %s FAILED!" % (netIf))
+            # Print statement
+            else:
+                print "DEBUG_4G_MODEM: Bringing UP interface %s FAILED!" % (netIf)
 
-                                    # NO error after command execution
-                                    if stderr == None:
-                                        execResult = stdout
+            return retResult
 
-                                        # 4G LTE modem initialization with network provider completed
-                                        #if '183.171.144.62 obtained' in execResult:
-                                        tempChk = publicIPaddr + ' obtained'
-                                        if tempChk in execResult:
-                                            # Write to logger
-                                            if backLogger == True:
-                                                logger.info("DEBUG_4G_MODEM: Obtained public IP address SUCCESSFUL")
-                                            # Print statement
-                                            else:
-                                                print "DEBUG_4G_MODEM: Obtained public IP address SUCCESSFUL"
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_4G_MODEM: Bringing UP interface %s SUCCESSFUL" % (netIf))
+        # Print statement
+        else:
+            print "DEBUG_4G_MODEM: Bringing UP interface %s SUCCESSFUL" % (netIf)
+
+    # Register the network with APN name, the start network request only return after the data session connected
+    # Command: qmicli -p -d /dev/cdc-wdm0 --client-cid=20 --device-open-net='net-raw-ip|net-no-qos-header' --wds-start-network="apn='celcom3g',username=' ',password=' ',ip-type=4" --wds-follow-network --client-no-release-cid
+    # Reply;
+    # [/dev/cdc-wdm0] Network started
+    # Packet data handle: '2264423824'
+    if startNet == True:
+        retCode, stdout = qmiStartNetwork(qmiDev=qmiDev)
+
+        if retCode != 0 or 'Network started' not in stdout or 'Packet data handle' not in stdout:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_4G_MODEM: 4G network registration FAILED!")
+            # Print statement
+            else:
+                print "DEBUG_4G_MODEM: 4G network registration FAILED!"
+
+            return retResult
+
+        # Write to logger
+        if backLogger == True:
+            logger.info("DEBUG_4G_MODEM: 4G network registration SUCCESSFUL")
+        # Print statement
+        else:
+            print "DEBUG_4G_MODEM: 4G network registration SUCCESSFUL"
+
+    # Finally, configure the IP address and the default route with udhcpc
+    # Command: udhcpc -i wwan0
+    # Reply:
+    # udhcpc: sending discover
+    # udhcpc: sending select for 183.171.144.62
+    # udhcpc: lease of 183.171.144.62 obtained, lease time 7200
+    if startDhcp == True:
+        retCode, stdout = runCommand(['udhcpc', '-i', netIf], 30)
+
+        # 4G LTE modem initialization with network provider completed
+        #if '183.171.144.62 obtained' in execResult:
+        if retCode != 0 or tempChk not in stdout:
+            # Write to logger
+            if backLogger == True:
+                logger.info("DEBUG_4G_MODEM: Obtained public IP address FAILED!")
+            # Print statement
+            else:
+                print "DEBUG_4G_MODEM: Obtained public IP address FAILED!"
+
+            return retResult
+
+    # Write to logger
+    if backLogger == True:
+        logger.info("DEBUG_4G_MODEM: Obtained public IP address SUCCESSFUL")
+    # Print statement
+    else:
+        print "DEBUG_4G_MODEM: Obtained public IP address SUCCESSFUL"
 
-                                            retResult = True
-                                            return retResult
+    retResult = True
     return retResult
             
 # Script entry point
@@ -3418,6 +7931,10 @@ def main():
     global radioMode
     global ubuntuTouch
     
+    # Select content hash and nc2vpn key bundle cipher backend
+    selectHashBackend()
+    selectCipherBackend()
+
     # Using Raspberry PI computer
     if ubuntuTouch == False:
         mylcd.lcd_clear()
@@ -3444,6 +7961,9 @@ def main():
             else:
                 print "THREAD_ERROR: Unable to start [lcdOperation] thread"
 
+        # Discover 4G LTE modem
+        discover4GModem()
+
         # Create thread for network monitoring and validation
         try:
             thread.start_new_thread(networkMon, ("[networkMon]", 1 ))
@@ -3455,8 +7975,65 @@ def main():
             else:
                 print "THREAD_ERROR: Unable to start [networkMon] thread"
 
+        # Create thread for DNS cache pre-resolve and refresh
+        try:
+            thread.start_new_thread(dnsCacheMon, ("[dnsCacheMon]", 1 ))
+        except:
+            # Write to logger
+            if backLogger == True:
+                logger.info("THREAD_ERROR: Unable to start [dnsCacheMon] thread")
+            # Print statement
+            else:
+                print "THREAD_ERROR: Unable to start [dnsCacheMon] thread"
+
+        # Create thread for warm-standby OpenVPN
+        try:
+            thread.start_new_thread(ovpnStandbyMon, ("[ovpnStandbyMon]", 1 ))
+        except:
+            # Write to logger
+            if backLogger == True:
+                logger.info("THREAD_ERROR: Unable to start [ovpnStandbyMon] thread")
+            # Print statement
+            else:
+                print "THREAD_ERROR: Unable to start [ovpnStandbyMon] thread"
+
+        # Create thread for WAN uplink management
+        if multiWan == True:
+            try:
+                thread.start_new_thread(uplinkMon, ("[uplinkMon]", uplinkProbeIntv ))
+            except:
+                # Write to logger
+                if backLogger == True:
+                    logger.info("THREAD_ERROR: Unable to start [uplinkMon] thread")
+                # Print statement
+                else:
+                    print "THREAD_ERROR: Unable to start [uplinkMon] thread"
+
+        # Create thread for NAS serving system monitoring
+        try:
+            thread.start_new_thread(nasServingMon, ("[nasServingMon]", nasPollIntv ))
+        except:
+            # Write to logger
+            if backLogger == True:
+                logger.info("THREAD_ERROR: Unable to start [nasServingMon] thread")
+            # Print statement
+            else:
+                print "THREAD_ERROR: Unable to start [nasServingMon] thread"
+
         # Secure gateway feature
         if radioMode == False:
+            # Create thread for multipath VPN tunnel monitoring
+            if multiPath == True:
+                try:
+                    thread.start_new_thread(multiPathMon, ("[multiPathMon]", 1 ))
+                except:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("THREAD_ERROR: Unable to start [multiPathMon] thread")
+                    # Print statement
+                    else:
+                        print "THREAD_ERROR: Unable to start [multiPathMon] thread"
+
             # Create thread for USB thumb drive removal
             try:
                 thread.start_new_thread(checkUSBStatus, ("[checkUSBStatus]", 0.5 ))
@@ -3468,15 +8045,20 @@ def main():
                 else:
                     print "THREAD_ERROR: Unable to start [checkUSBStatus] thread"
 
-            # Setup pyInotify
-            wm = pyinotify.WatchManager()  # Watch Manager
-            mask = pyinotify.IN_CREATE     # watched events
-
-            notifier = pyinotify.Notifier(wm, EventHandler(pubKeyPath, nc2VpnKeyPath, nc2VpnKeyTPath))
-
-            wdd = wm.add_watch(usbMountPath, mask)
+            # Create thread for crypto key pool
+            if keyPool == True:
+                try:
+                    thread.start_new_thread(keyPoolMon, ("[keyPoolMon]", 5 ))
+                except:
+                    # Write to logger
+                    if backLogger == True:
+                        logger.info("THREAD_ERROR: Unable to start [keyPoolMon] thread")
+                    # Print statement
+                    else:
+                        print "THREAD_ERROR: Unable to start [keyPoolMon] thread"
 
-            notifier.loop()  # Blocking loop
+            # Watch mounted USB volume
+            mountWatch(usbMountPath, EventHandler(pubKeyPath, nc2VpnKeyPath, nc2VpnKeyTPath))  # Blocking loop
 
         # Radio monitoring mode 
         else:
@@ -3498,6 +8080,29 @@ def main():
             else:
                 print "THREAD_ERROR: Unable to start [uTouchCommProc] thread"
 
+        # Create thread for DNS cache pre-resolve and refresh
+        try:
+            thread.start_new_thread(dnsCacheMon, ("[dnsCacheMon]", 1 ))
+        except:
+            # Write to logger
+            if backLogger == True:
+                logger.info("THREAD_ERROR: Unable to start [dnsCacheMon] thread")
+            # Print statement
+            else:
+                print "THREAD_ERROR: Unable to start [dnsCacheMon] thread"
+
+        # Create thread for WAN uplink management
+        if multiWan == True:
+            try:
+                thread.start_new_thread(uplinkMon, ("[uplinkMon]", uplinkProbeIntv ))
+            except:
+                # Write to logger
+                if backLogger == True:
+                    logger.info("THREAD_ERROR: Unable to start [uplinkMon] thread")
+                # Print statement
+                else:
+                    print "THREAD_ERROR: Unable to start [uplinkMon] thread"
+
         # Check directory existence
         directExists = False
         while directExists == False:
@@ -3505,11 +8110,10 @@ def main():
             directExists = path.exists('/media/phablet')
             # Start create the directory
             if directExists == False:
-                out = subprocess.Popen(['cd /media;mkdir phablet'], shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-                stdout,stderr = out.communicate()
+                retCode, stdout = runCommand(['mkdir', '-p', '/media/phablet'], 10)
                 
                 # NO error after command execution
-                if stderr == None:
+                if retCode == 0:
                     # Write to logger
                     if backLogger == True:
                         logger.info("MAIN: Create /media/phablet directory SUCCESSFULL")
@@ -3530,15 +8134,20 @@ def main():
             else:
                 print "THREAD_ERROR: Unable to start [checkUSBUtouchStatus] thread"
 
-        # Setup pyInotify
-        wm = pyinotify.WatchManager()  # Watch Manager
-        mask = pyinotify.IN_CREATE     # watched events
-
-        notifier = pyinotify.Notifier(wm, EventHandler(pubKeyPath, nc2VpnKeyPath, nc2VpnKeyTPath))
-
-        wdd = wm.add_watch(usbMountPath, mask)
+        # Create thread for crypto key pool
+        if keyPool == True:
+            try:
+                thread.start_new_thread(keyPoolMon, ("[keyPoolMon]", 5 ))
+            except:
+                # Write to logger
+                if backLogger == True:
+                    logger.info("THREAD_ERROR: Unable to start [keyPoolMon] thread")
+                # Print statement
+                else:
+                    print "THREAD_ERROR: Unable to start [keyPoolMon] thread"
 
-        notifier.loop()  # Blocking loop
+        # Watch mounted USB volume
+        mountWatch(usbMountPath, EventHandler(pubKeyPath, nc2VpnKeyPath, nc2VpnKeyTPath))  # Blocking loop
     
 if __name__ == "__main__":
     main()
@@ -0,0 +1,84 @@
+# nc2vpn key bundle crypto benchmark - Bundle of 1, 10 and 100 files (with sub directory) encrypted and decrypted by
+# runCryptoBundle() with a single job and with one job per online CPU, decrypted bundle are compared with the source
+# Bundle encrypted by the previous encrypt.py (stand-in inside nc2vpn/) are decrypted through decrypt.py per file
+# Usage: python bundlebench.py [file count]...
+from __future__ import unicode_literals
+import os, sys, time, shutil, filecmp, tempfile, subprocess
+from gwtest import loadGateway, chkResult
+
+fileCntList = [int(x) for x in sys.argv[1:]] if len(sys.argv) > 1 else [1, 10, 100]
+testDir = os.path.dirname(os.path.abspath(__file__))
+workDir = tempfile.mkdtemp(prefix='scssgw-bundle-')
+
+gw = loadGateway()
+gw.cryptoStagePath = os.path.join(workDir, 'stage')
+devNull = open(os.devnull, 'w')
+
+# Bundle of OpenVPN profile, certificate and key files, 1 - 64 KB
+def createBundle (bundleDir, fileCnt):
+    for a in range(fileCnt):
+        relPath = ['profile-%03d.ovpn', 'certs/client-%03d.crt', 'keys/client/client-%03d.key'][a % 3] % (a)
+        filePath = os.path.join(bundleDir, relPath)
+        if os.path.isdir(os.path.dirname(filePath)) == False:
+            os.makedirs(os.path.dirname(filePath))
+        bundleFile = open(filePath, 'wb')
+        bundleFile.write(os.urandom(1024 * (1 + (a * 37) % 64)))
+        bundleFile.close()
+
+# Compare decrypted bundle with the source bundle
+def sameBundle (srcDir, dstDir):
+    dirCmp = filecmp.dircmp(srcDir, dstDir)
+    dirList = [dirCmp]
+    while len(dirList) > 0:
+        oneCmp = dirList.pop()
+        if oneCmp.left_only or oneCmp.right_only or filecmp.cmpfiles(oneCmp.left, oneCmp.right, oneCmp.common_files, False)[1:] != ([], []):
+            return False
+        dirList += oneCmp.subdirs.values()
+    return True
+
+def runBundle (cryptoMode, srcDir, dstDir, keyPath):
+    os.mkdir(dstDir)
+    sys.stdout = devNull
+    try:
+        startTime = time.time()
+        retCode, stdout = gw.runCryptoBundle(cryptoMode, srcDir, dstDir, keyPath)
+        return retCode, time.time() - startTime
+    finally:
+        sys.stdout = sys.__stdout__
+
+os.chdir(workDir)
+try:
+    shutil.copy(os.path.join(testDir, 'nc2vpn', 'decrypt.py'), workDir)
+    subprocess.check_call(['python3', os.path.join(testDir, 'nc2vpn', 'generate_keys.py')], stdout=devNull)
+    pubKey = os.path.join(workDir, 'key.public')
+    privKey = os.path.join(workDir, 'key.private')
+
+    print '%-6s %-5s %9s %12s %12s' % ('Files', 'Jobs', 'Bytes', 'Encrypt', 'Decrypt')
+    for fileCnt in fileCntList:
+        srcDir = os.path.join(workDir, 'src-%d' % (fileCnt))
+        createBundle(srcDir, fileCnt)
+        totalSize = sum([os.path.getsize(os.path.join(x[0], y)) for x in os.walk(srcDir) for y in x[2]])
+
+        for maxJob in [1, 0]:
+            gw.cryptoMaxJob = maxJob
+            encDir = os.path.join(workDir, 'enc-%d-%d' % (fileCnt, maxJob))
+            decDir = os.path.join(workDir, 'dec-%d-%d' % (fileCnt, maxJob))
+            encCode, encTime = runBundle('encrypt', srcDir, encDir, pubKey)
+            decCode, decTime = runBundle('decrypt', encDir, decDir, privKey)
+            chkResult('Bundle %s files, %s jobs' % (fileCnt, maxJob if maxJob != 0 else os.sysconf(b'SC_NPROCESSORS_ONLN')), \
+                      encCode == 0 and decCode == 0 and sameBundle(srcDir, decDir))
+            print '%-6s %-5s %9s %6.2fs %4.1fMB/s %6.2fs %4.1fMB/s' % (fileCnt, maxJob if maxJob != 0 else 'CPU', totalSize, \
+                  encTime, totalSize / 1e6 / encTime, decTime, totalSize / 1e6 / decTime)
+
+    # Previous encrypt.py bundle
+    gw.cryptoMaxJob = 0
+    srcDir = os.path.join(workDir, 'src-legacy')
+    createBundle(srcDir, 6)
+    os.mkdir(os.path.join(workDir, 'enc-legacy'))
+    subprocess.check_call(['python3', os.path.join(testDir, 'nc2vpn', 'encrypt.py'), '--source', srcDir, '--destination', \
+                           os.path.join(workDir, 'enc-legacy'), '--public-key', pubKey], stdout=devNull)
+    decCode, decTime = runBundle('decrypt', os.path.join(workDir, 'enc-legacy'), os.path.join(workDir, 'dec-legacy'), privKey)
+    chkResult('Previous encrypt.py bundle decrypted by decrypt.py', decCode == 0 and sameBundle(srcDir, os.path.join(workDir, 'dec-legacy')))
+finally:
+    os.chdir(testDir)
+    shutil.rmtree(workDir, True)
@@ -0,0 +1,86 @@
+# nc2vpn key bundle cipher backend benchmark - File of 64 KB, 1 MB and 16 MB encrypted and decrypted by each cipher
+# backend, kernel crypto API (AF_ALG skcipher with splice zero-copy) and userspace (openssl enc), throughput reported
+# in MB/s per backend. Each backend output are decrypted by the other backend (compatible bundle file)
+# Backend NOT supported by the running kernel are reported as NOT available
+# Usage: python cipherbench.py [file size KB]...
+from __future__ import unicode_literals
+import os, sys, time, shutil, tempfile
+from gwtest import loadGateway, chkResult
+
+fileSizeList = [int(x) * 1024 for x in sys.argv[1:]] if len(sys.argv) > 1 else [65536, 1048576, 16777216]
+workDir = tempfile.mkdtemp(prefix='scssgw-cipher-')
+
+gw = loadGateway()
+gw.cryptoStagePath = os.path.join(workDir, 'stage')
+backendList = [('af_alg', gw.afAlgStreamCipher), ('openssl', gw.streamUserCipher)]
+secret = os.urandom(32).encode('hex')
+
+def sameFile (firstPath, secondPath):
+    firstFile = open(firstPath, 'rb')
+    secondFile = open(secondPath, 'rb')
+    try:
+        return firstFile.read() == secondFile.read()
+    finally:
+        firstFile.close()
+        secondFile.close()
+
+try:
+    srcPath = os.path.join(workDir, 'src')
+    availList = []
+    for backend, cipherFunc in backendList:
+        srcFile = open(srcPath, 'wb')
+        srcFile.write(os.urandom(4096))
+        srcFile.close()
+        if gw.cipherFile(cipherFunc, 'encrypt', secret, srcPath, os.devnull) == True:
+            availList.append(backend)
+        else:
+            print 'Cipher backend [%s] NOT available' % (backend)
+    chkResult('Userspace cipher backend available', 'openssl' in availList)
+
+    print '%-8s %10s %16s %16s' % ('Backend', 'Bytes', 'Encrypt', 'Decrypt')
+    for fileSize in fileSizeList:
+        srcFile = open(srcPath, 'wb')
+        srcFile.write(os.urandom(fileSize))
+        srcFile.close()
+
+        for backend, cipherFunc in [x for x in backendList if x[0] in availList]:
+            encPath = os.path.join(workDir, 'enc-' + backend)
+            decPath = os.path.join(workDir, 'dec-' + backend)
+
+            startTime = time.time()
+            encResult = gw.cipherFile(cipherFunc, 'encrypt', secret, srcPath, encPath)
+            encTime = time.time() - startTime
+
+            startTime = time.time()
+            decResult = gw.cipherFile(cipherFunc, 'decrypt', secret, encPath, decPath)
+            decTime = time.time() - startTime
+
+            chkResult('%s %s bytes' % (backend, fileSize), encResult == True and decResult == True and sameFile(srcPath, decPath))
+            print '%-8s %10s %6.3fs %6.1fMB/s %6.3fs %6.1fMB/s' % (backend, fileSize, encTime, fileSize / 1048576.0 / encTime, \
+                  decTime, fileSize / 1048576.0 / decTime)
+
+        # Output decrypted by the other backend
+        if len(availList) > 1:
+            for encBackend, decBackend in [(availList[0], availList[1]), (availList[1], availList[0])]:
+                decPath = os.path.join(workDir, 'cross-' + decBackend)
+                decResult = gw.cipherFile(dict(backendList)[decBackend], 'decrypt', secret, os.path.join(workDir, 'enc-' + encBackend), decPath)
+                chkResult('%s output decrypted by %s' % (encBackend, decBackend), decResult == True and sameFile(srcPath, decPath))
+
+    # Kernel crypto API failure fallback to userspace, bundle file header kept
+    gw.cipherBackend = 'af_alg'
+    gw.afAlgStreamCipher = lambda cipherMode, secret, srcFd, dstFd: os.write(dstFd, b'partial') and False
+    encPath = os.path.join(workDir, 'enc-fallback')
+    srcFd = os.open(srcPath, os.O_RDONLY)
+    dstFd = os.open(encPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.write(dstFd, b'SCSSENC1')
+    try:
+        encResult = gw.streamCipher('encrypt', secret, srcFd, dstFd)
+    finally:
+        os.close(srcFd)
+        os.close(dstFd)
+    encFile = open(encPath, 'rb')
+    encHdr = encFile.read(16)
+    encFile.close()
+    chkResult('Fallback to userspace cipher', encResult == True and encHdr == b'SCSSENC1Salted__')
+finally:
+    shutil.rmtree(workDir, True)
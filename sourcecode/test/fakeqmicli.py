@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# Fake QMI endpoint - Command line compatible subset of qmicli for 4G LTE modem session test and benchmark
+# Modem state (operating mode, allocated client ID, data session) are kept inside state file (FAKEQMI_STATE)
+# Latency model (seconds, environment variable):
+# FAKEQMI_OPEN    - Device open without qmi-proxy (-p), default 0.3
+# FAKEQMI_PROXY   - Connect to qmi-proxy, default 0.02
+# FAKEQMI_CID     - Client ID allocation, default 0.15
+# FAKEQMI_RELEASE - Client ID release, default 0.1
+# FAKEQMI_REQ     - QMI request, default 0.02
+# FAKEQMI_NET     - Start network (data session), default 0.5
+from __future__ import unicode_literals
+import os, sys, time, json, fcntl, signal
+
+statePath = os.environ.get('FAKEQMI_STATE', '/tmp/fakeqmi-state.json')
+
+def delay (envName, defValue):
+    time.sleep(float(os.environ.get(envName, defValue)))
+
+def output (oneLine):
+    sys.stdout.write(oneLine + '\n')
+    sys.stdout.flush()
+
+# Read and update modem state under file lock
+def updateState (updateFunc):
+    stateFd = os.open(statePath, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(stateFd, fcntl.LOCK_EX)
+        stateData = os.read(stateFd, 65536)
+        modemState = json.loads(stateData) if stateData else {'opMode': 'offline', 'cid': {}, 'nextCid': 1, 'session': False, 'pdh': 0}
+        retResult = updateFunc(modemState)
+        os.lseek(stateFd, 0, 0)
+        os.ftruncate(stateFd, 0)
+        os.write(stateFd, json.dumps(modemState).encode('ascii'))
+    finally:
+        os.close(stateFd)
+
+    return retResult
+
+def main ():
+    qmiDev = ''
+    useProxy = False
+    clientCid = ''
+    keepCid = False
+    followNet = False
+    qmiReq = []
+    args = sys.argv[1:]
+    while len(args) > 0:
+        oneArg = args.pop(0)
+        if oneArg == '-d':
+            qmiDev = args.pop(0)
+        elif oneArg == '-p':
+            useProxy = True
+        elif oneArg.startswith('--client-cid='):
+            clientCid = oneArg[len('--client-cid='):]
+        elif oneArg == '--client-no-release-cid':
+            keepCid = True
+        elif oneArg == '--wds-follow-network':
+            followNet = True
+        elif oneArg.startswith('--device-open'):
+            pass
+        elif oneArg.startswith('--dms-') or oneArg.startswith('--wds-') or oneArg.startswith('--nas-'):
+            qmiReq.append(oneArg)
+        # Start network argument, e.g. --wds-start-network= "apn='celcom3g',ip-type=4"
+        elif len(qmiReq) > 0 and qmiReq[-1].endswith('='):
+            qmiReq[-1] += oneArg
+
+    if qmiDev == '' or len(qmiReq) != 1:
+        output('error: invalid arguments')
+        return 1
+
+    qmiReq = qmiReq[0]
+    service = qmiReq[2:5]
+    delay('FAKEQMI_PROXY' if useProxy == True else 'FAKEQMI_OPEN', 0.02 if useProxy == True else 0.3)
+
+    # Client ID, allocated when NOT given
+    def chkCid (modemState):
+        cidList = modemState['cid'].setdefault(service, [])
+        if clientCid != '':
+            return clientCid if clientCid in cidList else ''
+        newCid = str(modemState['nextCid'])
+        modemState['nextCid'] += 1
+        cidList.append(newCid)
+        return newCid
+
+    currCid = updateState(chkCid)
+    if currCid == '':
+        output("error: couldn't create client for the '%s' service: CID %s NOT allocated" % (service, clientCid))
+        return 1
+    if clientCid == '':
+        delay('FAKEQMI_CID', 0.15)
+
+    delay('FAKEQMI_REQ', 0.02)
+    retCode = 0
+    if qmiReq == '--dms-get-operating-mode':
+        opMode = updateState(lambda x: x['opMode'])
+        output("[%s] Operating mode retrieved:\n\tMode: '%s'\n\tHW restricted: 'no'" % (qmiDev, opMode))
+    elif qmiReq.startswith('--dms-set-operating-mode='):
+        updateState(lambda x: x.update({'opMode': qmiReq.split('=', 1)[1].strip("'")}))
+        output('[%s] Operating mode set successfully' % (qmiDev))
+    elif qmiReq == '--wds-get-packet-service-status':
+        session = updateState(lambda x: x['session'])
+        output("[%s] Connection status: '%s'" % (qmiDev, 'connected' if session == True else 'disconnected'))
+    elif qmiReq == '--nas-get-serving-system':
+        output("[%s] Successfully got serving system:\n\tRegistration state: 'registered'\n\tRoaming status: 'off'" % (qmiDev))
+    elif qmiReq.startswith('--wds-start-network='):
+        delay('FAKEQMI_NET', 0.5)
+        def startNet (modemState):
+            if modemState['opMode'] != 'online':
+                return 0
+            modemState['session'] = True
+            modemState['pdh'] += 1
+            return modemState['pdh']
+        pktHandle = updateState(startNet)
+        if pktHandle == 0:
+            output('error: couldn\'t start network: QMI protocol error (14): \'CallFailed\'')
+            return 1
+        output("[%s] Network started\n\tPacket data handle: '%s'" % (qmiDev, pktHandle))
+        if keepCid == True:
+            output("[%s] Client ID not released:\n\tService: '%s'\n\t    CID: '%s'" % (qmiDev, service, currCid))
+
+        # Follow network, report the connection status until terminated
+        if followNet == True:
+            signal.signal(signal.SIGTERM, lambda x, y: sys.exit(0))
+            output("[%s] Connection status: 'connected'" % (qmiDev))
+            try:
+                while True:
+                    time.sleep(1)
+            finally:
+                updateState(lambda x: x.update({'session': False}))
+        return 0
+    elif qmiReq.startswith('--wds-stop-network='):
+        updateState(lambda x: x.update({'session': False}))
+        output('[%s] Network stopped' % (qmiDev))
+    else:
+        output('error: unsupported request %s' % (qmiReq))
+        retCode = 1
+
+    if keepCid == True:
+        output("[%s] Client ID not released:\n\tService: '%s'\n\t    CID: '%s'" % (qmiDev, service, currCid))
+    else:
+        updateState(lambda x: x['cid'][service].remove(currCid))
+        delay('FAKEQMI_RELEASE', 0.1)
+
+    return retCode
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,30 @@
+# Security gateway test and benchmark support
+# Load scssgw.py as module, hardware interfacing (LCD, GPIO) are NOT initiated (Ubuntu Touch macro) and main() are
+# NOT executed, test and benchmark call the gateway functions directly
+# Requirement: Executed as root, same python modules as scssgw.py (pyinotify, pyudev)
+from __future__ import unicode_literals
+import os, sys, time, imp
+
+gwPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scssgw.py')
+
+# Load the gateway script with the macro arguments, e.g. ['QMICLI=/path/to/fakeqmicli.py']
+# Return: Gateway module
+def loadGateway (macroArgs=[]):
+    testArgv = sys.argv
+    sys.argv = ['scssgw.py', '127.0.0.1', '127.0.0.2', 'UBUNTU'] + macroArgs
+    try:
+        return imp.load_source('scssgw', gwPath)
+    finally:
+        sys.argv = testArgv
+
+# Latency summary of the measured samples (seconds)
+# Return: 'min/median/max' string in ms
+def latencySummary (sampleList):
+    sampleList = sorted(sampleList)
+    return '%.1f/%.1f/%.1f ms' % (sampleList[0] * 1000, sampleList[len(sampleList) // 2] * 1000, sampleList[-1] * 1000)
+
+# Print test result line, exit code 1 on the first FAILED check
+def chkResult (testName, testResult, testInfo=''):
+    print '%s: %s %s' % ('PASS' if testResult == True else 'FAILED!', testName, testInfo)
+    if testResult != True:
+        sys.exit(1)
@@ -0,0 +1,128 @@
+# USB key removal lockdown time-to-blackhole test - Client computer traffic forwarded by the gateway network namespace,
+# simulated USB key removal run usbLockdown(), time-to-blackhole are measured from the forwarded traffic
+# Rig:
+# scssgw-cli (UDP sender, 1ms)       scssgw-gw (forwarding, usbLockdown)       scssgw-wan (UDP sink)
+# cli0 10.93.1.2/24 <---- veth ----> 10.93.1.1/24 gw0  gw1 10.93.2.1/24 <---- veth ----> 10.93.2.2/24 wan0
+# Lockdown jobs (VPN tunnel, DHCP client, 4G LTE modem, cached nc2vpn key, forwarding lockdown chain, secondary VPN
+# tunnel) are stubbed, host processes and kernel key retention NOT touched
+# Test: last forwarded packet after the USB key removal event within the deadline (usbLockDeadline), forwarded
+# traffic resumed once usbLockdown() restored the forwarding with the lockdown chain in place
+# Usage: python lockdowntest.py [rounds] (root)
+from __future__ import unicode_literals
+import os, sys, time, socket, struct, subprocess
+
+sinkAddr = ('10.93.2.2', 5300)
+sendIntv = 0.001
+
+rigCmd = [['ip', 'netns', 'add', 'scssgw-cli'],
+          ['ip', 'netns', 'add', 'scssgw-gw'],
+          ['ip', 'netns', 'add', 'scssgw-wan'],
+          ['ip', 'link', 'add', 'cli0', 'netns', 'scssgw-cli', 'type', 'veth', 'peer', 'name', 'gw0', 'netns', 'scssgw-gw'],
+          ['ip', 'link', 'add', 'gw1', 'netns', 'scssgw-gw', 'type', 'veth', 'peer', 'name', 'wan0', 'netns', 'scssgw-wan'],
+          ['ip', '-n', 'scssgw-cli', 'addr', 'add', '10.93.1.2/24', 'dev', 'cli0'],
+          ['ip', '-n', 'scssgw-gw', 'addr', 'add', '10.93.1.1/24', 'dev', 'gw0'],
+          ['ip', '-n', 'scssgw-gw', 'addr', 'add', '10.93.2.1/24', 'dev', 'gw1'],
+          ['ip', '-n', 'scssgw-wan', 'addr', 'add', '10.93.2.2/24', 'dev', 'wan0'],
+          ['ip', '-n', 'scssgw-cli', 'link', 'set', 'cli0', 'up'],
+          ['ip', '-n', 'scssgw-gw', 'link', 'set', 'gw0', 'up'],
+          ['ip', '-n', 'scssgw-gw', 'link', 'set', 'gw1', 'up'],
+          ['ip', '-n', 'scssgw-wan', 'link', 'set', 'wan0', 'up'],
+          ['ip', '-n', 'scssgw-cli', 'route', 'add', 'default', 'via', '10.93.1.1'],
+          ['ip', '-n', 'scssgw-wan', 'route', 'add', '10.93.1.0/24', 'via', '10.93.2.1'],
+          ['ip', 'netns', 'exec', 'scssgw-gw', 'sysctl', '-q', '-w', 'net.ipv4.ip_forward=1']]
+
+# UDP sink, receive time of each packet written to stdout when the sender stop (empty packet)
+def sinkRun ():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(sinkAddr)
+    recvTime = []
+    while True:
+        data = sock.recv(64)
+        if data == b'':
+            break
+        recvTime.append(time.time())
+    sys.stdout.write(' '.join(['%.6f' % (x) for x in recvTime]))
+
+# UDP sender every sendIntv for the duration
+def sendRun (duration):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    endTime = time.time() + duration
+    while time.time() < endTime:
+        try:
+            sock.sendto(struct.pack('>d', time.time()), sinkAddr)
+        except socket.error:
+            pass
+        time.sleep(sendIntv)
+    # Forwarding restored after the lockdown, stop the sink
+    for a in range(10):
+        sock.sendto(b'', sinkAddr)
+        time.sleep(0.05)
+
+# Stubbed lockdown job, take jobTime to complete
+def stubJob (jobTime, jobResult):
+    def jobFunc (*jobArgs):
+        time.sleep(jobTime)
+        return jobResult
+    return jobFunc
+
+# Simulated USB key removal inside the gateway network namespace, event and lockdown completed time to stdout
+def gwRun ():
+    from gwtest import loadGateway
+
+    gw = loadGateway()
+    gw.runCommand = stubJob(0.05, (0, b''))
+    gw.shutdown4GModem = stubJob(0.2, None)
+    gw.revokeOvpnKeyCache = stubJob(0.01, None)
+    gw.lockdownForward = stubJob(0.05, True)
+    gw.stopMultiPathTunnel = stubJob(0.05, None)
+    time.sleep(1)
+    gw.dCryptProc = False
+    gw.tunnelValid = False
+    evtTime = time.time()
+    gw.usbLockdown(evtTime)
+    endTime = time.time()
+    print 'LOCKDOWN %.6f %.6f %s' % (evtTime, endTime, gw.usbLockDeadline)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'sink':
+        sinkRun()
+        sys.exit(0)
+    elif len(sys.argv) > 1 and sys.argv[1] == 'send':
+        sendRun(float(sys.argv[2]))
+        sys.exit(0)
+    elif len(sys.argv) > 1 and sys.argv[1] == 'gw':
+        gwRun()
+        sys.stdout.flush()
+        os._exit(0)
+
+    from gwtest import chkResult
+
+    roundCnt = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    testPath = os.path.abspath(__file__)
+    testDir = os.path.dirname(testPath)
+    try:
+        for cmdArgs in rigCmd:
+            subprocess.check_call(cmdArgs)
+
+        for a in range(roundCnt):
+            sinkProc = subprocess.Popen(['ip', 'netns', 'exec', 'scssgw-wan', sys.executable, testPath, 'sink'], stdout=subprocess.PIPE)
+            time.sleep(0.5)
+            sendProc = subprocess.Popen(['ip', 'netns', 'exec', 'scssgw-cli', sys.executable, testPath, 'send', '6'])
+            gwOut = subprocess.Popen(['ip', 'netns', 'exec', 'scssgw-gw', sys.executable, testPath, 'gw'], stdout=subprocess.PIPE, \
+                                     cwd=testDir).communicate()[0]
+            sendProc.wait()
+            recvTime = [float(x) for x in sinkProc.communicate()[0].split()]
+
+            evtTime, endTime, lockDeadline = [float(x) for x in gwOut.split('LOCKDOWN ')[1].split()]
+            # Last packet forwarded after the USB key removal event, before the forwarding restored
+            beforeEvt = [x for x in recvTime if x < evtTime]
+            duringLock = [x for x in recvTime if evtTime <= x < endTime]
+            afterLock = [x for x in recvTime if x >= endTime]
+            blackholeTime = (max(duringLock) if len(duringLock) > 0 else evtTime) - evtTime
+
+            chkResult('Round %d time-to-blackhole %.1fms (deadline %.0fms), lockdown %.0fms, %d packets before removal' % \
+                      (a + 1, blackholeTime * 1000, lockDeadline * 1000, (endTime - evtTime) * 1000, len(beforeEvt)), \
+                      len(beforeEvt) > 0 and len(afterLock) > 0 and blackholeTime <= lockDeadline)
+    finally:
+        for nsName in ['scssgw-cli', 'scssgw-gw', 'scssgw-wan']:
+            subprocess.call(['ip', 'netns', 'del', nsName])
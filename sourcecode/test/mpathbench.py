@@ -0,0 +1,116 @@
+# Multipath VPN tunnel aggregate throughput benchmark - Network namespace with two rate limited veth links named as
+# the VPN tunnel (tun0, tun1), VPN route balanced by multiPathMon() weighted by the measured capacity
+# Rig:
+# scssgw-gw (multiPathMon, TCP sender)     scssgw-srv (TCP sink 10.92.100.1)
+# tun0 10.92.1.2/24 <---- veth ---->  10.92.1.1/24  (tbf 40mbit)
+# tun1 10.92.2.2/24 <---- veth ---->  10.92.2.1/24  (tbf 20mbit)
+# Benchmark: parallel TCP flows through tun0 only, then through multipath VPN route
+# Result (16 flows, 8s): tun0 only 39.8 Mbit/s, multipath weight tun0:10 tun1:5 55.4 Mbit/s (1.39x)
+# Usage: python mpathbench.py [flows] [seconds] (root)
+from __future__ import unicode_literals
+import os, sys, time, socket, subprocess, thread
+
+sinkAddr = '10.92.100.1'
+sinkPort = 5201
+linkRate = ['40mbit', '20mbit']
+
+rigCmd = [['ip', 'netns', 'add', 'scssgw-gw'],
+          ['ip', 'netns', 'add', 'scssgw-srv'],
+          ['ip', '-n', 'scssgw-srv', 'link', 'set', 'lo', 'up'],
+          ['ip', '-n', 'scssgw-srv', 'addr', 'add', sinkAddr + '/32', 'dev', 'lo'],
+          ['ip', '-n', 'scssgw-gw', 'link', 'set', 'lo', 'up'],
+          # Single sender address, flow hashed to the nexthop by L4 port
+          ['ip', 'netns', 'exec', 'scssgw-gw', 'sysctl', '-q', '-w', 'net.ipv4.fib_multipath_hash_policy=1']]
+for a in range(2):
+    rigCmd += [['ip', 'link', 'add', 'name', 'tun%d' % (a), 'netns', 'scssgw-gw', 'type', 'veth', 'peer', 'name', 'srv%d' % (a), 'netns', 'scssgw-srv'],
+               ['ip', '-n', 'scssgw-gw', 'addr', 'add', '10.92.%d.2/24' % (a + 1), 'dev', 'tun%d' % (a)],
+               ['ip', '-n', 'scssgw-srv', 'addr', 'add', '10.92.%d.1/24' % (a + 1), 'dev', 'srv%d' % (a)],
+               ['ip', '-n', 'scssgw-gw', 'link', 'set', 'dev', 'tun%d' % (a), 'up'],
+               ['ip', '-n', 'scssgw-srv', 'link', 'set', 'dev', 'srv%d' % (a), 'up'],
+               ['ip', 'netns', 'exec', 'scssgw-gw', 'tc', 'qdisc', 'add', 'dev', 'tun%d' % (a), 'root', 'tbf', 'rate', linkRate[a], \
+                'burst', '64kbit', 'latency', '50ms']]
+# VPN route installed by the primary VPN tunnel
+rigCmd += [['ip', '-n', 'scssgw-gw', 'route', 'add', '10.92.100.0/24', 'via', '10.92.1.1', 'dev', 'tun0']]
+
+# TCP sink - Discard everything
+def sinkServer ():
+    sinkSock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sinkSock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sinkSock.bind((sinkAddr, sinkPort))
+    sinkSock.listen(64)
+    def sinkConn (connSock):
+        while connSock.recv(65536) != b'':
+            pass
+        connSock.close()
+    while True:
+        connSock, connAddr = sinkSock.accept()
+        thread.start_new_thread(sinkConn, (connSock,))
+
+# Parallel TCP flows for the duration
+# Return: Aggregate throughput (Mbit/s)
+def sendFlows (flowCnt, duration):
+    sentBytes = [0] * flowCnt
+    endTime = time.time() + duration
+    def sendFlow (flowIdx):
+        sock = socket.create_connection((sinkAddr, sinkPort), 5)
+        data = b'\0' * 65536
+        while time.time() < endTime:
+            sentBytes[flowIdx] += sock.send(data)
+        sock.close()
+    for a in range(flowCnt):
+        thread.start_new_thread(sendFlow, (a,))
+    startTime = time.time()
+    time.sleep(duration + 0.5)
+    return sum(sentBytes) * 8 / (time.time() - startTime) / 1e6
+
+def benchRun (flowCnt, duration):
+    from gwtest import loadGateway
+
+    gw = loadGateway(['MULTIPATH'])
+
+    singleRate = sendFlows(flowCnt, duration)
+    print 'Single VPN tunnel (tun0 %s) : %.1f Mbit/s' % (linkRate[0], singleRate)
+
+    # Multipath VPN tunnel balanced by measured capacity
+    gw.tunnelValid = True
+    for tunDev in ['tun0', 'tun1']:
+        gw.mpathTunnel[tunDev] = {'netIf': tunDev, 'addr': '', 'table': 0, 'bytes': 0, 'cap': 0.0, 'proc': None}
+    thread.start_new_thread(gw.multiPathMon, ("[multiPathMon]", 1))
+    # Initial equal weight VPN route, TCP flow keep the nexthop chosen at connect
+    gw.waitForCondition(lambda: len(gw.mpathWeight) > 0, 5)
+
+    # Capacity measurement warm up, then measure with the settled weight
+    sendFlows(flowCnt, 5)
+    multiRate = sendFlows(flowCnt, duration)
+    print 'Multipath VPN tunnel (tun0 %s + tun1 %s, weight %s) : %.1f Mbit/s (%.2fx)' % \
+          (linkRate[0], linkRate[1], ' '.join(['%s:%s' % (x, gw.mpathWeight[x]) for x in sorted(gw.mpathWeight)]), \
+           multiRate, multiRate / singleRate)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'sink':
+        sinkServer()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        benchRun(int(sys.argv[2]), int(sys.argv[3]))
+        sys.stdout.flush()
+        os._exit(0)
+
+    flowCnt = sys.argv[1] if len(sys.argv) > 1 else '16'
+    duration = sys.argv[2] if len(sys.argv) > 2 else '10'
+    testDir = os.path.dirname(os.path.abspath(__file__))
+    sinkProc = None
+    retCode = 1
+    try:
+        for cmdArgs in rigCmd:
+            subprocess.check_call(cmdArgs)
+        sinkProc = subprocess.Popen(['ip', 'netns', 'exec', 'scssgw-srv', sys.executable, os.path.abspath(__file__), 'sink'])
+        time.sleep(1)
+        retCode = subprocess.call(['ip', 'netns', 'exec', 'scssgw-gw', sys.executable, os.path.abspath(__file__), 'bench', \
+                                   flowCnt, duration], cwd=testDir)
+    finally:
+        if sinkProc != None:
+            sinkProc.kill()
+            sinkProc.wait()
+        subprocess.call(['ip', 'netns', 'del', 'scssgw-gw'])
+        subprocess.call(['ip', 'netns', 'del', 'scssgw-srv'])
+
+    sys.exit(retCode)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# Stand-in nc2vpn decrypt.py for test and benchmark - Same command line and output as the nc2vpn tool invoked by the
+# gateway, decrypt the files encrypted by the stand-in encrypt.py
+# Usage: python3 decrypt.py --source <dir> --destination <dir> --private-key <key.private>
+import os, sys, struct, argparse, subprocess
+
+argParser = argparse.ArgumentParser()
+argParser.add_argument('--source', required=True)
+argParser.add_argument('--destination', required=True)
+argParser.add_argument('--private-key', required=True)
+cmdArgs = argParser.parse_args()
+
+for dirPath, dirList, fileList in os.walk(cmdArgs.source, followlinks=True):
+    for fileName in sorted(fileList):
+        srcPath = os.path.join(dirPath, fileName)
+        dstPath = os.path.join(cmdArgs.destination, os.path.relpath(srcPath, cmdArgs.source))
+        os.makedirs(os.path.dirname(dstPath), exist_ok=True)
+
+        with open(srcPath, 'rb') as srcFile:
+            encData = srcFile.read()
+        wrapLen = struct.unpack('>H', encData[:2])[0]
+        fileSecret = subprocess.run(['openssl', 'pkeyutl', '-decrypt', '-inkey', cmdArgs.private_key, \
+                                     '-pkeyopt', 'rsa_padding_mode:oaep'], input=encData[2:2 + wrapLen], \
+                                    stdout=subprocess.PIPE, check=True).stdout
+        readFd, writeFd = os.pipe()
+        os.write(writeFd, fileSecret)
+        os.close(writeFd)
+        with open(dstPath, 'wb') as dstFile:
+            subprocess.run(['openssl', 'enc', '-d', '-aes-256-cbc', '-pbkdf2', '-pass', 'fd:%d' % (readFd)], \
+                           input=encData[2 + wrapLen:], stdout=dstFile, pass_fds=[readFd], check=True)
+        os.close(readFd)
+
+        print('Decrypting: ' + srcPath)
+        sys.stdout.flush()
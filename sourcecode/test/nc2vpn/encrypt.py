@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# Stand-in nc2vpn encrypt.py for test and benchmark - Same command line and output as the nc2vpn tool invoked by the
+# gateway. Each file under the source directory are encrypted into the destination directory (same relative path)
+# File format: <wrapped secret length (2 bytes)> <RSA-OAEP wrapped secret> <openssl enc -aes-256-cbc -pbkdf2 content>
+# Usage: python3 encrypt.py --source <dir> --destination <dir> --public-key <key.public>
+import os, sys, struct, argparse, subprocess
+
+argParser = argparse.ArgumentParser()
+argParser.add_argument('--source', required=True)
+argParser.add_argument('--destination', required=True)
+argParser.add_argument('--public-key', required=True)
+cmdArgs = argParser.parse_args()
+
+for dirPath, dirList, fileList in os.walk(cmdArgs.source, followlinks=True):
+    for fileName in sorted(fileList):
+        srcPath = os.path.join(dirPath, fileName)
+        dstPath = os.path.join(cmdArgs.destination, os.path.relpath(srcPath, cmdArgs.source))
+        os.makedirs(os.path.dirname(dstPath), exist_ok=True)
+
+        fileSecret = os.urandom(32).hex().encode('ascii')
+        wrapSecret = subprocess.run(['openssl', 'pkeyutl', '-encrypt', '-pubin', '-inkey', cmdArgs.public_key, \
+                                     '-pkeyopt', 'rsa_padding_mode:oaep'], input=fileSecret, stdout=subprocess.PIPE, \
+                                    check=True).stdout
+        readFd, writeFd = os.pipe()
+        os.write(writeFd, fileSecret)
+        os.close(writeFd)
+        with open(srcPath, 'rb') as srcFile:
+            encData = subprocess.run(['openssl', 'enc', '-aes-256-cbc', '-pbkdf2', '-pass', 'fd:%d' % (readFd)], \
+                                     stdin=srcFile, stdout=subprocess.PIPE, pass_fds=[readFd], check=True).stdout
+        os.close(readFd)
+
+        with open(dstPath, 'wb') as dstFile:
+            dstFile.write(struct.pack('>H', len(wrapSecret)) + wrapSecret + encData)
+        print('Encrypting: ' + srcPath)
+        sys.stdout.flush()
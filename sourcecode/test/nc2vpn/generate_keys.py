@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# Stand-in nc2vpn generate_keys.py for test and benchmark - Same command line and output as the nc2vpn tool invoked
+# by the gateway, RSA key pair generated by openssl into the current directory
+# Usage: python3 generate_keys.py
+import os, subprocess
+
+keyBits = os.environ.get('NC2VPN_KEY_BITS', '4096')
+
+subprocess.check_call(['openssl', 'genpkey', '-algorithm', 'RSA', '-pkeyopt', 'rsa_keygen_bits:' + keyBits, \
+                       '-out', 'key.private'], stderr=subprocess.DEVNULL)
+os.chmod('key.private', 0o600)
+subprocess.check_call(['openssl', 'pkey', '-in', 'key.private', '-pubout', '-out', 'key.public'])
+print('Generated public key at: ' + os.path.abspath('key.public'))
+print('Generated private key at: ' + os.path.abspath('key.private'))
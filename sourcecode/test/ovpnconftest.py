@@ -0,0 +1,77 @@
+# OpenVPN profile handling test - Profile with non-ASCII content (UTF-8 and Latin-1 comment, non-ASCII referenced key
+# file name) inline by inlineOvpnConfig(), loaded into sealed memory file, archived into nc2vpn key archive and
+# decrypted, then parsed by the pre-flight check. Profile bytes are kept as is, profile remote seeded into the DNS cache
+# Usage: python ovpnconftest.py
+from __future__ import unicode_literals
+import os, sys, shutil, tempfile, subprocess
+from gwtest import loadGateway, chkResult
+
+workDir = tempfile.mkdtemp(prefix='scssgw-ovpnconf-')
+
+gw = loadGateway()
+gw.cryptoStagePath = os.path.join(workDir, 'stage')
+gw.ovpnStandbyPath = os.path.join(workDir, 'standby.ovpn')
+gw.nc2VpnArchPath = os.path.join(workDir, 'nc2vpn.arc')
+gw.nc2VpnKeyTPath = os.path.join(workDir, 'tkey')
+devNull = open(os.devnull, 'w')
+
+def writeFile (filePath, fileData):
+    dataFile = open(filePath, 'wb')
+    try:
+        dataFile.write(fileData)
+    finally:
+        dataFile.close()
+
+def readFile (filePath):
+    dataFile = open(filePath, 'rb')
+    try:
+        return dataFile.read()
+    finally:
+        dataFile.close()
+
+try:
+    os.mkdir(gw.nc2VpnKeyTPath)
+    srcDir = os.path.join(workDir, 'src')
+    os.mkdir(srcDir)
+
+    # Self-signed CA certificate and crypto key pair
+    subprocess.check_call(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-keyout', os.path.join(workDir, 'ca.key'), \
+                           '-out', os.path.join(workDir, 'ca.crt'), '-subj', '/CN=scssgw-test', '-days', '30'], stderr=devNull)
+    subprocess.check_call(['openssl', 'genrsa', '-out', os.path.join(workDir, 'key.private'), '2048'], stderr=devNull)
+    subprocess.check_call(['openssl', 'rsa', '-in', os.path.join(workDir, 'key.private'), '-pubout', '-out', \
+                           os.path.join(workDir, 'key.public')], stderr=devNull)
+    caData = readFile(os.path.join(workDir, 'ca.crt')).strip()
+
+    # Referenced CA file with non-ASCII name, UTF-8 and Latin-1 comment
+    os.mkdir(os.path.join(srcDir, 'keys'))
+    writeFile(os.path.join(srcDir.encode('utf-8'), b'keys', b'ca-r\xc3\xa9seau.crt'), caData + b'\n')
+    ovpnData = b'# Profil r\xc3\xa9seau \xe2\x80\x93 bureau\n; caf\xe9\nclient\ndev tun\nremote vpn.example.com 1194 udp\n' + \
+               b'ca keys/ca-r\xc3\xa9seau.crt\n'
+    writeFile(os.path.join(srcDir, 'office.ovpn'), ovpnData)
+
+    ovpnConf = gw.inlineOvpnConfig(os.path.join(srcDir, 'office.ovpn'))
+    chkResult('Inline non-ASCII profile', isinstance(ovpnConf, bytes) == True and b'\xe2\x80\x93 bureau' in ovpnConf and \
+              b'; caf\xe9\n' in ovpnConf and b'<ca>\n' + caData + b'\n</ca>' in ovpnConf)
+
+    # Sealed memory file, content unchanged
+    writeFile(os.path.join(gw.nc2VpnKeyTPath, 'office.ovpn'), ovpnConf)
+    ovpnPath = gw.loadOvpnMemfd('office.ovpn')
+    chkResult('Load non-ASCII profile into sealed memory file', ovpnPath == gw.ovpnMemfd.get('path') and \
+              readFile('/proc/self/fd/%d' % (gw.ovpnMemfd['fd'])).rstrip(b'\n') == ovpnConf.rstrip(b'\n'))
+    chkResult('DNS cache seeded with the profile remote', gw.dnsRemoteHost == [b'vpn.example.com'])
+    gw.releaseOvpnMemfd()
+
+    # Archive and decrypt the selected profile
+    chkResult('Archive non-ASCII profile', gw.buildOvpnArchive(srcDir, os.path.join(workDir, 'key.public'), gw.nc2VpnArchPath) == 1)
+    gw.ovpnProfile = 'office.ovpn'
+    decDir = os.path.join(workDir, 'dec')
+    os.mkdir(decDir)
+    chkResult('Decrypt non-ASCII profile from archive', gw.decryptOvpnArchive(decDir, os.path.join(workDir, 'key.private')) == 'office.ovpn' \
+              and readFile(os.path.join(decDir, 'office.ovpn')) == ovpnConf)
+
+    # Pre-flight check
+    ovpnInfo = gw.parseOvpnConfig(os.path.join(decDir, 'office.ovpn'))
+    chkResult('Pre-flight check non-ASCII profile', gw.preflightOvpn(os.path.join(decDir, 'office.ovpn')) == True and \
+              ovpnInfo['remote'] == [(b'vpn.example.com', b'1194', b'udp')])
+finally:
+    shutil.rmtree(workDir.encode('utf-8'), True)
@@ -0,0 +1,67 @@
+# USB provisioning latency test - nc2vpn key provisioning (ENCRYPT process) of a USB volume timed with the crypto key
+# pair generated on demand (generate_keys.py) and taken from the pre-generated key pool (KEYPOOL)
+# nc2vpn tool are the stand-in inside nc2vpn/ (RSA 4096 key pair, NC2VPN_KEY_BITS to change)
+# Usage: python provbench.py [rounds]
+from __future__ import unicode_literals
+import os, sys, time, shutil, tempfile, thread
+from gwtest import loadGateway, latencySummary, chkResult
+
+roundCnt = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+testDir = os.path.dirname(os.path.abspath(__file__))
+workDir = tempfile.mkdtemp(prefix='scssgw-prov-')
+
+gw = loadGateway()
+gw.cryptoStagePath = os.path.join(workDir, 'stage')
+gw.keyPoolPath = os.path.join(workDir, 'keypool')
+gw.nc2VpnArchPath = os.path.join(workDir, 'nc2vpn.arc')
+nc2VpnKeyPath = os.path.join(workDir, 'nc2vpn-key')
+os.mkdir(nc2VpnKeyPath)
+os.mkdir(gw.keyPoolPath, 0o700)
+
+# generate_keys.py are executed from the working directory
+for toolName in ['generate_keys.py']:
+    shutil.copy(os.path.join(testDir, 'nc2vpn', toolName), workDir)
+os.chdir(workDir)
+handler = gw.EventHandler(os.path.join(workDir, 'key.public'), nc2VpnKeyPath, os.path.join(workDir, 'nc2vpn-tkey'))
+
+# Provisioning USB volume with the nc2vpn key bundle
+# Return: Provisioning latency (seconds)
+def provisionVolume (volName):
+    volPath = os.path.join(workDir, volName)
+    os.mkdir(volPath)
+    for fileName, fileData in [('client.ovpn', b'client\ndev tun\nremote vpn.example.com 1194 udp\nca ca.crt\n'), \
+                               ('ca.crt', os.urandom(2048).encode('base64'))]:
+        volFile = open(os.path.join(volPath, fileName), 'wb')
+        volFile.write(fileData)
+        volFile.close()
+
+    gw.eCryptProc = False
+    startTime = time.time()
+    handler.process_IN_CREATE(gw.MountEvent(volPath, '/dev/sdz1', '', 'vfat'))
+    provTime = time.time() - startTime
+
+    chkResult('Provisioning %s' % (volName), gw.eCryptProc == True and os.listdir(volPath) == ['key.private'])
+    shutil.rmtree(volPath)
+
+    return provTime
+
+try:
+    # Key pair generated on demand
+    gw.keyPool = False
+    keyGenTime = [provisionVolume('keygen-%d' % (a)) for a in range(roundCnt)]
+
+    # Key pair from the key pool, pool refilled in background between provisioning
+    gw.keyPool = True
+    thread.start_new_thread(gw.keyPoolMon, ("[keyPoolMon]", 0.2))
+    keyPoolTime = []
+    for a in range(roundCnt):
+        gw.waitForCondition(lambda: len([x for x in os.listdir(gw.keyPoolPath) if x.startswith('key-')]) >= gw.keyPoolSize, 600, 0.5)
+        keyPoolTime.append(provisionVolume('keypool-%d' % (a)))
+
+    print 'Provisioning latency without key pool (min/median/max): %s' % (latencySummary(keyGenTime))
+    print 'Provisioning latency with key pool (min/median/max): %s' % (latencySummary(keyPoolTime))
+    chkResult('Key pool provisioning latency lower', sorted(keyPoolTime)[roundCnt // 2] < sorted(keyGenTime)[roundCnt // 2], \
+              '(%.2fs saved)' % (sorted(keyGenTime)[roundCnt // 2] - sorted(keyPoolTime)[roundCnt // 2]))
+finally:
+    os.chdir(testDir)
+    shutil.rmtree(workDir, True)
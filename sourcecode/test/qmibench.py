@@ -0,0 +1,57 @@
+# 4G LTE modem bring-up QMI latency benchmark against fake QMI endpoint
+# Before - qmicli per step, device open with client ID allocation and release on every request (original sequence)
+# After  - Persistent QMI session, qmi-proxy with kept client ID (qmiRequest), bring-up plan request sequence
+# Usage: python qmibench.py [rounds]
+from __future__ import unicode_literals
+import os, sys, time
+from gwtest import loadGateway, latencySummary
+
+fakeQmi = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fakeqmicli.py')
+os.environ['FAKEQMI_STATE'] = '/tmp/qmibench-state.json'
+gw = loadGateway(['QMICLI=' + fakeQmi])
+qmiDev = '/dev/cdc-wdm0'
+roundCnt = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+def resetModem ():
+    if os.path.exists(os.environ['FAKEQMI_STATE']):
+        os.remove(os.environ['FAKEQMI_STATE'])
+    gw.qmiClientCid.clear()
+    gw.qmiPktHandle.clear()
+
+# Original bring-up: operating mode, set online, start network (new client ID every request)
+def bringUpBefore ():
+    startNet = "apn='celcom3g',username=' ',password=' ',ip-type=4"
+    for cmdArgs in [['-d', qmiDev, '--dms-get-operating-mode'],
+                    ['-d', qmiDev, '--dms-set-operating-mode=online'],
+                    ['-p', '-d', qmiDev, '--device-open-net=net-raw-ip|net-no-qos-header', '--wds-start-network=', startNet,
+                     '--client-no-release-cid']]:
+        retCode, stdout = gw.runCommand([fakeQmi] + cmdArgs, 30)
+        if retCode != 0:
+            return False
+    return True
+
+# Persistent QMI session bring-up: probe, set online, wait online, start network with indication listener
+def bringUpAfter ():
+    if gw.probe4GModemState(qmiDev)['opMode'] != 'online':
+        retCode, stdout = gw.qmiRequest('dms', ['--dms-set-operating-mode=online'], qmiDev=qmiDev)
+        if retCode != 0 or gw.probe4GModemState(qmiDev)['opMode'] != 'online':
+            return False
+    retCode, stdout = gw.qmiStartNetwork(qmiDev=qmiDev)
+    return retCode == 0 and 'Packet data handle' in stdout
+
+for benchName, benchFunc in [('before', bringUpBefore), ('after', bringUpAfter)]:
+    # First bring-up (cold client ID) and reconnect with the same session are measured
+    coldTime = []
+    warmTime = []
+    for a in range(roundCnt):
+        resetModem()
+        for sampleList in [coldTime, warmTime]:
+            startTime = time.time()
+            if benchFunc() == False:
+                print 'FAILED! %s bring-up' % (benchName)
+                sys.exit(1)
+            sampleList.append(time.time() - startTime)
+            gw.stop4GModem(qmiDev)
+            gw.runCommand([fakeQmi, '-p', '-d', qmiDev, '--dms-set-operating-mode=offline'], 10)
+
+    print 'QMI bring-up %-6s - first: %s, reconnect: %s' % (benchName, latencySummary(coldTime), latencySummary(warmTime))
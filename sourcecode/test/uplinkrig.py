@@ -0,0 +1,84 @@
+# WAN uplink manager failover test rig - Network namespace with two veth WAN uplinks and tc netem impairment
+# Rig:
+# scssgw-gw (uplink manager)          scssgw-wan (internet, probe address 10.91.0.1)
+# wan0 10.91.1.2/24 <---- veth ----> 10.91.1.1/24  (netem delay 20ms)
+# wan1 10.91.2.2/24 <---- veth ----> 10.91.2.1/24  (netem delay 80ms)
+# Test:
+# 1 - Healthy active WAN uplink (default route) are kept at start up, NO default route switch and OpenVPN restart
+# 2 - 100% loss on the active WAN uplink, failover within 1s
+# 3 - Active WAN uplink recovered with better RTT, switch back after the hold period
+# Usage: python uplinkrig.py (root)
+from __future__ import unicode_literals
+import os, sys, time, subprocess
+
+rigCmd = [['ip', 'netns', 'add', 'scssgw-gw'],
+          ['ip', 'netns', 'add', 'scssgw-wan'],
+          ['ip', '-n', 'scssgw-wan', 'link', 'set', 'lo', 'up'],
+          ['ip', '-n', 'scssgw-wan', 'addr', 'add', '10.91.0.1/32', 'dev', 'lo'],
+          ['ip', '-n', 'scssgw-gw', 'link', 'set', 'lo', 'up']]
+for a in range(2):
+    rigCmd += [['ip', 'link', 'add', 'wan%d' % (a), 'netns', 'scssgw-gw', 'type', 'veth', 'peer', 'name', 'isp%d' % (a), 'netns', 'scssgw-wan'],
+               ['ip', '-n', 'scssgw-gw', 'addr', 'add', '10.91.%d.2/24' % (a + 1), 'dev', 'wan%d' % (a)],
+               ['ip', '-n', 'scssgw-wan', 'addr', 'add', '10.91.%d.1/24' % (a + 1), 'dev', 'isp%d' % (a)],
+               ['ip', '-n', 'scssgw-gw', 'link', 'set', 'wan%d' % (a), 'up'],
+               ['ip', '-n', 'scssgw-wan', 'link', 'set', 'isp%d' % (a), 'up'],
+               ['ip', '-n', 'scssgw-gw', 'route', 'add', 'default', 'via', '10.91.%d.1' % (a + 1), 'dev', 'wan%d' % (a), 'metric', str(100 + a * 100)],
+               ['ip', 'netns', 'exec', 'scssgw-gw', 'tc', 'qdisc', 'add', 'dev', 'wan%d' % (a), 'root', 'netem', 'delay', '%dms' % (20 + a * 60)]]
+
+# Uplink manager inside the gateway network namespace
+def rigTest ():
+    import thread
+    from gwtest import loadGateway, chkResult
+
+    gw = loadGateway(['MULTIWAN', 'UPLINK=wan0,wan1'])
+    gw.uplinkProbeAddr = '10.91.0.1'
+
+    switchLog = []
+    switchUplink = gw.switchUplink
+    def logSwitch (netIf, reason):
+        switchLog.append((time.time(), netIf, reason))
+        return switchUplink(netIf, reason)
+    gw.switchUplink = logSwitch
+
+    def waitUplink (netIf, timeOut):
+        startTime = time.time()
+        gw.waitForCondition(lambda: gw.getDefaultRouteIf() == netIf, timeOut, 0.01)
+        return gw.getDefaultRouteIf() == netIf, time.time() - startTime
+
+    thread.start_new_thread(gw.uplinkMon, ("[uplinkMon]", gw.uplinkProbeIntv))
+
+    time.sleep(2)
+    chkResult('Healthy WAN uplink kept at start up', len(switchLog) == 0 and gw.getDefaultRouteIf() == 'wan0', \
+              '(switch: %s)' % (len(switchLog)))
+
+    gw.runCommand(['tc', 'qdisc', 'change', 'dev', 'wan0', 'root', 'netem', 'loss', '100%'], 5)
+    # Lost probe detection bound, sub-second with the default probe interval
+    failBound = (gw.uplinkFailCnt + 1) * gw.uplinkProbeIntv
+    switchResult, switchTime = waitUplink('wan1', 5)
+    chkResult('Failover wan0 -> wan1 on 100% loss', switchResult == True and switchTime <= failBound, \
+              '(%.0f ms, bound %.0f ms)' % (switchTime * 1000, failBound * 1000))
+
+    gw.runCommand(['tc', 'qdisc', 'change', 'dev', 'wan0', 'root', 'netem', 'delay', '5ms'], 5)
+    holdTime = gw.uplinkHoldCnt * gw.uplinkProbeIntv
+    switchResult, switchTime = waitUplink('wan0', holdTime + 10)
+    chkResult('Switch back wan1 -> wan0 on better score', switchResult == True, \
+              '(%.0f ms, hold period %.0f ms)' % (switchTime * 1000, holdTime * 1000))
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == 'rig':
+        rigTest()
+        # Uplink manager thread still running
+        sys.stdout.flush()
+        os._exit(0)
+
+    retCode = 1
+    try:
+        for cmdArgs in rigCmd:
+            subprocess.check_call(cmdArgs)
+        retCode = subprocess.call(['ip', 'netns', 'exec', 'scssgw-gw', sys.executable, os.path.abspath(__file__), 'rig'], \
+                                  cwd=os.path.dirname(os.path.abspath(__file__)))
+    finally:
+        subprocess.call(['ip', 'netns', 'del', 'scssgw-gw'])
+        subprocess.call(['ip', 'netns', 'del', 'scssgw-wan'])
+
+    sys.exit(retCode)